@@ -382,6 +382,87 @@ class BenchLeastSquares(Benchmark):
             raise NotImplementedError
 
 
+class LeastSquaresSparse(Benchmark):
+    """Large sparse problems with the trust-region solvers for them."""
+    params = [
+        ['trf', 'dogbox'],
+        ['lsmr', 'normal'],
+        [1000, 100000]
+    ]
+    param_names = ['method', 'tr_solver', 'n']
+
+    def setup(self, method, tr_solver, n):
+        from scipy.sparse import diags
+        self.x0 = -np.ones(n)
+        self.diags = diags
+
+    def fun(self, x):
+        # the Broyden tridiagonal function
+        f = (3 - x) * x + 1
+        f[1:] -= x[:-1]
+        f[:-1] -= 2 * x[1:]
+        return f
+
+    def jac(self, x):
+        n = x.size
+        return self.diags([-np.ones(n - 1), 3 - 2 * x, -2 * np.ones(n - 1)],
+                          [-1, 0, 1], format='csr')
+
+    def time_least_squares(self, method, tr_solver, n):
+        scipy.optimize.least_squares(self.fun, self.x0, self.jac,
+                                     method=method, tr_solver=tr_solver)
+
+
+class ApproxDerivative(Benchmark):
+    """Finite difference Jacobians evaluated serially or vectorized."""
+    params = [
+        ['serial', 'vectorized'],
+        ['2-point', '3-point'],
+        [10, 100]
+    ]
+    param_names = ['evaluation', 'method', 'n']
+
+    def setup(self, evaluation, method, n):
+        self.x0 = np.linspace(0.5, 1.5, n)
+
+    def fun(self, x):
+        # cheap enough for the cost of the calls to dominate; vectorized
+        # over the columns of x
+        return np.cumsum(np.sin(x) * x, axis=0)
+
+    def time_approx_derivative(self, evaluation, method, n):
+        scipy.optimize._numdiff.approx_derivative(
+            self.fun, self.x0, method=method,
+            vectorized=(evaluation == 'vectorized'))
+
+
+class CurveFitBatch(Benchmark):
+    """Many small curve fits, one at a time or batched."""
+    params = [
+        ['loop', 'batch'],
+        [10, 1000]
+    ]
+    param_names = ['solver', 'n_problems']
+
+    def setup(self, solver, n_problems):
+        np.random.seed(1234)
+        self.x = np.linspace(0, 4, 20)
+        params = np.random.uniform(0.5, 2.5, size=(n_problems, 3))
+        self.y = self.func(self.x, *params.T[:, :, np.newaxis])
+        self.y += 0.02 * np.random.normal(size=self.y.shape)
+
+    def func(self, x, a, b, c):
+        return a * np.exp(-b * x) + c
+
+    def time_curve_fit(self, solver, n_problems):
+        if solver == 'batch':
+            scipy.optimize.curve_fit_batch(self.func, self.x, self.y,
+                                           p0=[1, 1, 1])
+        else:
+            for y in self.y:
+                scipy.optimize.curve_fit(self.func, self.x, y, p0=[1, 1, 1])
+
+
 try:
     # the value of SCIPY_XSLOW is used to control how many repeats of each
     # function
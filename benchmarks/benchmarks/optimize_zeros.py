@@ -2,9 +2,12 @@ from __future__ import division, print_function, absolute_import
 
 from math import sqrt
 
+import numpy as np
+
 # Import testing parameters
 try:
     from scipy.optimize._tstutils import methods, mstrings, functions, fstrings
+    from scipy.optimize import newton
 except ImportError:
     pass
 
@@ -27,3 +30,36 @@ class Zeros(Benchmark):
 
     def time_zeros(self, func, meth):
         self.meth(self.func, self.a, self.b)
+
+
+class ArrayZeros(Benchmark):
+    params = [
+        ['loop', 'array'],
+        mstrings + ['newton']
+    ]
+    param_names = ['problems', 'solver']
+
+    def setup(self, problems, meth):
+        n = 10000
+        np.random.seed(1234)
+        self.c = np.random.uniform(1, 100, n)
+        self.a = np.zeros(n)
+        self.b = np.full(n, 5.)
+        if meth == 'newton':
+            self.meth = newton
+        else:
+            self.meth = methods[mstrings.index(meth)]
+
+    def time_zeros(self, problems, meth):
+        f = lambda x, c: x*x*x - c
+        if problems == 'loop':
+            if meth == 'newton':
+                for c, x0 in zip(self.c, self.b):
+                    self.meth(f, x0, args=(c,))
+            else:
+                for c, a, b in zip(self.c, self.a, self.b):
+                    self.meth(f, a, b, args=(c,))
+        elif meth == 'newton':
+            self.meth(f, self.b, args=(self.c,))
+        else:
+            self.meth(f, self.a, self.b, args=(self.c,))
@@ -15,6 +15,7 @@ try:
     from scipy import sparse
     from scipy.sparse import (csr_matrix, coo_matrix, dia_matrix, lil_matrix,
                               dok_matrix, rand, SparseEfficiencyWarning)
+    from scipy.sparse.linalg import norm
 except ImportError:
     pass
 
@@ -139,6 +140,60 @@ class Matvecs(Benchmark):
         self.A * self.x
 
 
+class ThreadedMatvec(Benchmark):
+    params = [
+        ['csr', 'csc'],
+        [1, 8],
+        [1, 2, 4],
+    ]
+    param_names = ['format', 'n_vecs', 'workers']
+    timeout = 120
+
+    def setup(self, format, n_vecs, workers):
+        # 10**7 nonzeros
+        n = 10**6
+        np.random.seed(1234)
+        indptr = np.arange(0, 10*n + 1, 10)
+        indices = np.random.randint(0, n, size=10*n)
+        data = np.random.random_sample(10*n)
+        self.A = csr_matrix((data, indices, indptr), shape=(n, n))
+        if format == 'csc':
+            self.A = self.A.T
+        if n_vecs == 1:
+            self.x = ones(n)
+        else:
+            self.x = ones((n, n_vecs))
+
+    def time_matvec(self, format, n_vecs, workers):
+        self.A.dot(self.x, workers=workers)
+
+
+class ThreadedMatmul(Benchmark):
+    params = [
+        ['matmul', 'masked_matmul', 'estimate_nnz'],
+        [1, 2, 4],
+    ]
+    param_names = ['function', 'workers']
+    timeout = 120
+
+    def setup(self, function, workers):
+        # adjacency matrix of a random graph with 10**6 edges
+        n = 10**5
+        np.random.seed(1234)
+        indptr = np.arange(0, 10*n + 1, 10)
+        indices = np.random.randint(0, n, size=10*n)
+        self.A = csr_matrix((ones(10*n), indices, indptr), shape=(n, n))
+        self.AT = self.A.T.tocsr()
+
+    def time_product(self, function, workers):
+        if function == 'matmul':
+            self.A.dot(self.AT, workers=workers)
+        elif function == 'masked_matmul':
+            sparse.masked_matmul(self.A, self.AT, self.A, workers=workers)
+        else:
+            sparse.estimate_nnz(self.A, self.AT, exact=True, workers=workers)
+
+
 class Matmul(Benchmark):
     def setup(self):
         H1, W1 = 1, 100000
@@ -186,6 +241,76 @@ class Construction(Benchmark):
             T[i, j] = v
 
 
+class Assembly(Benchmark):
+    params = [
+        ['coo', 'assembler', 'refill'],
+    ]
+    param_names = ['method']
+
+    def setup(self, method):
+        # P1 triangle elements of a structured n x n mesh
+        n = 300
+        np.random.seed(1234)
+        nodes = np.arange(n*n).reshape(n, n)
+        lower = np.array([nodes[:-1, :-1], nodes[1:, :-1], nodes[:-1, 1:]])
+        upper = np.array([nodes[1:, 1:], nodes[:-1, 1:], nodes[1:, :-1]])
+        elements = np.hstack([lower.reshape(3, -1),
+                              upper.reshape(3, -1)]).T
+        self.shape = (n*n, n*n)
+        self.rows = elements[:, :, None]
+        self.cols = elements[:, None, :]
+        self.vals = np.random.rand(len(elements), 3, 3)
+        self.assembler = sparse.SparseAssembler(self.shape)
+        self.assembler.add(self.rows, self.cols, self.vals)
+        self.assembler.tocsr()
+
+    def time_assembly(self, method):
+        if method == 'coo':
+            rows, cols, vals = np.broadcast_arrays(self.rows, self.cols,
+                                                   self.vals)
+            A = coo_matrix((vals.ravel(), (rows.ravel(), cols.ravel())),
+                           shape=self.shape).tocsr()
+            A.sort_indices()
+        elif method == 'assembler':
+            assembler = sparse.SparseAssembler(self.shape)
+            assembler.add(self.rows, self.cols, self.vals)
+            assembler.tocsr()
+        else:
+            self.assembler.tocsr(self.vals)
+
+
+class ChunkedConstruction(Benchmark):
+    params = [
+        ['coo', 'chunks'],
+        [10**4, 10**6]
+    ]
+    param_names = ['method', 'chunk_size']
+
+    def setup(self, method, chunk_size):
+        n = 10**5
+        nnz = 2 * 10**6
+        np.random.seed(1234)
+        self.shape = (n, n)
+        self.rows = np.random.randint(0, n, size=nnz)
+        self.cols = np.random.randint(0, n, size=nnz)
+        self.vals = np.random.rand(nnz)
+
+    def _chunks(self, chunk_size):
+        for start in range(0, len(self.rows), chunk_size):
+            stop = start + chunk_size
+            yield (self.rows[start:stop], self.cols[start:stop],
+                   self.vals[start:stop])
+
+    def time_construction(self, method, chunk_size):
+        if method == 'coo':
+            rows, cols, vals = [np.concatenate(a) for a in
+                                zip(*self._chunks(chunk_size))]
+            coo_matrix((vals, (rows, cols)), shape=self.shape).tocsr()
+        else:
+            sparse.csr_from_chunks(lambda: self._chunks(chunk_size),
+                                   self.shape)
+
+
 class Conversion(Benchmark):
     params = [
         ['csr', 'csc', 'coo', 'dia', 'lil', 'dok'],
@@ -309,6 +434,32 @@ class NullSlice(Benchmark):
         self.X[:, np.arange(100)]
 
 
+class FancyIndexing(Benchmark):
+    params = [['csr', 'csc'],
+              ['rows', 'cols', 'row_mask', 'col_mask', 'row_step',
+               'col_step', 'outer']]
+    param_names = ['format', 'index']
+
+    def setup(self, format, index):
+        n = 100000
+        k = 2000
+        self.X = sparse.rand(n, k, format=format, density=0.005,
+                             random_state=1234)
+        rng = np.random.RandomState(1234)
+        rows = rng.randint(0, n, size=n // 2)
+        cols = rng.randint(0, k, size=k // 2)
+        self.key = {'rows': (rows, slice(None)),
+                    'cols': (slice(None), cols),
+                    'row_mask': (rng.rand(n) > 0.5, slice(None)),
+                    'col_mask': (slice(None), rng.rand(k) > 0.5),
+                    'row_step': (slice(None, None, 3), slice(None)),
+                    'col_step': (slice(None), slice(None, None, 3)),
+                    'outer': (rows[:, None], cols)}[index]
+
+    def time_getitem(self, format, index):
+        self.X[self.key]
+
+
 class Diagonal(Benchmark):
     params = [[0.01, 0.1, 0.5], ['csr', 'csc', 'coo', 'lil', 'dok', 'dia']]
     param_names = ['density', 'format']
@@ -345,6 +496,35 @@ class Sum(Benchmark):
         self.X.sum(axis=1)
 
 
+class Reductions(Benchmark):
+    params = [['csr', 'csc'], [0, 1], [1, 4]]
+    param_names = ['format', 'axis', 'workers']
+
+    def setup(self, format, axis, workers):
+        self.X = sparse.rand(100000, 2000, format=format, density=0.01,
+                             random_state=1234)
+        self.X.data -= 0.5
+        self.old_workers = sparse.set_workers(workers)
+
+    def teardown(self, format, axis, workers):
+        sparse.set_workers(self.old_workers)
+
+    def time_sum(self, format, axis, workers):
+        self.X.sum(axis=axis)
+
+    def time_max(self, format, axis, workers):
+        self.X.max(axis=axis)
+
+    def time_argmax(self, format, axis, workers):
+        self.X.argmax(axis=axis)
+
+    def time_count_nonzero(self, format, axis, workers):
+        self.X.count_nonzero(axis=axis)
+
+    def time_norm(self, format, axis, workers):
+        norm(self.X, axis=axis)
+
+
 class Iteration(Benchmark):
     params = [[0.05, 0.01], ['csr', 'csc', 'lil']]
     param_names = ['density', 'format']
@@ -8,7 +8,8 @@ from numpy.testing import assert_equal
 
 try:
     from scipy import linalg, sparse
-    from scipy.sparse.linalg import cg, minres, gmres, spsolve
+    from scipy.sparse.linalg import (cg, minres, gmres, spsolve, splu, spilu,
+                                     LinearOperator)
 except ImportError:
     pass
 
@@ -22,6 +23,20 @@ try:
 except ImportError:
     pass
 
+try:
+    from scipy.sparse.linalg import block_cg, block_gmres
+except ImportError:
+    pass
+
+try:
+    from scipy.sparse.linalg import (jacobi_preconditioner,
+                                     ssor_preconditioner,
+                                     ilu0_preconditioner,
+                                     ic0_preconditioner,
+                                     smoothed_aggregation_preconditioner)
+except ImportError:
+    pass
+
 from .common import Benchmark
 
 
@@ -76,6 +91,94 @@ class Bench(Benchmark):
             raise ValueError('Unknown solver: %r' % solver)
 
 
+class Refactor(Benchmark):
+    params = [
+        [50, 100, 200],
+        ['splu', 'refactor', 'refactor_same_row_perm']
+    ]
+    param_names = ['(n,n)', 'method']
+
+    def setup(self, n, method):
+        np.random.seed(1234)
+        self.P_sparse = _create_sparse_poisson2d(n).tocsc()
+        self.P_sparse.sort_indices()
+        self.data = self.P_sparse.data * (1 + 0.1*np.random.rand(
+            self.P_sparse.nnz))
+        self.lu = splu(self.P_sparse)
+
+    def time_factor(self, n, method):
+        if method == 'splu':
+            splu(sparse.csc_matrix((self.data, self.P_sparse.indices,
+                                    self.P_sparse.indptr)))
+        else:
+            same_row_perm = (method == 'refactor_same_row_perm')
+            self.lu.refactor(self.data, same_row_perm=same_row_perm)
+
+
+class BlockSolve(Benchmark):
+    params = [
+        [25, 64],
+        [1, 16, 64],
+        ['cg', 'block_cg', 'gmres', 'block_gmres']
+    ]
+    param_names = ['(n,n)', 'nrhs', 'solver']
+
+    def setup(self, n, nrhs, solver):
+        np.random.seed(1234)
+        self.P_sparse = _create_sparse_poisson2d(n)
+        self.B = np.random.rand(n*n, nrhs)
+
+    def time_solve(self, n, nrhs, solver):
+        if solver == 'cg':
+            for b in self.B.T:
+                cg(self.P_sparse, b)
+        elif solver == 'gmres':
+            for b in self.B.T:
+                gmres(self.P_sparse, b)
+        elif solver == 'block_cg':
+            block_cg(self.P_sparse, self.B)
+        else:
+            block_gmres(self.P_sparse, self.B)
+
+
+class Preconditioners(Benchmark):
+    params = [
+        [64, 256],
+        ['none', 'jacobi', 'ssor', 'ilu0', 'ic0', 'smoothed_aggregation',
+         'spilu']
+    ]
+    param_names = ['(n,n)', 'preconditioner']
+
+    def setup(self, n, preconditioner):
+        self.P_sparse = _create_sparse_poisson2d(n)
+        self.b = np.ones(n*n)
+
+    def _make(self, preconditioner):
+        A = self.P_sparse
+        if preconditioner == 'none':
+            return None
+        elif preconditioner == 'jacobi':
+            return jacobi_preconditioner(A)
+        elif preconditioner == 'ssor':
+            return ssor_preconditioner(A, 1.5)
+        elif preconditioner == 'ilu0':
+            return ilu0_preconditioner(A)
+        elif preconditioner == 'ic0':
+            return ic0_preconditioner(A)
+        elif preconditioner == 'smoothed_aggregation':
+            return smoothed_aggregation_preconditioner(A)
+        elif preconditioner == 'spilu':
+            return LinearOperator(A.shape, spilu(A.tocsc()).solve)
+        else:
+            raise ValueError('Unknown preconditioner: %r' % preconditioner)
+
+    def time_setup(self, n, preconditioner):
+        self._make(preconditioner)
+
+    def time_solve(self, n, preconditioner):
+        cg(self.P_sparse, self.b, M=self._make(preconditioner))
+
+
 class Lgmres(Benchmark):
     params = [
         [10, 50, 100, 1000, 10000],
@@ -88,6 +88,47 @@ class Query(Benchmark):
         self.T.query(self.queries, p=p)
 
 
+class ApproximateQuery(Benchmark):
+    params = [
+        [(8,100000,1000), (32,100000,1000)],
+        [1, 10],
+        [None, 1, 8, 64],
+    ]
+    param_names = ['(m, n, r)', 'k', 'max_leaves']
+
+    def setup(self, mnr, k, max_leaves):
+        m, n, r = mnr
+
+        np.random.seed(1234)
+
+        # clustered data, for which approximate search is most useful
+        centers = np.random.uniform(size=(100, m))
+        self.data = (centers[np.random.randint(100, size=n)] +
+                     0.05*np.random.randn(n, m))
+        self.queries = (centers[np.random.randint(100, size=r)] +
+                        0.05*np.random.randn(r, m))
+
+        self.T = cKDTree(self.data)
+
+    def time_query(self, mnr, k, max_leaves):
+        self.T.query(self.queries, k=k, max_leaves=max_leaves)
+
+    def track_recall(self, mnr, k, max_leaves):
+        """
+        Fraction of the exact k nearest neighbors found (recall@k)
+        """
+        kk = np.arange(1, k + 1)
+        d, i = self.T.query(self.queries, k=kk)
+        da, ia = self.T.query(self.queries, k=kk, max_leaves=max_leaves)
+        return np.mean([len(set(a) & set(b)) / k for a, b in zip(ia, i)])
+
+    def time_brute_force(self, mnr, k, max_leaves):
+        if max_leaves is not None:
+            raise NotImplementedError()
+        dist = distance.cdist(self.queries, self.data)
+        np.argpartition(dist, k - 1, axis=1)[:, :k]
+
+
 class Radius(Benchmark):
     params = [
         [(3,10000,1000)],
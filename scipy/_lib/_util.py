@@ -7,9 +7,13 @@ import warnings
 import numbers
 from collections import namedtuple
 import inspect
+import threading
+from multiprocessing import Pool, cpu_count
 
 import numpy as np
 
+from scipy._lib.six import reraise
+
 
 def _valarray(shape, value=np.nan, typecode=None):
     """Return an array of all value.
@@ -337,3 +341,143 @@ except AttributeError:
         if argspec.args[0] == 'self':
             argspec.args.pop(0)
         return argspec
+
+
+def _init_workers(workers):
+    """Check a `workers` argument and return the number of threads."""
+    workers = operator.index(workers)
+    if workers == -1:
+        return cpu_count()
+    if workers < 1:
+        raise ValueError("workers must be a positive integer or -1, "
+                         "got %d" % workers)
+    return workers
+
+
+def _run_threads(func, tasks, workers):
+    """
+    Call ``func(task)`` for all the `tasks`, in `workers` threads taking the
+    next task when they are done with the previous one.
+
+    The calls are made in the calling thread if `workers` is 1 or there is
+    a single task.  Otherwise the first exception raised by a call is
+    re-raised once all the threads have stopped; the threads do not start
+    new tasks after it.
+    """
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            func(task)
+        return
+
+    errors = []
+    lock = threading.Lock()
+    it = iter(tasks)
+    end = object()
+
+    def _thread_func():
+        try:
+            while not errors:
+                with lock:
+                    task = next(it, end)
+                if task is end:
+                    return
+                func(task)
+        except Exception:
+            errors.append(sys.exc_info())
+
+    threads = [threading.Thread(target=_thread_func)
+               for i in range(min(workers, len(tasks)))]
+    # Daemon threads, so that the process can be aborted.
+    for t in threads:
+        t.daemon = True
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        reraise(*errors[0])
+
+
+class _FunctionWrapper(object):
+    """
+    Object to wrap ``f(x, *args, **kwargs)`` as a function of ``x``,
+    allowing picklability for evaluations with `MapWrapper`.
+    """
+    def __init__(self, f, args=(), kwargs=None):
+        self.f = f
+        self.args = [] if args is None else args
+        self.kwargs = {} if kwargs is None else kwargs
+
+    def __call__(self, x):
+        return self.f(x, *self.args, **self.kwargs)
+
+
+class MapWrapper(object):
+    """
+    Parallelisation wrapper for working with map-like callables, such as
+    `multiprocessing.Pool.map`.
+
+    Parameters
+    ----------
+    pool : int or map-like callable
+        If `pool` is an integer, then it specifies the number of processes to
+        use for parallelization. If ``int(pool) == 1``, then no parallel
+        processing is used and the map builtin is used.
+        If ``pool == -1``, then the pool will utilize all available CPUs.
+        If `pool` is a map-like callable that follows the same
+        calling sequence as the built-in map function, then this callable is
+        used for parallelization.
+    """
+    def __init__(self, pool=1):
+        self.pool = None
+        self._mapfunc = map
+        self._own_pool = False
+
+        if callable(pool):
+            self.pool = pool
+            self._mapfunc = self.pool
+        else:
+            # user supplies a number
+            if int(pool) == -1:
+                # use as many processors as possible
+                self.pool = Pool()
+                self._mapfunc = self.pool.map
+                self._own_pool = True
+            elif int(pool) == 1:
+                pass
+            elif int(pool) > 1:
+                # use the number of processors requested
+                self.pool = Pool(processes=int(pool))
+                self._mapfunc = self.pool.map
+                self._own_pool = True
+            else:
+                raise RuntimeError("Number of workers specified must be -1,"
+                                   " an int >= 1, or an object with a 'map'"
+                                   " method")
+
+    def __enter__(self):
+        return self
+
+    def __del__(self):
+        self.close()
+        self.terminate()
+
+    def terminate(self):
+        if self._own_pool:
+            self.pool.terminate()
+
+    def join(self):
+        if self._own_pool:
+            self.pool.join()
+
+    def close(self):
+        if self._own_pool:
+            self.pool.close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._own_pool:
+            self.pool.close()
+            self.pool.terminate()
+
+    def __call__(self, func, iterable):
+        # only accept one iterable because that's all Pool.map accepts
+        return self._mapfunc(func, iterable)
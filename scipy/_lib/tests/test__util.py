@@ -4,7 +4,7 @@ import numpy as np
 from numpy.testing import assert_equal, assert_
 from pytest import raises as assert_raises
 
-from scipy._lib._util import _aligned_zeros, check_random_state
+from scipy._lib._util import _aligned_zeros, check_random_state, MapWrapper
 
 
 def test__aligned_zeros():
@@ -54,3 +54,34 @@ def test_check_random_state():
     rsi = check_random_state(None)
     assert_equal(type(rsi), np.random.RandomState)
     assert_raises(ValueError, check_random_state, 'a')
+
+
+def test_mapwrapper_serial():
+    in_arg = np.arange(10.)
+    out_arg = np.sin(in_arg)
+
+    p = MapWrapper(1)
+    assert_(p._mapfunc is map)
+    assert_(p.pool is None)
+    assert_(p._own_pool is False)
+    out = list(p(np.sin, in_arg))
+    assert_equal(out, out_arg)
+
+    assert_raises(RuntimeError, MapWrapper, 0)
+
+
+def test_mapwrapper_parallel():
+    in_arg = np.arange(10.)
+    out_arg = np.sin(in_arg)
+
+    with MapWrapper(2) as p:
+        out = p(np.sin, in_arg)
+        assert_equal(list(out), out_arg)
+
+        assert_(p._own_pool is True)
+        assert_(p.pool is not None)
+
+    # a user-supplied map-like callable is used as is, and isn't owned
+    p = MapWrapper(map)
+    assert_(p._own_pool is False)
+    assert_equal(list(p(np.sin, in_arg)), out_arg)
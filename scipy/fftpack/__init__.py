@@ -55,6 +55,17 @@ Helper functions
    rfftfreq - DFT sample frequencies (for usage with rfft, irfft)
    next_fast_len - Find the optimal length to zero-pad an FFT for speed
 
+Plan caches
+===========
+
+.. autosummary::
+   :toctree: generated/
+
+   plan_cache_info - Report the usage of the caches of FFT plans
+   set_plan_cache_size - Set the number of plans kept by the caches
+   clear_plan_cache - Free the cached plans
+   pinned_plans - Context manager keeping the plans of given sizes cached
+
 Note that ``fftshift``, ``ifftshift`` and ``fftfreq`` are numpy functions
 exposed by ``fftpack``; importing them from ``numpy`` should be preferred.
 
@@ -94,6 +105,8 @@ __all__ = ['fft','ifft','fftn','ifftn','rfft','irfft',
            'fftfreq', 'rfftfreq',
            'fftshift', 'ifftshift',
            'next_fast_len',
+           'plan_cache_info', 'set_plan_cache_size', 'clear_plan_cache',
+           'pinned_plans',
            ]
 
 from .basic import *
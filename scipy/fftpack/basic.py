@@ -9,6 +9,7 @@ __all__ = ['fft','ifft','fftn','ifftn','rfft','irfft',
 
 from numpy import zeros, swapaxes
 import numpy
+from scipy._lib._util import _init_workers, _run_threads
 from . import _fftpack
 
 import atexit
@@ -160,7 +161,86 @@ def _fix_shape(x, n, axis):
         return z, True
 
 
-def _raw_fft(x, n, axis, direction, overwrite_x, work_function):
+# Size in bytes of the blocks of 1-D transforms that are done at a time by
+# _transform_along_axis.
+_BLOCK_BYTES = 2**20
+
+
+def _transform_along_axis(func, x, axis, dtype, overwrite_x, workers):
+    """
+    Apply a batched 1-D transform along an axis of an array.
+
+    ``func(a, overwrite_a)`` transforms ``a`` along its last axis and
+    returns the result, which is `a` itself if it could be transformed in
+    place.  The transforms are done in blocks of about ``_BLOCK_BYTES``,
+    which are split between `workers` threads; the routines of `_fftpack`
+    release the GIL while transforming.  Along an axis that is not the last
+    one each block is gathered into its place in the (transposed) result
+    and transformed there, instead of making a transposed copy of the whole
+    of `x` first.  `dtype` is the data type of the result.
+    """
+    axis = axis % x.ndim
+    n = x.shape[axis]
+    itemsize = numpy.dtype(dtype).itemsize
+
+    if axis == x.ndim - 1:
+        if workers == 1:
+            return func(x, overwrite_x)
+        if overwrite_x:
+            y = numpy.ascontiguousarray(x, dtype=dtype)
+        else:
+            y = numpy.array(x, dtype=dtype, order='C')
+        rows = y.reshape(-1, n)
+        step = _block_rows(n, itemsize, rows.shape[0], workers)
+
+        def transform(start):
+            block = rows[start:start + step]
+            r = func(block, True)
+            if r is not block:
+                block[...] = r
+
+        _run_threads(transform, range(0, rows.shape[0], step), workers)
+        return y
+
+    shape = x.shape
+    pre = int(numpy.prod(shape[:axis]))
+    post = int(numpy.prod(shape[axis + 1:]))
+    y = numpy.empty((pre, post, n), dtype=dtype)
+    if y.size:
+        x = x.reshape(pre, n, post)
+        step = _block_rows(n, itemsize, pre * post, workers)
+        if step < post:
+            blocks = [(i, i + 1, j, j + step)
+                      for i in range(pre) for j in range(0, post, step)]
+        else:
+            step //= post
+            blocks = [(i, i + step, 0, post) for i in range(0, pre, step)]
+
+        def transform(block):
+            i0, i1, j0, j1 = block
+            out = y[i0:i1, j0:j1]
+            out[...] = swapaxes(x[i0:i1, :, j0:j1], 1, 2)
+            r = func(out, True)
+            if r is not out:
+                out[...] = r
+
+        _run_threads(transform, blocks, workers)
+
+    # Move the transformed axis back into place, as a view
+    y = y.reshape(shape[:axis] + shape[axis + 1:] + (n,))
+    ndim = len(shape)
+    return y.transpose(list(range(axis)) + [ndim - 1] +
+                       list(range(axis, ndim - 1)))
+
+
+def _block_rows(n, itemsize, howmany, workers):
+    """Number of transforms of length `n` in a block."""
+    rows = max(1, _BLOCK_BYTES // (n * itemsize))
+    return max(1, min(rows, -(-howmany // workers)))
+
+
+def _raw_fft(x, n, axis, direction, overwrite_x, work_function, workers=1,
+             dtype=None):
     """ Internal auxiliary function for fft, ifft, rfft, irfft."""
     if n is None:
         n = x.shape[axis]
@@ -172,16 +252,17 @@ def _raw_fft(x, n, axis, direction, overwrite_x, work_function):
         raise ValueError("Invalid number of FFT data points "
                          "(%d) specified." % n)
 
-    if axis == -1 or axis == len(x.shape)-1:
-        r = work_function(x,n,direction,overwrite_x=overwrite_x)
-    else:
-        x = swapaxes(x, axis, -1)
-        r = work_function(x,n,direction,overwrite_x=overwrite_x)
-        r = swapaxes(r, axis, -1)
-    return r
+    if dtype is None:
+        dtype = x.dtype
 
+    def func(a, overwrite_a):
+        return work_function(a,n,direction,overwrite_x=overwrite_a)
 
-def fft(x, n=None, axis=-1, overwrite_x=False):
+    return _transform_along_axis(func, x, axis, dtype, overwrite_x,
+                                 _init_workers(workers))
+
+
+def fft(x, n=None, axis=-1, overwrite_x=False, workers=1):
     """
     Return discrete Fourier transform of real or complex sequence.
 
@@ -202,6 +283,9 @@ def fft(x, n=None, axis=-1, overwrite_x=False):
         last axis (i.e., ``axis=-1``).
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -268,25 +352,11 @@ def fft(x, n=None, axis=-1, overwrite_x=False):
 
     overwrite_x = overwrite_x or _datacopied(tmp, x)
 
-    if n is None:
-        n = tmp.shape[axis]
-    elif n != tmp.shape[axis]:
-        tmp, copy_made = _fix_shape(tmp,n,axis)
-        overwrite_x = overwrite_x or copy_made
-
-    if n < 1:
-        raise ValueError("Invalid number of FFT data points "
-                         "(%d) specified." % n)
-
-    if axis == -1 or axis == len(tmp.shape) - 1:
-        return work_function(tmp,n,1,0,overwrite_x)
-
-    tmp = swapaxes(tmp, axis, -1)
-    tmp = work_function(tmp,n,1,0,overwrite_x)
-    return swapaxes(tmp, axis, -1)
+    return _raw_fft(tmp,n,axis,1,overwrite_x,work_function,workers,
+                    numpy.result_type(tmp.dtype, numpy.complex64))
 
 
-def ifft(x, n=None, axis=-1, overwrite_x=False):
+def ifft(x, n=None, axis=-1, overwrite_x=False, workers=1):
     """
     Return discrete inverse Fourier transform of real or complex sequence.
 
@@ -307,6 +377,9 @@ def ifft(x, n=None, axis=-1, overwrite_x=False):
         last axis (i.e., ``axis=-1``).
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -351,25 +424,11 @@ def ifft(x, n=None, axis=-1, overwrite_x=False):
 
     overwrite_x = overwrite_x or _datacopied(tmp, x)
 
-    if n is None:
-        n = tmp.shape[axis]
-    elif n != tmp.shape[axis]:
-        tmp, copy_made = _fix_shape(tmp,n,axis)
-        overwrite_x = overwrite_x or copy_made
-
-    if n < 1:
-        raise ValueError("Invalid number of FFT data points "
-                         "(%d) specified." % n)
-
-    if axis == -1 or axis == len(tmp.shape) - 1:
-        return work_function(tmp,n,-1,1,overwrite_x)
-
-    tmp = swapaxes(tmp, axis, -1)
-    tmp = work_function(tmp,n,-1,1,overwrite_x)
-    return swapaxes(tmp, axis, -1)
+    return _raw_fft(tmp,n,axis,-1,overwrite_x,work_function,workers,
+                    numpy.result_type(tmp.dtype, numpy.complex64))
 
 
-def rfft(x, n=None, axis=-1, overwrite_x=False):
+def rfft(x, n=None, axis=-1, overwrite_x=False, workers=1):
     """
     Discrete Fourier transform of a real sequence.
 
@@ -387,6 +446,9 @@ def rfft(x, n=None, axis=-1, overwrite_x=False):
     overwrite_x : bool, optional
         If set to true, the contents of `x` can be overwritten. Default is
         False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -439,10 +501,10 @@ def rfft(x, n=None, axis=-1, overwrite_x=False):
 
     overwrite_x = overwrite_x or _datacopied(tmp, x)
 
-    return _raw_fft(tmp,n,axis,1,overwrite_x,work_function)
+    return _raw_fft(tmp,n,axis,1,overwrite_x,work_function,workers)
 
 
-def irfft(x, n=None, axis=-1, overwrite_x=False):
+def irfft(x, n=None, axis=-1, overwrite_x=False, workers=1):
     """
     Return inverse discrete Fourier transform of real sequence x.
 
@@ -463,6 +525,9 @@ def irfft(x, n=None, axis=-1, overwrite_x=False):
         the last axis (i.e., axis=-1).
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -509,7 +574,7 @@ def irfft(x, n=None, axis=-1, overwrite_x=False):
 
     overwrite_x = overwrite_x or _datacopied(tmp, x)
 
-    return _raw_fft(tmp,n,axis,-1,overwrite_x,work_function)
+    return _raw_fft(tmp,n,axis,-1,overwrite_x,work_function,workers)
 
 
 def _raw_fftnd(x, s, axes, direction, overwrite_x, work_function):
@@ -577,7 +642,7 @@ def _raw_fftnd(x, s, axes, direction, overwrite_x, work_function):
     return r
 
 
-def fftn(x, shape=None, axes=None, overwrite_x=False):
+def fftn(x, shape=None, axes=None, overwrite_x=False, workers=1):
     """
     Return multidimensional discrete Fourier transform.
 
@@ -604,6 +669,10 @@ def fftn(x, shape=None, axes=None, overwrite_x=False):
         transform is applied.
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed.  Default is False.
+    workers : int, optional
+        Number of threads to use.  If not 1, the axes are transformed one
+        at a time, with the 1-D transforms along an axis split between the
+        threads.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -632,10 +701,10 @@ def fftn(x, shape=None, axes=None, overwrite_x=False):
     True
 
     """
-    return _raw_fftn_dispatch(x, shape, axes, overwrite_x, 1)
+    return _raw_fftn_dispatch(x, shape, axes, overwrite_x, 1, workers)
 
 
-def _raw_fftn_dispatch(x, shape, axes, overwrite_x, direction):
+def _raw_fftn_dispatch(x, shape, axes, overwrite_x, direction, workers=1):
     tmp = _asfarray(x)
 
     try:
@@ -647,10 +716,32 @@ def _raw_fftn_dispatch(x, shape, axes, overwrite_x, direction):
         overwrite_x = 1
 
     overwrite_x = overwrite_x or _datacopied(tmp, x)
-    return _raw_fftnd(tmp,shape,axes,direction,overwrite_x,work_function)
+    workers = _init_workers(workers)
+    if workers == 1:
+        return _raw_fftnd(tmp,shape,axes,direction,overwrite_x,work_function)
+
+    # One axis at a time, with the 1-D transforms split between the threads
+    if shape is None:
+        if axes is None:
+            shape = tmp.shape
+        else:
+            shape = numpy.take(tmp.shape, axes)
+    if axes is None:
+        axes = list(range(-tmp.ndim, 0))
+    if len(axes) != len(shape):
+        raise ValueError("when given, axes and shape arguments "
+                         "have to be of the same length")
+
+    dtype = numpy.result_type(tmp.dtype, numpy.complex64)
+    work_function = _DTYPE_TO_FFT[dtype]
+    for n, axis in zip(shape, axes):
+        tmp = _raw_fft(tmp, n, axis, direction, overwrite_x, work_function,
+                       workers, dtype)
+        overwrite_x = True
+    return tmp
 
 
-def ifftn(x, shape=None, axes=None, overwrite_x=False):
+def ifftn(x, shape=None, axes=None, overwrite_x=False, workers=1):
     """
     Return inverse multi-dimensional discrete Fourier transform of
     arbitrary type sequence x.
@@ -677,10 +768,10 @@ def ifftn(x, shape=None, axes=None, overwrite_x=False):
     True
 
     """
-    return _raw_fftn_dispatch(x, shape, axes, overwrite_x, -1)
+    return _raw_fftn_dispatch(x, shape, axes, overwrite_x, -1, workers)
 
 
-def fft2(x, shape=None, axes=(-2,-1), overwrite_x=False):
+def fft2(x, shape=None, axes=(-2,-1), overwrite_x=False, workers=1):
     """
     2-D discrete Fourier transform.
 
@@ -692,10 +783,10 @@ def fft2(x, shape=None, axes=(-2,-1), overwrite_x=False):
     fftn : for detailed information.
 
     """
-    return fftn(x,shape,axes,overwrite_x)
+    return fftn(x,shape,axes,overwrite_x,workers)
 
 
-def ifft2(x, shape=None, axes=(-2,-1), overwrite_x=False):
+def ifft2(x, shape=None, axes=(-2,-1), overwrite_x=False, workers=1):
     """
     2-D discrete inverse Fourier transform of real or complex sequence.
 
@@ -709,4 +800,4 @@ def ifft2(x, shape=None, axes=(-2,-1), overwrite_x=False):
     fft2, ifft
 
     """
-    return ifftn(x,shape,axes,overwrite_x)
+    return ifftn(x,shape,axes,overwrite_x,workers)
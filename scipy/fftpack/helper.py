@@ -1,11 +1,18 @@
 from __future__ import division, print_function, absolute_import
 
 import operator
+from collections import namedtuple
+from contextlib import contextmanager
 from numpy import arange
 from numpy.fft.helper import fftshift, ifftshift, fftfreq
 from bisect import bisect_left
 
-__all__ = ['fftshift', 'ifftshift', 'fftfreq', 'rfftfreq', 'next_fast_len']
+from scipy._lib.six import string_types
+from . import _fftpack
+
+__all__ = ['fftshift', 'ifftshift', 'fftfreq', 'rfftfreq', 'next_fast_len',
+           'plan_cache_info', 'set_plan_cache_size', 'clear_plan_cache',
+           'pinned_plans']
 
 
 def rfftfreq(n, d=1.0):
@@ -149,3 +156,225 @@ def next_fast_len(target):
     if p5 < match:
         match = p5
     return match
+
+
+# The caches of work arrays ("plans") kept by the compiled transforms; see
+# plan_cache_info for the transforms using each of them.
+_PLAN_CACHES = ('zfft', 'cfft', 'drfft', 'rfft', 'zfftnd', 'cfftnd',
+                'ddct1', 'ddct2', 'dct1', 'dct2',
+                'ddst1', 'ddst2', 'dst1', 'dst2')
+
+# n-dimensional plans are keyed by size and rank, and can't be pinned
+_ND_PLAN_CACHES = ('zfftnd', 'cfftnd')
+
+PlanCacheInfo = namedtuple('PlanCacheInfo',
+                           ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _plan_cache_names(kind):
+    if kind is None:
+        return list(_PLAN_CACHES)
+    if isinstance(kind, string_types):
+        kind = [kind]
+    kind = list(kind)
+    for name in kind:
+        if name not in _PLAN_CACHES:
+            raise ValueError("unknown plan cache %r, should be one of %s"
+                             % (name, sorted(_PLAN_CACHES)))
+    return kind
+
+
+def plan_cache_info(kind=None):
+    """
+    Report the usage of the caches of FFT plans.
+
+    The transforms keep the work arrays (twiddle factors, "plans") that they
+    compute for a given transform length in least recently used (LRU)
+    caches, one per kind of transform.
+
+    Parameters
+    ----------
+    kind : str or sequence of str, optional
+        The caches to report on, by default all of them.  The caches are:
+
+        ========  ====================================================
+        'zfft'    fft, ifft of double precision data
+        'cfft'    fft, ifft of single precision data
+        'drfft'   rfft, irfft, and fft, ifft of real double precision data
+        'rfft'    rfft, irfft of single precision data
+        'zfftnd'  fftn, ifftn of double precision data
+        'cfftnd'  fftn, ifftn of single precision data
+        'ddct1'   dct, idct of type 1 in double precision
+        'ddct2'   dct, idct of types 2 and 3 in double precision
+        'dct1'    dct, idct of type 1 in single precision
+        'dct2'    dct, idct of types 2 and 3 in single precision
+        'ddst1'   dst, idst of type 1 in double precision
+        'ddst2'   dst, idst of types 2 and 3 in double precision
+        'dst1'    dst, idst of type 1 in single precision
+        'dst2'    dst, idst of types 2 and 3 in single precision
+        ========  ====================================================
+
+    Returns
+    -------
+    info : dict
+        Maps the name of each cache to a ``PlanCacheInfo(hits, misses,
+        maxsize, currsize)`` named tuple, in the manner of
+        `functools.lru_cache`.  ``currsize`` can exceed ``maxsize`` when more
+        plans than ``maxsize`` are pinned.
+
+    See Also
+    --------
+    set_plan_cache_size, clear_plan_cache, pinned_plans
+
+    Notes
+    -----
+    All the operations on the plan caches are carried out with the GIL held,
+    so the caches can safely be shared by transforms running in several
+    threads.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy import fftpack
+    >>> fftpack.clear_plan_cache()
+    >>> for n in [32, 64, 32]:
+    ...     y = fftpack.fft(np.ones(n, dtype=complex))
+    >>> fftpack.plan_cache_info('zfft')['zfft']
+    PlanCacheInfo(hits=1, misses=2, maxsize=10, currsize=2)
+
+    """
+    info = {}
+    for name in _plan_cache_names(kind):
+        hits, misses, currsize, maxsize = getattr(
+            _fftpack, 'get_%s_cache_info' % name)()
+        info[name] = PlanCacheInfo(int(hits), int(misses), int(maxsize),
+                                   int(currsize))
+    return info
+
+
+def set_plan_cache_size(maxsize, kind=None):
+    """
+    Set the number of FFT plans kept by the plan caches.
+
+    Least recently used plans are evicted when a cache is full, or when it is
+    shrunk below its current size.  Pinned plans are never evicted.
+
+    Parameters
+    ----------
+    maxsize : int
+        The number of plans to keep in each cache, at least 1.
+    kind : str or sequence of str, optional
+        The caches to resize, by default all of them.  See `plan_cache_info`
+        for the names of the caches.
+
+    See Also
+    --------
+    plan_cache_info, clear_plan_cache, pinned_plans
+
+    Notes
+    -----
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    A service cycling through 50 different frame sizes of complex data should
+    keep at least 50 plans, to avoid recomputing them on every call:
+
+    >>> from scipy import fftpack
+    >>> fftpack.set_plan_cache_size(64, 'zfft')
+
+    """
+    maxsize = operator.index(maxsize)
+    if maxsize < 1:
+        raise ValueError("maxsize must be a positive integer, got %d"
+                         % maxsize)
+    for name in _plan_cache_names(kind):
+        getattr(_fftpack, 'set_%s_cache_size' % name)(maxsize)
+
+
+def clear_plan_cache(kind=None):
+    """
+    Free all the plans of the plan caches, and reset their statistics.
+
+    Parameters
+    ----------
+    kind : str or sequence of str, optional
+        The caches to clear, by default all of them.  See `plan_cache_info`
+        for the names of the caches.
+
+    See Also
+    --------
+    plan_cache_info, set_plan_cache_size, pinned_plans
+
+    Notes
+    -----
+    Pinned plans are freed as well.  The size of the caches is unchanged.
+
+    .. versionadded:: 1.1.0
+
+    """
+    for name in _plan_cache_names(kind):
+        getattr(_fftpack, 'destroy_%s_cache' % name)()
+
+
+@contextmanager
+def pinned_plans(sizes, kind=('zfft', 'drfft')):
+    """
+    Context manager keeping the FFT plans of the given sizes in the caches.
+
+    On entry the plans of the transform lengths `sizes` are computed if they
+    are not cached yet, and they are protected from eviction until exit.
+    Pins nest: a plan pinned by several active contexts stays pinned until
+    all of them have exited.
+
+    Parameters
+    ----------
+    sizes : int or sequence of int
+        The transform lengths whose plans are kept.
+    kind : str or sequence of str, optional
+        The caches in which the plans are pinned.  The default pins the plans
+        of `fft`, `ifft`, `rfft` and `irfft` in double precision.  See
+        `plan_cache_info` for the names of the caches; the n-dimensional
+        caches ``'zfftnd'`` and ``'cfftnd'`` can't be pinned.
+
+    See Also
+    --------
+    plan_cache_info, set_plan_cache_size, clear_plan_cache
+
+    Notes
+    -----
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy import fftpack
+    >>> frames = [np.ones(n) for n in [256, 480, 512, 256, 480]]
+    >>> with fftpack.pinned_plans([256, 480, 512]):
+    ...     spectra = [fftpack.rfft(frame) for frame in frames]
+
+    """
+    try:
+        sizes = [operator.index(sizes)]
+    except TypeError:
+        sizes = [operator.index(n) for n in sizes]
+    for n in sizes:
+        if n < 1:
+            raise ValueError("invalid transform length %d" % n)
+
+    names = _plan_cache_names(kind)
+    for name in names:
+        if name in _ND_PLAN_CACHES:
+            raise ValueError("plans of the %r cache can't be pinned" % name)
+
+    pinned = []
+    try:
+        for name in names:
+            pin = getattr(_fftpack, 'pin_%s_cache' % name)
+            for n in sizes:
+                pin(n, 1)
+                pinned.append((pin, n))
+        yield
+    finally:
+        for pin, n in pinned:
+            pin(n, 0)
@@ -8,7 +8,9 @@ __all__ = ['dct', 'idct', 'dst', 'idst', 'dctn', 'idctn', 'dstn', 'idstn']
 
 import numpy as np
 from scipy.fftpack import _fftpack
-from scipy.fftpack.basic import _datacopied, _fix_shape, _asfarray
+from scipy.fftpack.basic import (_datacopied, _fix_shape, _asfarray,
+                                  _transform_along_axis)
+from scipy._lib._util import _init_workers
 
 import atexit
 atexit.register(_fftpack.destroy_ddct1_cache)
@@ -48,7 +50,8 @@ def _init_nd_shape_and_axes(x, shape, axes):
     return shape, axes
 
 
-def dctn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
+def dctn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False,
+         workers=1):
     """
     Return multidimensional Discrete Cosine Transform along the specified axes.
 
@@ -71,6 +74,9 @@ def dctn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
         Normalization mode (see Notes). Default is None.
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -97,11 +103,13 @@ def dctn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
     x = np.asanyarray(x)
     shape, axes = _init_nd_shape_and_axes(x, shape, axes)
     for n, ax in zip(shape, axes):
-        x = dct(x, type=type, n=n, axis=ax, norm=norm, overwrite_x=overwrite_x)
+        x = dct(x, type=type, n=n, axis=ax, norm=norm,
+                overwrite_x=overwrite_x, workers=workers)
     return x
 
 
-def idctn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
+def idctn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False,
+          workers=1):
     """
     Return multidimensional Discrete Cosine Transform along the specified axes.
 
@@ -124,6 +132,9 @@ def idctn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
         Normalization mode (see Notes). Default is None.
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -150,11 +161,12 @@ def idctn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
     shape, axes = _init_nd_shape_and_axes(x, shape, axes)
     for n, ax in zip(shape, axes):
         x = idct(x, type=type, n=n, axis=ax, norm=norm,
-                 overwrite_x=overwrite_x)
+                 overwrite_x=overwrite_x, workers=workers)
     return x
 
 
-def dstn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
+def dstn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False,
+         workers=1):
     """
     Return multidimensional Discrete Sine Transform along the specified axes.
 
@@ -177,6 +189,9 @@ def dstn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
         Normalization mode (see Notes). Default is None.
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -203,11 +218,13 @@ def dstn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
     x = np.asanyarray(x)
     shape, axes = _init_nd_shape_and_axes(x, shape, axes)
     for n, ax in zip(shape, axes):
-        x = dst(x, type=type, n=n, axis=ax, norm=norm, overwrite_x=overwrite_x)
+        x = dst(x, type=type, n=n, axis=ax, norm=norm,
+                overwrite_x=overwrite_x, workers=workers)
     return x
 
 
-def idstn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
+def idstn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False,
+          workers=1):
     """
     Return multidimensional Discrete Sine Transform along the specified axes.
 
@@ -230,6 +247,9 @@ def idstn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
         Normalization mode (see Notes). Default is None.
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -256,11 +276,12 @@ def idstn(x, type=2, shape=None, axes=None, norm=None, overwrite_x=False):
     shape, axes = _init_nd_shape_and_axes(x, shape, axes)
     for n, ax in zip(shape, axes):
         x = idst(x, type=type, n=n, axis=ax, norm=norm,
-                 overwrite_x=overwrite_x)
+                 overwrite_x=overwrite_x, workers=workers)
     return x
 
 
-def dct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
+def dct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False,
+        workers=1):
     """
     Return the Discrete Cosine Transform of arbitrary type sequence x.
 
@@ -281,6 +302,9 @@ def dct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
         Normalization mode (see Notes). Default is None.
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -374,10 +398,12 @@ def dct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
     if type == 1 and norm is not None:
         raise NotImplementedError(
               "Orthonormalization not yet supported for DCT-I")
-    return _dct(x, type, n, axis, normalize=norm, overwrite_x=overwrite_x)
+    return _dct(x, type, n, axis, normalize=norm, overwrite_x=overwrite_x,
+                workers=workers)
 
 
-def idct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
+def idct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False,
+         workers=1):
     """
     Return the Inverse Discrete Cosine Transform of an arbitrary type sequence.
 
@@ -398,6 +424,9 @@ def idct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
         Normalization mode (see Notes). Default is None.
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -437,7 +466,8 @@ def idct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
               "Orthonormalization not yet supported for IDCT-I")
     # Inverse/forward type table
     _TP = {1:1, 2:3, 3:2}
-    return _dct(x, _TP[type], n, axis, normalize=norm, overwrite_x=overwrite_x)
+    return _dct(x, _TP[type], n, axis, normalize=norm,
+                overwrite_x=overwrite_x, workers=workers)
 
 
 def _get_dct_fun(type, dtype):
@@ -474,26 +504,26 @@ def __fix_shape(x, n, axis, dct_or_dst):
     return tmp, n, copy_made
 
 
-def _raw_dct(x0, type, n, axis, nm, overwrite_x):
+def _raw_dct(x0, type, n, axis, nm, overwrite_x, workers=1):
     f = _get_dct_fun(type, x0.dtype)
-    return _eval_fun(f, x0, n, axis, nm, overwrite_x)
+    return _eval_fun(f, x0, n, axis, nm, overwrite_x, workers)
 
 
-def _raw_dst(x0, type, n, axis, nm, overwrite_x):
+def _raw_dst(x0, type, n, axis, nm, overwrite_x, workers=1):
     f = _get_dst_fun(type, x0.dtype)
-    return _eval_fun(f, x0, n, axis, nm, overwrite_x)
+    return _eval_fun(f, x0, n, axis, nm, overwrite_x, workers)
 
 
-def _eval_fun(f, tmp, n, axis, nm, overwrite_x):
-    if axis == -1 or axis == len(tmp.shape) - 1:
-        return f(tmp, n, nm, overwrite_x)
+def _eval_fun(f, tmp, n, axis, nm, overwrite_x, workers=1):
+    def func(a, overwrite_a):
+        return f(a, n, nm, overwrite_a)
 
-    tmp = np.swapaxes(tmp, axis, -1)
-    tmp = f(tmp, n, nm, overwrite_x)
-    return np.swapaxes(tmp, axis, -1)
+    return _transform_along_axis(func, tmp, axis, tmp.dtype, overwrite_x,
+                                 workers)
 
 
-def _dct(x, type, n=None, axis=-1, overwrite_x=False, normalize=None):
+def _dct(x, type, n=None, axis=-1, overwrite_x=False, normalize=None,
+         workers=1):
     """
     Return Discrete Cosine Transform of arbitrary type sequence x.
 
@@ -521,14 +551,17 @@ def _dct(x, type, n=None, axis=-1, overwrite_x=False, normalize=None):
         raise ValueError("DCT-I is not defined for size < 2")
     overwrite_x = overwrite_x or copy_made
     nm = _get_norm_mode(normalize)
+    workers = _init_workers(workers)
     if np.iscomplexobj(x0):
-        return (_raw_dct(x0.real, type, n, axis, nm, overwrite_x) + 1j *
-                _raw_dct(x0.imag, type, n, axis, nm, overwrite_x))
+        return (_raw_dct(x0.real, type, n, axis, nm, overwrite_x, workers) +
+                1j * _raw_dct(x0.imag, type, n, axis, nm, overwrite_x,
+                             workers))
     else:
-        return _raw_dct(x0, type, n, axis, nm, overwrite_x)
+        return _raw_dct(x0, type, n, axis, nm, overwrite_x, workers)
 
 
-def dst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
+def dst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False,
+        workers=1):
     """
     Return the Discrete Sine Transform of arbitrary type sequence x.
 
@@ -549,6 +582,9 @@ def dst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
         Normalization mode (see Notes). Default is None.
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -620,10 +656,12 @@ def dst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
     if type == 1 and norm is not None:
         raise NotImplementedError(
               "Orthonormalization not yet supported for IDCT-I")
-    return _dst(x, type, n, axis, normalize=norm, overwrite_x=overwrite_x)
+    return _dst(x, type, n, axis, normalize=norm, overwrite_x=overwrite_x,
+                workers=workers)
 
 
-def idst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
+def idst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False,
+         workers=1):
     """
     Return the Inverse Discrete Sine Transform of an arbitrary type sequence.
 
@@ -644,6 +682,9 @@ def idst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
         Normalization mode (see Notes). Default is None.
     overwrite_x : bool, optional
         If True, the contents of `x` can be destroyed; the default is False.
+    workers : int, optional
+        Number of threads that the independent 1-D transforms are split
+        between.  -1 uses all CPUs.  Default is 1.
 
     Returns
     -------
@@ -670,7 +711,8 @@ def idst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False):
               "Orthonormalization not yet supported for IDCT-I")
     # Inverse/forward type table
     _TP = {1:1, 2:3, 3:2}
-    return _dst(x, _TP[type], n, axis, normalize=norm, overwrite_x=overwrite_x)
+    return _dst(x, _TP[type], n, axis, normalize=norm,
+                overwrite_x=overwrite_x, workers=workers)
 
 
 def _get_dst_fun(type, dtype):
@@ -685,7 +727,8 @@ def _get_dst_fun(type, dtype):
     return f
 
 
-def _dst(x, type, n=None, axis=-1, overwrite_x=False, normalize=None):
+def _dst(x, type, n=None, axis=-1, overwrite_x=False, normalize=None,
+         workers=1):
     """
     Return Discrete Sine Transform of arbitrary type sequence x.
 
@@ -710,8 +753,10 @@ def _dst(x, type, n=None, axis=-1, overwrite_x=False, normalize=None):
         raise ValueError("DST-I is not defined for size < 2")
     overwrite_x = overwrite_x or copy_made
     nm = _get_norm_mode(normalize)
+    workers = _init_workers(workers)
     if np.iscomplexobj(x0):
-        return (_raw_dst(x0.real, type, n, axis, nm, overwrite_x) + 1j *
-                _raw_dst(x0.imag, type, n, axis, nm, overwrite_x))
+        return (_raw_dst(x0.real, type, n, axis, nm, overwrite_x, workers) +
+                1j * _raw_dst(x0.imag, type, n, axis, nm, overwrite_x,
+                             workers))
     else:
-        return _raw_dst(x0, type, n, axis, nm, overwrite_x)
+        return _raw_dst(x0, type, n, axis, nm, overwrite_x, workers)
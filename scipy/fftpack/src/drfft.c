@@ -32,14 +32,18 @@ GEN_CACHE(rfft, (int n)
 	  , free(caches_rfft[id].wsave);
 	  , 10)
 
-void drfft(double *inout, int n, int direction, int howmany,
-			  int normalize)
+GEN_CACHE_PIN(drfft)
+GEN_CACHE_PIN(rfft)
+
+/*
+  Transforms with the work array wsave, which the callers get from the
+  cache.  zrfft uses these for its rows.
+ */
+void drfft_work(double *inout, int n, int direction, int howmany,
+		 int normalize, double *wsave)
 {
     int i;
     double *ptr = inout;
-    double *wsave = NULL;
-    wsave = caches_drfft[get_cache_id_drfft(n)].wsave;
-
 
     switch (direction) {
         case 1:
@@ -67,14 +71,11 @@ void drfft(double *inout, int n, int direction, int howmany,
     }
 }
 
-void rfft(float *inout, int n, int direction, int howmany,
-			 int normalize)
+void rfft_work(float *inout, int n, int direction, int howmany,
+		 int normalize, float *wsave)
 {
     int i;
     float *ptr = inout;
-    float *wsave = NULL;
-    wsave = caches_rfft[get_cache_id_rfft(n)].wsave;
-
 
     switch (direction) {
         case 1:
@@ -101,3 +102,46 @@ void rfft(float *inout, int n, int direction, int howmany,
         }
     }
 }
+
+/* The cached work arrays, only valid while the GIL is held. */
+double *drfft_cached_wsave(int n)
+{
+    int cache_id = get_cache_id_drfft(n);
+
+    return caches_drfft[cache_id].wsave;
+}
+
+float *rfft_cached_wsave(int n)
+{
+    int cache_id = get_cache_id_rfft(n);
+
+    return caches_rfft[cache_id].wsave;
+}
+
+void drfft(double *inout, int n, int direction, int howmany,
+			  int normalize)
+{
+    int cache_id;
+    double *wsave = NULL;
+
+    cache_id = get_cache_id_drfft(n);
+
+    FFTPACK_BEGIN_NOGIL(wsave, caches_drfft[cache_id].wsave,
+                        sizeof(double) * (2 * n + 15))
+    drfft_work(inout, n, direction, howmany, normalize, wsave);
+    FFTPACK_END_NOGIL(wsave)
+}
+
+void rfft(float *inout, int n, int direction, int howmany,
+			 int normalize)
+{
+    int cache_id;
+    float *wsave = NULL;
+
+    cache_id = get_cache_id_rfft(n);
+
+    FFTPACK_BEGIN_NOGIL(wsave, caches_rfft[cache_id].wsave,
+                        sizeof(float) * (2 * n + 15))
+    rfft_work(inout, n, direction, howmany, normalize, wsave);
+    FFTPACK_END_NOGIL(wsave)
+}
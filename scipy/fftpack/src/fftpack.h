@@ -6,6 +6,7 @@
 #ifndef FFTPACK_H
 #define FFTPACK_H
 
+#include <Python.h>
 #include <stdlib.h>
 #include <stdio.h>
 #include <string.h>
@@ -40,37 +41,87 @@ extern int ispow2le2e13(int n);
 #endif
 
 /*
-  Simple cyclic cache.
+  Least recently used (LRU) cache of the work arrays (twiddle factors) of
+  the transforms.
+
+  The number of cached work arrays can be changed at run time with
+  set_<name>_cache_size, and the usage is reported by get_<name>_cache_info.
+  Entries can be pinned (by caches keyed on the transform length only, see
+  GEN_CACHE_PIN) so that they are never evicted.  A full cache whose entries
+  are all pinned grows beyond its size instead of evicting.
+
+  These functions are only called with the GIL held, which serializes the
+  accesses to the caches (see also FFTPACK_BEGIN_NOGIL).
  */
+typedef long long cache_count_t;
+
 #define GEN_CACHE(name,CACHEARG,CACHETYPE,CHECK,MALLOC,FREE,CACHESIZE) \
 typedef struct {\
   int n;\
+  int pinned;\
+  cache_count_t last_used;\
   CACHETYPE \
 } cache_type_##name;\
-static cache_type_##name caches_##name[CACHESIZE];\
+static cache_type_##name *caches_##name = NULL;\
 static int nof_in_cache_##name = 0;\
-static int last_cache_id_##name = 0;\
+static int nof_allocated_##name = 0;\
+static int max_cache_size_##name = CACHESIZE;\
+static cache_count_t clock_##name = 0;\
+static cache_count_t hits_##name = 0;\
+static cache_count_t misses_##name = 0;\
+static int grow_cache_##name(void) {\
+  int nof = (nof_allocated_##name > 0) ? 2*nof_allocated_##name : CACHESIZE;\
+  cache_type_##name *tmp = (cache_type_##name *)realloc(caches_##name,\
+                                            nof*sizeof(cache_type_##name));\
+  if (tmp == NULL) {\
+    fprintf(stderr, "fftpack: out of memory growing the " #name " cache\n");\
+    abort();\
+  }\
+  caches_##name = tmp;\
+  nof_allocated_##name = nof;\
+  return 0;\
+}\
+static int lru_cache_id_##name(void) {\
+  int i, id = -1;\
+  for (i=0;i<nof_in_cache_##name;i++) \
+    if (!caches_##name[i].pinned && (id < 0 || \
+        caches_##name[i].last_used < caches_##name[id].last_used)) \
+      id = i;\
+  return id;\
+}\
+static void evict_cache_id_##name(int id) {\
+  int last = --nof_in_cache_##name;\
+  FREE \
+  if (id != last) caches_##name[id] = caches_##name[last];\
+  caches_##name[last].n = 0;\
+}\
 static int get_cache_id_##name CACHEARG { \
   int i,id = -1; \
+  ++clock_##name;\
   for (i=0;i<nof_in_cache_##name;i++) \
     if (CHECK) { \
       id=i; \
       break; \
     } \
-  if (id>=0) goto exit;\
-  if (nof_in_cache_##name<CACHESIZE) {\
-    id = nof_in_cache_##name++;\
-  } else {\
-    id = (last_cache_id_##name<CACHESIZE-1)?last_cache_id_##name+1:0;\
+  if (id>=0) {\
+    ++hits_##name;\
+    goto exit;\
+  }\
+  ++misses_##name;\
+  while (nof_in_cache_##name>=max_cache_size_##name) {\
+    id = lru_cache_id_##name();\
+    if (id < 0) break;\
     /*fprintf(stderr,"Removing cache item n=%d\n",caches_##name[id].n);*/\
-    FREE \
-    caches_##name[id].n = 0;\
+    evict_cache_id_##name(id);\
   }\
+  if (nof_in_cache_##name>=nof_allocated_##name) grow_cache_##name();\
+  id = nof_in_cache_##name++;\
   /*fprintf(stderr,"New cache item n=%d\n",n);*/\
   caches_##name[id].n = n;\
+  caches_##name[id].pinned = 0;\
   MALLOC \
  exit:\
-  last_cache_id_##name = id;\
+  caches_##name[id].last_used = clock_##name;\
   return id;\
 }\
 void destroy_##name##_cache(void) {\
@@ -79,7 +130,80 @@ void destroy_##name##_cache(void) {\
     FREE \
     caches_##name[id].n = 0;\
   }\
-  nof_in_cache_##name = last_cache_id_##name = 0;\
+  free(caches_##name);\
+  caches_##name = NULL;\
+  nof_in_cache_##name = nof_allocated_##name = 0;\
+  clock_##name = hits_##name = misses_##name = 0;\
+}\
+void set_##name##_cache_size(int size) {\
+  int id;\
+  max_cache_size_##name = (size > 1) ? size : 1;\
+  while (nof_in_cache_##name > max_cache_size_##name) {\
+    id = lru_cache_id_##name();\
+    if (id < 0) break;\
+    evict_cache_id_##name(id);\
+  }\
+}\
+void get_##name##_cache_info(cache_count_t *info) {\
+  info[0] = hits_##name;\
+  info[1] = misses_##name;\
+  info[2] = nof_in_cache_##name;\
+  info[3] = max_cache_size_##name;\
+}
+
+/*
+  Pinning of the entries of a cache generated by GEN_CACHE whose entries are
+  keyed by the transform length n only.  pin=1 creates the entry if needed
+  and protects it from eviction, pin=0 undoes one pin=1 call.
+ */
+#define GEN_CACHE_PIN(name) \
+void pin_##name##_cache(int n, int pin) {\
+  int i;\
+  if (pin) {\
+    /* get_cache_id may reallocate caches_##name */\
+    i = get_cache_id_##name(n);\
+    caches_##name[i].pinned++;\
+    return;\
+  }\
+  for (i=0;i<nof_in_cache_##name;i++) \
+    if (caches_##name[i].n == n && caches_##name[i].pinned > 0) {\
+      caches_##name[i].pinned--;\
+      break;\
+    }\
 }
 
+/*
+  Release the GIL around the loops of a transform, so that other threads can
+  transform other parts of an array at the same time.
+
+  FFTPACK uses the start of its work array as scratch space, and another
+  thread may evict the cache entry while the GIL is released, so the
+  transform works on a private copy of the cached work array, made while
+  the GIL is still held.  If the copy cannot be allocated, the transform
+  keeps the GIL and uses the cached work array.  Usage:
+
+      FFTPACK_BEGIN_NOGIL(wsave, caches_<name>[cache_id].wsave, size)
+      ... loops using wsave, no Python API calls ...
+      FFTPACK_END_NOGIL(wsave)
+ */
+#define FFTPACK_BEGIN_NOGIL(wsave, cached, size) \
+  { \
+    PyThreadState *_fftpack_save = NULL; \
+    int _fftpack_copied = 0; \
+    wsave = malloc(size); \
+    if (wsave == NULL) { \
+      wsave = cached; \
+    } else { \
+      memcpy(wsave, cached, size); \
+      _fftpack_copied = 1; \
+      _fftpack_save = PyEval_SaveThread(); \
+    }
+
+#define FFTPACK_END_NOGIL(wsave) \
+    if (_fftpack_copied) { \
+      PyEval_RestoreThread(_fftpack_save); \
+      free(wsave); \
+    } \
+  }
+
 #endif
@@ -29,14 +29,18 @@ GEN_CACHE(cfft,(int n)
 	  ,free(caches_cfft[id].wsave);
 	  ,10)
 
-void zfft(complex_double * inout, int n, int direction, int howmany,
-		int normalize)
+GEN_CACHE_PIN(zfft)
+GEN_CACHE_PIN(cfft)
+
+/*
+  Transforms with the work array wsave, which the callers get from the
+  cache.  zfftnd uses these with the GIL held.
+ */
+void zfft_work(complex_double * inout, int n, int direction, int howmany,
+		int normalize, double *wsave)
 {
 	int i;
 	complex_double *ptr = inout;
-	double *wsave = NULL;
-
-	wsave = caches_zfft[get_cache_id_zfft(n)].wsave;
 
 	switch (direction) {
 	case 1:
@@ -64,14 +68,11 @@ void zfft(complex_double * inout, int n, int direction, int howmany,
 	}
 }
 
-void cfft(complex_float * inout, int n, int direction, int howmany,
-	int normalize)
+void cfft_work(complex_float * inout, int n, int direction, int howmany,
+	int normalize, float *wsave)
 {
 	int i;
 	complex_float *ptr = inout;
-	float *wsave = NULL;
-
-	wsave = caches_cfft[get_cache_id_cfft(n)].wsave;
 
 	switch (direction) {
 	case 1:
@@ -99,3 +100,46 @@ void cfft(complex_float * inout, int n, int direction, int howmany,
 		}
 	}
 }
+
+/* The cached work arrays, only valid while the GIL is held. */
+double *zfft_cached_wsave(int n)
+{
+	int cache_id = get_cache_id_zfft(n);
+
+	return caches_zfft[cache_id].wsave;
+}
+
+float *cfft_cached_wsave(int n)
+{
+	int cache_id = get_cache_id_cfft(n);
+
+	return caches_cfft[cache_id].wsave;
+}
+
+void zfft(complex_double * inout, int n, int direction, int howmany,
+		int normalize)
+{
+	int cache_id;
+	double *wsave = NULL;
+
+	cache_id = get_cache_id_zfft(n);
+
+	FFTPACK_BEGIN_NOGIL(wsave, caches_zfft[cache_id].wsave,
+			sizeof(double) * (4 * n + 15))
+	zfft_work(inout, n, direction, howmany, normalize, wsave);
+	FFTPACK_END_NOGIL(wsave)
+}
+
+void cfft(complex_float * inout, int n, int direction, int howmany,
+	int normalize)
+{
+	int cache_id;
+	float *wsave = NULL;
+
+	cache_id = get_cache_id_cfft(n);
+
+	FFTPACK_BEGIN_NOGIL(wsave, caches_cfft[cache_id].wsave,
+			sizeof(float) * (4 * n + 15))
+	cfft_work(inout, n, direction, howmany, normalize, wsave);
+	FFTPACK_END_NOGIL(wsave)
+}
@@ -10,6 +10,7 @@ GEN_CACHE(zfftnd, (int n, int rank)
 	  , ((caches_zfftnd[i].n == n)
 	     && (caches_zfftnd[i].rank == rank))
 	  , caches_zfftnd[id].n = n;
+	  caches_zfftnd[id].rank = rank;
 	  caches_zfftnd[id].ptr =
 	  (complex_double *) malloc(2 * sizeof(double) * n);
 	  caches_zfftnd[id].iptr =
@@ -24,6 +25,7 @@ GEN_CACHE(cfftnd, (int n, int rank)
 	  , ((caches_cfftnd[i].n == n)
 	     && (caches_cfftnd[i].rank == rank))
 	  , caches_cfftnd[id].n = n;
+	  caches_cfftnd[id].rank = rank;
 	  caches_cfftnd[id].ptr =
 	  (complex_float *) malloc(2 * sizeof(float) * n);
 	  caches_cfftnd[id].iptr =
@@ -121,11 +123,17 @@ void sflatten(complex_float * dest, complex_float * src,
     }
 }
 
-extern void cfft(complex_float * inout,
-		 int n, int direction, int howmany, int normalize);
+/*
+  The n-d transforms keep the GIL, as they use the scratch arrays of their
+  cache entries, so they call the 1-d transforms with the cached work arrays.
+ */
+extern void cfft_work(complex_float * inout, int n, int direction,
+		      int howmany, int normalize, float *wsave);
+extern float *cfft_cached_wsave(int n);
 
-extern void zfft(complex_double * inout,
-		 int n, int direction, int howmany, int normalize);
+extern void zfft_work(complex_double * inout, int n, int direction,
+		      int howmany, int normalize, double *wsave);
+extern double *zfft_cached_wsave(int n);
 
 extern void zfftnd(complex_double * inout, int rank,
 			   int *dims, int direction, int howmany,
@@ -142,8 +150,8 @@ extern void zfftnd(complex_double * inout, int rank,
     for (i = 0; i < rank; ++i) {
         sz *= dims[i];
     }
-    zfft(ptr, dims[rank - 1], direction, howmany * sz / dims[rank - 1],
-	 normalize);
+    zfft_work(ptr, dims[rank - 1], direction, howmany * sz / dims[rank - 1],
+	      normalize, zfft_cached_wsave(dims[rank - 1]));
 
     i = get_cache_id_zfftnd(sz, rank);
     tmp = caches_zfftnd[i].ptr;
@@ -163,7 +171,8 @@ extern void zfftnd(complex_double * inout, int rank,
                 }
             }
             flatten(tmp, ptr, rank, itmp[axis], dims[axis], 0, itmp);
-            zfft(tmp, dims[axis], direction, sz / dims[axis], normalize);
+            zfft_work(tmp, dims[axis], direction, sz / dims[axis],
+                      normalize, zfft_cached_wsave(dims[axis]));
             flatten(ptr, tmp, rank, itmp[axis], dims[axis], 1, itmp);
         }
     }
@@ -185,8 +194,8 @@ extern void cfftnd(complex_float * inout, int rank,
     for (i = 0; i < rank; ++i) {
         sz *= dims[i];
     }
-    cfft(ptr, dims[rank - 1], direction, howmany * sz / dims[rank - 1],
-	 normalize);
+    cfft_work(ptr, dims[rank - 1], direction, howmany * sz / dims[rank - 1],
+	      normalize, cfft_cached_wsave(dims[rank - 1]));
 
     i = get_cache_id_cfftnd(sz, rank);
     tmp = caches_cfftnd[i].ptr;
@@ -206,7 +215,8 @@ extern void cfftnd(complex_float * inout, int rank,
                 }
             }
             sflatten(tmp, ptr, rank, itmp[axis], dims[axis], 0, itmp);
-            cfft(tmp, dims[axis], direction, sz / dims[axis], normalize);
+            cfft_work(tmp, dims[axis], direction, sz / dims[axis],
+                      normalize, cfft_cached_wsave(dims[axis]));
             sflatten(ptr, tmp, rank, itmp[axis], dims[axis], 1, itmp);
         }
     }
@@ -6,20 +6,27 @@
 
 #include "fftpack.h"
 
-extern void drfft(double *inout,int n,int direction,int howmany,int normalize);
-extern void rfft(float *inout,int n,int direction,int howmany,int normalize);
+extern void drfft_work(double *inout,int n,int direction,int howmany,
+		       int normalize,double *wsave);
+extern double *drfft_cached_wsave(int n);
+extern void rfft_work(float *inout,int n,int direction,int howmany,
+		      int normalize,float *wsave);
+extern float *rfft_cached_wsave(int n);
 
 extern void zrfft(complex_double *inout,
 		  int n,int direction,int howmany,int normalize) {
   int i,j,k;
   double* ptr = (double *)inout;
+  double* wsave = NULL;
+  double* cached = drfft_cached_wsave(n);
+  FFTPACK_BEGIN_NOGIL(wsave,cached,sizeof(double)*(2*n+15))
   switch (direction) {
     case 1:
       for (i=0;i<howmany;++i,ptr+=2*n) {
 	*(ptr+1) = *ptr;
 	for(j=2,k=3;j<n;++j,++k)
 	  *(ptr+k) = *(ptr+2*j);
-	drfft(ptr+1,n,1,1,normalize);
+	drfft_work(ptr+1,n,1,1,normalize,wsave);
 	*ptr = *(ptr+1);
 	*(ptr+1) = 0.0;
 	if (!(n%2))
@@ -35,7 +42,7 @@ extern void zrfft(complex_double *inout,
       *(ptr+1) = (*ptr);
       for(j=1,k=2;j<n;++j,++k)
 	*(ptr+k) = (*(ptr+2*j));
-      drfft(ptr+1,n,1,1,normalize);
+      drfft_work(ptr+1,n,1,1,normalize,wsave);
       *ptr = *(ptr+1);
       *(ptr+1) = 0.0;
       if (!(n%2))
@@ -52,19 +59,23 @@ extern void zrfft(complex_double *inout,
   default:
     fprintf(stderr,"zrfft: invalid direction=%d\n",direction);
   }
+  FFTPACK_END_NOGIL(wsave)
 }
 
 extern void crfft(complex_float *inout,
 		  int n,int direction,int howmany,int normalize) {
   int i,j,k;
   float* ptr = (float *)inout;
+  float* wsave = NULL;
+  float* cached = rfft_cached_wsave(n);
+  FFTPACK_BEGIN_NOGIL(wsave,cached,sizeof(float)*(2*n+15))
   switch (direction) {
     case 1:
       for (i=0;i<howmany;++i,ptr+=2*n) {
 	*(ptr+1) = *ptr;
 	for(j=2,k=3;j<n;++j,++k)
 	  *(ptr+k) = *(ptr+2*j);
-	rfft(ptr+1,n,1,1,normalize);
+	rfft_work(ptr+1,n,1,1,normalize,wsave);
 	*ptr = *(ptr+1);
 	*(ptr+1) = 0.0;
 	if (!(n%2))
@@ -80,7 +91,7 @@ extern void crfft(complex_float *inout,
       *(ptr+1) = (*ptr);
       for(j=1,k=2;j<n;++j,++k)
 	*(ptr+k) = (*(ptr+2*j));
-      rfft(ptr+1,n,1,1,normalize);
+      rfft_work(ptr+1,n,1,1,normalize,wsave);
       *ptr = *(ptr+1);
       *(ptr+1) = 0.0;
       if (!(n%2))
@@ -97,4 +108,5 @@ extern void crfft(complex_float *inout,
   default:
     fprintf(stderr,"crfft: invalid direction=%d\n",direction);
   }
+  FFTPACK_END_NOGIL(wsave)
 }
@@ -912,3 +912,80 @@ class TestOverwrite(object):
         for dtype in self.dtypes:
             self._check_nd(ifftn, dtype, overwritable)
 
+
+class TestWorkers(object):
+
+    def setup_method(self):
+        np.random.seed(1234)
+
+    @pytest.mark.parametrize('func', [fft, ifft, rfft, irfft])
+    @pytest.mark.parametrize('dtype', [np.float32, np.float64])
+    @pytest.mark.parametrize('axis', [0, 1, -1])
+    def test_1d(self, func, dtype, axis):
+        x = np.random.randn(33, 16, 10).astype(dtype)
+        expected = func(x, axis=axis)
+        for workers in [2, 4, -1]:
+            y = func(x, axis=axis, workers=workers)
+            assert_equal(y.dtype, expected.dtype)
+            assert_array_almost_equal(y, expected)
+
+    @pytest.mark.parametrize('func', [fft, ifft])
+    def test_complex(self, func):
+        x = np.random.randn(50, 24) + 1j*np.random.randn(50, 24)
+        for axis in [0, 1]:
+            assert_array_almost_equal(func(x, axis=axis, workers=3),
+                                      func(x, axis=axis))
+
+    def test_nonlast_axis(self):
+        # the batched transforms along axis 0 match the transforms of the
+        # contiguous transposed array
+        x = np.random.randn(64, 300)
+        for workers in [1, 3]:
+            y = fft(x, n=48, axis=0, workers=workers)
+            assert_array_almost_equal(y, fft(x[:48].T.copy()).T)
+
+    @pytest.mark.parametrize('func', [fftn, ifftn])
+    def test_nd(self, func):
+        x = np.random.randn(6, 10, 12) + 1j*np.random.randn(6, 10, 12)
+        ref = {fftn: np.fft.fftn, ifftn: np.fft.ifftn}[func]
+        assert_array_almost_equal(func(x, workers=2), ref(x))
+        assert_array_almost_equal(func(x, shape=(8, 5), axes=(2, 0),
+                                       workers=2),
+                                  ref(x, s=(8, 5), axes=(2, 0)))
+        assert_array_almost_equal(fft2(x.real, workers=2), np.fft.fft2(x.real))
+
+    def test_overwrite(self):
+        x = np.random.randn(40, 16) + 1j*np.random.randn(40, 16)
+        x0 = x.copy()
+        fft(x, workers=4)
+        fft(x, axis=0, workers=4, overwrite_x=True)
+        assert_equal(x, x0)
+
+    def test_threads(self):
+        # concurrent transforms of many sizes, which evict each other from
+        # the plan caches
+        import threading
+        data = [np.random.randn(20, n) for n in range(30, 60)]
+        expected = [rfft(x) for x in data]
+        errors = []
+
+        def worker():
+            try:
+                for x, y in zip(data, expected):
+                    assert_array_almost_equal(rfft(x, workers=2), y)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert_equal(errors, [])
+
+    def test_invalid(self):
+        x = np.ones(16)
+        for workers in [0, -2]:
+            assert_raises(ValueError, fft, x, workers=workers)
+            assert_raises(ValueError, fftn, x, workers=workers)
+        assert_raises(TypeError, fft, x, workers=1.5)
@@ -13,9 +13,14 @@ Run tests if fftpack is not installed:
 
 from numpy.testing import (assert_array_almost_equal,
                            assert_equal, assert_)
+from pytest import raises as assert_raises
 from scipy.fftpack import fftshift,ifftshift,fftfreq,rfftfreq
+from scipy.fftpack import fft, rfft
+from scipy.fftpack import (plan_cache_info, set_plan_cache_size,
+                           clear_plan_cache, pinned_plans)
 from scipy.fftpack.helper import next_fast_len
 
+import numpy as np
 from numpy import pi, random
 
 
@@ -159,3 +164,76 @@ class TestNextOptLen(object):
         for x, y in hams.items():
             assert_equal(next_fast_len(x), y)
 
+
+class TestPlanCache(object):
+
+    def setup_method(self):
+        self.old_info = plan_cache_info()
+        clear_plan_cache()
+
+    def teardown_method(self):
+        for name, info in self.old_info.items():
+            set_plan_cache_size(info.maxsize, name)
+        clear_plan_cache()
+
+    def test_hits_misses(self):
+        for n in [16, 32, 16, 16]:
+            fft(np.ones(n, dtype=complex))
+        info = plan_cache_info('zfft')['zfft']
+        assert_equal(info.hits, 2)
+        assert_equal(info.misses, 2)
+        assert_equal(info.currsize, 2)
+
+        # real input goes through the drfft cache
+        rfft(np.ones(16))
+        assert_equal(plan_cache_info('drfft')['drfft'].misses, 1)
+
+        clear_plan_cache('zfft')
+        assert_equal(plan_cache_info('zfft')['zfft'][:2], (0, 0))
+        assert_equal(plan_cache_info('zfft')['zfft'].currsize, 0)
+
+        assert_raises(ValueError, plan_cache_info, 'rubbish')
+
+    def test_lru_eviction(self):
+        set_plan_cache_size(2, 'zfft')
+        x = np.arange(7.) + 1j
+
+        for n in [5, 6, 5, 7, 5]:
+            # results are unaffected by evictions
+            assert_array_almost_equal(fft(x[:n]), np.fft.fft(x[:n]))
+
+        # 7 evicted the least recently used plan (6), so 5 is still cached
+        info = plan_cache_info('zfft')['zfft']
+        assert_equal((info.hits, info.misses), (2, 3))
+        assert_equal((info.maxsize, info.currsize), (2, 2))
+
+        # shrinking the cache evicts plans
+        set_plan_cache_size(1, 'zfft')
+        assert_equal(plan_cache_info('zfft')['zfft'].currsize, 1)
+        assert_raises(ValueError, set_plan_cache_size, 0)
+
+    def test_pinned_plans(self):
+        set_plan_cache_size(1, ['zfft', 'drfft'])
+        with pinned_plans([8, 9]):
+            info = plan_cache_info('zfft')['zfft']
+            assert_equal((info.misses, info.currsize), (2, 2))
+
+            for n in [10, 11, 8, 9]:
+                fft(np.ones(n, dtype=complex))
+
+            # 8 and 9 survived the other sizes, which evicted each other
+            info = plan_cache_info('zfft')['zfft']
+            assert_equal((info.hits, info.misses), (2, 4))
+            assert_equal(info.currsize, 3)
+
+            # pins nest
+            with pinned_plans(8, kind='zfft'):
+                pass
+            fft(np.ones(12, dtype=complex))
+            assert_equal(plan_cache_info('zfft')['zfft'].currsize, 3)
+
+        # once unpinned, the plans are evicted again
+        fft(np.ones(13, dtype=complex))
+        assert_equal(plan_cache_info('zfft')['zfft'].currsize, 1)
+
+        assert_raises(ValueError, pinned_plans([8], kind='zfftnd').__enter__)
@@ -4,6 +4,7 @@ from os.path import join, dirname
 
 import numpy as np
 from numpy.testing import assert_array_almost_equal, assert_equal
+import pytest
 from pytest import raises as assert_raises
 
 from scipy.fftpack.realtransforms import (
@@ -651,3 +652,25 @@ class Test_DCTN_IDCTN(object):
             # non-default shape
             tmp = fforward(self.data, shape=(128, 128), axes=None)
             assert_equal(tmp.shape, (128, 128))
+
+
+@pytest.mark.parametrize('func', [dct, idct, dst, idst])
+@pytest.mark.parametrize('type', [1, 2, 3])
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, np.complex128])
+def test_workers(func, type, dtype):
+    np.random.seed(1234)
+    x = np.random.randn(17, 12, 9).astype(dtype)
+    for axis in [0, 1, 2]:
+        expected = func(x, type=type, axis=axis)
+        y = func(x, type=type, axis=axis, workers=3)
+        assert_equal(y.dtype, expected.dtype)
+        assert_array_almost_equal(y, expected, decimal=4)
+
+
+@pytest.mark.parametrize('func', [dctn, idctn, dstn, idstn])
+def test_workers_nd(func):
+    np.random.seed(1234)
+    x = np.random.randn(10, 12, 6)
+    assert_array_almost_equal(func(x, norm='ortho', workers=2),
+                              func(x, norm='ortho'))
+    assert_raises(ValueError, func, x, workers=0)
@@ -18,6 +18,7 @@ Local Optimization
    minimize_scalar - Unified interface for minimizers of univariate functions
    OptimizeResult - The optimization result returned by some optimizers
    OptimizeWarning - The optimization encountered problems
+   EvaluationCache - Cache of the values of an objective function
 
 The `minimize` function supports the following methods:
 
@@ -119,6 +120,7 @@ Fitting
    :toctree: generated/
 
    curve_fit -- Fit curve to a set of points
+   curve_fit_batch -- Fit curves to many sets of points at once
 
 Root finding
 ============
@@ -6,7 +6,8 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 from scipy.optimize import OptimizeResult, minimize
 from scipy.optimize.optimize import _status_message
-from scipy._lib._util import check_random_state
+from scipy._lib._util import (check_random_state, MapWrapper,
+                              _FunctionWrapper)
 from scipy._lib.six import xrange
 import warnings
 
@@ -20,7 +21,8 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
                            maxiter=1000, popsize=15, tol=0.01,
                            mutation=(0.5, 1), recombination=0.7, seed=None,
                            callback=None, disp=False, polish=True,
-                           init='latinhypercube', atol=0):
+                           init='latinhypercube', atol=0, updating='immediate',
+                           workers=1, vectorized=False):
     """Finds the global minimum of a multivariate function.
     Differential Evolution is stochastic in nature (does not use gradient
     methods) to find the minimium, and can search large areas of candidate
@@ -124,6 +126,32 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
         ``np.std(pop) <= atol + tol * np.abs(np.mean(population_energies))``,
         where and `atol` and `tol` are the absolute and relative tolerance
         respectively.
+    updating : {'immediate', 'deferred'}, optional
+        If ``'immediate'``, the best solution vector is continuously updated
+        within a single generation. This can lead to faster convergence as
+        trial vectors can take advantage of continuous improvements in the best
+        solution.
+        With ``'deferred'``, the best solution vector is updated once per
+        generation. Only ``'deferred'`` is compatible with parallelization, and
+        the `workers` and `vectorized` keywords can over-ride this option.
+    workers : int or map-like callable, optional
+        If `workers` is an int the population is subdivided into `workers`
+        sections and evaluated in parallel (uses `multiprocessing.Pool`).
+        Supply -1 to use all available CPU cores.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map` for evaluating the population in parallel.
+        This evaluation is carried out as ``workers(func, iterable)``.
+        This option will override the `updating` keyword to
+        ``updating='deferred'`` if ``workers != 1``.
+        Requires that `func` be pickleable.
+    vectorized : bool, optional
+        If ``vectorized is True``, `func` is sent an `x` array with
+        ``x.shape == (len(x), S)``, and is expected to return an array of
+        shape ``(S,)``, where `S` is the number of solution vectors to be
+        calculated. This option will override the `updating` keyword to
+        ``updating='deferred'``, and takes precedence over `workers`.
+        If `polish` is True the polishing step also calls `func` with arrays
+        of shape ``(len(x), 1)``.
 
     Returns
     -------
@@ -167,6 +195,16 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
     values, with higher `mutation` and (dithering), but lower `recombination`
     values. This has the effect of widening the search radius, but slowing
     convergence.
+    By default the best solution vector is updated continuously within a single
+    iteration (``updating='immediate'``). This is a modification [4]_ of the
+    original differential evolution algorithm which can lead to faster
+    convergence as trial vectors can immediately benefit from improved
+    solutions. To use the original Storn and Price behaviour, updating the best
+    solution once per iteration, set ``updating='deferred'``.
+    The ``'deferred'`` approach is compatible with both parallelization and
+    vectorization (``'workers'`` and ``'vectorized'`` keywords). For a given
+    `seed` the ``'deferred'`` results do not depend on how the population is
+    evaluated, so serial, parallel and vectorized runs give identical answers.
 
     .. versionadded:: 0.15.0
 
@@ -202,17 +240,27 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
            Journal of Global Optimization, 1997, 11, 341 - 359.
     .. [2] http://www1.icsi.berkeley.edu/~storn/code.html
     .. [3] http://en.wikipedia.org/wiki/Differential_evolution
+    .. [4] Wormington, M., Panaccione, C., Matney, K. M., Bowen, D. K., -
+           Characterization of structures from X-ray scattering data using
+           genetic algorithms, Phil. Trans. R. Soc. Lond. A, 1999, 357,
+           2827-2848
     """
 
-    solver = DifferentialEvolutionSolver(func, bounds, args=args,
-                                         strategy=strategy, maxiter=maxiter,
-                                         popsize=popsize, tol=tol,
-                                         mutation=mutation,
-                                         recombination=recombination,
-                                         seed=seed, polish=polish,
-                                         callback=callback,
-                                         disp=disp, init=init, atol=atol)
-    return solver.solve()
+    # using a context manager means that any created Pool objects are
+    # cleared up.
+    with DifferentialEvolutionSolver(func, bounds, args=args,
+                                     strategy=strategy, maxiter=maxiter,
+                                     popsize=popsize, tol=tol,
+                                     mutation=mutation,
+                                     recombination=recombination,
+                                     seed=seed, polish=polish,
+                                     callback=callback,
+                                     disp=disp, init=init, atol=atol,
+                                     updating=updating, workers=workers,
+                                     vectorized=vectorized) as solver:
+        ret = solver.solve()
+
+    return ret
 
 
 class DifferentialEvolutionSolver(object):
@@ -314,6 +362,32 @@ class DifferentialEvolutionSolver(object):
         ``np.std(pop) <= atol + tol * np.abs(np.mean(population_energies))``,
         where and `atol` and `tol` are the absolute and relative tolerance
         respectively.
+    updating : {'immediate', 'deferred'}, optional
+        If ``'immediate'``, the best solution vector is continuously updated
+        within a single generation. This can lead to faster convergence as
+        trial vectors can take advantage of continuous improvements in the best
+        solution.
+        With ``'deferred'``, the best solution vector is updated once per
+        generation. Only ``'deferred'`` is compatible with parallelization, and
+        the `workers` and `vectorized` keywords can over-ride this option.
+    workers : int or map-like callable, optional
+        If `workers` is an int the population is subdivided into `workers`
+        sections and evaluated in parallel (uses `multiprocessing.Pool`).
+        Supply -1 to use all available CPU cores.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map` for evaluating the population in parallel.
+        This evaluation is carried out as ``workers(func, iterable)``.
+        This option will override the `updating` keyword to
+        ``updating='deferred'`` if ``workers != 1``.
+        Requires that `func` be pickleable.
+    vectorized : bool, optional
+        If ``vectorized is True``, `func` is sent an `x` array with
+        ``x.shape == (len(x), S)``, and is expected to return an array of
+        shape ``(S,)``, where `S` is the number of solution vectors to be
+        calculated. This option will override the `updating` keyword to
+        ``updating='deferred'``, and takes precedence over `workers`.
+        If `polish` is True the polishing step also calls `func` with arrays
+        of shape ``(len(x), 1)``.
     """
 
     # Dispatch of mutation strategy method (binomial or exponential).
@@ -330,11 +404,14 @@ class DifferentialEvolutionSolver(object):
                     'best2exp': '_best2',
                     'rand2exp': '_rand2'}
 
+    _updating_modes = ['immediate', 'deferred']
+
     def __init__(self, func, bounds, args=(),
                  strategy='best1bin', maxiter=1000, popsize=15,
                  tol=0.01, mutation=(0.5, 1), recombination=0.7, seed=None,
                  maxfun=np.inf, callback=None, disp=False, polish=True,
-                 init='latinhypercube', atol=0):
+                 init='latinhypercube', atol=0, updating='immediate',
+                 workers=1, vectorized=False):
 
         if strategy in self._binomial:
             self.mutation_func = getattr(self, self._binomial[strategy])
@@ -369,6 +446,30 @@ class DifferentialEvolutionSolver(object):
 
         self.func = func
         self.args = args
+        # a picklable ``f(x)`` closure over `args`, for use with `workers`.
+        self._wrapped_func = _FunctionWrapper(func, args)
+
+        if updating not in self._updating_modes:
+            raise ValueError("updating should be one of %s"
+                             % self._updating_modes)
+        self._updating = updating
+
+        # vectorized evaluation supersedes any request for workers
+        if vectorized and workers != 1:
+            warnings.warn("differential_evolution: the 'vectorized' keyword"
+                          " has overridden workers=%r to workers=1" % workers,
+                          UserWarning)
+            workers = 1
+        self.vectorized = vectorized
+
+        # the population is evaluated in one batch per generation when it is
+        # parallelized or vectorized, which requires deferred updating.
+        if (workers != 1 or vectorized) and updating == 'immediate':
+            warnings.warn("differential_evolution: the 'workers' or"
+                          " 'vectorized' keyword has overridden"
+                          " updating='immediate' to updating='deferred'",
+                          UserWarning)
+            self._updating = 'deferred'
 
         # convert tuple of lower and upper bounds to limits
         # [(low_0, high_0), ..., (low_n, high_n]
@@ -416,6 +517,11 @@ class DifferentialEvolutionSolver(object):
 
         self.disp = disp
 
+        # an object with a map method. It is created once the arguments are
+        # validated, so that a pool of processes isn't left behind by an
+        # error above.
+        self._mapwrapper = MapWrapper(workers)
+
     def init_population_lhs(self):
         """
         Initializes the population with Latin Hypercube Sampling.
@@ -562,7 +668,10 @@ class DifferentialEvolutionSolver(object):
             success=(warning_flag is not True))
 
         if self.polish:
-            result = minimize(self.func,
+            polish_func = self.func
+            if self.vectorized:
+                polish_func = _VectorizedScalarFunction(self.func)
+            result = minimize(polish_func,
                               np.copy(DE_result.x),
                               method='L-BFGS-B',
                               bounds=self.limits.T,
@@ -587,15 +696,63 @@ class DifferentialEvolutionSolver(object):
         Puts the best member in first place. Useful if the population has just
         been initialised.
         """
-        for index, candidate in enumerate(self.population):
-            if self._nfev > self.maxfun:
-                break
+        self.population_energies = self._evaluate_population(self.population)
+        self._promote_lowest_energy()
 
-            parameters = self._scale_parameters(candidate)
-            self.population_energies[index] = self.func(parameters,
-                                                        *self.args)
-            self._nfev += 1
+    def _evaluate_population(self, population):
+        """
+        Calculate the energies of a population in one batch, using the map-like
+        callable given by `workers`, or a single call of a vectorized `func`.
+
+        Parameters
+        ----------
+        population : ndarray
+            An array of parameter vectors normalised to [0, 1] using lower
+            and upper limits. Has shape ``(np.size(population, 0), len(x))``.
+
+        Returns
+        -------
+        energies : ndarray
+            An array of energies corresponding to each population member. If
+            maxfun would be exceeded during this call, then the number of
+            function evaluations is reduced and the energies of the members
+            that were not evaluated are set to ``np.inf``.
+            Has shape ``(np.size(population, 0),)``.
+        """
+        num_members = np.size(population, 0)
+
+        # the solver stops once _nfev exceeds maxfun, so no more than
+        # ``maxfun - _nfev + 1`` evaluations are carried out.
+        nfevs = int(max(0, min(num_members, self.maxfun - self._nfev + 1)))
+
+        energies = np.full(num_members, np.inf)
+        if not nfevs:
+            return energies
+
+        parameters_pop = self._scale_parameters(population[:nfevs])
+
+        if self.vectorized:
+            calc_energies = self.func(parameters_pop.T, *self.args)
+        else:
+            calc_energies = list(self._mapwrapper(self._wrapped_func,
+                                                  parameters_pop))
+
+        calc_energies = np.asarray(calc_energies, dtype=float)
+        if calc_energies.size != nfevs:
+            raise RuntimeError("The map-like callable (or vectorized func)"
+                               " must return one energy per population"
+                               " member")
+
+        energies[:nfevs] = calc_energies.reshape(nfevs)
+        self._nfev += nfevs
 
+        return energies
+
+    def _promote_lowest_energy(self):
+        """
+        Swap the population member with the lowest energy into the first
+        (best solution) position.
+        """
         minval = np.argmin(self.population_energies)
 
         # put the lowest energy into the best solution position.
@@ -628,6 +785,34 @@ class DifferentialEvolutionSolver(object):
             self.scale = (self.random_number_generator.rand()
                           * (self.dither[1] - self.dither[0]) + self.dither[0])
 
+        if self._updating == 'deferred':
+            if self._nfev > self.maxfun:
+                raise StopIteration
+
+            # create the complete trial population from the current
+            # generation, ensuring all of its members are in the range [0, 1)
+            trial_pop = np.array(
+                [self._mutate(i) for i in range(self.num_population_members)])
+            self._ensure_constraint(trial_pop)
+
+            # determine the energies of the whole trial population in a single
+            # batch (in parallel, or vectorized, if requested).
+            trial_energies = self._evaluate_population(trial_pop)
+
+            # which solutions are improvements?
+            loc = trial_energies < self.population_energies
+            self.population = np.where(loc[:, np.newaxis],
+                                       trial_pop,
+                                       self.population)
+            self.population_energies = np.where(loc,
+                                                trial_energies,
+                                                self.population_energies)
+
+            # make sure the best solution is updated if updating='deferred'.
+            self._promote_lowest_energy()
+
+            return self.x, self.population_energies[0]
+
         for candidate in range(self.num_population_members):
             if self._nfev > self.maxfun:
                 raise StopIteration
@@ -659,6 +844,13 @@ class DifferentialEvolutionSolver(object):
 
         return self.x, self.population_energies[0]
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        # to make sure resources are freed up
+        self._mapwrapper.__exit__(*args)
+
     def next(self):
         """
         Evolve the population by a single generation
@@ -687,11 +879,12 @@ class DifferentialEvolutionSolver(object):
 
     def _ensure_constraint(self, trial):
         """
-        make sure the parameters lie between the limits
+        make sure the parameters lie between the limits. `trial` may be a
+        single solution vector or a whole trial population.
         """
-        for index, param in enumerate(trial):
-            if param > 1 or param < 0:
-                trial[index] = self.random_number_generator.rand()
+        mask = np.where((trial > 1) | (trial < 0))
+        trial[mask] = self.random_number_generator.random_sample(
+            mask[0].shape)
 
     def _mutate(self, candidate):
         """
@@ -801,3 +994,15 @@ class DifferentialEvolutionSolver(object):
         idxs = idxs[:number_samples]
         return idxs
 
+
+class _VectorizedScalarFunction(object):
+    """
+    Object to wrap a vectorized user cost function, so that it can be called
+    with a single solution vector (e.g. by `minimize` when polishing).
+    """
+    def __init__(self, f):
+        self.f = f
+
+    def __call__(self, x, *args):
+        energy = self.f(np.asarray(x)[:, np.newaxis], *args)
+        return np.asarray(energy, dtype=float).item()
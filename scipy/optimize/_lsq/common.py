@@ -7,8 +7,8 @@ import numpy as np
 from numpy.linalg import norm
 
 from scipy.linalg import cho_factor, cho_solve, LinAlgError
-from scipy.sparse import issparse
-from scipy.sparse.linalg import LinearOperator, aslinearoperator
+from scipy.sparse import issparse, diags
+from scipy.sparse.linalg import LinearOperator, aslinearoperator, lsmr, splu
 
 
 EPS = np.finfo(float).eps
@@ -670,6 +670,49 @@ def regularized_lsq_operator(J, diag):
     return LinearOperator((m + n, n), matvec=matvec, rmatvec=rmatvec)
 
 
+def solve_normal_equation(J, f, diag=None):
+    """Solve a linear least-squares problem from its normal equation.
+
+    Finds x minimizing ``||J x - f||**2 + ||diag * x||**2`` by factorizing
+    ``J.T J + diag(diag**2)``, with a Cholesky factorization for dense `J` and
+    with `scipy.sparse.linalg.splu` in symmetric mode for sparse `J`. If the
+    matrix is numerically singular the problem is solved by
+    `scipy.sparse.linalg.lsmr` instead.
+    """
+    g = J.T.dot(f)
+    x = None
+    if issparse(J):
+        A = J.T.dot(J)
+        if diag is not None:
+            A = A + diags(diag**2)
+        try:
+            # The fill reducing ordering of A + A.T and diagonal pivots are
+            # the choices of SuperLU for symmetric positive definite matrices.
+            lu = splu(A.tocsc(), permc_spec='MMD_AT_PLUS_A',
+                      diag_pivot_thresh=0.0,
+                      options=dict(SymmetricMode=True))
+            x = lu.solve(g)
+        except RuntimeError:
+            pass
+    else:
+        A = J.T.dot(J)
+        if diag is not None:
+            A[np.diag_indices_from(A)] += diag**2
+        try:
+            x = cho_solve(cho_factor(A), g)
+        except LinAlgError:
+            pass
+
+    if x is None or not np.all(np.isfinite(x)):
+        if diag is None:
+            x = lsmr(J, f)[0]
+        else:
+            x = lsmr(regularized_lsq_operator(J, diag),
+                     np.hstack((f, np.zeros_like(diag))))[0]
+
+    return x
+
+
 def right_multiply(J, d, copy=True):
     """Compute J diag(d).
     
@@ -22,15 +22,16 @@ optimality conditions and they are excluded before computing a next dogleg
 step.
 
 Gauss-Newton step can be computed exactly by `numpy.linalg.lstsq` (for dense
-Jacobian matrices) or by iterative procedure `scipy.sparse.linalg.lsmr` (for
-dense and sparse matrices, or Jacobian being LinearOperator). The second
-option allows to solve very large problems (up to couple of millions of
-residuals on a regular PC), provided the Jacobian matrix is sufficiently
-sparse. But note that dogbox is not very good for solving problems with
-large number of constraints, because of variables exclusion-inclusion on each
-iteration (a required number of function evaluations might be high or accuracy
-of a solution will be poor), thus its large-scale usage is probably limited
-to unconstrained problems.
+Jacobian matrices), by factorizing the normal equation (for dense and sparse
+matrices, with `scipy.sparse.linalg.splu` for the latter) or by iterative
+procedure `scipy.sparse.linalg.lsmr` (for dense and sparse matrices, or
+Jacobian being LinearOperator). The last two options allow to solve very large
+problems (up to couple of millions of residuals on a regular PC), provided
+the Jacobian matrix is sufficiently sparse. But note that dogbox is not very
+good for solving problems with large number of constraints, because of
+variables exclusion-inclusion on each iteration (a required number of function
+evaluations might be high or accuracy of a solution will be poor), thus its
+large-scale usage is probably limited to unconstrained problems.
 
 References
 ----------
@@ -53,7 +54,8 @@ from .common import (
     step_size_to_bound, in_bounds, update_tr_radius, evaluate_quadratic,
     build_quadratic_1d, minimize_quadratic_1d, compute_grad,
     compute_jac_scale, check_termination, scale_for_robust_loss_function,
-    print_header_nonlinear, print_iteration_nonlinear)
+    right_multiply, solve_normal_equation, print_header_nonlinear,
+    print_iteration_nonlinear)
 
 
 def lsmr_operator(Jop, d, active_set):
@@ -67,7 +69,7 @@ def lsmr_operator(Jop, d, active_set):
     def matvec(x):
         x_free = x.ravel().copy()
         x_free[active_set] = 0
-        return Jop.matvec(x * d)
+        return Jop.matvec(x_free * d)
 
     def rmatvec(x):
         r = d * Jop.rmatvec(x)
@@ -225,6 +227,15 @@ def dogbox(fun, jac, x0, f0, J0, lb, ub, ftol, xtol, gtol, max_nfev, x_scale,
             newton_step = lstsq(J_free, -f, rcond=-1)[0]
 
             # Coefficients for the quadratic model along the anti-gradient.
+            a, b = build_quadratic_1d(J_free, g_free, -g_free)
+        elif tr_solver == 'normal':
+            # Slicing a sparse J is done once per iteration here, in exchange
+            # for the exact Gauss-Newton step in scaled variables.
+            J_free = J[:, free_set]
+            newton_step = -solve_normal_equation(
+                right_multiply(J_free, scale_free), f)
+            newton_step *= scale_free
+
             a, b = build_quadratic_1d(J_free, g_free, -g_free)
         elif tr_solver == 'lsmr':
             Jop = aslinearoperator(J)
@@ -257,7 +268,7 @@ def dogbox(fun, jac, x0, f0, J0, lb, ub, ftol, xtol, gtol, max_nfev, x_scale,
             step.fill(0.0)
             step[free_set] = step_free
 
-            if tr_solver == 'exact':
+            if tr_solver in ['exact', 'normal']:
                 predicted_reduction = -evaluate_quadratic(J_free, g_free,
                                                           step_free)
             elif tr_solver == 'lsmr':
@@ -11,6 +11,7 @@ from scipy.sparse.linalg import LinearOperator
 from scipy.optimize import _minpack, OptimizeResult
 from scipy.optimize._numdiff import approx_derivative, group_columns
 from scipy._lib.six import string_types
+from scipy._lib._util import MapWrapper
 
 from .trf import trf
 from .dogbox import dogbox
@@ -235,7 +236,8 @@ def least_squares(
         fun, x0, jac='2-point', bounds=(-np.inf, np.inf), method='trf',
         ftol=1e-8, xtol=1e-8, gtol=1e-8, x_scale=1.0, loss='linear',
         f_scale=1.0, diff_step=None, tr_solver=None, tr_options={},
-        jac_sparsity=None, max_nfev=None, verbose=0, args=(), kwargs={}):
+        jac_sparsity=None, max_nfev=None, verbose=0, args=(), kwargs={},
+        workers=1):
     """Solve a nonlinear least-squares problem with bounds on the variables.
 
     Given the residuals f(x) (an m-dimensional real function of n real
@@ -373,7 +375,7 @@ def least_squares(
         ``x * diff_step``. If None (default), then `diff_step` is taken to be
         a conventional "optimal" power of machine epsilon for the finite
         difference scheme used [NR]_.
-    tr_solver : {None, 'exact', 'lsmr'}, optional
+    tr_solver : {None, 'exact', 'lsmr', 'normal'}, optional
         Method for solving trust-region subproblems, relevant only for 'trf'
         and 'dogbox' methods.
 
@@ -386,6 +388,14 @@ def least_squares(
               `scipy.sparse.linalg.lsmr` for finding a solution of a linear
               least-squares problem and only requires matrix-vector product
               evaluations.
+            * 'normal' is suitable for problems with sparse and large Jacobian
+              matrices, when `scipy.sparse.linalg.lsmr` needs many iterations
+              to find accurate steps. It solves the normal equation of the
+              linear least-squares problem with a sparse factorization by
+              `scipy.sparse.linalg.splu` (or a Cholesky factorization for
+              dense Jacobians), and does not support LinearOperator Jacobians.
+
+              .. versionadded:: 1.1.0
 
         If None (default) the solver is chosen based on the type of Jacobian
         returned on the first iteration.
@@ -398,6 +408,8 @@ def least_squares(
               (bool, default is True) which adds a regularization term to the
               normal equation, which improves convergence if the Jacobian is
               rank-deficient [Byrd]_ (eq. 3.4).
+            * ``tr_solver='normal'``: only the 'regularize' option of
+              ``method='trf'``, as for 'lsmr'.
 
     jac_sparsity : {None, array_like, sparse matrix}, optional
         Defines the sparsity structure of the Jacobian matrix for finite
@@ -405,7 +417,8 @@ def least_squares(
         only few non-zero elements in *each* row, providing the sparsity
         structure will greatly speed up the computations [Curtis]_. A zero
         entry means that a corresponding element in the Jacobian is identically
-        zero. If provided, forces the use of 'lsmr' trust-region solver.
+        zero. If provided, forces the use of 'lsmr' or 'normal' trust-region
+        solver.
         If None (default) then dense differencing will be used. Has no effect
         for 'lm' method.
     verbose : {0, 1, 2}, optional
@@ -420,6 +433,16 @@ def least_squares(
         Additional arguments passed to `fun` and `jac`. Both empty by default.
         The calling signature is ``fun(x, *args, **kwargs)`` and the same for
         `jac`.
+    workers : int or map-like callable, optional
+        The residuals at the perturbed points of the finite difference
+        estimates of the Jacobian are computed in parallel in `workers`
+        processes (uses `multiprocessing.Pool`), or with a map-like callable
+        such as `multiprocessing.Pool.map`, called as ``workers(f, points)``.
+        Supply -1 to use all available CPU cores.  Requires that `fun` be
+        pickleable for processes.  Default is 1.  Has no effect for 'lm'
+        method, which estimates the Jacobian in MINPACK.
+
+        .. versionadded:: 1.1.0
 
     Returns
     -------
@@ -507,10 +530,12 @@ def least_squares(
     of Givens rotation eliminations. For large sparse Jacobians a 2-d subspace
     approach of solving trust-region subproblems is used [STIR]_, [Byrd]_.
     The subspace is spanned by a scaled gradient and an approximate
-    Gauss-Newton solution delivered by `scipy.sparse.linalg.lsmr`. When no
-    constraints are imposed the algorithm is very similar to MINPACK and has
-    generally comparable performance. The algorithm works quite robust in
-    unbounded and bounded problems, thus it is chosen as a default algorithm.
+    Gauss-Newton solution delivered by `scipy.sparse.linalg.lsmr`, or an
+    exact one computed from the normal equation with ``tr_solver='normal'``.
+    When no constraints are imposed the algorithm is very similar to MINPACK
+    and has generally comparable performance. The algorithm works quite robust
+    in unbounded and bounded problems, thus it is chosen as a default
+    algorithm.
 
     Method 'dogbox' operates in a trust-region framework, but considers
     rectangular trust regions as opposed to conventional ellipsoids [Voglis]_.
@@ -518,11 +543,12 @@ def least_squares(
     rectangular, so on each iteration a quadratic minimization problem subject
     to bound constraints is solved approximately by Powell's dogleg method
     [NumOpt]_. The required Gauss-Newton step can be computed exactly for
-    dense Jacobians or approximately by `scipy.sparse.linalg.lsmr` for large
-    sparse Jacobians. The algorithm is likely to exhibit slow convergence when
-    the rank of Jacobian is less than the number of variables. The algorithm
-    often outperforms 'trf' in bounded problems with a small number of
-    variables.
+    dense Jacobians, from the normal equation for sparse Jacobians
+    (``tr_solver='normal'``), or approximately by `scipy.sparse.linalg.lsmr`
+    for large sparse Jacobians and LinearOperators. The algorithm is likely to
+    exhibit slow convergence when the rank of Jacobian is less than the number
+    of variables. The algorithm often outperforms 'trf' in bounded problems
+    with a small number of variables.
 
     Robust loss functions are implemented as described in [BA]_. The idea
     is to modify a residual vector and a Jacobian matrix on each iteration
@@ -744,8 +770,13 @@ def least_squares(
         raise ValueError("`jac` must be '2-point', '3-point', 'cs' or "
                          "callable.")
 
-    if tr_solver not in [None, 'exact', 'lsmr']:
-        raise ValueError("`tr_solver` must be None, 'exact' or 'lsmr'.")
+    if tr_solver not in [None, 'exact', 'lsmr', 'normal']:
+        raise ValueError("`tr_solver` must be None, 'exact', 'lsmr' or "
+                         "'normal'.")
+
+    if tr_solver == 'normal' and not set(tr_options) <= {'regularize'}:
+        raise ValueError("tr_solver='normal' supports only the 'regularize' "
+                         "option in `tr_options`.")
 
     if loss not in IMPLEMENTED_LOSSES and not callable(loss):
         raise ValueError("`loss` must be one of {0} or a callable."
@@ -823,100 +854,112 @@ def least_squares(
     else:
         initial_cost = 0.5 * np.dot(f0, f0)
 
-    if callable(jac):
-        J0 = jac(x0, *args, **kwargs)
-
-        if issparse(J0):
-            J0 = csr_matrix(J0)
-
-            def jac_wrapped(x, _=None):
-                return csr_matrix(jac(x, *args, **kwargs))
+    mapper = MapWrapper(workers)
+    try:
+        if callable(jac):
+            J0 = jac(x0, *args, **kwargs)
 
-        elif isinstance(J0, LinearOperator):
-            def jac_wrapped(x, _=None):
-                return jac(x, *args, **kwargs)
+            if issparse(J0):
+                J0 = csr_matrix(J0)
 
-        else:
-            J0 = np.atleast_2d(J0)
+                def jac_wrapped(x, _=None):
+                    return csr_matrix(jac(x, *args, **kwargs))
 
-            def jac_wrapped(x, _=None):
-                return np.atleast_2d(jac(x, *args, **kwargs))
+            elif isinstance(J0, LinearOperator):
+                def jac_wrapped(x, _=None):
+                    return jac(x, *args, **kwargs)
 
-    else:  # Estimate Jacobian by finite differences.
-        if method == 'lm':
-            if jac_sparsity is not None:
-                raise ValueError("method='lm' does not support "
-                                 "`jac_sparsity`.")
+            else:
+                J0 = np.atleast_2d(J0)
 
-            if jac != '2-point':
-                warn("jac='{0}' works equivalently to '2-point' "
-                     "for method='lm'.".format(jac))
+                def jac_wrapped(x, _=None):
+                    return np.atleast_2d(jac(x, *args, **kwargs))
 
-            J0 = jac_wrapped = None
-        else:
-            if jac_sparsity is not None and tr_solver == 'exact':
-                raise ValueError("tr_solver='exact' is incompatible "
-                                 "with `jac_sparsity`.")
+        else:  # Estimate Jacobian by finite differences.
+            if method == 'lm':
+                if jac_sparsity is not None:
+                    raise ValueError("method='lm' does not support "
+                                     "`jac_sparsity`.")
 
-            jac_sparsity = check_jac_sparsity(jac_sparsity, m, n)
+                if jac != '2-point':
+                    warn("jac='{0}' works equivalently to '2-point' "
+                         "for method='lm'.".format(jac))
 
-            def jac_wrapped(x, f):
-                J = approx_derivative(fun, x, rel_step=diff_step, method=jac,
-                                      f0=f, bounds=bounds, args=args,
-                                      kwargs=kwargs, sparsity=jac_sparsity)
-                if J.ndim != 2:  # J is guaranteed not sparse.
-                    J = np.atleast_2d(J)
+                J0 = jac_wrapped = None
+            else:
+                if jac_sparsity is not None and tr_solver == 'exact':
+                    raise ValueError("tr_solver='exact' is incompatible "
+                                     "with `jac_sparsity`.")
 
-                return J
+                jac_sparsity = check_jac_sparsity(jac_sparsity, m, n)
 
-            J0 = jac_wrapped(x0, f0)
+                def jac_wrapped(x, f):
+                    J = approx_derivative(fun, x, rel_step=diff_step,
+                                          method=jac, f0=f, bounds=bounds,
+                                          args=args, kwargs=kwargs,
+                                          sparsity=jac_sparsity,
+                                          workers=mapper)
+                    if J.ndim != 2:  # J is guaranteed not sparse.
+                        J = np.atleast_2d(J)
 
-    if J0 is not None:
-        if J0.shape != (m, n):
-            raise ValueError(
-                "The return value of `jac` has wrong shape: expected {0}, "
-                "actual {1}.".format((m, n), J0.shape))
+                    return J
 
-        if not isinstance(J0, np.ndarray):
-            if method == 'lm':
-                raise ValueError("method='lm' works only with dense "
-                                 "Jacobian matrices.")
+                J0 = jac_wrapped(x0, f0)
 
-            if tr_solver == 'exact':
+        if J0 is not None:
+            if J0.shape != (m, n):
                 raise ValueError(
-                    "tr_solver='exact' works only with dense "
-                    "Jacobian matrices.")
+                    "The return value of `jac` has wrong shape: expected {0}, "
+                    "actual {1}.".format((m, n), J0.shape))
+
+            if not isinstance(J0, np.ndarray):
+                if method == 'lm':
+                    raise ValueError("method='lm' works only with dense "
+                                     "Jacobian matrices.")
+
+                if tr_solver == 'exact':
+                    raise ValueError(
+                        "tr_solver='exact' works only with dense "
+                        "Jacobian matrices.")
+
+            if isinstance(J0, LinearOperator) and tr_solver == 'normal':
+                raise ValueError("tr_solver='normal' can't be used when "
+                                 "`jac` returns LinearOperator.")
+
+            jac_scale = isinstance(x_scale, string_types) and x_scale == 'jac'
+            if isinstance(J0, LinearOperator) and jac_scale:
+                raise ValueError("x_scale='jac' can't be used when `jac` "
+                                 "returns LinearOperator.")
+
+            if tr_solver is None:
+                if isinstance(J0, np.ndarray):
+                    tr_solver = 'exact'
+                else:
+                    tr_solver = 'lsmr'
 
-        jac_scale = isinstance(x_scale, string_types) and x_scale == 'jac'
-        if isinstance(J0, LinearOperator) and jac_scale:
-            raise ValueError("x_scale='jac' can't be used when `jac` "
-                             "returns LinearOperator.")
-
-        if tr_solver is None:
-            if isinstance(J0, np.ndarray):
-                tr_solver = 'exact'
-            else:
-                tr_solver = 'lsmr'
-
-    if method == 'lm':
-        result = call_minpack(fun_wrapped, x0, jac_wrapped, ftol, xtol, gtol,
-                              max_nfev, x_scale, diff_step)
-
-    elif method == 'trf':
-        result = trf(fun_wrapped, jac_wrapped, x0, f0, J0, lb, ub, ftol, xtol,
-                     gtol, max_nfev, x_scale, loss_function, tr_solver,
-                     tr_options.copy(), verbose)
-
-    elif method == 'dogbox':
-        if tr_solver == 'lsmr' and 'regularize' in tr_options:
-            warn("The keyword 'regularize' in `tr_options` is not relevant "
-                 "for 'dogbox' method.")
-            tr_options = tr_options.copy()
-            del tr_options['regularize']
-
-        result = dogbox(fun_wrapped, jac_wrapped, x0, f0, J0, lb, ub, ftol,
-                        xtol, gtol, max_nfev, x_scale, loss_function,
-                        tr_solver, tr_options, verbose)
+        if method == 'lm':
+            result = call_minpack(fun_wrapped, x0, jac_wrapped, ftol, xtol,
+                                  gtol, max_nfev, x_scale, diff_step)
+
+        elif method == 'trf':
+            result = trf(fun_wrapped, jac_wrapped, x0, f0, J0, lb, ub, ftol,
+                         xtol, gtol, max_nfev, x_scale, loss_function,
+                         tr_solver, tr_options.copy(), verbose)
+
+        elif method == 'dogbox':
+            if (tr_solver in ['lsmr', 'normal'] and
+                    'regularize' in tr_options):
+                warn("The keyword 'regularize' in `tr_options` is not "
+                     "relevant for 'dogbox' method.")
+                tr_options = tr_options.copy()
+                del tr_options['regularize']
+
+            result = dogbox(fun_wrapped, jac_wrapped, x0, f0, J0, lb, ub, ftol,
+                            xtol, gtol, max_nfev, x_scale, loss_function,
+                            tr_solver, tr_options, verbose)
+    finally:
+        mapper.close()
+        mapper.terminate()
 
     result.message = TERMINATION_MESSAGES[result.status]
     result.success = result.status > 0
@@ -72,17 +72,22 @@ Note, that all described peculiarities are completely gone as we consider
 problems without bounds (the algorithm becomes a standard trust-region type
 algorithm very similar to ones implemented in MINPACK).
 
-The implementation supports two methods of solving the trust-region problem.
-The first, called 'exact', applies SVD on Jacobian and then solves the problem
-very accurately using the algorithm described in [JJMore]_. It is not
-applicable to large problem. The second, called 'lsmr', uses the 2-D subspace
-approach (sometimes called "indefinite dogleg"), where the problem is solved
-in a subspace spanned by the gradient and the approximate Gauss-Newton step
-found by ``scipy.sparse.linalg.lsmr``. A 2-D trust-region problem is
+The implementation supports three methods of solving the trust-region
+problem. The first, called 'exact', applies SVD on Jacobian and then solves
+the problem very accurately using the algorithm described in [JJMore]_. It is
+not applicable to large problem. The second, called 'lsmr', uses the 2-D
+subspace approach (sometimes called "indefinite dogleg"), where the problem is
+solved in a subspace spanned by the gradient and the approximate Gauss-Newton
+step found by ``scipy.sparse.linalg.lsmr``. A 2-D trust-region problem is
 reformulated as a 4-th order algebraic equation and solved very accurately by
 ``numpy.roots``. The subspace approach allows to solve very large problems
 (up to couple of millions of residuals on a regular PC), provided the Jacobian
-matrix is sufficiently sparse.
+matrix is sufficiently sparse. The third, called 'normal', uses the same
+subspace approach with the Gauss-Newton step found by factorizing the
+normal equation, with ``scipy.sparse.linalg.splu`` for sparse Jacobians. The
+step is exact, where 'lsmr' may need many iterations to find it accurately,
+as long as the normal matrix can be factorized, but the condition number of
+the Jacobian is squared.
 
 References
 ----------
@@ -107,8 +112,9 @@ from .common import (
     make_strictly_feasible, intersect_trust_region, solve_lsq_trust_region,
     solve_trust_region_2d, minimize_quadratic_1d, build_quadratic_1d,
     evaluate_quadratic, right_multiplied_operator, regularized_lsq_operator,
-    CL_scaling_vector, compute_grad, compute_jac_scale, check_termination,
-    update_tr_radius, scale_for_robust_loss_function, print_header_nonlinear,
+    right_multiply, solve_normal_equation, CL_scaling_vector, compute_grad,
+    compute_jac_scale, check_termination, update_tr_radius,
+    scale_for_robust_loss_function, print_header_nonlinear,
     print_iteration_nonlinear)
 
 
@@ -243,7 +249,7 @@ def trf_bounds(fun, jac, x0, f0, J0, lb, ub, ftol, xtol, gtol, max_nfev,
     f_augmented = np.zeros((m + n))
     if tr_solver == 'exact':
         J_augmented = np.empty((m + n, n))
-    elif tr_solver == 'lsmr':
+    elif tr_solver in ['lsmr', 'normal']:
         reg_term = 0.0
         regularize = tr_options.pop('regularize', True)
 
@@ -304,8 +310,11 @@ def trf_bounds(fun, jac, x0, f0, J0, lb, ub, ftol, xtol, gtol, max_nfev,
             U, s, V = svd(J_augmented, full_matrices=False)
             V = V.T
             uf = U.T.dot(f_augmented)
-        elif tr_solver == 'lsmr':
-            J_h = right_multiplied_operator(J, d)
+        elif tr_solver in ['lsmr', 'normal']:
+            if tr_solver == 'lsmr':
+                J_h = right_multiplied_operator(J, d)
+            else:
+                J_h = right_multiply(J, d)
 
             if regularize:
                 a, b = build_quadratic_1d(J_h, g_h, -g_h, diag=diag_h)
@@ -313,8 +322,12 @@ def trf_bounds(fun, jac, x0, f0, J0, lb, ub, ftol, xtol, gtol, max_nfev,
                 ag_value = minimize_quadratic_1d(a, b, 0, to_tr)[1]
                 reg_term = -ag_value / Delta**2
 
-            lsmr_op = regularized_lsq_operator(J_h, (diag_h + reg_term)**0.5)
-            gn_h = lsmr(lsmr_op, f_augmented, **tr_options)[0]
+            if tr_solver == 'lsmr':
+                lsmr_op = regularized_lsq_operator(J_h,
+                                                   (diag_h + reg_term)**0.5)
+                gn_h = lsmr(lsmr_op, f_augmented, **tr_options)[0]
+            else:
+                gn_h = solve_normal_equation(J_h, f, (diag_h + reg_term)**0.5)
             S = np.vstack((g_h, gn_h)).T
             S, _ = qr(S, mode='economic')
             JS = J_h.dot(S)  # LinearOperator does dot too.
@@ -329,7 +342,7 @@ def trf_bounds(fun, jac, x0, f0, J0, lb, ub, ftol, xtol, gtol, max_nfev,
             if tr_solver == 'exact':
                 p_h, alpha, n_iter = solve_lsq_trust_region(
                     n, m, uf, s, V, Delta, initial_alpha=alpha)
-            elif tr_solver == 'lsmr':
+            elif tr_solver in ['lsmr', 'normal']:
                 p_S, _ = solve_trust_region_2d(B_S, g_S, Delta)
                 p_h = S.dot(p_S)
 
@@ -437,7 +450,7 @@ def trf_no_bounds(fun, jac, x0, f0, J0, ftol, xtol, gtol, max_nfev,
     if Delta == 0:
         Delta = 1.0
 
-    if tr_solver == 'lsmr':
+    if tr_solver in ['lsmr', 'normal']:
         reg_term = 0
         damp = tr_options.pop('damp', 0.0)
         regularize = tr_options.pop('regularize', True)
@@ -475,8 +488,11 @@ def trf_no_bounds(fun, jac, x0, f0, J0, ftol, xtol, gtol, max_nfev,
             U, s, V = svd(J_h, full_matrices=False)
             V = V.T
             uf = U.T.dot(f)
-        elif tr_solver == 'lsmr':
-            J_h = right_multiplied_operator(J, d)
+        elif tr_solver in ['lsmr', 'normal']:
+            if tr_solver == 'lsmr':
+                J_h = right_multiplied_operator(J, d)
+            else:
+                J_h = right_multiply(J, d)
 
             if regularize:
                 a, b = build_quadratic_1d(J_h, g_h, -g_h)
@@ -485,7 +501,12 @@ def trf_no_bounds(fun, jac, x0, f0, J0, ftol, xtol, gtol, max_nfev,
                 reg_term = -ag_value / Delta**2
 
             damp_full = (damp**2 + reg_term)**0.5
-            gn_h = lsmr(J_h, f, damp=damp_full, **tr_options)[0]
+            if tr_solver == 'lsmr':
+                gn_h = lsmr(J_h, f, damp=damp_full, **tr_options)[0]
+            elif damp_full > 0:
+                gn_h = solve_normal_equation(J_h, f, np.full(n, damp_full))
+            else:
+                gn_h = solve_normal_equation(J_h, f)
             S = np.vstack((g_h, gn_h)).T
             S, _ = qr(S, mode='economic')
             JS = J_h.dot(S)
@@ -497,7 +518,7 @@ def trf_no_bounds(fun, jac, x0, f0, J0, ftol, xtol, gtol, max_nfev,
             if tr_solver == 'exact':
                 step_h, alpha, n_iter = solve_lsq_trust_region(
                     n, m, uf, s, V, Delta, initial_alpha=alpha)
-            elif tr_solver == 'lsmr':
+            elif tr_solver in ['lsmr', 'normal']:
                 p_S, _ = solve_trust_region_2d(B_S, g_S, Delta)
                 step_h = S.dot(p_S)
 
@@ -22,7 +22,8 @@ from scipy._lib.six import callable
 from .optimize import (_minimize_neldermead, _minimize_powell, _minimize_cg,
                        _minimize_bfgs, _minimize_newtoncg,
                        _minimize_scalar_brent, _minimize_scalar_bounded,
-                       _minimize_scalar_golden, MemoizeJac)
+                       _minimize_scalar_golden, MemoizeJac, EvaluationCache,
+                       wrap_function)
 from ._trustregion_dogleg import _minimize_dogleg
 from ._trustregion_ncg import _minimize_trust_ncg
 from ._trustregion_krylov import _minimize_trust_krylov
@@ -37,7 +38,7 @@ from .slsqp import _minimize_slsqp
 
 def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
              hessp=None, bounds=None, constraints=(), tol=None,
-             callback=None, options=None):
+             callback=None, options=None, cache_size=None):
     """Minimization of scalar function of one or more variables.
 
     In general, the optimization problems are of the form::
@@ -143,6 +144,14 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
     callback : callable, optional
         Called after each iteration, as ``callback(xk)``, where ``xk`` is the
         current parameter vector.
+    cache_size : int, optional
+        If given, the values of the objective function and of its Jacobian
+        are kept for the `cache_size` most recently used points, and are
+        not computed again when the solver evaluates the functions at one of
+        these points again (see `EvaluationCache`).  The functions must then
+        depend only on ``x`` and `args`.  Default is None, no cache.
+
+        .. versionadded:: 1.1.0
 
     Returns
     -------
@@ -151,7 +160,9 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
         Important attributes are: ``x`` the solution array, ``success`` a
         Boolean flag indicating if the optimizer exited successfully and
         ``message`` which describes the cause of the termination. See
-        `OptimizeResult` for a description of other attributes.
+        `OptimizeResult` for a description of other attributes.  With
+        `cache_size`, ``cache_info`` reports the number of values found in
+        the cache and the number of calls of the functions.
 
 
     See also
@@ -443,6 +454,18 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
         warn('Method %s does not support the return_all option.' % method,
              RuntimeWarning)
 
+    # cache of the values of fun and jac; the extra arguments are bound to
+    # all the functions
+    cache = None
+    if cache_size is not None:
+        cache = EvaluationCache(fun, jac, args, maxsize=cache_size)
+        fun = cache.fun
+        if callable(jac) or bool(jac):
+            jac = cache.jac
+        hess = wrap_function(hess, args)[1]
+        hessp = wrap_function(hessp, args)[1]
+        args = ()
+
     # fun also returns the jacobian
     if not callable(jac):
         if bool(jac):
@@ -468,46 +491,50 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
             options.setdefault('tol', tol)
 
     if meth == '_custom':
-        return method(fun, x0, args=args, jac=jac, hess=hess, hessp=hessp,
-                      bounds=bounds, constraints=constraints,
-                      callback=callback, **options)
+        res = method(fun, x0, args=args, jac=jac, hess=hess, hessp=hessp,
+                     bounds=bounds, constraints=constraints,
+                     callback=callback, **options)
     elif meth == 'nelder-mead':
-        return _minimize_neldermead(fun, x0, args, callback, **options)
+        res = _minimize_neldermead(fun, x0, args, callback, **options)
     elif meth == 'powell':
-        return _minimize_powell(fun, x0, args, callback, **options)
+        res = _minimize_powell(fun, x0, args, callback, **options)
     elif meth == 'cg':
-        return _minimize_cg(fun, x0, args, jac, callback, **options)
+        res = _minimize_cg(fun, x0, args, jac, callback, **options)
     elif meth == 'bfgs':
-        return _minimize_bfgs(fun, x0, args, jac, callback, **options)
+        res = _minimize_bfgs(fun, x0, args, jac, callback, **options)
     elif meth == 'newton-cg':
-        return _minimize_newtoncg(fun, x0, args, jac, hess, hessp, callback,
-                                  **options)
+        res = _minimize_newtoncg(fun, x0, args, jac, hess, hessp, callback,
+                                 **options)
     elif meth == 'l-bfgs-b':
-        return _minimize_lbfgsb(fun, x0, args, jac, bounds,
-                                callback=callback, **options)
+        res = _minimize_lbfgsb(fun, x0, args, jac, bounds,
+                               callback=callback, **options)
     elif meth == 'tnc':
-        return _minimize_tnc(fun, x0, args, jac, bounds, callback=callback,
-                             **options)
+        res = _minimize_tnc(fun, x0, args, jac, bounds, callback=callback,
+                            **options)
     elif meth == 'cobyla':
-        return _minimize_cobyla(fun, x0, args, constraints, **options)
+        res = _minimize_cobyla(fun, x0, args, constraints, **options)
     elif meth == 'slsqp':
-        return _minimize_slsqp(fun, x0, args, jac, bounds,
-                               constraints, callback=callback, **options)
+        res = _minimize_slsqp(fun, x0, args, jac, bounds,
+                              constraints, callback=callback, **options)
     elif meth == 'dogleg':
-        return _minimize_dogleg(fun, x0, args, jac, hess,
-                                callback=callback, **options)
+        res = _minimize_dogleg(fun, x0, args, jac, hess,
+                               callback=callback, **options)
     elif meth == 'trust-ncg':
-        return _minimize_trust_ncg(fun, x0, args, jac, hess, hessp,
-                                   callback=callback, **options)
+        res = _minimize_trust_ncg(fun, x0, args, jac, hess, hessp,
+                                  callback=callback, **options)
     elif meth == 'trust-krylov':
-        return _minimize_trust_krylov(fun, x0, args, jac, hess, hessp,
-                                      callback=callback, **options)
+        res = _minimize_trust_krylov(fun, x0, args, jac, hess, hessp,
+                                     callback=callback, **options)
     elif meth == 'trust-exact':
-        return _minimize_trustregion_exact(fun, x0, args, jac, hess,
-                                           callback=callback, **options)
+        res = _minimize_trustregion_exact(fun, x0, args, jac, hess,
+                                          callback=callback, **options)
     else:
         raise ValueError('Unknown solver %s' % method)
 
+    if cache is not None:
+        res.cache_info = cache.info()
+    return res
+
 
 def minimize_scalar(fun, bracket=None, bounds=None, args=(),
                     method='brent', tol=None, options=None):
@@ -2,14 +2,46 @@
 
 from __future__ import division
 
+import warnings
+
 import numpy as np
 
+from scipy._lib._util import MapWrapper, _FunctionWrapper
 from ..sparse import issparse, csc_matrix, csr_matrix, coo_matrix, find
 from ._group_columns import group_dense, group_sparse
 
 EPS = np.finfo(np.float64).eps
 
 
+def _map_points(fun, points, workers=map, vectorized=False):
+    """
+    Evaluate `fun` at an iterable of points.
+
+    The points are evaluated with the map-like callable `workers`, or, if
+    `vectorized`, by a single call of `fun` with the points as the columns
+    of an array, which returns the values as columns.
+
+    Returns an iterable of the values, in the order of the points.
+    """
+    if not vectorized:
+        return workers(fun, points)
+
+    points = list(points)
+    if not points:
+        return []
+    x = np.array(points).T
+    f = np.asarray(fun(x))
+    if f.ndim < 2:
+        # a scalar function returns one value per point
+        f = f.reshape(1, -1)
+    if f.ndim != 2 or f.shape[1] != len(points):
+        raise RuntimeError("A vectorized `fun` called with an array of "
+                           "shape (n, k) must return an array of shape "
+                           "(m, k), got %s for k = %d."
+                           % (f.shape, len(points)))
+    return f.T
+
+
 def _adjust_scheme_to_bounds(x0, h, num_steps, scheme, lb, ub):
     """Adjust final difference scheme to the presence of bounds.
 
@@ -178,7 +210,7 @@ def group_columns(A, order=0):
 
 def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
                       bounds=(-np.inf, np.inf), sparsity=None, args=(),
-                      kwargs={}):
+                      kwargs={}, workers=1, vectorized=False):
     """Compute finite difference approximation of the derivatives of a
     vector-valued function.
 
@@ -243,6 +275,24 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
     args, kwargs : tuple and dict, optional
         Additional arguments passed to `fun`. Both empty by default.
         The calling signature is ``fun(x, *args, **kwargs)``.
+    workers : int or map-like callable, optional
+        If `workers` is an int, the function is evaluated at the perturbed
+        points in parallel in `workers` processes (uses
+        `multiprocessing.Pool`); supply -1 to use all available CPU cores.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map`, which is called as
+        ``workers(f, points)``.  Requires that `fun` be pickleable for
+        processes.  Default is 1, evaluating the points one after another.
+
+        .. versionadded:: 1.1.0
+    vectorized : bool, optional
+        If True, `fun` is called once with all the perturbed points, as the
+        columns of an array `x` of shape ``(n, k)``, and must return an
+        array of shape ``(m, k)`` (or ``(k,)`` if ``m == 1``).  `f0` is
+        computed in the same way from an array of shape ``(n, 1)``.  Takes
+        precedence over `workers`.  Default is False.
+
+        .. versionadded:: 1.1.0
 
     Returns
     -------
@@ -277,6 +327,12 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
     different cases. b) In all cases np.atleast_2d can be called to get 2-d
     Jacobian with correct dimensions.
 
+    All the perturbed points (``n`` or ``2 * n`` points for dense
+    differencing, one or two per group of columns for sparse differencing)
+    are computed before evaluating the function, so that they can be
+    evaluated in parallel (`workers`) or in a single call (`vectorized`).
+    The results do not depend on the way the points are evaluated.
+
     References
     ----------
     .. [1] W. H. Press et. al. "Numerical Recipes. The Art of Scientific
@@ -314,6 +370,14 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
     array([ 1.])
     >>> approx_derivative(g, x0, bounds=(1.0, np.inf))
     array([ 2.])
+
+    The function `f` above also accepts the points as the columns of an
+    array, and can evaluate all the perturbed points at once:
+
+    >>> x0 = np.array([1.0, 0.5 * np.pi])
+    >>> approx_derivative(f, x0, args=(1, 2), vectorized=True)
+    array([[ 1.,  0.],
+           [-1.,  0.]])
     """
     if method not in ['2-point', '3-point', 'cs']:
         raise ValueError("Unknown method '%s'. " % method)
@@ -327,15 +391,25 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
     if lb.shape != x0.shape or ub.shape != x0.shape:
         raise ValueError("Inconsistent shapes between bounds and `x0`.")
 
-    def fun_wrapped(x):
-        f = np.atleast_1d(fun(x, *args, **kwargs))
-        if f.ndim > 1:
-            raise RuntimeError(("`fun` return value has "
-                                "more than 1 dimension."))
-        return f
+    # vectorized evaluation supersedes any request for workers
+    if vectorized and workers != 1:
+        warnings.warn("approx_derivative: the 'vectorized' keyword has "
+                      "overridden workers=%r to workers=1" % (workers,),
+                      UserWarning)
+        workers = 1
+
+    fun_wrapped = _FunctionWrapper(fun, args, kwargs)
+
+    def evaluate(points, mapper=map):
+        for f in _map_points(fun_wrapped, points, mapper, vectorized):
+            f = np.atleast_1d(f)
+            if f.ndim > 1:
+                raise RuntimeError(("`fun` return value has "
+                                    "more than 1 dimension."))
+            yield f
 
     if f0 is None:
-        f0 = fun_wrapped(x0)
+        f0, = evaluate([x0])
     else:
         f0 = np.atleast_1d(f0)
         if f0.ndim > 1:
@@ -355,9 +429,7 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
     elif method == 'cs':
         use_one_sided = False
 
-    if sparsity is None:
-        return _dense_difference(fun_wrapped, x0, f0, h, use_one_sided, method)
-    else:
+    if sparsity is not None:
         if not issparse(sparsity) and len(sparsity) == 2:
             structure, groups = sparsity
         else:
@@ -370,41 +442,59 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
             structure = np.atleast_2d(structure)
 
         groups = np.atleast_1d(groups)
-        return _sparse_difference(fun_wrapped, x0, f0, h, use_one_sided,
-                                  structure, groups, method)
+
+    with MapWrapper(workers) as mapper:
+        if sparsity is None:
+            return _dense_difference(evaluate, mapper, x0, f0, h,
+                                     use_one_sided, method)
+        else:
+            return _sparse_difference(evaluate, mapper, x0, f0, h,
+                                      use_one_sided, structure, groups,
+                                      method)
 
 
-def _dense_difference(fun, x0, f0, h, use_one_sided, method):
+def _dense_difference(evaluate, mapper, x0, f0, h, use_one_sided, method):
     m = f0.size
     n = x0.size
     J_transposed = np.empty((n, m))
     h_vecs = np.diag(h)
 
+    def points():
+        # The perturbed points, generated in the order of their use below.
+        for i in range(h.size):
+            if method == '2-point':
+                yield x0 + h_vecs[i]
+            elif method == '3-point' and use_one_sided[i]:
+                yield x0 + h_vecs[i]
+                yield x0 + 2 * h_vecs[i]
+            elif method == '3-point' and not use_one_sided[i]:
+                yield x0 - h_vecs[i]
+                yield x0 + h_vecs[i]
+            elif method == 'cs':
+                yield x0 + h_vecs[i]*1.j
+            else:
+                raise RuntimeError("Never be here.")
+
+    values = iter(evaluate(points(), mapper))
     for i in range(h.size):
+        # The steps are recomputed as exactly representable numbers, from
+        # the perturbed components of the points.
         if method == '2-point':
-            x = x0 + h_vecs[i]
-            dx = x[i] - x0[i]  # Recompute dx as exactly representable number.
-            df = fun(x) - f0
+            dx = (x0[i] + h[i]) - x0[i]
+            df = next(values) - f0
         elif method == '3-point' and use_one_sided[i]:
-            x1 = x0 + h_vecs[i]
-            x2 = x0 + 2 * h_vecs[i]
-            dx = x2[i] - x0[i]
-            f1 = fun(x1)
-            f2 = fun(x2)
+            dx = (x0[i] + 2 * h[i]) - x0[i]
+            f1 = next(values)
+            f2 = next(values)
             df = -3.0 * f0 + 4 * f1 - f2
         elif method == '3-point' and not use_one_sided[i]:
-            x1 = x0 - h_vecs[i]
-            x2 = x0 + h_vecs[i]
-            dx = x2[i] - x1[i]
-            f1 = fun(x1)
-            f2 = fun(x2)
+            dx = (x0[i] + h[i]) - (x0[i] - h[i])
+            f1 = next(values)
+            f2 = next(values)
             df = f2 - f1
         elif method == 'cs':
-            f1 = fun(x0 + h_vecs[i]*1.j)
-            df = f1.imag
-            dx = h_vecs[i, i]
-        else:
-            raise RuntimeError("Never be here.")
+            df = next(values).imag
+            dx = h[i]
 
         J_transposed[i] = df / dx
 
@@ -414,7 +504,7 @@ def _dense_difference(fun, x0, f0, h, use_one_sided, method):
     return J_transposed.T
 
 
-def _sparse_difference(fun, x0, f0, h, use_one_sided,
+def _sparse_difference(evaluate, mapper, x0, f0, h, use_one_sided,
                        structure, groups, method):
     m = f0.size
     n = x0.size
@@ -422,7 +512,11 @@ def _sparse_difference(fun, x0, f0, h, use_one_sided,
     col_indices = []
     fractions = []
 
+    # The perturbed points of all groups are computed first, and evaluated
+    # together.
     n_groups = np.max(groups) + 1
+    perturbations = []
+    points = []
     for group in range(n_groups):
         # Perturb variables which are in the same group simultaneously.
         e = np.equal(group, groups)
@@ -430,14 +524,7 @@ def _sparse_difference(fun, x0, f0, h, use_one_sided,
         if method == '2-point':
             x = x0 + h_vec
             dx = x - x0
-            df = fun(x) - f0
-            # The result is  written to columns which correspond to perturbed
-            # variables.
-            cols, = np.nonzero(e)
-            # Find all non-zero elements in selected columns of Jacobian.
-            i, j, _ = find(structure[:, cols])
-            # Restore column indices in the full array.
-            j = cols[j]
+            points.append(x)
         elif method == '3-point':
             # Here we do conceptually the same but separate one-sided
             # and two-sided schemes.
@@ -456,12 +543,30 @@ def _sparse_difference(fun, x0, f0, h, use_one_sided,
             dx[mask_1] = x2[mask_1] - x0[mask_1]
             dx[mask_2] = x2[mask_2] - x1[mask_2]
 
-            f1 = fun(x1)
-            f2 = fun(x2)
+            points.append(x1)
+            points.append(x2)
+        elif method == 'cs':
+            points.append(x0 + h_vec*1.j)
+            dx = h_vec
+        else:
+            raise ValueError("Never be here.")
+        perturbations.append((e, dx))
+
+    values = iter(evaluate(points, mapper))
+    for e, dx in perturbations:
+        # The result is  written to columns which correspond to perturbed
+        # variables.
+        cols, = np.nonzero(e)
+        # Find all non-zero elements in selected columns of Jacobian.
+        i, j, _ = find(structure[:, cols])
+        # Restore column indices in the full array.
+        j = cols[j]
 
-            cols, = np.nonzero(e)
-            i, j, _ = find(structure[:, cols])
-            j = cols[j]
+        if method == '2-point':
+            df = next(values) - f0
+        elif method == '3-point':
+            f1 = next(values)
+            f2 = next(values)
 
             mask = use_one_sided[j]
             df = np.empty(m)
@@ -472,14 +577,7 @@ def _sparse_difference(fun, x0, f0, h, use_one_sided,
             rows = i[~mask]
             df[rows] = f2[rows] - f1[rows]
         elif method == 'cs':
-            f1 = fun(x0 + h_vec*1.j)
-            df = f1.imag
-            dx = h_vec
-            cols, = np.nonzero(e)
-            i, j, _ = find(structure[:, cols])
-            j = cols[j]
-        else:
-            raise ValueError("Never be here.")
+            df = next(values).imag
 
         # All that's left is to compute the fraction. We store i, j and
         # fractions as separate arrays and later construct coo_matrix.
@@ -42,6 +42,7 @@ from .optimize import (approx_fprime, MemoizeJac, OptimizeResult,
                        _check_unknown_options, wrap_function,
                        _approx_fprime_helper)
 from scipy.sparse.linalg import LinearOperator
+from scipy._lib._util import MapWrapper
 
 __all__ = ['fmin_l_bfgs_b', 'LbfgsInvHessProduct']
 
@@ -51,7 +52,7 @@ def fmin_l_bfgs_b(func, x0, fprime=None, args=(),
                   bounds=None, m=10, factr=1e7, pgtol=1e-5,
                   epsilon=1e-8,
                   iprint=-1, maxfun=15000, maxiter=15000, disp=None,
-                  callback=None, maxls=20):
+                  callback=None, maxls=20, workers=1):
     """
     Minimize a function func using the L-BFGS-B algorithm.
 
@@ -114,6 +115,15 @@ def fmin_l_bfgs_b(func, x0, fprime=None, args=(),
         current parameter vector.
     maxls : int, optional
         Maximum number of line search steps (per iteration). Default is 20.
+    workers : int or map-like callable, optional
+        When `approx_grad` is True, the function values at the perturbed
+        points of each gradient approximation are computed in parallel in
+        `workers` processes (uses `multiprocessing.Pool`), or with a
+        map-like callable such as `multiprocessing.Pool.map`, called as
+        ``workers(f, points)``.  Supply -1 to use all available CPU cores.
+        Requires that `func` be pickleable for processes.  Default is 1.
+
+        .. versionadded:: 1.1.0
 
     Returns
     -------
@@ -193,7 +203,8 @@ def fmin_l_bfgs_b(func, x0, fprime=None, args=(),
             'maxfun': maxfun,
             'maxiter': maxiter,
             'callback': callback,
-            'maxls': maxls}
+            'maxls': maxls,
+            'workers': workers}
 
     res = _minimize_lbfgsb(fun, x0, args=args, jac=jac, bounds=bounds,
                            **opts)
@@ -211,7 +222,8 @@ def fmin_l_bfgs_b(func, x0, fprime=None, args=(),
 def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
                      disp=None, maxcor=10, ftol=2.2204460492503131e-09,
                      gtol=1e-5, eps=1e-8, maxfun=15000, maxiter=15000,
-                     iprint=-1, callback=None, maxls=20, **unknown_options):
+                     iprint=-1, callback=None, maxls=20, workers=1,
+                     **unknown_options):
     """
     Minimize a scalar function of one or more variables using the L-BFGS-B
     algorithm.
@@ -242,6 +254,15 @@ def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
         Maximum number of iterations.
     maxls : int, optional
         Maximum number of line search steps (per iteration). Default is 20.
+    workers : int or map-like callable, optional
+        If `jac` is not given, the function values at the perturbed points
+        of each gradient approximation are computed in parallel in `workers`
+        processes (uses `multiprocessing.Pool`), or with a map-like callable
+        such as `multiprocessing.Pool.map`, called as ``workers(f, points)``.
+        Supply -1 to use all available CPU cores.  Requires that `fun` be
+        pickleable for processes.  Default is 1.
+
+        .. versionadded:: 1.1.0
 
     Notes
     -----
@@ -274,11 +295,16 @@ def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
         else:
             iprint = disp
 
+    # The perturbed points are evaluated with the unwrapped function, which
+    # can be pickled, and counted separately.
+    user_fun = fun
     n_function_evals, fun = wrap_function(fun, ())
     if jac is None:
         def func_and_grad(x):
             f = fun(x, *args)
-            g = _approx_fprime_helper(x, fun, epsilon, args=args, f0=f)
+            g = _approx_fprime_helper(x, user_fun, epsilon, args=args, f0=f,
+                                      workers=mapper)
+            n_function_evals[0] += len(x)
             return f, g
     else:
         def func_and_grad(x):
@@ -321,31 +347,36 @@ def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
 
     n_iterations = 0
 
-    while 1:
-        # x, f, g, wa, iwa, task, csave, lsave, isave, dsave = \
-        _lbfgsb.setulb(m, x, low_bnd, upper_bnd, nbd, f, g, factr,
-                       pgtol, wa, iwa, task, iprint, csave, lsave,
-                       isave, dsave, maxls)
-        task_str = task.tostring()
-        if task_str.startswith(b'FG'):
-            # The minimization routine wants f and g at the current x.
-            # Note that interruptions due to maxfun are postponed
-            # until the completion of the current minimization iteration.
-            # Overwrite f and g:
-            f, g = func_and_grad(x)
-        elif task_str.startswith(b'NEW_X'):
-            # new iteration
-            if n_iterations > maxiter:
-                task[:] = 'STOP: TOTAL NO. of ITERATIONS EXCEEDS LIMIT'
-            elif n_function_evals[0] > maxfun:
-                task[:] = ('STOP: TOTAL NO. of f AND g EVALUATIONS '
-                           'EXCEEDS LIMIT')
+    mapper = MapWrapper(workers)
+    try:
+        while 1:
+            # x, f, g, wa, iwa, task, csave, lsave, isave, dsave = \
+            _lbfgsb.setulb(m, x, low_bnd, upper_bnd, nbd, f, g, factr,
+                           pgtol, wa, iwa, task, iprint, csave, lsave,
+                           isave, dsave, maxls)
+            task_str = task.tostring()
+            if task_str.startswith(b'FG'):
+                # The minimization routine wants f and g at the current x.
+                # Note that interruptions due to maxfun are postponed
+                # until the completion of the current minimization iteration.
+                # Overwrite f and g:
+                f, g = func_and_grad(x)
+            elif task_str.startswith(b'NEW_X'):
+                # new iteration
+                if n_iterations > maxiter:
+                    task[:] = 'STOP: TOTAL NO. of ITERATIONS EXCEEDS LIMIT'
+                elif n_function_evals[0] > maxfun:
+                    task[:] = ('STOP: TOTAL NO. of f AND g EVALUATIONS '
+                               'EXCEEDS LIMIT')
+                else:
+                    n_iterations += 1
+                    if callback is not None:
+                        callback(x)
             else:
-                n_iterations += 1
-                if callback is not None:
-                    callback(x)
-        else:
-            break
+                break
+    finally:
+        mapper.close()
+        mapper.terminate()
 
     task_str = task.tostring().strip(b'\x00').strip()
     if task_str.startswith(b'CONV'):
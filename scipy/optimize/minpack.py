@@ -19,7 +19,7 @@ from ._lsq.least_squares import prepare_bounds
 _MINPACK_LOCK = threading.RLock()
 error = _minpack.error
 
-__all__ = ['fsolve', 'leastsq', 'fixed_point', 'curve_fit']
+__all__ = ['fsolve', 'leastsq', 'fixed_point', 'curve_fit', 'curve_fit_batch']
 
 
 def _check_func(checker, argname, thefunc, x0, args, numinputs,
@@ -796,6 +796,427 @@ def curve_fit(f, xdata, ydata, p0=None, sigma=None, absolute_sigma=False,
         return popt, pcov
 
 
+class _BatchedModel(object):
+    """
+    Weighted residuals, and their Jacobians, of a subset of the problems of
+    `curve_fit_batch`.
+    """
+    def __init__(self, f, jac, xdata, ydata, weights, epsfcn):
+        self.f = f
+        self.jac = jac
+        self.xdata = xdata
+        self.ydata = ydata
+        self.weights = weights
+        self.step = np.sqrt(max(epsfcn, finfo(float).eps))
+
+    def _params(self, p):
+        # the parameters as columns, broadcasting against `xdata`
+        return [p[:, j:j+1] for j in range(p.shape[1])]
+
+    def _weights(self, idx):
+        if self.weights is None or self.weights.shape[0] == 1:
+            return self.weights
+        return self.weights[idx]
+
+    def residuals(self, p, idx):
+        shape = (len(idx), self.ydata.shape[1])
+        fx = np.asarray(self.f(self.xdata, *self._params(p)), dtype=float)
+        if fx.shape != shape:
+            raise ValueError("The model function must return an array of "
+                             "shape %s for the parameters of %d problems, "
+                             "got %s." % (shape, shape[0], fx.shape))
+        r = fx - self.ydata[idx]
+        weights = self._weights(idx)
+        if weights is not None:
+            r *= weights
+        return r
+
+    def jacobian(self, p, idx, r):
+        """
+        Jacobians of the residuals `r` at `p`, and the number of evaluations
+        of the model function made to compute them.
+        """
+        k, n = p.shape
+        shape = (k, self.ydata.shape[1], n)
+        if self.jac is not None:
+            J = np.asarray(self.jac(self.xdata, *self._params(p)),
+                           dtype=float)
+            if J.shape != shape:
+                raise ValueError("`jac` must return an array of shape %s "
+                                 "for the parameters of %d problems, got "
+                                 "%s." % (shape, k, J.shape))
+            weights = self._weights(idx)
+            if weights is not None:
+                J = J * weights[:, :, np.newaxis]
+            return J, 0
+
+        # forward differences, with the steps of MINPACK's lmdif
+        J = np.empty(shape)
+        for j in range(n):
+            h = self.step * abs(p[:, j])
+            h[h == 0] = self.step
+            pj = p.copy()
+            pj[:, j] += h
+            J[:, :, j] = (self.residuals(pj, idx) - r) / h[:, np.newaxis]
+        return J, n
+
+
+def _batched_pcov(J, cost, absolute_sigma):
+    """
+    Covariances of the parameters of the problems with (weighted) Jacobians
+    `J` and costs `cost` at the solution.
+    """
+    k, m, n = J.shape
+    pcov = np.empty((k, n, n))
+    pcov.fill(inf)
+    finite = np.isfinite(J).all(axis=(1, 2))
+    if finite.any():
+        # Moore-Penrose inverse discarding zero singular values, as in
+        # curve_fit with the 'trf' and 'dogbox' methods
+        _, s, VT = np.linalg.svd(J[finite], full_matrices=False)
+        threshold = finfo(float).eps * max(m, n) * s[:, :1]
+        with np.errstate(divide='ignore'):
+            s_inv2 = np.where(s > threshold, 1 / s**2, 0)
+        pcov[finite] = np.einsum('kji,kj,kjl->kil', VT, s_inv2, VT)
+
+    warn_cov = False
+    if not absolute_sigma:
+        if m > n:
+            pcov *= (2 * cost / (m - n))[:, np.newaxis, np.newaxis]
+        else:
+            pcov.fill(inf)
+            warn_cov = True
+    return pcov, warn_cov
+
+
+def curve_fit_batch(f, xdata, ydata, p0=None, sigma=None,
+                    absolute_sigma=False, check_finite=True, jac=None,
+                    ftol=1.49012e-08, xtol=1.49012e-08, gtol=0.0, maxfev=0,
+                    epsfcn=None):
+    """
+    Fit a function to many independent datasets at once, with non-linear
+    least squares.
+
+    Assumes ``ydata[i] = f(xdata, *params[i]) + eps`` for each problem ``i``
+    of the batch.  The Levenberg-Marquardt iterations of all the problems
+    are done together, with one call of the model function for the problems
+    that have not converged yet, and batched linear algebra.
+
+    Parameters
+    ----------
+    f : callable
+        The model function, ``f(x, *params)``, vectorized over the problems.
+        It is called with the parameters of ``k`` problems as separate
+        arrays of shape ``(k, 1)``, so that they broadcast against a 1-d
+        `xdata`, and must return an array of shape ``(k, M)``.
+    xdata : An M-length sequence or an (q,M)-shaped array for functions with q predictors
+        The independent variable where the data is measured, the same for
+        all the problems.
+    ydata : (P, M) array_like
+        The dependent data of the ``P`` problems, one per row.
+    p0 : None, scalar, (N,) or (P, N) array_like, optional
+        Initial guess for the parameters, common to all the problems or one
+        row per problem.  If None, then the initial values will all be 1 (if
+        the number of parameters for the function can be determined using
+        introspection, otherwise a ValueError is raised).
+    sigma : None, (M,) or (P, M) array_like, optional
+        The standard deviations of the errors in `ydata`, common to all the
+        problems or one row per problem.  The optimized function is
+        ``chisq = sum((r / sigma) ** 2)`` for the residuals
+        ``r = ydata[i] - f(xdata, *popt[i])`` of each problem.  None
+        (default) is equivalent to `sigma` filled with ones.
+    absolute_sigma : bool, optional
+        If True, `sigma` is used in an absolute sense and the estimated
+        parameter covariances `pcov` reflect these absolute values.
+        Otherwise, as in `curve_fit`, `sigma` is scaled for each problem to
+        match the sample variance of its residuals after the fit.
+    check_finite : bool, optional
+        If True, check that the input arrays do not contain nans of infs,
+        and raise a ValueError if they do.  Default is True.
+    jac : callable, optional
+        The Jacobian of the model function with respect to the parameters,
+        ``jac(x, *params)``, called as `f` and returning an array of shape
+        ``(k, M, N)``.  If None (default), the Jacobian is estimated by
+        forward differences, as in `leastsq`.
+    ftol, xtol, gtol : float, optional
+        The tolerances of `leastsq` on the relative reduction of the sum of
+        squares, the relative change of the parameters and the orthogonality
+        of the residuals and the columns of the Jacobian, for each problem.
+    maxfev : int, optional
+        The maximum number of calls of the model function for each problem
+        (counting its evaluations for the forward differences).  If zero,
+        then ``100*(N+1)`` is the maximum if `jac` is given, otherwise it is
+        ``200*(N+1)``, as in `leastsq`.
+    epsfcn : float, optional
+        A variable used in determining a suitable step length for the
+        forward-difference approximation of the Jacobian, as in `leastsq`.
+
+    Returns
+    -------
+    popt : (P, N) ndarray
+        The optimal values of the parameters of each problem.
+    pcov : (P, N, N) ndarray
+        The estimated covariances of the parameters of each problem, see
+        `curve_fit`.  Filled with ``np.inf`` where they cannot be estimated.
+    info : OptimizeResult
+        Per-problem results, with the attributes:
+
+        status : (P,) ndarray of int
+            The reason for the end of the iterations, as in
+            `least_squares`: -1 if the initial residuals are not finite,
+            0 if the maximum number of function evaluations is exceeded,
+            1 if `gtol`, 2 if `ftol`, 3 if `xtol`, and 4 if both `ftol`
+            and `xtol` termination conditions are satisfied.
+        success : (P,) ndarray of bool
+            Whether the problems converged, i.e. ``status > 0``.
+        nfev : (P,) ndarray of int
+            The numbers of evaluations of the model function.
+        cost : (P,) ndarray
+            Half the sums of squares of the (weighted) residuals.
+
+    Raises
+    ------
+    ValueError
+        if either `ydata` or `xdata` contain NaNs, or if the shapes of the
+        arguments, or of the values of `f` and `jac`, are incompatible.
+
+    OptimizeWarning
+        if the covariance of the parameters can not be estimated.
+
+    See Also
+    --------
+    curve_fit : Fit a single dataset.
+
+    Notes
+    -----
+    The Levenberg-Marquardt iterations follow [1]_: the damping parameter of
+    each problem is scaled by the largest diagonal entries of the
+    Gauss-Newton matrix seen so far, as in MINPACK, and updated from the
+    ratio of the actual and predicted reductions of the sum of squares.  The
+    damped normal equations of all the problems are solved together with
+    `numpy.linalg.solve`, so that the iterations have a fixed cost in Python
+    whatever the number of problems, and suit models with a few parameters.
+
+    The results of each problem do not depend on the other problems of the
+    batch, but may differ slightly from those of `curve_fit`, which uses
+    MINPACK's trust region strategy.
+
+    .. versionadded:: 1.1.0
+
+    References
+    ----------
+    .. [1] H. B. Nielsen, "Damping Parameter in Marquardt's Method",
+           Technical Report IMM-REP-1999-05, Technical University of
+           Denmark, 1999.
+
+    Examples
+    --------
+    >>> from scipy.optimize import curve_fit_batch
+
+    The model function is vectorized over the problems by broadcasting:
+
+    >>> def func(x, a, b, c):
+    ...     return a * np.exp(-b * x) + c
+
+    Fit 1000 noisy datasets with different parameters:
+
+    >>> np.random.seed(1729)
+    >>> xdata = np.linspace(0, 4, 50)
+    >>> params = np.random.uniform(0.5, 2.5, size=(1000, 3))
+    >>> ydata = func(xdata, *params.T[:, :, np.newaxis])
+    >>> ydata += 0.02 * np.random.normal(size=ydata.shape)
+    >>> popt, pcov, info = curve_fit_batch(func, xdata, ydata)
+    >>> popt.shape, pcov.shape
+    ((1000, 3), (1000, 3, 3))
+    >>> info.success.all()
+    True
+    >>> np.abs(popt - params).max() < 0.2
+    True
+
+    """
+    if check_finite:
+        ydata = np.asarray_chkfinite(ydata, dtype=float)
+    else:
+        ydata = np.asarray(ydata, dtype=float)
+    if ydata.ndim != 2:
+        raise ValueError("`ydata` must be a 2-d array of shape "
+                         "(n_problems, n_points).")
+    n_problems, m = ydata.shape
+
+    if p0 is None:
+        # determine number of parameters by inspecting the function
+        from scipy._lib._util import getargspec_no_self as _getargspec
+        args, varargs, varkw, defaults = _getargspec(f)
+        if len(args) < 2:
+            raise ValueError("Unable to determine number of fit parameters.")
+        p0 = np.ones(len(args) - 1)
+    p0 = np.atleast_1d(np.asarray(p0, dtype=float))
+    if p0.ndim > 2 or p0.ndim == 2 and p0.shape[0] != n_problems:
+        raise ValueError("`p0` must be a scalar, a 1-d array or a 2-d array "
+                         "with one row per problem.")
+    n = p0.shape[-1]
+    p = np.empty((n_problems, n))
+    p[...] = p0
+    if m < n:
+        raise ValueError("The number of data points must be at least the "
+                         "number of parameters.")
+
+    if isinstance(xdata, (list, tuple, np.ndarray)):
+        # `xdata` is passed straight to the user-defined `f`, so allow
+        # non-array_like `xdata`.
+        if check_finite:
+            xdata = np.asarray_chkfinite(xdata)
+        else:
+            xdata = np.asarray(xdata)
+
+    if sigma is not None:
+        sigma = np.asarray(sigma, dtype=float)
+        if sigma.shape not in [(m,), (n_problems, m)]:
+            raise ValueError("`sigma` has incorrect shape.")
+        weights = np.atleast_2d(1.0 / sigma)
+    else:
+        weights = None
+
+    if maxfev == 0:
+        maxfev = 100 * (n + 1) if jac is not None else 200 * (n + 1)
+    model = _BatchedModel(f, jac, xdata, ydata, weights,
+                          0.0 if epsfcn is None else epsfcn)
+
+    popt = p.copy()
+    pcov = np.empty((n_problems, n, n))
+    status = np.zeros(n_problems, dtype=int)
+    nfev = np.zeros(n_problems, dtype=int)
+    cost = np.zeros(n_problems)
+
+    # The state of the problems that have not converged yet, which are
+    # removed from these arrays as they converge.
+    idx = np.arange(n_problems)
+    r = model.residuals(p, idx)
+    c = 0.5 * np.sum(r**2, axis=1)
+    nf = np.ones(n_problems, dtype=int)
+    J = np.empty((n_problems, m, n))
+    warn_cov = [False]
+
+    def finish(done, code):
+        # record the results of the problems in `done`, and return the mask
+        # of the problems to keep
+        i = idx[done]
+        popt[i] = p[done]
+        status[i] = code[done] if np.ndim(code) else code
+        nfev[i] = nf[done]
+        cost[i] = c[done]
+        if np.ndim(code) or code != -1:
+            pcov[i], warn = _batched_pcov(J[done], c[done], absolute_sigma)
+            warn_cov[0] |= warn
+        return ~done
+
+    # problems with non-finite initial residuals are not solved
+    bad = ~np.isfinite(c)
+    if bad.any():
+        pcov[idx[bad]] = inf
+        keep = finish(bad, -1)
+        idx, p, r, c, nf, J = (idx[keep], p[keep], r[keep], c[keep],
+                               nf[keep], J[keep])
+
+    if idx.size:
+        J, nj = model.jacobian(p, idx, r)
+        nf += nj
+    diag_scale = np.zeros((idx.size, n))
+    # The damping is lam * diag_scale, so lam itself is dimensionless and
+    # the iterations do not depend on the scale of the residuals.
+    lam = np.empty(idx.size)
+    lam.fill(1e-3)
+    nu = np.empty(idx.size)
+    nu.fill(2.0)
+    diag = np.arange(n)
+
+    while idx.size:
+        A = np.einsum('kmi,kmj->kij', J, J)
+        g = np.einsum('kmi,km->ki', J, r)
+        A_diag = A[:, diag, diag]
+        diag_scale = np.maximum(diag_scale, A_diag)
+        diag_scale[diag_scale == 0] = 1
+
+        # gtol: orthogonality of the residuals and the columns of J
+        with np.errstate(divide='ignore', invalid='ignore'):
+            col_norms = np.sqrt(A_diag)
+            gnorm = np.abs(g) / (col_norms * np.sqrt(2 * c)[:, np.newaxis])
+        gnorm[~(col_norms > 0)] = 0
+        gnorm = np.max(gnorm, axis=1)
+        gnorm[c == 0] = 0
+        done = gnorm <= gtol
+        if done.any():
+            keep = finish(done, 1)
+            idx, p, r, c, nf, J = (idx[keep], p[keep], r[keep], c[keep],
+                                   nf[keep], J[keep])
+            A, g, lam, nu, diag_scale = (A[keep], g[keep], lam[keep],
+                                         nu[keep], diag_scale[keep])
+            if not idx.size:
+                break
+
+        # damped Gauss-Newton step
+        A[:, diag, diag] += lam[:, np.newaxis] * diag_scale
+        try:
+            dp = -np.linalg.solve(A, g[:, :, np.newaxis])[:, :, 0]
+        except np.linalg.LinAlgError:
+            dp = np.empty_like(g)
+            for i in range(idx.size):
+                dp[i] = -np.linalg.lstsq(A[i], g[i], rcond=-1)[0]
+        p_new = p + dp
+        r_new = model.residuals(p_new, idx)
+        nf += 1
+        c_new = 0.5 * np.sum(r_new**2, axis=1)
+        c_new[~np.isfinite(c_new)] = inf
+
+        predicted = 0.5 * np.sum(dp * (lam[:, np.newaxis] * diag_scale * dp
+                                       - g), axis=1)
+        actual = c - c_new
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rho = actual / predicted
+        accept = rho > 0
+
+        # update the damping parameters
+        rho_acc = rho[accept]
+        lam[accept] *= np.maximum(1 / 3, 1 - (2 * rho_acc - 1)**3)
+        nu[accept] = 2
+        lam[~accept] *= nu[~accept]
+        nu[~accept] *= 2
+
+        # convergence tests of MINPACK, on the relative reduction of the sum
+        # of squares and the relative size of the step
+        ftol_ok = ((np.abs(actual) <= ftol * c) & (predicted <= ftol * c) &
+                   (0.5 * rho <= 1))
+        p[accept] = p_new[accept]
+        r[accept] = r_new[accept]
+        c[accept] = c_new[accept]
+        scale = np.sqrt(diag_scale)
+        xtol_ok = (np.sqrt(np.sum((scale * dp)**2, axis=1)) <=
+                   xtol * np.sqrt(np.sum((scale * p)**2, axis=1)))
+
+        if accept.any():
+            J[accept], nj = model.jacobian(p[accept], idx[accept], r[accept])
+            nf[accept] += nj
+
+        code = np.where(ftol_ok, 2, 0) + np.where(xtol_ok, 3, 0)
+        code[code == 5] = 4
+        code[(code == 0) & (nf >= maxfev)] = -2
+        done = code != 0
+        if done.any():
+            code[code == -2] = 0
+            keep = finish(done, code)
+            idx, p, r, c, nf, J = (idx[keep], p[keep], r[keep], c[keep],
+                                   nf[keep], J[keep])
+            lam, nu, diag_scale = lam[keep], nu[keep], diag_scale[keep]
+
+    if warn_cov[0]:
+        warnings.warn('Covariance of the parameters could not be estimated',
+                      category=OptimizeWarning)
+
+    info = OptimizeResult(status=status, success=status > 0, nfev=nfev,
+                          cost=cost)
+    return popt, pcov, info
+
+
 def check_gradient(fcn, Dfcn, x0, args=(), col_deriv=0):
     """Perform a simple check on the gradient for correctness.
 
@@ -23,12 +23,13 @@ __all__ = ['fmin', 'fmin_powell', 'fmin_bfgs', 'fmin_ncg', 'fmin_cg',
            'fminbound', 'brent', 'golden', 'bracket', 'rosen', 'rosen_der',
            'rosen_hess', 'rosen_hess_prod', 'brute', 'approx_fprime',
            'line_search', 'check_grad', 'OptimizeResult', 'show_options',
-           'OptimizeWarning']
+           'OptimizeWarning', 'EvaluationCache']
 
 __docformat__ = "restructuredtext en"
 
 import warnings
 import sys
+from collections import namedtuple, OrderedDict
 import numpy
 from scipy._lib.six import callable, xrange
 from numpy import (atleast_1d, eye, mgrid, argmin, zeros, shape, squeeze,
@@ -38,6 +39,7 @@ from .linesearch import (line_search_wolfe1, line_search_wolfe2,
                          line_search_wolfe2 as line_search,
                          LineSearchWarning)
 from scipy._lib._util import getargspec_no_self as _getargspec
+from scipy._lib._util import _FunctionWrapper
 
 
 # standard status messages of optimizers
@@ -72,6 +74,131 @@ class MemoizeJac(object):
             return self.jac
 
 
+EvaluationCacheInfo = namedtuple('EvaluationCacheInfo',
+                                 ['hits', 'nfev', 'njev', 'maxsize',
+                                  'currsize'])
+
+
+def _copy_value(value):
+    # the optimizers may modify the arrays they are given in place
+    if isinstance(value, numpy.ndarray):
+        return value.copy()
+    return value
+
+
+class EvaluationCache(object):
+    """
+    Least recently used cache of the values of an objective function and of
+    its gradient.
+
+    The values are cached for the exact points `x` at which they are
+    computed, so that an optimizer evaluating the function again at a
+    recently seen point, or the function and its gradient separately at the
+    same point, does not call the functions again.  The functions must not
+    depend on anything else than `x`.
+
+    Parameters
+    ----------
+    fun : callable
+        The objective function, ``fun(x, *args)``.
+    jac : callable or bool, optional
+        The gradient of `fun`, ``jac(x, *args)``.  If True, `fun` returns
+        the value and the gradient of the objective function, as in
+        `minimize`.
+    args : tuple, optional
+        Extra arguments passed to `fun` and `jac`.
+    maxsize : int, optional
+        The maximum number of points whose values are kept.
+
+    Attributes
+    ----------
+    hits : int
+        Number of values returned from the cache.
+    nfev, njev : int
+        Number of calls of the objective function and of its gradient.
+        With ``jac=True``, a call of `fun` counts in both.
+
+    Notes
+    -----
+    ``fun`` and ``jac`` are the methods to pass to the optimizers instead of
+    the functions themselves, without `args`.
+
+    .. versionadded:: 1.1.0
+
+    """
+    def __init__(self, fun, jac=None, args=(), maxsize=1):
+        if int(maxsize) < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self._fun = fun
+        self._jac = jac
+        self.args = args
+        self.maxsize = int(maxsize)
+        self.hits = 0
+        self.nfev = 0
+        self.njev = 0
+        # maps the points to the lists [value, gradient], None if unknown
+        self._values = OrderedDict()
+
+    def _lookup(self, x):
+        x = numpy.asarray(x)
+        key = (x.shape, x.dtype.char, x.tostring())
+        try:
+            # move the point to the end, as the most recently used one
+            values = self._values.pop(key)
+        except KeyError:
+            values = [None, None]
+            if len(self._values) >= self.maxsize:
+                self._values.popitem(last=False)
+        self._values[key] = values
+        return values
+
+    def _evaluate(self, x, values):
+        if callable(self._jac) or not self._jac:
+            values[0] = _copy_value(self._fun(x, *self.args))
+            self.nfev += 1
+        else:
+            fg = self._fun(x, *self.args)
+            values[0] = _copy_value(fg[0])
+            values[1] = _copy_value(fg[1])
+            self.nfev += 1
+            self.njev += 1
+
+    def fun(self, x, *args):
+        """Value of the objective function at `x`; `args` are ignored."""
+        values = self._lookup(x)
+        if values[0] is None:
+            self._evaluate(x, values)
+        else:
+            self.hits += 1
+        return _copy_value(values[0])
+
+    def jac(self, x, *args):
+        """Gradient of the objective function at `x`; `args` are ignored."""
+        values = self._lookup(x)
+        if values[1] is None:
+            if callable(self._jac):
+                values[1] = _copy_value(self._jac(x, *self.args))
+                self.njev += 1
+            else:
+                self._evaluate(x, values)
+        else:
+            self.hits += 1
+        return _copy_value(values[1])
+
+    def info(self):
+        """
+        Report the usage of the cache.
+
+        Returns
+        -------
+        info : EvaluationCacheInfo
+            Named tuple ``(hits, nfev, njev, maxsize, currsize)``.
+
+        """
+        return EvaluationCacheInfo(self.hits, self.nfev, self.njev,
+                                   self.maxsize, len(self._values))
+
+
 class OptimizeResult(dict):
     """ Represents the optimization result.
 
@@ -101,6 +228,12 @@ class OptimizeResult(dict):
         Number of iterations performed by the optimizer.
     maxcv : float
         The maximum constraint violation.
+    cache_info : EvaluationCacheInfo
+        Number of values of the objective function and of its Jacobian
+        returned from the cache of `minimize` (if enabled with its
+        `cache_size` argument), and number of calls of the functions, as a
+        named tuple ``(hits, nfev, njev, maxsize, currsize)``.  The counts
+        ``nfev`` and ``njev`` of the optimizer include the cached values.
 
     Notes
     -----
@@ -647,20 +780,29 @@ def _minimize_neldermead(func, x0, args=(), callback=None,
     return result
 
 
-def _approx_fprime_helper(xk, f, epsilon, args=(), f0=None):
+def _approx_fprime_helper(xk, f, epsilon, args=(), f0=None, workers=map):
     """
     See ``approx_fprime``.  An optional initial function value arg is added.
+    The perturbed points are evaluated with the map-like callable `workers`,
+    which must be able to pickle `f` if it uses processes.
 
     """
     if f0 is None:
         f0 = f(*((xk,) + args))
     grad = numpy.zeros((len(xk),), float)
     ei = numpy.zeros((len(xk),), float)
-    for k in range(len(xk)):
-        ei[k] = 1.0
-        d = epsilon * ei
-        grad[k] = (f(*((xk + d,) + args)) - f0) / d[k]
-        ei[k] = 0.0
+    steps = epsilon * numpy.ones((len(xk),), float)
+
+    def points():
+        # generated one at a time, so that a serial map holds one of them
+        for k in range(len(xk)):
+            ei[k] = 1.0
+            yield xk + epsilon * ei
+            ei[k] = 0.0
+
+    values = workers(_FunctionWrapper(f, args), points())
+    for k, fk in enumerate(values):
+        grad[k] = (fk - f0) / steps[k]
     return grad
 
 
@@ -21,6 +21,7 @@ import numpy as np
 from scipy.optimize._slsqp import slsqp
 from numpy import (zeros, array, linalg, append, asfarray, concatenate, finfo,
                    sqrt, vstack, exp, inf, isfinite, atleast_1d)
+from scipy._lib._util import MapWrapper, _FunctionWrapper
 from .optimize import wrap_function, OptimizeResult, _check_unknown_options
 
 __docformat__ = "restructuredtext en"
@@ -53,15 +54,32 @@ def approx_jacobian(x, func, epsilon, *args):
     -----
     The approximation is done using forward differences.
 
+    """
+    return _approx_jacobian(x, func, epsilon, args)
+
+
+def _approx_jacobian(x, func, epsilon, args=(), workers=map):
+    """
+    See ``approx_jacobian``.  The perturbed points are evaluated with the
+    map-like callable `workers`, which must be able to pickle `func` if it
+    uses processes.
+
     """
     x0 = asfarray(x)
     f0 = atleast_1d(func(*((x0,)+args)))
     jac = zeros([len(x0), len(f0)])
     dx = zeros(len(x0))
-    for i in range(len(x0)):
-        dx[i] = epsilon
-        jac[i] = (func(*((x0+dx,)+args)) - f0)/epsilon
-        dx[i] = 0.0
+
+    def points():
+        # the perturbed points, created as they are evaluated
+        for i in range(len(x0)):
+            dx[i] = epsilon
+            yield x0+dx
+            dx[i] = 0.0
+
+    values = workers(_FunctionWrapper(func, args), points())
+    for i, fi in enumerate(values):
+        jac[i] = (fi - f0)/epsilon
 
     return jac.transpose()
 
@@ -70,7 +88,7 @@ def fmin_slsqp(func, x0, eqcons=(), f_eqcons=None, ieqcons=(), f_ieqcons=None,
                bounds=(), fprime=None, fprime_eqcons=None,
                fprime_ieqcons=None, args=(), iter=100, acc=1.0E-6,
                iprint=1, disp=None, full_output=0, epsilon=_epsilon,
-               callback=None):
+               callback=None, workers=1):
     """
     Minimize a function using Sequential Least SQuares Programming
 
@@ -138,6 +156,15 @@ def fmin_slsqp(func, x0, eqcons=(), f_eqcons=None, ieqcons=(), f_ieqcons=None,
     callback : callable, optional
         Called after each iteration, as ``callback(x)``, where ``x`` is the
         current parameter vector.
+    workers : int or map-like callable, optional
+        The function values at the perturbed points of the finite-difference
+        derivative estimates are computed in parallel in `workers` processes
+        (uses `multiprocessing.Pool`), or with a map-like callable such as
+        `multiprocessing.Pool.map`, called as ``workers(f, points)``.  Supply
+        -1 to use all available CPU cores.  Requires that the functions be
+        pickleable for processes.  Default is 1.
+
+        .. versionadded:: 1.1.0
 
     Returns
     -------
@@ -185,7 +212,8 @@ def fmin_slsqp(func, x0, eqcons=(), f_eqcons=None, ieqcons=(), f_ieqcons=None,
             'iprint': iprint,
             'disp': iprint != 0,
             'eps': epsilon,
-            'callback': callback}
+            'callback': callback,
+            'workers': workers}
 
     # Build the constraints as a tuple of dictionaries
     cons = ()
@@ -214,7 +242,7 @@ def fmin_slsqp(func, x0, eqcons=(), f_eqcons=None, ieqcons=(), f_ieqcons=None,
 def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
                     constraints=(),
                     maxiter=100, ftol=1.0E-6, iprint=1, disp=False,
-                    eps=_epsilon, callback=None,
+                    eps=_epsilon, callback=None, workers=1,
                     **unknown_options):
     """
     Minimize a scalar function of one or more variables using Sequential
@@ -231,6 +259,15 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
         `verbosity` is ignored and set to 0.
     maxiter : int
         Maximum number of iterations.
+    workers : int or map-like callable
+        The function values at the perturbed points of the finite-difference
+        derivative estimates are computed in parallel in `workers` processes
+        (uses `multiprocessing.Pool`), or with a map-like callable such as
+        `multiprocessing.Pool.map`, called as ``workers(f, points)``.  Supply
+        -1 to use all available CPU cores.  Requires that the functions be
+        pickleable for processes.  Default is 1.
+
+        .. versionadded:: 1.1.0
 
     """
     _check_unknown_options(unknown_options)
@@ -273,7 +310,8 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
             # to keep a reference to `fun`, see gh-4240.
             def cjac_factory(fun):
                 def cjac(x, *args):
-                    return approx_jacobian(x, fun, epsilon, *args)
+                    return _approx_jacobian(x, fun, epsilon, args,
+                                            workers=mapper)
                 return cjac
             cjac = cjac_factory(con['fun'])
 
@@ -295,13 +333,20 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
                    9: "Iteration limit exceeded"}
 
     # Wrap func
+    user_func = func
     feval, func = wrap_function(func, args)
 
     # Wrap fprime, if provided, or approx_jacobian if not
     if fprime:
         geval, fprime = wrap_function(fprime, args)
     else:
-        geval, fprime = wrap_function(approx_jacobian, (func, epsilon))
+        # The points are evaluated with the unwrapped function, which can be
+        # pickled, and counted separately.
+        def approx_fprime(x):
+            feval[0] += len(x) + 1
+            return _approx_jacobian(x, user_func, epsilon, args,
+                                    workers=mapper)
+        geval, fprime = wrap_function(approx_fprime, ())
 
     # Transform x0 into an array.
     x = asfarray(x0).flatten()
@@ -370,75 +415,81 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
     if iprint >= 2:
         print("%5s %5s %16s %16s" % ("NIT", "FC", "OBJFUN", "GNORM"))
 
-    while 1:
-
-        if mode == 0 or mode == 1:  # objective and constraint evaluation required
-
-            # Compute objective function
-            fx = func(x)
-            try:
-                fx = float(np.asarray(fx))
-            except (TypeError, ValueError):
-                raise ValueError("Objective function must return a scalar")
-            # Compute the constraints
-            if cons['eq']:
-                c_eq = concatenate([atleast_1d(con['fun'](x, *con['args']))
-                                    for con in cons['eq']])
-            else:
-                c_eq = zeros(0)
-            if cons['ineq']:
-                c_ieq = concatenate([atleast_1d(con['fun'](x, *con['args']))
-                                     for con in cons['ineq']])
-            else:
-                c_ieq = zeros(0)
-
-            # Now combine c_eq and c_ieq into a single matrix
-            c = concatenate((c_eq, c_ieq))
-
-        if mode == 0 or mode == -1:  # gradient evaluation required
-
-            # Compute the derivatives of the objective function
-            # For some reason SLSQP wants g dimensioned to n+1
-            g = append(fprime(x), 0.0)
-
-            # Compute the normals of the constraints
-            if cons['eq']:
-                a_eq = vstack([con['jac'](x, *con['args'])
-                               for con in cons['eq']])
-            else:  # no equality constraint
-                a_eq = zeros((meq, n))
-
-            if cons['ineq']:
-                a_ieq = vstack([con['jac'](x, *con['args'])
-                                for con in cons['ineq']])
-            else:  # no inequality constraint
-                a_ieq = zeros((mieq, n))
-
-            # Now combine a_eq and a_ieq into a single a matrix
-            if m == 0:  # no constraints
-                a = zeros((la, n))
-            else:
-                a = vstack((a_eq, a_ieq))
-            a = concatenate((a, zeros([la, 1])), 1)
-
-        # Call SLSQP
-        slsqp(m, meq, x, xl, xu, fx, c, g, a, acc, majiter, mode, w, jw)
-
-        # call callback if major iteration has incremented
-        if callback is not None and majiter > majiter_prev:
-            callback(x)
-
-        # Print the status of the current iterate if iprint > 2 and the
-        # major iteration has incremented
-        if iprint >= 2 and majiter > majiter_prev:
-            print("%5i %5i % 16.6E % 16.6E" % (majiter, feval[0],
-                                               fx, linalg.norm(g)))
-
-        # If exit mode is not -1 or 1, slsqp has completed
-        if abs(mode) != 1:
-            break
-
-        majiter_prev = int(majiter)
+    mapper = MapWrapper(workers)
+    try:
+        while 1:
+
+            if mode == 0 or mode == 1:  # objective and constraint evaluation required
+
+                # Compute objective function
+                fx = func(x)
+                try:
+                    fx = float(np.asarray(fx))
+                except (TypeError, ValueError):
+                    raise ValueError("Objective function must return a scalar")
+                # Compute the constraints
+                if cons['eq']:
+                    c_eq = concatenate([atleast_1d(con['fun'](x, *con['args']))
+                                        for con in cons['eq']])
+                else:
+                    c_eq = zeros(0)
+                if cons['ineq']:
+                    c_ieq = concatenate([atleast_1d(con['fun'](x,
+                                                               *con['args']))
+                                         for con in cons['ineq']])
+                else:
+                    c_ieq = zeros(0)
+
+                # Now combine c_eq and c_ieq into a single matrix
+                c = concatenate((c_eq, c_ieq))
+
+            if mode == 0 or mode == -1:  # gradient evaluation required
+
+                # Compute the derivatives of the objective function
+                # For some reason SLSQP wants g dimensioned to n+1
+                g = append(fprime(x), 0.0)
+
+                # Compute the normals of the constraints
+                if cons['eq']:
+                    a_eq = vstack([con['jac'](x, *con['args'])
+                                   for con in cons['eq']])
+                else:  # no equality constraint
+                    a_eq = zeros((meq, n))
+
+                if cons['ineq']:
+                    a_ieq = vstack([con['jac'](x, *con['args'])
+                                    for con in cons['ineq']])
+                else:  # no inequality constraint
+                    a_ieq = zeros((mieq, n))
+
+                # Now combine a_eq and a_ieq into a single a matrix
+                if m == 0:  # no constraints
+                    a = zeros((la, n))
+                else:
+                    a = vstack((a_eq, a_ieq))
+                a = concatenate((a, zeros([la, 1])), 1)
+
+            # Call SLSQP
+            slsqp(m, meq, x, xl, xu, fx, c, g, a, acc, majiter, mode, w, jw)
+
+            # call callback if major iteration has incremented
+            if callback is not None and majiter > majiter_prev:
+                callback(x)
+
+            # Print the status of the current iterate if iprint > 2 and the
+            # major iteration has incremented
+            if iprint >= 2 and majiter > majiter_prev:
+                print("%5i %5i % 16.6E % 16.6E" % (majiter, feval[0],
+                                                   fx, linalg.norm(g)))
+
+            # If exit mode is not -1 or 1, slsqp has completed
+            if abs(mode) != 1:
+                break
+
+            majiter_prev = int(majiter)
+    finally:
+        mapper.close()
+        mapper.terminate()
 
     # Optimization loop complete.  Print status if requested
     if iprint >= 1:
@@ -9,7 +9,8 @@ from scipy.optimize import rosen
 from numpy.testing import (assert_equal, assert_allclose,
                            assert_almost_equal,
                            assert_string_equal, assert_)
-from pytest import raises as assert_raises
+from scipy._lib._numpy_compat import suppress_warnings
+from pytest import raises as assert_raises, warns
 
 class TestDifferentialEvolutionSolver(object):
 
@@ -444,3 +445,102 @@ class TestDifferentialEvolutionSolver(object):
         assert_equal(solver._nfev, 0)
         assert_(np.all(np.isinf(solver.population_energies)))
 
+    def test_immediate_updating(self):
+        # check setting of immediate updating, with default workers
+        bounds = [(0., 2.), (0., 2.)]
+        solver = DifferentialEvolutionSolver(rosen, bounds)
+        assert_(solver._updating == 'immediate')
+
+        # invalid updating modes are rejected
+        assert_raises(ValueError, DifferentialEvolutionSolver, rosen, bounds,
+                      updating='rubbish')
+
+        # should raise a UserWarning because the updating='immediate'
+        # is being overridden by the workers keyword
+        with warns(UserWarning):
+            solver = DifferentialEvolutionSolver(rosen, bounds, workers=map)
+        assert_(solver._updating == 'deferred')
+
+    def test_parallel(self):
+        # smoke test for parallelisation with deferred updating
+        bounds = [(0., 2.), (0., 2.)]
+        with DifferentialEvolutionSolver(rosen, bounds,
+                                         updating='deferred',
+                                         workers=2) as solver:
+            assert_(solver._mapwrapper.pool is not None)
+            assert_(solver._updating == 'deferred')
+            solver.solve()
+
+        # with a map-like callable the same generations are produced as for
+        # serial deferred updating.
+        res = differential_evolution(rosen, bounds, updating='deferred',
+                                     seed=1, polish=False)
+        res_map = differential_evolution(rosen, bounds, updating='deferred',
+                                         workers=map, seed=1, polish=False)
+        assert_equal(res_map.x, res.x)
+        assert_equal(res_map.fun, res.fun)
+        assert_equal(res_map.nfev, res.nfev)
+
+    def test_parallel_invalid_arguments(self, monkeypatch):
+        # no pool of processes is created when the arguments are invalid
+        created = []
+        MapWrapper = _differentialevolution.MapWrapper
+
+        def mapwrapper(workers):
+            created.append(workers)
+            return MapWrapper(workers)
+
+        monkeypatch.setattr(_differentialevolution, 'MapWrapper', mapwrapper)
+        assert_raises(ValueError, DifferentialEvolutionSolver, rosen,
+                      [(0., np.inf)], updating='deferred', workers=2)
+        assert_raises(ValueError, DifferentialEvolutionSolver, rosen,
+                      [(0., 2.)], init='rubbish', workers=2)
+        assert_equal(created, [])
+
+    def test_vectorized(self):
+        def quadratic(x):
+            # x has shape (len(bounds), S)
+            return np.sum(x**2, axis=0)
+
+        calls = []
+
+        def vquadratic(x):
+            assert_equal(x.ndim, 2)
+            calls.append(x.shape)
+            return quadratic(x)
+
+        bounds = [(-5., 5.), (-5., 5.)]
+        res = differential_evolution(quadratic, bounds, updating='deferred',
+                                     seed=1, polish=False)
+        res_vec = differential_evolution(vquadratic, bounds,
+                                         updating='deferred', vectorized=True,
+                                         seed=1, polish=False)
+        assert_equal(res_vec.x, res.x)
+        assert_equal(res_vec.nfev, res.nfev)
+        # one call per generation, plus the initial population
+        assert_equal(len(calls), res_vec.nit + 1)
+        assert_equal(calls[0], (2, 30))
+
+        # polishing calls the vectorized function with a single column
+        res_vec = differential_evolution(vquadratic, bounds,
+                                         updating='deferred', vectorized=True,
+                                         seed=1)
+        assert_(calls[-1] == (2, 1))
+        assert_allclose(res_vec.x, [0, 0], atol=1e-6)
+
+        # vectorized takes precedence over workers
+        with suppress_warnings() as sup:
+            sup.filter(UserWarning)
+            solver = DifferentialEvolutionSolver(vquadratic, bounds,
+                                                 vectorized=True, workers=map)
+        assert_(solver._mapwrapper.pool is None)
+        assert_(solver._updating == 'deferred')
+
+    def test_deferred_maxfun(self):
+        # maxfun is honoured in the same way as for immediate updating
+        solver = DifferentialEvolutionSolver(rosen, self.bounds, popsize=5,
+                                             polish=False, maxfun=40,
+                                             updating='deferred')
+        result = solver.solve()
+        assert_equal(result.nfev, 41)
+        assert_equal(result.success, False)
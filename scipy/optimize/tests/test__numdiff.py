@@ -5,7 +5,7 @@ from itertools import product
 
 import numpy as np
 from numpy.testing import assert_allclose, assert_equal, assert_
-from pytest import raises as assert_raises
+from pytest import raises as assert_raises, warns
 
 from scipy.sparse import csr_matrix, csc_matrix, lil_matrix
 
@@ -380,6 +380,71 @@ class TestApproxDerivativesDense(object):
                                     self.jac_zero_jacobian, x0)
         assert_(accuracy == 0)
 
+    def test_workers(self):
+        # a map-like callable gives the same result as serial evaluation
+        npoints = []
+
+        def mapper(func, iterable):
+            points = list(iterable)
+            npoints.append(len(points))
+            return map(func, points)
+
+        x0 = np.array([-0.1, 0.1])
+        lb = [-0.1, -np.inf]
+        for method in ['2-point', '3-point', 'cs']:
+            for bounds in [(-np.inf, np.inf), (lb, np.inf)]:
+                if method == 'cs' and bounds[0] is lb:
+                    continue
+                J = approx_derivative(self.fun_vector_vector, x0,
+                                      method=method, bounds=bounds)
+                J_map = approx_derivative(self.fun_vector_vector, x0,
+                                          method=method, bounds=bounds,
+                                          workers=mapper)
+                assert_equal(J_map, J)
+
+        # all the perturbed points are mapped at once
+        assert_equal(npoints[-1], 2)
+        npoints = []
+        approx_derivative(self.fun_parametrized, x0, args=(-1.0,),
+                          kwargs=dict(c1=1.0), workers=mapper)
+        assert_equal(npoints, [4])
+
+    def test_vectorized(self):
+        calls = []
+
+        def fun(x):
+            assert_equal(x.ndim, 2)
+            calls.append(x.shape)
+            return self.fun_vector_vector(x)
+
+        x0 = np.array([-0.1, 0.1])
+        jac_true = self.jac_vector_vector(x0)
+        for method, rtol in [('2-point', 1e-5), ('3-point', 1e-6),
+                             ('cs', 1e-12)]:
+            calls = []
+            J = approx_derivative(fun, x0, method=method, vectorized=True)
+            assert_allclose(J, jac_true, rtol=rtol)
+            assert_allclose(J, approx_derivative(self.fun_vector_vector, x0,
+                                                 method=method),
+                            rtol=1e-14)
+            npoints = 2 if method == '3-point' else 1
+            assert_equal(calls, [(2, 1), (2, npoints * x0.size)])
+
+        # a scalar function returns an array of shape (k,)
+        x0 = np.array([1.0, 0.5])
+        J = approx_derivative(self.fun_vector_scalar, x0, vectorized=True)
+        assert_allclose(J, self.jac_vector_scalar(x0), rtol=1e-6)
+
+        # vectorized takes precedence over workers
+        with warns(UserWarning):
+            J = approx_derivative(self.fun_vector_scalar, x0,
+                                  vectorized=True, workers=map)
+        assert_allclose(J, self.jac_vector_scalar(x0), rtol=1e-6)
+
+        # a return value of the wrong shape raises
+        assert_raises(RuntimeError, approx_derivative,
+                      lambda x: x[:, :1], x0, vectorized=True)
+
 
 class TestApproxDerivativeSparse(object):
     # Example from Numerical Optimization 2nd edition, p. 198.
@@ -449,6 +514,35 @@ class TestApproxDerivativeSparse(object):
         J = approx_derivative(self.fun, self.x0, sparsity=A)
         assert_allclose(J.toarray(), self.J_true, rtol=1e-6)
 
+    def test_workers_vectorized(self):
+        # column grouping is used in parallel and vectorized evaluations
+        def fun_vectorized(x):
+            calls.append(x.shape)
+            e = x[1:]**3 - x[:-1]**2
+            f = np.zeros_like(x)
+            f[1:] += 3 * e
+            f[:-1] += 2 * e
+            return f
+
+        A = self.structure(self.n)
+        groups = group_columns(A)
+        n_groups = np.max(groups) + 1
+        for method, npoints in [('2-point', 1), ('3-point', 2), ('cs', 1)]:
+            J = approx_derivative(self.fun, self.x0, method=method,
+                                  bounds=(self.lb, self.ub),
+                                  sparsity=(A, groups))
+            J_map = approx_derivative(self.fun, self.x0, method=method,
+                                      bounds=(self.lb, self.ub),
+                                      sparsity=(A, groups), workers=map)
+            assert_equal(J_map.toarray(), J.toarray())
+
+            calls = []
+            J_vec = approx_derivative(fun_vectorized, self.x0, method=method,
+                                      bounds=(self.lb, self.ub),
+                                      sparsity=(A, groups), vectorized=True)
+            assert_allclose(J_vec.toarray(), J.toarray(), rtol=1e-14)
+            assert_equal(calls, [(self.n, 1), (self.n, npoints * n_groups)])
+
     def test_equivalence(self):
         structure = np.ones((self.n, self.n), dtype=int)
         groups = np.arange(self.n)
@@ -247,6 +247,20 @@ class BaseMixin(object):
         assert_equal(res1.nfev, res2.nfev)
         assert_(res2.nfev != res3.nfev)
 
+    def test_workers(self):
+        # a map-like callable gives the same iterations as serial evaluation
+        for jac in ['2-point', '3-point']:
+            with suppress_warnings() as sup:
+                sup.filter(UserWarning,
+                           "jac='3-point' works equivalently to '2-point' "
+                           "for method='lm'")
+                res = least_squares(fun_rosenbrock, [2, 2], jac,
+                                    method=self.method)
+                res_map = least_squares(fun_rosenbrock, [2, 2], jac,
+                                        method=self.method, workers=map)
+            assert_equal(res_map.x, res.x)
+            assert_equal(res_map.nfev, res.nfev)
+
     def test_incorrect_options_usage(self):
         assert_raises(TypeError, least_squares, fun_trivial, 2.0,
                       method=self.method, options={'no_such_option': 100})
@@ -465,6 +479,17 @@ class SparseMixin(object):
         assert_allclose(res_sparse.cost, 0, atol=1e-20)
         assert_allclose(res_dense.cost, 0, atol=1e-20)
 
+    def test_workers(self):
+        # the groups of columns are evaluated with a map-like callable
+        p = BroydenTridiagonal()
+        for jac in ['2-point', '3-point']:
+            res = least_squares(p.fun, p.x0, jac, method=self.method,
+                                jac_sparsity=p.sparsity)
+            res_map = least_squares(p.fun, p.x0, jac, method=self.method,
+                                    jac_sparsity=p.sparsity, workers=map)
+            assert_equal(res_map.x, res.x)
+            assert_equal(res_map.nfev, res.nfev)
+
     def test_tr_options(self):
         p = BroydenTridiagonal()
         res = least_squares(p.fun, p.x0, p.jac, method=self.method,
@@ -532,6 +557,46 @@ class SparseMixin(object):
         assert_raises(ValueError, least_squares, p.fun, p.x0, p.jac,
                       method=self.method, tr_solver='exact')
 
+    def test_linear_operator_bounds(self):
+        p = BroydenTridiagonal(mode='operator')
+        res = least_squares(p.fun, p.x0, p.jac, bounds=(p.lb, p.ub),
+                            method=self.method)
+        assert_allclose(res.optimality, 0, atol=1e-10)
+
+    def test_normal_tr_solver(self):
+        sparse = BroydenTridiagonal(mode='sparse')
+        dense = BroydenTridiagonal(mode='dense')
+        res_sparse = least_squares(sparse.fun, sparse.x0, sparse.jac,
+                                   method=self.method, tr_solver='normal')
+        res_dense = least_squares(dense.fun, dense.x0, dense.jac,
+                                  method=self.method, tr_solver='normal')
+        assert_allclose(res_sparse.cost, 0, atol=1e-20)
+        assert_allclose(res_dense.cost, 0, atol=1e-20)
+        assert_(issparse(res_sparse.jac))
+        assert_(isinstance(res_dense.jac, np.ndarray))
+
+        for jac, jac_sparsity in [(sparse.jac, None),
+                                  ('2-point', sparse.sparsity)]:
+            res = least_squares(sparse.fun, sparse.x0, jac,
+                                bounds=(sparse.lb, sparse.ub),
+                                jac_sparsity=jac_sparsity,
+                                method=self.method, tr_solver='normal')
+            assert_allclose(res.optimality, 0, atol=1e-10)
+
+        for loss in ['soft_l1', 'cauchy']:
+            res = least_squares(sparse.fun, sparse.x0, sparse.jac, loss=loss,
+                                x_scale='jac', method=self.method,
+                                tr_solver='normal')
+            assert_allclose(res.cost, 0, atol=1e-20)
+
+        assert_raises(ValueError, least_squares, sparse.fun, sparse.x0,
+                      sparse.jac, method=self.method, tr_solver='normal',
+                      tr_options={'btol': 1e-10})
+
+        p = BroydenTridiagonal(mode='operator')
+        assert_raises(ValueError, least_squares, p.fun, p.x0, p.jac,
+                      method=self.method, tr_solver='normal')
+
     def test_x_scale_jac_scale(self):
         p = BroydenTridiagonal()
         res = least_squares(p.fun, p.x0, p.jac, method=self.method,
@@ -693,6 +758,15 @@ class TestTRF(BaseMixin, BoundsMixin, SparseMixin, LossFunctionMixin):
                                 tr_options={'regularize': regularize})
             assert_allclose(res.cost, 0, atol=1e-20)
 
+    def test_normal_regularization(self):
+        p = BroydenTridiagonal()
+        for regularize in [True, False]:
+            for bounds in [(-np.inf, np.inf), (p.lb, p.ub)]:
+                res = least_squares(p.fun, p.x0, p.jac, bounds=bounds,
+                                    method='trf', tr_solver='normal',
+                                    tr_options={'regularize': regularize})
+                assert_allclose(res.optimality, 0, atol=1e-10)
+
 
 class TestLM(BaseMixin):
     method = 'lm'
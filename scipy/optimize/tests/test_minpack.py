@@ -4,14 +4,15 @@ Unit tests for optimization routines from minpack.py.
 from __future__ import division, print_function, absolute_import
 
 from numpy.testing import (assert_, assert_almost_equal, assert_array_equal,
-        assert_array_almost_equal, assert_allclose)
+        assert_array_almost_equal, assert_allclose, assert_equal)
 from pytest import raises as assert_raises
 import numpy as np
 from numpy import array, float64, matrix
 
 from scipy import optimize
 from scipy.special import lambertw
-from scipy.optimize.minpack import leastsq, curve_fit, fixed_point
+from scipy.optimize.minpack import (leastsq, curve_fit, curve_fit_batch,
+                                   fixed_point)
 from scipy._lib._numpy_compat import _assert_warns, suppress_warnings
 from scipy.optimize import OptimizeWarning
 
@@ -588,6 +589,112 @@ class TestCurveFit(object):
                 assert_allclose(pcov1, pcov2, atol=1e-14)
 
 
+class TestCurveFitBatch(object):
+    def setup_method(self):
+        np.random.seed(1234)
+        self.x = np.linspace(0, 4, 30)
+        self.params = np.random.uniform(0.5, 2.5, size=(20, 3))
+        self.y = self.func(self.x, *self.params.T[:, :, np.newaxis])
+        self.y += 0.02 * np.random.normal(size=self.y.shape)
+
+    def func(self, x, a, b, c):
+        return a * np.exp(-b * x) + c
+
+    def jac(self, x, a, b, c):
+        e = np.exp(-b * x) * np.ones_like(a)
+        return np.dstack([e, -a * x * e, np.ones_like(e)])
+
+    def test_matches_curve_fit(self):
+        # the problems of the batch are solved independently, with the
+        # results of curve_fit up to the tolerances
+        sigma = np.random.uniform(0.01, 0.05, size=self.y.shape)
+        for jac in [None, self.jac]:
+            for absolute_sigma in [False, True]:
+                popt, pcov, info = curve_fit_batch(
+                    self.func, self.x, self.y, sigma=sigma, jac=jac,
+                    absolute_sigma=absolute_sigma)
+                assert_equal(popt.shape, (20, 3))
+                assert_equal(pcov.shape, (20, 3, 3))
+                assert_(info.success.all())
+                assert_(np.in1d(info.status, [2, 3, 4]).all())
+                for i in range(20):
+                    popt1, pcov1 = curve_fit(self.func, self.x, self.y[i],
+                                             sigma=sigma[i],
+                                             absolute_sigma=absolute_sigma)
+                    assert_allclose(popt[i], popt1, rtol=1e-5)
+                    assert_allclose(pcov[i], pcov1, rtol=1e-3, atol=1e-10)
+                    assert_allclose(info.cost[i],
+                                    0.5 * np.sum(((self.func(self.x, *popt1)
+                                                  - self.y[i]) / sigma[i])**2),
+                                    rtol=1e-6)
+
+    def test_residual_scale(self):
+        # the iterations do not depend on the scale of the residuals
+        popt1 = np.array([curve_fit(self.func, self.x, y)[0]
+                          for y in self.y])
+        res = curve_fit_batch(self.func, self.x, self.y)
+        for scale in [1e-4, 1e4]:
+            popt, pcov, info = curve_fit_batch(self.func, self.x, self.y,
+                                               sigma=np.full(30, scale))
+            assert_(info.success.all())
+            assert_allclose(popt, popt1, rtol=1e-5)
+            assert_allclose(info.nfev, res[2].nfev, atol=3)
+
+            popt, pcov, info = curve_fit_batch(
+                lambda x, a, b, c: scale * self.func(x, a, b, c), self.x,
+                scale * self.y)
+            assert_(info.success.all())
+            assert_allclose(popt, popt1, rtol=1e-5)
+
+    def test_independent_problems(self):
+        # the results of a problem do not depend on the rest of the batch
+        popt, pcov, info = curve_fit_batch(self.func, self.x, self.y)
+        popt1, pcov1, info1 = curve_fit_batch(self.func, self.x, self.y[5:6])
+        assert_equal(popt1[0], popt[5])
+        assert_equal(pcov1[0], pcov[5])
+        assert_equal(info1.nfev[0], info.nfev[5])
+
+    def test_p0_and_sigma_shapes(self):
+        p0 = self.params + 0.1
+        sigma = np.ones(30)
+        res1 = curve_fit_batch(self.func, self.x, self.y, p0=p0, sigma=sigma)
+        res2 = curve_fit_batch(self.func, self.x, self.y, p0=p0,
+                               sigma=np.tile(sigma, (20, 1)))
+        assert_allclose(res1[0], res2[0], rtol=1e-13)
+        assert_allclose(res1[0], self.params, atol=0.2)
+
+        assert_raises(ValueError, curve_fit_batch, self.func, self.x,
+                      self.y[0])
+        assert_raises(ValueError, curve_fit_batch, self.func, self.x, self.y,
+                      p0=np.ones((3, 3)))
+        assert_raises(ValueError, curve_fit_batch, self.func, self.x, self.y,
+                      sigma=np.ones(3))
+        assert_raises(ValueError, curve_fit_batch,
+                      lambda x, a, b, c: a + b + c, self.x, self.y)
+
+    def test_status(self):
+        y = self.y[:3].copy()
+        y[1, 4] = np.nan
+        assert_raises(ValueError, curve_fit_batch, self.func, self.x, y)
+        popt, pcov, info = curve_fit_batch(self.func, self.x, y,
+                                           check_finite=False, maxfev=10)
+        assert_array_equal(info.status[1], -1)
+        assert_array_equal(info.success, info.status > 0)
+        assert_(np.isinf(pcov[1]).all())
+        assert_(not info.success[0])
+        assert_(info.nfev[0] >= 10)
+
+    def test_indeterminate_covariance(self):
+        # as many data points as parameters
+        with suppress_warnings() as sup:
+            sup.filter(OptimizeWarning)
+            popt, pcov, info = curve_fit_batch(self.func, self.x[:3],
+                                               self.y[:, :3])
+        assert_(np.isinf(pcov).all())
+        _assert_warns(OptimizeWarning, curve_fit_batch, self.func,
+                      self.x[:3], self.y[:, :3])
+
+
 class TestFixedPoint(object):
 
     def test_scalar_trivial(self):
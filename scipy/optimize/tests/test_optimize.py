@@ -23,6 +23,7 @@ from pytest import raises as assert_raises
 
 from scipy._lib._numpy_compat import suppress_warnings
 from scipy import optimize
+from scipy.optimize import EvaluationCache
 
 
 def test_check_grad():
@@ -605,6 +606,31 @@ class TestOptimizeSimple(CheckOptimize):
                                 options={'disp': False, 'maxls': 1})
         assert_(not sol.success)
 
+    def test_minimize_l_bfgs_b_workers(self):
+        # the approximate gradient is computed with a map-like callable, and
+        # its function evaluations are counted
+        calls = []
+
+        def mapper(func, iterable):
+            calls.append(1)
+            return map(func, iterable)
+
+        opts = {'disp': False, 'maxiter': self.maxiter}
+        r = optimize.minimize(self.func, self.startparams,
+                              method='L-BFGS-B', options=opts)
+        opts['workers'] = mapper
+        rm = optimize.minimize(self.func, self.startparams,
+                               method='L-BFGS-B', options=opts)
+        assert_equal(rm.x, r.x)
+        assert_equal(rm.nfev, r.nfev)
+        assert_(len(calls) > 0)
+
+        params, fopt, d = optimize.fmin_l_bfgs_b(self.func, self.startparams,
+                                                 approx_grad=True,
+                                                 maxiter=self.maxiter,
+                                                 workers=map)
+        assert_equal(params, r.x)
+
     def test_minimize_l_bfgs_b_maxfun_interruption(self):
         # gh-6162
         f = optimize.rosen
@@ -1141,6 +1167,100 @@ class TestOptimizeResultAttributes(object):
                 assert_(attribute in dir(res))
 
 
+class TestEvaluationCache(object):
+    def fun_and_grad(self, x):
+        self.calls.append(np.array(x))
+        return optimize.rosen(x), optimize.rosen_der(x)
+
+    def setup_method(self):
+        self.calls = []
+
+    def test_lru(self):
+        cache = EvaluationCache(self.fun_and_grad, True, maxsize=2)
+        x = np.array([1., 2.])
+        assert_equal(cache.fun(x), optimize.rosen(x))
+        assert_equal(cache.jac(x), optimize.rosen_der(x))
+        cache.fun(x + 1)
+        cache.fun(x)
+        # x + 1 is the least recently used point
+        cache.fun(x + 2)
+        cache.jac(x)
+        cache.fun(x + 1)
+        assert_equal(len(self.calls), 4)
+        assert_equal(cache.info(), (3, 4, 4, 2, 2))
+
+        # the arrays returned can be modified
+        g = cache.jac(x + 1)
+        g[:] = 0
+        assert_equal(cache.jac(x + 1), optimize.rosen_der(x + 1))
+
+        assert_raises(ValueError, EvaluationCache, self.fun_and_grad,
+                      maxsize=0)
+
+    def test_separate_jac(self):
+        def fun(x, a):
+            self.calls.append(np.array(x))
+            return a * optimize.rosen(x)
+
+        def jac(x, a):
+            return a * optimize.rosen_der(x)
+
+        cache = EvaluationCache(fun, jac, args=(2.,))
+        x = np.array([1., 2.])
+        assert_equal(cache.jac(x), 2 * optimize.rosen_der(x))
+        assert_equal(cache.fun(x), 2 * optimize.rosen(x))
+        assert_equal(cache.fun(x), 2 * optimize.rosen(x))
+        assert_equal(cache.info(), (1, 1, 1, 1, 1))
+
+    def test_minimize(self):
+        x0 = [1.3, 0.7, 0.8, 1.9, 1.2]
+        for method in ['Nelder-Mead', 'Powell', 'CG', 'BFGS', 'Newton-CG',
+                       'L-BFGS-B', 'TNC', 'COBYLA', 'SLSQP', 'dogleg',
+                       'trust-ncg', 'trust-krylov', 'trust-exact']:
+            with suppress_warnings() as sup:
+                sup.filter(RuntimeWarning,
+                           "Method .+ does not use (gradient|Hessian.*) "
+                           "information")
+                self.calls = []
+                res = optimize.minimize(self.fun_and_grad, x0, jac=True,
+                                        hess=optimize.rosen_hess,
+                                        method=method,
+                                        options={'maxiter': 50})
+                ncalls = len(self.calls)
+                self.calls = []
+                res_cache = optimize.minimize(self.fun_and_grad, x0,
+                                              jac=True,
+                                              hess=optimize.rosen_hess,
+                                              method=method,
+                                              options={'maxiter': 50},
+                                              cache_size=4)
+            assert_equal(res_cache.x, res.x)
+            assert_(res_cache.cache_info.nfev == len(self.calls) <= ncalls)
+            assert_(res_cache.cache_info.maxsize == 4)
+            assert_('cache_info' not in res)
+
+    def test_minimize_args(self):
+        # the extra arguments are passed to all the functions
+        def hessp(x, p, a):
+            return a * optimize.rosen_hess_prod(x, p)
+
+        def fun(x, a):
+            return a * optimize.rosen(x)
+
+        def jac(x, a):
+            return a * optimize.rosen_der(x)
+
+        x0 = [1.3, 0.7, 0.8]
+        res = optimize.minimize(fun, x0, args=(2.,), jac=jac, hessp=hessp,
+                                method='trust-ncg')
+        res_cache = optimize.minimize(fun, x0, args=(2.,), jac=jac,
+                                      hessp=hessp, method='trust-ncg',
+                                      cache_size=1)
+        assert_equal(res_cache.x, res.x)
+        assert_equal(res_cache.cache_info.nfev + res_cache.cache_info.njev
+                     + res_cache.cache_info.hits, res.nfev + res.njev)
+
+
 class TestBrute:
     # Test the "brute force" method
     def setup_method(self):
@@ -142,6 +142,27 @@ class TestSLSQP(object):
         assert_(res['success'], res['message'])
         assert_allclose(res.x, [1, 1])
 
+    def test_minimize_equality_approximated_workers(self):
+        # The approximate Jacobians are computed with a map-like callable,
+        # with the same results as serial evaluation.
+        calls = []
+
+        def mapper(func, iterable):
+            calls.append(1)
+            return map(func, iterable)
+
+        cons = {'type': 'eq', 'fun': self.f_eqcon, 'args': (-1.0, )}
+        res = minimize(self.fun, [-1.0, 1.0], args=(-1.0, ),
+                       constraints=cons, method='SLSQP', options=self.opts)
+        opts = dict(self.opts, workers=mapper)
+        res_map = minimize(self.fun, [-1.0, 1.0], args=(-1.0, ),
+                           constraints=cons, method='SLSQP', options=opts)
+        assert_(res_map['success'], res_map['message'])
+        assert_equal(res_map.x, res.x)
+        assert_equal(res_map.nfev, res.nfev)
+        # the objective and the constraint at each gradient evaluation
+        assert_equal(len(calls), 2 * res.njev)
+
     def test_minimize_equality_given(self):
         # Minimize with method='SLSQP': equality constraint, given jacobian.
         res = minimize(self.fun, [-1.0, 1.0], jac=self.jac,
@@ -2,10 +2,13 @@ from __future__ import division, print_function, absolute_import
 
 from math import sqrt, exp, sin, cos
 
+import numpy as np
 from numpy.testing import (assert_warns, assert_, 
                            assert_allclose,
                            assert_equal)
 from numpy import finfo
+from pytest import raises as assert_raises
+from scipy._lib._numpy_compat import suppress_warnings
 
 from scipy.optimize import zeros as cc
 from scipy.optimize import zeros
@@ -101,6 +104,158 @@ def test_gh_5557():
         assert_allclose(0.6, res, atol=atol, rtol=rtol)
 
 
+class TestArrayProblems(object):
+    # The roots of arrays of problems are those of the scalar problems
+
+    def check_scalar_results(self, method, f, x, r, *points, **kwargs):
+        for i in range(len(x)):
+            scalar_points = [p[i] for p in points]
+            try:
+                xs, rs = method(f, *scalar_points, full_output=True,
+                                disp=False, **kwargs)
+            except ValueError:
+                assert_equal(r.flag[i], 'sign error')
+                assert_(np.isnan(x[i]))
+                continue
+            assert_equal(x[i], xs)
+            assert_equal(r.iterations[i], rs.iterations)
+            assert_equal(r.function_calls[i], rs.function_calls)
+            assert_equal(r.converged[i], rs.converged)
+            assert_equal(r.flag[i], rs.flag)
+
+    def test_bracket_methods(self):
+        np.random.seed(1234)
+        a = np.random.uniform(-0.5, 0.9, 30)
+        b = np.random.uniform(1.1, 3, 30)
+        xtol = 4*finfo(float).eps
+        rtol = 4*finfo(float).eps
+        for method in [cc.bisect, cc.ridder, cc.brentq, cc.brenth]:
+            for function in functions[:4]:
+                sizes = []
+
+                def f(x):
+                    sizes.append(x.size)
+                    return np.vectorize(function, otypes=[float])(x)
+
+                x, r = method(f, a, b, xtol=xtol, rtol=rtol,
+                              full_output=True, disp=False)
+                assert_equal(x.shape, a.shape)
+                self.check_scalar_results(method, function, x, r, a, b,
+                                          xtol=xtol, rtol=rtol)
+                # the converged problems are not evaluated any more
+                assert_(sizes[-1] < sizes[0])
+
+    def test_newton(self):
+        # x*x*x is rounded in the same way for arrays and scalars
+        f = lambda x, c: x*x*x - c
+        f_1 = lambda x, c: 3*x*x
+        f_2 = lambda x, c: 6*x
+        np.random.seed(1234)
+        c = np.random.uniform(1, 100, (4, 5))
+        x0 = np.random.uniform(1, 10, (4, 5))
+        for kwargs in [{}, {'fprime': f_1}, {'fprime': f_1, 'fprime2': f_2}]:
+            x, r = zeros.newton(f, x0, args=(c,), tol=1e-12,
+                                full_output=True, **kwargs)
+            assert_equal(x.shape, (4, 5))
+            assert_(r.converged.all())
+            assert_allclose(x, c**(1/3.), rtol=1e-12)
+            for i in range(4):
+                for j in range(5):
+                    xs, rs = zeros.newton(f, x0[i, j], args=(c[i, j],),
+                                          tol=1e-12, full_output=True,
+                                          **kwargs)
+                    assert_equal(x[i, j], xs)
+                    assert_equal(r.iterations[i, j], rs.iterations)
+                    assert_equal(r.function_calls[i, j], rs.function_calls)
+
+    def test_newton_zero_derivative(self):
+        x0 = np.array([0., 1., 0.5])
+        x, r = assert_warns(RuntimeWarning, zeros.newton,
+                            lambda x: x**2 - 0.25, x0, lambda x: 2*x,
+                            full_output=True)
+        assert_equal(r.flag[0], 'zero derivative')
+        assert_equal(r.converged, [False, True, True])
+        assert_allclose(x[1:], 0.5)
+        # as for a scalar x0, func isn't called where fprime is zero
+        assert_equal(r.function_calls[0], 0)
+        assert_equal(r.function_calls[1:], r.iterations[1:])
+
+    def test_single_element_arrays(self):
+        # arrays of one element are solved as scalar problems
+        f = lambda x: x**2 - 0.25
+        for method in [cc.bisect, cc.ridder, cc.brentq, cc.brenth]:
+            x, r = method(f, np.array([0.]), np.array([1.]),
+                          full_output=True)
+            assert_equal(np.ndim(x), 0)
+            assert_equal(np.ndim(r.iterations), 0)
+            assert_allclose(x, 0.5)
+        x, r = zeros.newton(f, np.array([1.]), lambda x: 2*x,
+                            full_output=True)
+        assert_equal(np.ndim(r.iterations), 0)
+        assert_allclose(x, 0.5)
+
+    def test_no_empty_calls(self):
+        # the functions aren't called with an empty array once all the
+        # problems are finished, as reductions over x fail then
+        def nonempty(function):
+            def f(x):
+                x.max()
+                return function(x)
+            return f
+
+        f = nonempty(lambda x: x**2 - 0.25)
+        f_1 = nonempty(lambda x: 2*x)
+        f_2 = nonempty(lambda x: 2 + 0*x)
+        for kwargs in [{}, {'fprime': f_1}, {'fprime': f_1, 'fprime2': f_2}]:
+            x = zeros.newton(f, np.array([1., 2.]), **kwargs)
+            assert_allclose(x, 0.5)
+            # the derivative is zero for all the problems
+            with suppress_warnings() as sup:
+                sup.filter(RuntimeWarning, "derivative was zero")
+                zeros.newton(f, np.array([0., 0.]), full_output=True,
+                             disp=False, **kwargs)
+        for method in [cc.bisect, cc.ridder, cc.brentq, cc.brenth]:
+            x = method(f, np.array([0., 0.1]), np.array([1., 2.]))
+            assert_allclose(x, 0.5)
+
+    def test_errors(self):
+        f = lambda x: x**2 - 1
+        a = np.array([0.1, 2., 0.2])
+        b = np.array([2.3, 3., 3.1])
+        for method in [cc.bisect, cc.ridder, cc.brentq, cc.brenth]:
+            assert_raises(ValueError, method, f, a, b)
+            x, r = method(f, a, b, full_output=True, disp=False)
+            assert_equal(r.flag[1], 'sign error')
+            assert_equal(r.converged, [True, False, True])
+            assert_(np.isnan(x[1]))
+            assert_allclose(x[[0, 2]], 1.)
+
+            assert_raises(RuntimeError, method, f, a[[0, 2]], b[[0, 2]],
+                          maxiter=2)
+            x, r = method(f, a[[0, 2]], b[[0, 2]], maxiter=2,
+                          full_output=True, disp=False)
+            assert_equal(r.flag, ['convergence error'] * 2)
+            assert_equal(r.iterations, [2, 2])
+
+            # the function must return an array of the shape of x
+            assert_raises(ValueError, method, lambda x: 1., a, b)
+
+        assert_raises(RuntimeError, zeros.newton, lambda x: x**2 + 1,
+                      np.array([2., 3.]), maxiter=5)
+        x, r = zeros.newton(lambda x: x**2 + 1, np.array([2., 3.]),
+                            maxiter=5, full_output=True, disp=False)
+        assert_equal(r.converged, [False, False])
+
+    def test_scalar_newton_full_output(self):
+        f = lambda x: x**2 - 2
+        x, r = zeros.newton(f, 1., fprime=lambda x: 2*x, full_output=True)
+        assert_(r.converged)
+        assert_allclose(x, sqrt(2))
+        assert_equal(r.function_calls, r.iterations)
+        x, r = zeros.newton(f, 1., maxiter=2, full_output=True, disp=False)
+        assert_equal(r.flag, 'convergence error')
+
+
 class TestRootResults:
     def test_repr(self):
         r = zeros.RootResults(root=1.0,
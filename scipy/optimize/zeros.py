@@ -2,6 +2,8 @@ from __future__ import division, print_function, absolute_import
 
 import warnings
 
+import numpy as np
+
 from . import _zeros
 from numpy import finfo, sign, sqrt
 
@@ -14,22 +16,31 @@ __all__ = ['newton', 'bisect', 'ridder', 'brentq', 'brenth']
 CONVERGED = 'converged'
 SIGNERR = 'sign error'
 CONVERR = 'convergence error'
-flag_map = {0: CONVERGED, -1: SIGNERR, -2: CONVERR}
+ZERODER = 'zero derivative'
+flag_map = {0: CONVERGED, -1: SIGNERR, -2: CONVERR, -3: ZERODER}
+_ECONVERGED = 0
+_ESIGNERR = -1
+_ECONVERR = -2
+_EZERODER = -3
 
 
 class RootResults(object):
     """ Represents the root finding result.
+
+    For the array problems of the root finders, the attributes are arrays
+    with one element per scalar problem.
+
     Attributes
     ----------
-    root : float
+    root : float or ndarray
         Estimated root location.
-    iterations : int
+    iterations : int or ndarray
         Number of iterations needed to find the root.
-    function_calls : int
+    function_calls : int or ndarray
         Number of times the function was called.
-    converged : bool
+    converged : bool or ndarray
         True if the routine converged.
-    flag : str
+    flag : str or ndarray of str
         Description of the cause of termination.
     """
     def __init__(self, root, iterations, function_calls, flag):
@@ -37,6 +48,11 @@ class RootResults(object):
         self.iterations = iterations
         self.function_calls = function_calls
         self.converged = flag == 0
+        if np.ndim(flag) > 0:
+            self.flag = np.empty(np.shape(flag), dtype=object)
+            for code, name in flag_map.items():
+                self.flag[flag == code] = name
+            return
         try:
             self.flag = flag_map[flag]
         except KeyError:
@@ -62,9 +78,325 @@ def results_c(full_output, r):
         return r
 
 
+def _results_select(full_output, r):
+    """Select from a tuple of (root, funccalls, iterations, flag)"""
+    x, funcalls, iterations, flag = r
+    if full_output:
+        results = RootResults(root=x,
+                              iterations=iterations,
+                              function_calls=funcalls,
+                              flag=flag)
+        return x, results
+    return x
+
+
+class _ArrayRoots(object):
+    """
+    Bookkeeping of the root finders for arrays of scalar problems.
+
+    The problems are raveled.  The active problems, those not finished,
+    are ``self.active``: the solvers keep their state for the active
+    problems only, and evaluate the function at their points only, with
+    the elements of the arguments of the shape of the problems for the
+    active problems.
+
+    Parameters
+    ----------
+    f : callable
+        Vectorized function ``f(x, *args)``.
+    arrays : list of array_like
+        Initial points or brackets, broadcast against each other.
+    args : tuple
+        Extra arguments of `f`.  The arrays of the shape of the
+        problems are taken element-wise, the others are passed as is.
+    dtype : dtype
+        Data type of the points.
+    """
+
+    def __init__(self, f, arrays, args, dtype=float):
+        arrays = np.broadcast_arrays(*[np.asarray(a, dtype=dtype)
+                                       for a in arrays])
+        self.shape = arrays[0].shape
+        self.points = [a.ravel().copy() for a in arrays]
+        n = self.points[0].size
+
+        self.f = f
+        self._elementwise = [np.shape(arg) == self.shape for arg in args]
+        self.args = tuple(np.ravel(arg) if e else arg
+                          for arg, e in zip(args, self._elementwise))
+        self.active = np.arange(n)
+        self.root = np.zeros(n, dtype=dtype)
+        self.iterations = np.zeros(n, dtype=int)
+        self.function_calls = np.zeros(n, dtype=int)
+        self.flag = np.zeros(n, dtype=int)
+
+    def __call__(self, x, func=None, count=True):
+        """Evaluate `func` (default: `f`) at points of the active problems."""
+        if not self.active.size:
+            # all the problems are finished: `func` isn't called with an
+            # empty array, which a reducing function may not support
+            return np.zeros(x.shape, dtype=x.dtype)
+        if func is None:
+            func = self.f
+        fx = np.asarray(func(x, *self.args))
+        if fx.shape != x.shape:
+            raise ValueError('the function must return an array of the '
+                             'shape of its argument, %s instead of %s'
+                             % (fx.shape, x.shape))
+        if count:
+            self.function_calls[self.active] += 1
+        return fx
+
+    def next_iteration(self):
+        self.iterations[self.active] += 1
+
+    def finish(self, done, x, flag=_ECONVERGED):
+        """
+        Record the points `x` of the active problems where `done` as
+        their roots, and remove them from the active problems.
+
+        Returns the index of the remaining active problems in the state
+        arrays of the solver.
+        """
+        if not done.any():
+            return slice(None)
+        finished = self.active[done]
+        self.root[finished] = x[done]
+        self.flag[finished] = flag
+        keep = ~done
+        self.active = self.active[keep]
+        self.args = tuple(arg[keep] if e else arg
+                          for arg, e in zip(self.args, self._elementwise))
+        return keep
+
+    def results(self, full_output, disp, maxiter):
+        """Return the roots, or the roots and a RootResults."""
+        if disp:
+            n_sign = np.count_nonzero(self.flag == _ESIGNERR)
+            if n_sign:
+                raise ValueError('f(a) and f(b) must have different signs '
+                                 '(%d problems)' % n_sign)
+            n_conv = np.count_nonzero(self.flag == _ECONVERR)
+            if n_conv:
+                raise RuntimeError('Failed to converge after %d iterations '
+                                   '(%d problems).' % (maxiter, n_conv))
+        r = (self.root.reshape(self.shape),
+             self.function_calls.reshape(self.shape),
+             self.iterations.reshape(self.shape),
+             self.flag.reshape(self.shape))
+        return _results_select(full_output, r)
+
+
+def _is_array_problem(*points):
+    # Arrays of a single element are a single problem, which is solved by
+    # the scalar solvers as before arrays of problems were supported.
+    return any(np.size(x) != 1 for x in points)
+
+
+def _check_bracket(rs):
+    """
+    Evaluate the function at the brackets ``[a, b]`` of the problems, and
+    finish the problems whose bracket is not valid or has a root at an end.
+
+    Returns the brackets and the values of the function at them, for the
+    remaining problems.
+    """
+    a, b = rs.points
+    fa = rs(a)
+    fb = rs(b)
+    nan = np.full(a.shape, np.nan)
+    keep = rs.finish(fa*fb > 0, nan, _ESIGNERR)
+    a, b, fa, fb = a[keep], b[keep], fa[keep], fb[keep]
+    keep = rs.finish(fa == 0, a)
+    a, b, fa, fb = a[keep], b[keep], fa[keep], fb[keep]
+    keep = rs.finish(fb == 0, b)
+    return a[keep], b[keep], fa[keep], fb[keep]
+
+
+def _array_bisect(rs, xtol, rtol, maxiter):
+    # The algorithm of Zeros/bisect.c, for the active problems
+    xa, xb, fa, fb = _check_bracket(rs)
+    dm = xb - xa
+    for i in range(maxiter):
+        if not rs.active.size:
+            break
+        rs.next_iteration()
+        dm *= .5
+        xm = xa + dm
+        fm = rs(xm)
+        xa = np.where(fm*fa >= 0, xm, xa)
+        keep = rs.finish((fm == 0) | (abs(dm) < xtol + rtol*abs(xm)), xm)
+        xa, fa, dm = xa[keep], fa[keep], dm[keep]
+    rs.finish(np.ones(xa.shape, dtype=bool), xa, _ECONVERR)
+
+
+def _array_ridder(rs, xtol, rtol, maxiter):
+    # The algorithm of Zeros/ridder.c, for the active problems
+    tol = xtol + rtol*np.minimum(abs(rs.points[0]), abs(rs.points[1]))
+    xa, xb, fa, fb = _check_bracket(rs)
+    tol = tol[rs.active]
+    xn = np.zeros(xa.shape)
+    for i in range(maxiter):
+        if not rs.active.size:
+            break
+        rs.next_iteration()
+        dm = 0.5*(xb - xa)
+        xm = xa + dm
+        fm = rs(xm)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dn = (np.where(fb - fa > 0, 1., -1.)*dm*fm
+                  / np.sqrt(fm*fm - fa*fb))
+        xn = xm - np.where(dn > 0, 1., -1.)*np.minimum(abs(dn),
+                                                       abs(dm) - .5*tol)
+        fn = rs(xn)
+        lower = fn*fm < 0.0
+        upper = ~lower & (fn*fa < 0.0)
+        xa, fa, xb, fb = (np.where(upper, xa, xn), np.where(upper, fa, fn),
+                          np.where(lower, xm, np.where(upper, xn, xb)),
+                          np.where(lower, fm, np.where(upper, fn, fb)))
+        tol = xtol + rtol*xn
+        keep = rs.finish((fn == 0.0) | (abs(xb - xa) < tol), xn)
+        xa, fa, xb, fb, xn, tol = (xa[keep], fa[keep], xb[keep], fb[keep],
+                                   xn[keep], tol[keep])
+    rs.finish(np.ones(xn.shape, dtype=bool), xn, _ECONVERR)
+
+
+def _array_brent(rs, xtol, rtol, maxiter, hyperbolic=False):
+    # The algorithms of Zeros/brentq.c and Zeros/brenth.c, for the active
+    # problems
+    xpre, xcur, fpre, fcur = _check_bracket(rs)
+    xblk = np.zeros(xpre.shape)
+    fblk = np.zeros(xpre.shape)
+    spre = np.zeros(xpre.shape)
+    scur = np.zeros(xpre.shape)
+    for i in range(maxiter):
+        if not rs.active.size:
+            break
+        rs.next_iteration()
+        bracket = fpre*fcur < 0
+        xblk = np.where(bracket, xpre, xblk)
+        fblk = np.where(bracket, fpre, fblk)
+        spre = np.where(bracket, xcur - xpre, spre)
+        scur = np.where(bracket, xcur - xpre, scur)
+
+        swap = abs(fblk) < abs(fcur)
+        xpre, xcur, xblk = (np.where(swap, xcur, xpre),
+                            np.where(swap, xblk, xcur),
+                            np.where(swap, xcur, xblk))
+        fpre, fcur, fblk = (np.where(swap, fcur, fpre),
+                            np.where(swap, fblk, fcur),
+                            np.where(swap, fcur, fblk))
+
+        delta = (xtol + rtol*abs(xcur))/2
+        sbis = (xblk - xcur)/2
+        keep = rs.finish((fcur == 0) | (abs(sbis) < delta), xcur)
+        (xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, delta,
+         sbis) = (xpre[keep], xcur[keep], xblk[keep], fpre[keep],
+                  fcur[keep], fblk[keep], spre[keep], scur[keep],
+                  delta[keep], sbis[keep])
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # interpolate
+            stry = -fcur*(xcur - xpre)/(fcur - fpre)
+            # extrapolate
+            dpre = (fpre - fcur)/(xpre - xcur)
+            dblk = (fblk - fcur)/(xblk - xcur)
+            if hyperbolic:
+                sext = -fcur*(fblk - fpre)/(fblk*dpre - fpre*dblk)
+            else:
+                sext = (-fcur*(fblk*dblk - fpre*dpre)
+                        / (dblk*dpre*(fblk - fpre)))
+        stry = np.where(xpre == xblk, stry, sext)
+        short = ((abs(spre) > delta) & (abs(fcur) < abs(fpre))
+                 & (2*abs(stry) < np.minimum(abs(spre), 3*abs(sbis) - delta)))
+        spre = np.where(short, scur, sbis)
+        scur = np.where(short, stry, sbis)
+
+        xpre = xcur
+        fpre = fcur
+        xcur = xcur + np.where(abs(scur) > delta, scur,
+                               np.where(sbis > 0, delta, -delta))
+        fcur = rs(xcur)
+    rs.finish(np.ones(xcur.shape, dtype=bool), xcur, _ECONVERR)
+
+
+def _array_bracket_solver(solver, f, a, b, args, xtol, rtol, maxiter,
+                          full_output, disp, **kwargs):
+    if maxiter < 0:
+        raise ValueError("maxiter should be > 0")
+    rs = _ArrayRoots(f, [a, b], args)
+    solver(rs, xtol, rtol, maxiter, **kwargs)
+    return rs.results(full_output, disp, maxiter)
+
+
+def _array_newton(func, x0, fprime, args, tol, maxiter, fprime2,
+                  full_output, disp):
+    # The iterations of newton for the active problems
+    x0 = np.asarray(x0)
+    rs = _ArrayRoots(func, [x0], args, dtype=np.result_type(x0, 1.0))
+    p0 = rs.points[0]
+    n_zero_der = 0
+    if fprime is not None:
+        for iter in range(maxiter):
+            if not rs.active.size:
+                break
+            rs.next_iteration()
+            # as in the scalar method, `func` isn't evaluated at the points
+            # where the derivative is zero
+            fder = rs(p0, fprime, count=False)
+            zero_der = fder == 0
+            n_zero_der += np.count_nonzero(zero_der)
+            keep = rs.finish(zero_der, p0, _EZERODER)
+            p0, fder = p0[keep], fder[keep]
+            fval = rs(p0)
+            if fprime2 is not None:
+                fder2 = rs(p0, fprime2, count=False)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    # Parabolic Halley's method
+                    discr = fder ** 2 - 2 * fval * fder2
+                    halley = np.where(
+                        discr < 0, fder / fder2,
+                        2*fval / (fder + sign(fder) * sqrt(discr)))
+                p = p0 - np.where(fder2 == 0, fval / fder, halley)
+            else:
+                # Newton step
+                p = p0 - fval / fder
+            keep = rs.finish(abs(p - p0) < tol, p)
+            p0 = p[keep]
+        p = p0
+    else:
+        # Secant method
+        p1 = np.where(p0 >= 0, p0*(1 + 1e-4) + 1e-4, p0*(1 + 1e-4) - 1e-4)
+        q0 = rs(p0)
+        q1 = rs(p1)
+        p = p1
+        for iter in range(maxiter):
+            if not rs.active.size:
+                break
+            rs.next_iteration()
+            flat = q1 == q0
+            midpoint = (p1 + p0)/2.0
+            keep = rs.finish(flat & (p1 == p0), midpoint)
+            p0, p1, q0, q1, midpoint, flat = (p0[keep], p1[keep], q0[keep],
+                                              q1[keep], midpoint[keep],
+                                              flat[keep])
+            n_zero_der += np.count_nonzero(flat)
+            keep = rs.finish(flat, midpoint, _EZERODER)
+            p0, p1, q0, q1 = p0[keep], p1[keep], q0[keep], q1[keep]
+            p = p1 - q1*(p1 - p0)/(q1 - q0)
+            keep = rs.finish(abs(p - p1) < tol, p)
+            p0, p1, q0, p = p1[keep], p[keep], q1[keep], p[keep]
+            q1 = rs(p1)
+    rs.finish(np.ones(p.shape, dtype=bool), p, _ECONVERR)
+    if n_zero_der:
+        msg = "derivative was zero for %d problems." % n_zero_der
+        warnings.warn(msg, RuntimeWarning)
+    return rs.results(full_output, disp, maxiter)
+
+
 # Newton-Raphson method
 def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
-           fprime2=None):
+           fprime2=None, full_output=False, disp=True):
     """
     Find a zero using the Newton-Raphson or secant method.
 
@@ -74,20 +406,29 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
     derivate `fprime2` of `func` is provided, parabolic Halley's method
     is used.
 
+    If `x0` is an array of more than one element, the zeros of many
+    independent scalar problems are found at once: `func`, `fprime` and
+    `fprime2` must be vectorized, and are called with the array of the
+    current points of the problems that have not converged yet.  An array
+    `x0` of one element is a single problem, solved as for a scalar `x0`.
+
     Parameters
     ----------
     func : function
         The function whose zero is wanted. It must be a function of a
         single variable of the form f(x,a,b,c...), where a,b,c... are extra
         arguments that can be passed in the `args` parameter.
-    x0 : float
+    x0 : float or array_like
         An initial estimate of the zero that should be somewhere near the
-        actual zero.
+        actual zero, or an array of initial estimates of the zeros of
+        independent problems.
     fprime : function, optional
         The derivative of the function when available and convenient. If it
         is None (default), then the secant method is used.
     args : tuple, optional
-        Extra arguments to be used in the function call.
+        Extra arguments to be used in the function call.  If `x0` is an
+        array, the arguments that are arrays of the shape of `x0` are
+        taken element-wise, for the problems that have not converged yet.
     tol : float, optional
         The allowable error of the zero value.
     maxiter : int, optional
@@ -97,11 +438,28 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
         convenient. If it is None (default), then the normal Newton-Raphson
         or the secant method is used. If it is given, parabolic Halley's
         method is used.
+    full_output : bool, optional
+        If `full_output` is False (default), the root is returned.  If True,
+        the return value is ``(x, r)``, where ``x`` is the root and ``r`` is
+        a `RootResults` object, whose attributes are arrays if `x0` is an
+        array.
+
+        .. versionadded:: 1.1.0
+    disp : bool, optional
+        If True (default), raise RuntimeError if the algorithm didn't
+        converge (for any of the problems if `x0` is an array).  Otherwise
+        the last estimate is returned, and the convergence status is
+        reported by ``r.flag``.
+
+        .. versionadded:: 1.1.0
 
     Returns
     -------
-    zero : float
+    zero : float or ndarray
         Estimated location where function is zero.
+    r : RootResults (present if ``full_output = True``)
+        Object containing information about the convergence.  In particular,
+        ``r.converged`` is True if the routine converged.
 
     See Also
     --------
@@ -154,11 +512,24 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
     >>> root
     1.0
 
+    Find the roots of many problems at once, with a vectorized function
+    and an array argument:
+
+    >>> a = np.array([1., 8., 27.])
+    >>> roots = optimize.newton(lambda x, a: x**3 - a, np.full(3, 1.5),
+    ...                         fprime=lambda x, a: 3 * x**2, args=(a,))
+    >>> roots
+    array([ 1.,  2.,  3.])
+
     """
     if tol <= 0:
         raise ValueError("tol too small (%g <= 0)" % tol)
     if maxiter < 1:
         raise ValueError("maxiter must be greater than 0")
+    if _is_array_problem(x0):
+        return _array_newton(func, x0, fprime, args, tol, maxiter, fprime2,
+                             full_output, disp)
+    funcalls = 0
     if fprime is not None:
         # Newton-Rapheson method
         # Multiply by 1.0 to convert to floating point.  We don't use float(x0)
@@ -171,8 +542,10 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
             if fder == 0:
                 msg = "derivative was zero."
                 warnings.warn(msg, RuntimeWarning)
-                return p0
+                return _results_select(full_output,
+                                       (p0, funcalls, iter + 1, _EZERODER))
             fval = func(*myargs)
+            funcalls += 1
             if fprime2 is not None:
                 fder2 = fprime2(*myargs)
             if fder2 == 0:
@@ -186,7 +559,8 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
                 else:
                     p = p0 - 2*fval / (fder + sign(fder) * sqrt(discr))
             if abs(p - p0) < tol:
-                return p
+                return _results_select(full_output,
+                                       (p, funcalls, iter + 1, _ECONVERGED))
             p0 = p
     else:
         # Secant method
@@ -197,22 +571,32 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
             p1 = x0*(1 + 1e-4) - 1e-4
         q0 = func(*((p0,) + args))
         q1 = func(*((p1,) + args))
+        funcalls = 2
         for iter in range(maxiter):
             if q1 == q0:
+                flag = _ECONVERGED
                 if p1 != p0:
                     msg = "Tolerance of %s reached" % (p1 - p0)
                     warnings.warn(msg, RuntimeWarning)
-                return (p1 + p0)/2.0
+                    flag = _EZERODER
+                return _results_select(full_output,
+                                       ((p1 + p0)/2.0, funcalls, iter + 1,
+                                        flag))
             else:
                 p = p1 - q1*(p1 - p0)/(q1 - q0)
             if abs(p - p1) < tol:
-                return p
+                return _results_select(full_output,
+                                       (p, funcalls, iter + 1, _ECONVERGED))
             p0 = p1
             q0 = q1
             p1 = p
             q1 = func(*((p1,) + args))
-    msg = "Failed to converge after %d iterations, value is %s" % (maxiter, p)
-    raise RuntimeError(msg)
+            funcalls += 1
+    if disp:
+        msg = ("Failed to converge after %d iterations, value is %s"
+               % (maxiter, p))
+        raise RuntimeError(msg)
+    return _results_select(full_output, (p, funcalls, maxiter, _ECONVERR))
 
 
 def bisect(f, a, b, args=(),
@@ -230,10 +614,14 @@ def bisect(f, a, b, args=(),
     f : function
         Python function returning a number.  `f` must be continuous, and
         f(a) and f(b) must have opposite signs.
-    a : number
-        One end of the bracketing interval [a,b].
-    b : number
-        The other end of the bracketing interval [a,b].
+    a : number or array_like
+        One end of the bracketing interval [a,b], or an array of the ends of
+        the brackets of independent problems, which are solved at once with
+        a vectorized `f`.
+    b : number or array_like
+        The other end of the bracketing interval [a,b], or an array of the
+        other ends.  Arrays of one element are a single problem, solved as
+        for numbers.
     xtol : number, optional
         The computed root ``x0`` will satisfy ``np.allclose(x, x0,
         atol=xtol, rtol=rtol)``, where ``x`` is the exact root. The
@@ -248,18 +636,26 @@ def bisect(f, a, b, args=(),
         raised.  Must be >= 0.
     args : tuple, optional
         containing extra arguments for the function `f`.
-        `f` is called by ``apply(f, (x)+args)``.
+        `f` is called by ``apply(f, (x)+args)``.  If `a` or `b` is an
+        array, the arguments that are arrays of the shape of the
+        problems are taken element-wise, for the problems that have not
+        converged yet.
     full_output : bool, optional
         If `full_output` is False, the root is returned.  If `full_output` is
         True, the return value is ``(x, r)``, where x is the root, and r is
         a `RootResults` object.
     disp : bool, optional
         If True, raise RuntimeError if the algorithm didn't converge.
+        For an array of problems, raise RuntimeError if any of the
+        problems didn't converge, and ValueError if ``f(a)`` and ``f(b)``
+        have the same sign for any of them; if False, the status of each
+        problem is reported by ``r.flag``, and the roots of the problems
+        with invalid brackets are NaN.
 
     Returns
     -------
-    x0 : float
-        Zero of `f` between `a` and `b`.
+    x0 : float or ndarray
+        Zero of `f` between `a` and `b`, or the zeros of the problems.
     r : RootResults (present if ``full_output = True``)
         Object containing information about the convergence.  In particular,
         ``r.converged`` is True if the routine converged.
@@ -293,6 +689,9 @@ def bisect(f, a, b, args=(),
         raise ValueError("xtol too small (%g <= 0)" % xtol)
     if rtol < _rtol:
         raise ValueError("rtol too small (%g < %g)" % (rtol, _rtol))
+    if _is_array_problem(a, b):
+        return _array_bracket_solver(_array_bisect, f, a, b, args, xtol, rtol,
+                                     maxiter, full_output, disp)
     r = _zeros._bisect(f,a,b,xtol,rtol,maxiter,args,full_output,disp)
     return results_c(full_output, r)
 
@@ -308,10 +707,14 @@ def ridder(f, a, b, args=(),
     f : function
         Python function returning a number.  f must be continuous, and f(a) and
         f(b) must have opposite signs.
-    a : number
-        One end of the bracketing interval [a,b].
-    b : number
-        The other end of the bracketing interval [a,b].
+    a : number or array_like
+        One end of the bracketing interval [a,b], or an array of the ends of
+        the brackets of independent problems, which are solved at once with
+        a vectorized `f`.
+    b : number or array_like
+        The other end of the bracketing interval [a,b], or an array of the
+        other ends.  Arrays of one element are a single problem, solved as
+        for numbers.
     xtol : number, optional
         The computed root ``x0`` will satisfy ``np.allclose(x, x0,
         atol=xtol, rtol=rtol)``, where ``x`` is the exact root. The
@@ -326,18 +729,26 @@ def ridder(f, a, b, args=(),
         raised.  Must be >= 0.
     args : tuple, optional
         containing extra arguments for the function `f`.
-        `f` is called by ``apply(f, (x)+args)``.
+        `f` is called by ``apply(f, (x)+args)``.  If `a` or `b` is an
+        array, the arguments that are arrays of the shape of the
+        problems are taken element-wise, for the problems that have not
+        converged yet.
     full_output : bool, optional
         If `full_output` is False, the root is returned.  If `full_output` is
         True, the return value is ``(x, r)``, where `x` is the root, and `r` is
         a RootResults object.
     disp : bool, optional
         If True, raise RuntimeError if the algorithm didn't converge.
+        For an array of problems, raise RuntimeError if any of the
+        problems didn't converge, and ValueError if ``f(a)`` and ``f(b)``
+        have the same sign for any of them; if False, the status of each
+        problem is reported by ``r.flag``, and the roots of the problems
+        with invalid brackets are NaN.
 
     Returns
     -------
-    x0 : float
-        Zero of `f` between `a` and `b`.
+    x0 : float or ndarray
+        Zero of `f` between `a` and `b`, or the zeros of the problems.
     r : RootResults (present if ``full_output = True``)
         Object containing information about the convergence.
         In particular, ``r.converged`` is True if the routine converged.
@@ -388,6 +799,9 @@ def ridder(f, a, b, args=(),
         raise ValueError("xtol too small (%g <= 0)" % xtol)
     if rtol < _rtol:
         raise ValueError("rtol too small (%g < %g)" % (rtol, _rtol))
+    if _is_array_problem(a, b):
+        return _array_bracket_solver(_array_ridder, f, a, b, args, xtol, rtol,
+                                     maxiter, full_output, disp)
     r = _zeros._ridder(f,a,b,xtol,rtol,maxiter,args,full_output,disp)
     return results_c(full_output, r)
 
@@ -420,10 +834,14 @@ def brentq(f, a, b, args=(),
         Python function returning a number.  The function :math:`f`
         must be continuous, and :math:`f(a)` and :math:`f(b)` must
         have opposite signs.
-    a : number
-        One end of the bracketing interval :math:`[a, b]`.
-    b : number
-        The other end of the bracketing interval :math:`[a, b]`.
+    a : number or array_like
+        One end of the bracketing interval :math:`[a, b]`, or an array of the
+        ends of the brackets of independent problems, which are solved at
+        once with a vectorized `f`.
+    b : number or array_like
+        The other end of the bracketing interval :math:`[a, b]`, or an array of
+        the other ends.  Arrays of one element are a single problem, solved
+        as for numbers.
     xtol : number, optional
         The computed root ``x0`` will satisfy ``np.allclose(x, x0,
         atol=xtol, rtol=rtol)``, where ``x`` is the exact root. The
@@ -442,18 +860,26 @@ def brentq(f, a, b, args=(),
         raised.  Must be >= 0.
     args : tuple, optional
         containing extra arguments for the function `f`.
-        `f` is called by ``apply(f, (x)+args)``.
+        `f` is called by ``apply(f, (x)+args)``.  If `a` or `b` is an
+        array, the arguments that are arrays of the shape of the
+        problems are taken element-wise, for the problems that have not
+        converged yet.
     full_output : bool, optional
         If `full_output` is False, the root is returned.  If `full_output` is
         True, the return value is ``(x, r)``, where `x` is the root, and `r` is
         a RootResults object.
     disp : bool, optional
         If True, raise RuntimeError if the algorithm didn't converge.
+        For an array of problems, raise RuntimeError if any of the
+        problems didn't converge, and ValueError if ``f(a)`` and ``f(b)``
+        have the same sign for any of them; if False, the status of each
+        problem is reported by ``r.flag``, and the roots of the problems
+        with invalid brackets are NaN.
 
     Returns
     -------
-    x0 : float
-        Zero of `f` between `a` and `b`.
+    x0 : float or ndarray
+        Zero of `f` between `a` and `b`, or the zeros of the problems.
     r : RootResults (present if ``full_output = True``)
         Object containing information about the convergence.  In particular,
         ``r.converged`` is True if the routine converged.
@@ -496,6 +922,14 @@ def brentq(f, a, b, args=(),
     >>> root
     1.0
 
+    Find the roots of ``x**2 - c`` for many values of ``c`` at once:
+
+    >>> c = np.array([1., 4., 9.])
+    >>> roots = optimize.brentq(lambda x, c: x**2 - c, np.zeros(3), 4,
+    ...                         args=(c,))
+    >>> roots
+    array([ 1.,  2.,  3.])
+
     References
     ----------
     .. [Brent1973]
@@ -516,6 +950,9 @@ def brentq(f, a, b, args=(),
         raise ValueError("xtol too small (%g <= 0)" % xtol)
     if rtol < _rtol:
         raise ValueError("rtol too small (%g < %g)" % (rtol, _rtol))
+    if _is_array_problem(a, b):
+        return _array_bracket_solver(_array_brent, f, a, b, args, xtol, rtol,
+                                     maxiter, full_output, disp)
     r = _zeros._brentq(f,a,b,xtol,rtol,maxiter,args,full_output,disp)
     return results_c(full_output, r)
 
@@ -538,10 +975,14 @@ def brenth(f, a, b, args=(),
     f : function
         Python function returning a number.  f must be continuous, and f(a) and
         f(b) must have opposite signs.
-    a : number
-        One end of the bracketing interval [a,b].
-    b : number
-        The other end of the bracketing interval [a,b].
+    a : number or array_like
+        One end of the bracketing interval [a,b], or an array of the ends of
+        the brackets of independent problems, which are solved at once with
+        a vectorized `f`.
+    b : number or array_like
+        The other end of the bracketing interval [a,b], or an array of the
+        other ends.  Arrays of one element are a single problem, solved as
+        for numbers.
     xtol : number, optional
         The computed root ``x0`` will satisfy ``np.allclose(x, x0,
         atol=xtol, rtol=rtol)``, where ``x`` is the exact root. The
@@ -560,18 +1001,26 @@ def brenth(f, a, b, args=(),
         raised.  Must be >= 0.
     args : tuple, optional
         containing extra arguments for the function `f`.
-        `f` is called by ``apply(f, (x)+args)``.
+        `f` is called by ``apply(f, (x)+args)``.  If `a` or `b` is an
+        array, the arguments that are arrays of the shape of the
+        problems are taken element-wise, for the problems that have not
+        converged yet.
     full_output : bool, optional
         If `full_output` is False, the root is returned.  If `full_output` is
         True, the return value is ``(x, r)``, where `x` is the root, and `r` is
         a RootResults object.
     disp : bool, optional
         If True, raise RuntimeError if the algorithm didn't converge.
+        For an array of problems, raise RuntimeError if any of the
+        problems didn't converge, and ValueError if ``f(a)`` and ``f(b)``
+        have the same sign for any of them; if False, the status of each
+        problem is reported by ``r.flag``, and the roots of the problems
+        with invalid brackets are NaN.
 
     Returns
     -------
-    x0 : float
-        Zero of `f` between `a` and `b`.
+    x0 : float or ndarray
+        Zero of `f` between `a` and `b`, or the zeros of the problems.
     r : RootResults (present if ``full_output = True``)
         Object containing information about the convergence.  In particular,
         ``r.converged`` is True if the routine converged.
@@ -617,5 +1066,9 @@ def brenth(f, a, b, args=(),
         raise ValueError("xtol too small (%g <= 0)" % xtol)
     if rtol < _rtol:
         raise ValueError("rtol too small (%g < %g)" % (rtol, _rtol))
+    if _is_array_problem(a, b):
+        return _array_bracket_solver(_array_brent, f, a, b, args, xtol, rtol,
+                                     maxiter, full_output, disp,
+                                     hyperbolic=True)
     r = _zeros._brenth(f,a, b, xtol, rtol, maxiter, args, full_output, disp)
     return results_c(full_output, r)
@@ -62,6 +62,7 @@ Filtering
    sosfilt_zi    -- Compute an initial state zi for the sosfilt function that
                  -- corresponds to the steady state of the step response.
    sosfiltfilt   -- A forward-backward filter for second-order sections.
+   FilterStream  -- Stateful lfilter/sosfilt for signals given in blocks.
    hilbert       -- Compute 1-D analytic signal, using the Hilbert transform.
    hilbert2      -- Compute 2-D analytic signal, using the Hilbert transform.
 
@@ -293,6 +294,7 @@ Spectral Analysis
    stft           -- Compute the Short Time Fourier Transform
    istft          -- Compute the Inverse Short Time Fourier Transform
    check_COLA     -- Check the COLA constraint for iSTFT reconstruction
+   SpectralStream -- Streaming STFT and Welch PSD/CSD estimation
 
 """
 from __future__ import division, print_function, absolute_import
@@ -0,0 +1,79 @@
+# In-place direct form II transposed filters, used by FilterStream.
+#
+# The signals are the rows of `x`, which is overwritten with the output, and
+# the state of each signal is kept in the matching row of `zi`.  The
+# coefficients must have been normalized so that a[0] == 1.
+
+from __future__ import absolute_import
+
+cimport cython
+cimport numpy as np
+import numpy as np
+
+
+ctypedef double complex double_complex
+ctypedef float complex float_complex
+
+ctypedef fused DTYPE_t:
+    float
+    float_complex
+    double
+    double_complex
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _lfilter_inplace(DTYPE_t [::1] b, DTYPE_t [::1] a, DTYPE_t [:, :] x,
+                     DTYPE_t [:, ::1] zi):
+    """
+    Filter the rows of `x` in place with the transfer function (b, a).
+
+    `b` and `a` have the same length n, `zi` has shape ``(x.shape[0], n-1)``.
+    """
+    cdef np.intp_t n_signals = x.shape[0]
+    cdef np.intp_t n_samples = x.shape[1]
+    cdef np.intp_t n_delays = b.shape[0] - 1
+    cdef np.intp_t i, k, j
+    cdef DTYPE_t x_n, y_n
+
+    with nogil:
+        for i in range(n_signals):
+            for k in range(n_samples):
+                x_n = x[i, k]
+                if n_delays == 0:
+                    x[i, k] = b[0] * x_n
+                    continue
+                y_n = zi[i, 0] + b[0] * x_n
+                for j in range(n_delays - 1):
+                    zi[i, j] = zi[i, j + 1] + b[j + 1] * x_n - a[j + 1] * y_n
+                zi[i, n_delays - 1] = b[n_delays] * x_n - a[n_delays] * y_n
+                x[i, k] = y_n
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _sosfilt_inplace(DTYPE_t [:, ::1] sos, DTYPE_t [:, :] x,
+                     DTYPE_t [:, :, ::1] zi):
+    """
+    Filter the rows of `x` in place with the second-order sections `sos`.
+
+    `sos` has shape ``(n_sections, 6)``, `zi` has shape
+    ``(x.shape[0], n_sections, 2)``.
+    """
+    cdef np.intp_t n_signals = x.shape[0]
+    cdef np.intp_t n_samples = x.shape[1]
+    cdef np.intp_t n_sections = sos.shape[0]
+    cdef np.intp_t i, k, s
+    cdef DTYPE_t x_n, y_n
+
+    with nogil:
+        for i in range(n_signals):
+            for k in range(n_samples):
+                x_n = x[i, k]
+                for s in range(n_sections):
+                    y_n = sos[s, 0] * x_n + zi[i, s, 0]
+                    zi[i, s, 0] = (sos[s, 1] * x_n - sos[s, 4] * y_n +
+                                   zi[i, s, 1])
+                    zi[i, s, 1] = sos[s, 2] * x_n - sos[s, 5] * y_n
+                    x_n = y_n
+                x[i, k] = x_n
@@ -23,6 +23,7 @@ def configuration(parent_package='', top_path=None):
     config.add_extension('_spectral', sources=['_spectral.c'])
     config.add_extension('_max_len_seq_inner', sources=['_max_len_seq_inner.c'])
     config.add_extension('_upfirdn_apply', sources=['_upfirdn_apply.c'])
+    config.add_extension('_filter_stream', sources=['_filter_stream.c'])
     spline_src = ['splinemodule.c', 'S_bspline_util.c', 'D_bspline_util.c',
                   'C_bspline_util.c', 'Z_bspline_util.c', 'bspline_util.c']
     config.add_extension('spline', sources=spline_src, **numpy_nodepr_api)
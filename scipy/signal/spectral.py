@@ -14,7 +14,13 @@ import warnings
 from scipy._lib.six import string_types
 
 __all__ = ['periodogram', 'welch', 'lombscargle', 'csd', 'coherence',
-           'spectrogram', 'stft', 'istft', 'check_COLA']
+           'spectrogram', 'stft', 'istft', 'check_COLA', 'SpectralStream']
+
+_BOUNDARY_FUNCS = {'even': even_ext,
+                   'odd': odd_ext,
+                   'constant': const_ext,
+                   'zeros': zero_ext,
+                   None: None}
 
 
 def lombscargle(x,
@@ -1385,6 +1391,449 @@ def coherence(x, y, fs=1.0, window='hann', nperseg=None, noverlap=None,
     return freqs, Cxy
 
 
+class SpectralStream(object):
+    r"""
+    Streaming short-time Fourier transform and Welch's method.
+
+    The input signal is given in blocks of arbitrary length, and only the
+    samples that are not yet part of a complete segment are kept between
+    the blocks, so the memory used is bounded by the size of the blocks.
+    The object either returns the STFT frames of each block (``mode='stft'``)
+    or keeps running sums of the periodograms of the segments, which
+    `average` turns into the power or cross spectral density estimates of
+    Welch's method (``mode='psd'`` and ``mode='csd'``).
+
+    The results are equal, to round-off, to those of `stft`, `welch` and
+    `csd` with the same parameters for the concatenation of the blocks.
+
+    Parameters
+    ----------
+    fs : float, optional
+        Sampling frequency of the time series. Defaults to 1.0.
+    window : str or tuple or array_like, optional
+        Desired window to use. If `window` is a string or tuple, it is
+        passed to `get_window` to generate the window values, which are
+        DFT-even by default. See `get_window` for a list of windows and
+        required parameters. If `window` is array_like it will be used
+        directly as the window and its length must be nperseg. Defaults
+        to a Hann window.
+    nperseg : int, optional
+        Length of each segment. Defaults to None, but if window is str or
+        tuple, is set to 256, and if window is array_like, is set to the
+        length of the window.  Unlike the one-shot functions, `nperseg` is
+        not reduced for a signal shorter than it.
+    noverlap : int, optional
+        Number of points to overlap between segments. If `None`,
+        ``noverlap = nperseg // 2``. Defaults to `None`.
+    nfft : int, optional
+        Length of the FFT used, if a zero padded FFT is desired. If
+        `None`, the FFT length is `nperseg`. Defaults to `None`.
+    detrend : str or function or `False`, optional
+        Specifies how to detrend each segment, as in `welch`. Defaults to
+        'constant' for the spectral densities and to `False` for the STFT.
+    return_onesided : bool, optional
+        If `True`, return a one-sided spectrum for real data. If
+        `False` return a two-sided spectrum. Note that for complex
+        data, a two-sided spectrum is always returned.
+    scaling : { 'density', 'spectrum' }, optional
+        Selects between computing the power spectral density ('density')
+        and the power spectrum ('spectrum'), as in `welch`.  Defaults to
+        'density' for the spectral densities and to 'spectrum' for the
+        STFT.
+    mode : { 'psd', 'csd', 'stft' }, optional
+        Compute the power spectral density of ``x`` ('psd'), the cross
+        spectral density of ``x`` and ``y`` ('csd'), or the STFT of ``x``
+        ('stft').  Defaults to 'psd'.
+    boundary : str or None, optional
+        Specifies whether the input signal is extended at both ends, and
+        how, as in `stft`.  The start of the stream is extended once enough
+        samples have been given, the end by `finish`.  Defaults to `None`.
+    padded : bool, optional
+        Specifies whether the input signal is zero-padded at the end by
+        `finish` to make it fit exactly into an integer number of window
+        segments, as in `stft`. Defaults to `False`.
+    axis : int, optional
+        Axis of the blocks along which the spectra are computed; the
+        default is over the last axis (i.e. ``axis=-1``).
+
+    Attributes
+    ----------
+    freqs : ndarray or None
+        Array of sample frequencies, available once the first block has
+        been given.
+    nsegments : int
+        Number of segments transformed so far.
+
+    See Also
+    --------
+    stft, welch, csd
+
+    Notes
+    -----
+    To reproduce `stft`, use ``SpectralStream(mode='stft',
+    boundary='zeros', padded=True)`` and collect the frames returned by
+    `process` and `finish`.
+
+    The other dimensions of the blocks must be the same for all the blocks
+    of a stream, and in 'csd' mode the blocks of ``x`` and ``y`` must have
+    the same length.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy import signal
+    >>> fs = 10e3
+    >>> x = np.random.normal(size=100000)
+
+    Welch's estimate of the power spectral density, from blocks of 4096
+    samples:
+
+    >>> stream = signal.SpectralStream(fs, nperseg=1024)
+    >>> for i in range(0, len(x), 4096):
+    ...     stream.process(x[i:i+4096])
+    >>> f, Pxx = stream.finish()
+    >>> f1, Pxx1 = signal.welch(x, fs, nperseg=1024)
+    >>> np.allclose(Pxx, Pxx1)
+    True
+
+    The STFT of the same blocks:
+
+    >>> stream = signal.SpectralStream(fs, nperseg=1024, mode='stft',
+    ...                                boundary='zeros', padded=True)
+    >>> frames = [stream.process(x[i:i+4096])[1]
+    ...           for i in range(0, len(x), 4096)]
+    >>> frames.append(stream.finish()[1])
+    >>> Zxx = np.concatenate(frames, axis=-1)
+    >>> f1, t1, Zxx1 = signal.stft(x, fs, nperseg=1024)
+    >>> np.allclose(Zxx, Zxx1)
+    True
+
+    """
+
+    def __init__(self, fs=1.0, window='hann', nperseg=None, noverlap=None,
+                 nfft=None, detrend=None, return_onesided=True, scaling=None,
+                 mode='psd', boundary=None, padded=False, axis=-1):
+        if mode not in ['psd', 'csd', 'stft']:
+            raise ValueError("Unknown value for mode %s, must be one of: "
+                             "{'psd', 'csd', 'stft'}" % mode)
+        if boundary not in _BOUNDARY_FUNCS:
+            raise ValueError("Unknown boundary option '{0}', must be one of: "
+                             "{1}".format(boundary,
+                                          list(_BOUNDARY_FUNCS.keys())))
+        if detrend is None:
+            detrend = False if mode == 'stft' else 'constant'
+        if scaling is None:
+            scaling = 'spectrum' if mode == 'stft' else 'density'
+        if scaling not in ['density', 'spectrum']:
+            raise ValueError('Unknown scaling: %r' % scaling)
+
+        if nperseg is not None:  # if specified by user
+            nperseg = int(nperseg)
+            if nperseg < 1:
+                raise ValueError('nperseg must be a positive integer')
+        win, nperseg = _triage_segments(window, nperseg, input_length=np.inf)
+
+        if nfft is None:
+            nfft = nperseg
+        elif nfft < nperseg:
+            raise ValueError('nfft must be greater than or equal to nperseg.')
+        else:
+            nfft = int(nfft)
+
+        if noverlap is None:
+            noverlap = nperseg//2
+        else:
+            noverlap = int(noverlap)
+        if noverlap >= nperseg:
+            raise ValueError('noverlap must be less than nperseg.')
+
+        self.fs = fs
+        self.nperseg = nperseg
+        self.noverlap = noverlap
+        self.nfft = nfft
+        self.mode = mode
+        self.scaling = scaling
+        self.return_onesided = return_onesided
+        self.boundary = boundary
+        self.padded = padded
+        self.axis = int(axis)
+        self._window = win
+        self._detrend_func = _detrend_func(detrend, self.axis)
+        self.reset()
+
+    def reset(self):
+        """Forget the samples and sums, to start a new stream."""
+        self.freqs = None
+        self.nsegments = 0
+        # samples not yet in a complete segment, data axis last
+        self._buf = None
+        # samples before the start was extended, and the last samples,
+        # from which the end is extended (see `boundary`)
+        self._pending = None
+        self._tail = None
+        self._sum = None
+        self._finished = False
+
+    def _setup(self, x, y):
+        # Windows and scaling as in _spectral_helper, which depend on the
+        # data types of the first blocks
+        win = self._window
+        if y is None:
+            outdtype = np.result_type(x, np.complex64)
+        else:
+            outdtype = np.result_type(x, y, np.complex64)
+        if np.result_type(win, np.complex64) != outdtype:
+            win = win.astype(outdtype)
+
+        if self.scaling == 'density':
+            scale = 1.0 / (self.fs * (win*win).sum())
+        else:
+            scale = 1.0 / win.sum()**2
+        if self.mode == 'stft':
+            scale = np.sqrt(scale)
+
+        if self.return_onesided:
+            if np.iscomplexobj(x) or np.iscomplexobj(y):
+                sides = 'twosided'
+                warnings.warn('Input data is complex, switching to '
+                              'return_onesided=False')
+            else:
+                sides = 'onesided'
+        else:
+            sides = 'twosided'
+
+        if sides == 'twosided':
+            self.freqs = fftpack.fftfreq(self.nfft, 1/self.fs)
+        else:
+            self.freqs = np.fft.rfftfreq(self.nfft, 1/self.fs)
+
+        self._win = win
+        self._scale = scale
+        self._sides = sides
+        self._outdtype = outdtype
+
+    def _as_block(self, x):
+        x = np.asarray(x)
+        if x.ndim == 0:
+            raise ValueError('blocks must be at least 1-D')
+        if x.ndim > 1 and self.axis != -1:
+            x = np.rollaxis(x, self.axis, x.ndim)
+        return x
+
+    def process(self, x, y=None):
+        """
+        Process a block of the signal.
+
+        Parameters
+        ----------
+        x : array_like
+            The next block of the signal.
+        y : array_like, optional
+            The next block of the second signal, of the same length as
+            `x`.  Required in 'csd' mode, not allowed otherwise.
+
+        Returns
+        -------
+        t : ndarray
+            Times of the STFT frames completed by the block, only returned
+            in 'stft' mode.
+        Zxx : ndarray
+            The STFT frames completed by the block, along the last axis,
+            only returned in 'stft' mode.  Their number may be zero.
+        """
+        if self._finished:
+            raise RuntimeError("finish() has been called, call reset() to "
+                               "start a new stream")
+        if (y is None) != (self.mode != 'csd'):
+            raise ValueError("y must be given if and only if mode is 'csd'")
+
+        x = self._as_block(x)
+        if y is not None:
+            y = self._as_block(y)
+            if x.shape[-1] != y.shape[-1]:
+                raise ValueError('the blocks of x and y must have the same '
+                                 'length')
+        if self.freqs is None:
+            self._setup(x, y)
+
+        data = (x,) if y is None else (x, y)
+        if self.boundary is not None:
+            n = self.nperseg//2
+            self._tail = _append(self._tail, data, keep=n + 1)
+            if self._buf is None:
+                # The start is extended once n + 1 samples are known
+                self._pending = _append(self._pending, data)
+                if self._pending[0].shape[-1] <= n:
+                    return self._frames(None)
+                ext_func = _BOUNDARY_FUNCS[self.boundary]
+                data = tuple(np.concatenate(
+                                 (ext_func(d[..., :n + 1], n, axis=-1)[..., :n],
+                                  d), axis=-1)
+                             for d in self._pending)
+                self._pending = None
+
+        self._buf = _append(self._buf, data)
+        return self._frames(self._transform())
+
+    def finish(self):
+        """
+        Process the end of the signal, as set by `boundary` and `padded`.
+
+        Returns
+        -------
+        t : ndarray
+            Times of the last STFT frames, only returned in 'stft' mode.
+        Zxx : ndarray
+            The last STFT frames, along the last axis, only returned in
+            'stft' mode.
+        freqs : ndarray
+            Array of sample frequencies, only returned in 'psd' and 'csd'
+            mode.
+        Pxx : ndarray
+            The power or cross spectral density estimate of the whole
+            signal, only returned in 'psd' and 'csd' mode.
+        """
+        if self.freqs is None:
+            raise ValueError('no data has been processed')
+
+        if not self._finished:
+            self._finished = True
+            n = self.nperseg//2
+            if self.boundary is not None:
+                ext_func = _BOUNDARY_FUNCS[self.boundary]
+                if self._buf is None:
+                    # Too short a signal to have extended its start
+                    self._buf = tuple(ext_func(d, n, axis=-1)
+                                      for d in self._pending)
+                    self._pending = None
+                elif n > 0:
+                    end = tuple(ext_func(d, n, axis=-1)[..., -n:]
+                                for d in self._tail)
+                    self._buf = _append(self._buf, end)
+
+            if self.padded and self._buf is not None:
+                nstep = self.nperseg - self.noverlap
+                nadd = (-(self._buf[0].shape[-1] - self.nperseg) %
+                        nstep) % self.nperseg
+                zeros = tuple(np.zeros(d.shape[:-1] + (nadd,), d.dtype)
+                              for d in self._buf)
+                self._buf = _append(self._buf, zeros)
+
+            result = self._transform()
+        else:
+            result = None
+
+        if self.mode == 'stft':
+            return self._frames(result)
+        return self.average()
+
+    def average(self):
+        """
+        Welch's estimate from the segments processed so far.
+
+        Only available in 'psd' and 'csd' mode.
+
+        Returns
+        -------
+        freqs : ndarray
+            Array of sample frequencies.
+        Pxx : ndarray
+            Power or cross spectral density or power spectrum of the
+            segments processed so far.
+        """
+        if self.mode == 'stft':
+            raise ValueError("average is not available in 'stft' mode")
+        if self.nsegments == 0:
+            raise ValueError('no complete segment has been processed')
+
+        result = self._sum / self.nsegments
+        result *= self._scale
+        if self._sides == 'onesided':
+            if self.nfft % 2:
+                result[..., 1:] *= 2
+            else:
+                # Last point is unpaired Nyquist freq point, don't double
+                result[..., 1:-1] *= 2
+        result = result.astype(self._outdtype)
+        if self.mode == 'psd':
+            result = result.real
+        return self.freqs, np.rollaxis(result, -1, self.axis)
+
+    def _transform(self):
+        """Transform the complete segments of the buffered samples."""
+        if self._buf is None or self._buf[0].shape[-1] < self.nperseg:
+            return None
+
+        nstep = self.nperseg - self.noverlap
+        nseg = (self._buf[0].shape[-1] - self.noverlap) // nstep
+        results = [_fft_helper(d, self._win, self._detrend_func,
+                               self.nperseg, self.noverlap, self.nfft,
+                               self._sides)
+                   for d in self._buf]
+        # Keep a copy of the rest only, not a view of the whole block
+        self._buf = tuple(d[..., nseg*nstep:].copy() for d in self._buf)
+        self.nsegments += nseg
+
+        if self.mode == 'stft':
+            result = results[0]
+            result *= self._scale
+            return result.astype(self._outdtype)
+
+        result = np.conjugate(results[0]) * results[-1]
+        total = result.sum(axis=-2)
+        if self._sum is None:
+            self._sum = total.astype(np.result_type(total, np.complex128))
+        else:
+            self._sum += total
+        return None
+
+    def _frames(self, result):
+        if self.mode != 'stft':
+            return None
+
+        nstep = self.nperseg - self.noverlap
+        if result is None:
+            nseg = 0
+        else:
+            nseg = result.shape[-2]
+        start = self.nsegments - nseg
+        time = (self.nperseg/2 + nstep*np.arange(start, self.nsegments)
+                )/float(self.fs)
+        if self.boundary is not None:
+            time -= (self.nperseg/2) / self.fs
+
+        if result is None:
+            shape = self._block_shape() + (0, len(self.freqs))
+            result = np.empty(shape, dtype=self._outdtype)
+
+        # Output is going to have new last axis for time/window index, so a
+        # negative axis index shifts down one
+        axis = self.axis
+        if axis < 0:
+            axis -= 1
+        return time, np.rollaxis(result, -1, axis)
+
+    def _block_shape(self):
+        for d in (self._buf, self._pending, self._tail):
+            if d is not None:
+                return d[0].shape[:-1]
+        return ()
+
+
+def _append(buffers, data, keep=None):
+    """
+    Concatenate the arrays of `data` to those of `buffers` (or None) along
+    their last axis, keeping the last `keep` samples only if given.
+    """
+    if buffers is not None:
+        data = tuple(np.concatenate((b, d), axis=-1)
+                     for b, d in zip(buffers, data))
+    if keep is not None:
+        data = tuple(d[..., -keep:].copy() for d in data)
+    return data
+
+
 def _spectral_helper(x, y, fs=1.0, window='hann', nperseg=None, noverlap=None,
                      nfft=None, detrend='constant', return_onesided=True,
                      scaling='spectrum', axis=-1, mode='psd', boundary=None,
@@ -1486,15 +1935,9 @@ def _spectral_helper(x, y, fs=1.0, window='hann', nperseg=None, noverlap=None,
         raise ValueError("Unknown value for mode %s, must be one of: "
                          "{'psd', 'stft'}" % mode)
 
-    boundary_funcs = {'even': even_ext,
-                      'odd': odd_ext,
-                      'constant': const_ext,
-                      'zeros': zero_ext,
-                      None: None}
-
-    if boundary not in boundary_funcs:
+    if boundary not in _BOUNDARY_FUNCS:
         raise ValueError("Unknown boundary option '{0}', must be one of: {1}"
-                          .format(boundary, list(boundary_funcs.keys())))
+                          .format(boundary, list(_BOUNDARY_FUNCS.keys())))
 
     # If x and y are the same object we can save ourselves some computation.
     same_data = y is x
@@ -1580,7 +2023,7 @@ def _spectral_helper(x, y, fs=1.0, window='hann', nperseg=None, noverlap=None,
     # pad then extend -> [..., 3, 2, 0, 0, 0, 2, 3]
 
     if boundary is not None:
-        ext_func = boundary_funcs[boundary]
+        ext_func = _BOUNDARY_FUNCS[boundary]
         x = ext_func(x, nperseg//2, axis=-1)
         if not same_data:
             y = ext_func(y, nperseg//2, axis=-1)
@@ -1596,21 +2039,7 @@ def _spectral_helper(x, y, fs=1.0, window='hann', nperseg=None, noverlap=None,
             y = np.concatenate((y, np.zeros(zeros_shape)), axis=-1)
 
     # Handle detrending and window functions
-    if not detrend:
-        def detrend_func(d):
-            return d
-    elif not hasattr(detrend, '__call__'):
-        def detrend_func(d):
-            return signaltools.detrend(d, type=detrend, axis=-1)
-    elif axis != -1:
-        # Wrap this function so that it receives a shape that it could
-        # reasonably expect to receive.
-        def detrend_func(d):
-            d = np.rollaxis(d, -1, axis)
-            d = detrend(d)
-            return np.rollaxis(d, axis, len(d.shape))
-    else:
-        detrend_func = detrend
+    detrend_func = _detrend_func(detrend, axis)
 
     if np.result_type(win,np.complex64) != outdtype:
         win = win.astype(outdtype)
@@ -1686,6 +2115,29 @@ def _spectral_helper(x, y, fs=1.0, window='hann', nperseg=None, noverlap=None,
     return freqs, time, result
 
 
+def _detrend_func(detrend, axis):
+    """
+    Return the function that detrends the segments of the helpers, whose
+    last axis is the data axis, for the `detrend` argument.
+    """
+    if not detrend:
+        def detrend_func(d):
+            return d
+    elif not hasattr(detrend, '__call__'):
+        def detrend_func(d):
+            return signaltools.detrend(d, type=detrend, axis=-1)
+    elif axis != -1:
+        # Wrap this function so that it receives a shape that it could
+        # reasonably expect to receive.
+        def detrend_func(d):
+            d = np.rollaxis(d, -1, axis)
+            d = detrend(d)
+            return np.rollaxis(d, axis, len(d.shape))
+    else:
+        detrend_func = detrend
+    return detrend_func
+
+
 def _fft_helper(x, win, detrend_func, nperseg, noverlap, nfft, sides):
     """
     Calculate windowed FFT, for internal use by
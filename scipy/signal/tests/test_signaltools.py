@@ -24,7 +24,7 @@ from scipy.signal import (
     correlate, convolve, convolve2d, fftconvolve, choose_conv_method,
     hilbert, hilbert2, lfilter, lfilter_zi, filtfilt, butter, zpk2tf, zpk2sos,
     invres, invresz, vectorstrength, lfiltic, tf2sos, sosfilt, sosfiltfilt,
-    sosfilt_zi, tf2zpk, BadCoefficients)
+    sosfilt_zi, tf2zpk, BadCoefficients, FilterStream)
 from scipy.signal.windows import hann
 from scipy.signal.signaltools import _filtfilt_gust
 
@@ -2266,3 +2266,141 @@ class TestSOSFilt(object):
         # Expected steady state value of the step response of this filter:
         ss = np.prod(sos[:, :3].sum(axis=-1) / sos[:, 3:].sum(axis=-1))
         assert_allclose(y, ss, rtol=1e-13)
+
+
+def _filter_blocks(stream, x, axis, in_place=False):
+    # Filter x in blocks of random lengths, including empty blocks
+    rng = np.random.RandomState(1234)
+    blocks = []
+    start = 0
+    while start < x.shape[axis]:
+        stop = start + rng.randint(0, 40)
+        index = [slice(None)]*x.ndim
+        index[axis] = slice(start, stop)
+        block = x[tuple(index)].copy()
+        if in_place:
+            assert_(stream.process(block, out=block) is block)
+            blocks.append(block)
+        else:
+            blocks.append(stream.process(block))
+        start = stop
+    return np.concatenate(blocks, axis=axis)
+
+
+class TestFilterStream(object):
+
+    @pytest.mark.parametrize('dt', [np.float32, np.float64, np.complex64,
+                                    np.complex128])
+    @pytest.mark.parametrize('axis', [0, 1, -1])
+    def test_sos(self, dt, axis):
+        np.random.seed(1234)
+        sos = butter(8, 0.2, output='sos')
+        x = np.random.randn(3, 300, 4).astype(dt)
+
+        stream = FilterStream(sos, axis=axis)
+        y = _filter_blocks(stream, x, axis, in_place=True)
+        y_r, zf = sosfilt(sos, x.astype(np.result_type(dt, 1.0)), axis=axis,
+                          zi=np.zeros_like(stream.zi))
+
+        assert_equal(y.dtype, dt)
+        rtol = 1e-4 if dt in (np.float32, np.complex64) else 1e-10
+        assert_allclose(y, y_r, rtol=rtol, atol=rtol)
+        assert_allclose(stream.zi, zf, rtol=rtol, atol=rtol)
+
+    @pytest.mark.parametrize('axis', [0, 1, -1])
+    def test_ba(self, axis):
+        np.random.seed(1234)
+        b, a = butter(4, 0.2)
+        # Not normalized
+        b, a = 2*b, 2*a
+        x = np.random.randn(3, 300, 4)
+
+        stream = FilterStream(b, a, axis=axis)
+        y = _filter_blocks(stream, x, axis)
+        y_r, zf = lfilter(b, a, x, axis=axis, zi=np.zeros_like(stream.zi))
+        assert_allclose(y, y_r, rtol=1e-10, atol=1e-12)
+        assert_allclose(stream.zi, zf, rtol=1e-10, atol=1e-12)
+
+        # FIR filter
+        b = signal.firwin(11, 0.3)
+        stream = FilterStream(b, [1], axis=axis)
+        y = _filter_blocks(stream, x, axis)
+        assert_allclose(y, lfilter(b, [1], x, axis=axis), atol=1e-13)
+
+    def test_zpk(self):
+        np.random.seed(1234)
+        z, p, k = signal.cheby1(6, 1, 0.3, output='zpk')
+        x = np.random.randn(500)
+
+        stream = FilterStream(z, p, k)
+        y = _filter_blocks(stream, x, -1)
+        assert_allclose(y, sosfilt(zpk2sos(z, p, k), x), rtol=1e-10)
+
+    def test_types(self):
+        sos = butter(2, 0.2, output='sos')
+        stream = FilterStream(sos)
+        # Integers are filtered in double precision
+        y = stream.process(np.arange(10))
+        assert_equal(y.dtype, np.float64)
+        assert_allclose(y, sosfilt(sos, np.arange(10.)))
+
+        # Complex coefficients make the output of real blocks complex
+        stream = FilterStream([1, 1j], [1])
+        y = stream.process(np.ones(3, dtype=np.float32))
+        assert_equal(y.dtype, np.complex64)
+        assert_allclose(y, [1, 1 + 1j, 1 + 1j])
+
+        # and so do complex delays
+        stream = FilterStream([1, 1], [1])
+        stream.reset(zi=[1j])
+        assert_allclose(stream.process(np.ones(2)), [1 + 1j, 2])
+
+        x = np.ones(3, dtype=np.float32)
+        assert_raises(ValueError, FilterStream(sos).process, x,
+                      out=np.empty(3))
+        assert_raises(NotImplementedError, FilterStream(sos).process,
+                      np.ones(3, dtype=np.longdouble))
+
+    def test_reset(self):
+        np.random.seed(1234)
+        sos = butter(4, 0.2, output='sos')
+        x = np.random.randn(2, 100)
+
+        stream = FilterStream(sos)
+        y = stream.process(x)
+        assert_equal(stream.zi.shape, (2, 2, 2))
+        stream.reset()
+        assert_(stream.zi is None)
+        # A new number of channels after a reset
+        assert_allclose(stream.process(x[:1]), y[:1])
+
+        # Steady state initial conditions
+        zi = sosfilt_zi(sos)[:, None, :] * x[:, :1]
+        stream.reset(zi)
+        y_r, zf = sosfilt(sos, x, zi=zi)
+        assert_allclose(stream.process(x), y_r, rtol=1e-13)
+        assert_allclose(stream.zi, zf, rtol=1e-13)
+
+        b, a = butter(4, 0.2)
+        zi = lfilter_zi(b, a) * x[:, :1]
+        stream = FilterStream(b, a)
+        stream.reset(zi)
+        y_r, zf = lfilter(b, a, x, zi=zi)
+        assert_allclose(stream.process(x), y_r, rtol=1e-12)
+        assert_allclose(stream.zi, zf, rtol=1e-12)
+
+    def test_errors(self):
+        sos = butter(2, 0.2, output='sos')
+        assert_raises(ValueError, FilterStream)
+        assert_raises(ValueError, FilterStream, [1], [0, 1])
+        assert_raises(ValueError, FilterStream, np.ones((2, 5)))
+        assert_raises(TypeError, FilterStream, sos, dt=1)
+
+        stream = FilterStream(sos)
+        assert_raises(ValueError, stream.process, 1.)
+        stream.process(np.ones((2, 5)))
+        # Another number of channels
+        assert_raises(ValueError, stream.process, np.ones((3, 5)))
+        assert_raises(ValueError, stream.reset, np.ones((2, 2)))
+        assert_raises(ValueError, FilterStream([1, 2, 3], [1]).reset,
+                      np.ones(3))
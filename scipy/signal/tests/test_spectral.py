@@ -10,7 +10,8 @@ from pytest import raises as assert_raises
 from scipy._lib._numpy_compat import suppress_warnings
 from scipy import signal, fftpack
 from scipy.signal import (periodogram, welch, lombscargle, csd, coherence,
-                          spectrogram, stft, istft, check_COLA)
+                          spectrogram, stft, istft, check_COLA,
+                          SpectralStream)
 from scipy.signal.spectral import _spectral_helper
 
 
@@ -1355,3 +1356,121 @@ class TestSTFT(object):
 
         assert_allclose(x_flat, x_transpose_m, err_msg='istft transpose minus')
         assert_allclose(x_flat, x_transpose_p, err_msg='istft transpose plus')
+
+
+def _stream_blocks(n, seed=1234):
+    # Random block lengths, including empty blocks
+    rng = np.random.RandomState(seed)
+    start = 0
+    while start < n:
+        stop = start + rng.randint(0, 200)
+        yield slice(start, stop)
+        start = stop
+
+
+class TestSpectralStream(object):
+    def _feed(self, stream, x, y=None, axis=-1):
+        results = []
+        for block in _stream_blocks(x.shape[axis]):
+            index = [slice(None)]*x.ndim
+            index[axis] = block
+            index = tuple(index)
+            if y is None:
+                results.append(stream.process(x[index]))
+            else:
+                results.append(stream.process(x[index], y[index]))
+        return results
+
+    @pytest.mark.parametrize('axis', [-1, 0, 1])
+    def test_welch(self, axis):
+        np.random.seed(1234)
+        shape = [3, 4]
+        shape.insert(axis % 3, 1000)
+        x = np.random.randn(*shape)
+
+        stream = SpectralStream(8., nperseg=64, noverlap=20, axis=axis)
+        assert_(all(r is None for r in self._feed(stream, x, axis=axis)))
+        f, p = stream.finish()
+        fr, pr = welch(x, 8., nperseg=64, noverlap=20, axis=axis)
+
+        assert_allclose(f, fr)
+        assert_equal(p.shape, pr.shape)
+        assert_allclose(p, pr)
+        assert_equal(stream.nsegments, (1000 - 20) // 44)
+
+        # average is available before the end of the stream
+        assert_allclose(stream.average()[1], pr)
+
+    def test_csd(self):
+        np.random.seed(1234)
+        x = np.random.randn(2, 1500)
+        y = np.random.randn(2, 1500) + 1j*np.random.randn(2, 1500)
+
+        stream = SpectralStream(nperseg=100, nfft=128, detrend='linear',
+                                return_onesided=False, mode='csd')
+        self._feed(stream, x, y)
+        f, p = stream.finish()
+        fr, pr = csd(x, y, nperseg=100, nfft=128, detrend='linear',
+                     return_onesided=False)
+
+        assert_allclose(f, fr)
+        assert_allclose(p, pr)
+
+    @pytest.mark.parametrize('boundary', [None, 'zeros', 'even', 'odd',
+                                          'constant'])
+    @pytest.mark.parametrize('padded', [False, True])
+    def test_stft(self, boundary, padded):
+        np.random.seed(1234)
+        x = np.random.randn(4, 1000, 2).astype(np.float32)
+
+        stream = SpectralStream(nperseg=50, noverlap=30, window='hamming',
+                                mode='stft', boundary=boundary,
+                                padded=padded, axis=1)
+        results = self._feed(stream, x, axis=1)
+        results.append(stream.finish())
+        t = np.concatenate([r[0] for r in results])
+        z = np.concatenate([r[1] for r in results], axis=-1)
+        fr, tr, zr = stft(x, nperseg=50, noverlap=30, window='hamming',
+                          boundary=boundary, padded=padded, axis=1)
+
+        assert_allclose(stream.freqs, fr)
+        assert_allclose(t, tr)
+        assert_equal(z.dtype, zr.dtype)
+        assert_equal(z.shape, zr.shape)
+        assert_allclose(z, zr, rtol=1e-5, atol=1e-6)
+
+    def test_reset(self):
+        np.random.seed(1234)
+        x = np.random.randn(500)
+
+        stream = SpectralStream(nperseg=32)
+        stream.process(x)
+        f, p = stream.finish()
+        assert_raises(RuntimeError, stream.process, x)
+
+        stream.reset()
+        assert_(stream.freqs is None)
+        stream.process(x[:250])
+        stream.process(x[250:])
+        assert_allclose(stream.finish()[1], p)
+
+    def test_errors(self):
+        assert_raises(ValueError, SpectralStream, mode='spectrum')
+        assert_raises(ValueError, SpectralStream, boundary='wrap')
+        assert_raises(ValueError, SpectralStream, nperseg=8, noverlap=8)
+        assert_raises(ValueError, SpectralStream, nperseg=8, nfft=4)
+        assert_raises(ValueError, SpectralStream, scaling='power')
+
+        stream = SpectralStream(nperseg=16)
+        assert_raises(ValueError, stream.finish)
+        assert_raises(ValueError, stream.process, np.ones(8), np.ones(8))
+        stream.process(np.ones(8))
+        # no complete segment yet
+        assert_raises(ValueError, stream.average)
+
+        stream = SpectralStream(nperseg=16, mode='csd')
+        assert_raises(ValueError, stream.process, np.ones(8))
+        assert_raises(ValueError, stream.process, np.ones(8), np.ones(9))
+
+        stream = SpectralStream(nperseg=16, mode='stft')
+        assert_raises(ValueError, stream.average)
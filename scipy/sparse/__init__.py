@@ -56,12 +56,30 @@ Save and load sparse matrices:
    save_npz - Save a sparse matrix to a file using ``.npz`` format.
    load_npz - Load a sparse matrix from a file using ``.npz`` format.
 
+Assemble sparse matrices from triplets:
+
+.. autosummary::
+   :toctree: generated/
+
+   SparseAssembler - Assemble a sparse matrix from batches of triplets
+   csr_from_chunks - Build a CSR matrix from chunks of triplets, in two passes
+
 Sparse matrix tools:
 
 .. autosummary::
    :toctree: generated/
 
    find
+   estimate_nnz - Estimate the number of entries of a sparse matrix product
+   masked_matmul - Sparse matrix product in a given sparsity pattern
+
+Threading of sparse matrix products:
+
+.. autosummary::
+   :toctree: generated/
+
+   get_workers - Default number of threads of sparse matrix products
+   set_workers - Set the default number of threads of sparse matrix products
 
 Identifying sparse matrices:
 
@@ -236,6 +254,9 @@ from .bsr import *
 from .construct import *
 from .extract import *
 from ._matrix_io import *
+from ._threads import *
+from ._matmul import *
+from ._assembler import *
 
 __all__ = [s for s in dir() if not s.startswith('_')]
 
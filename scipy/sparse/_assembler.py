@@ -0,0 +1,492 @@
+"""Incremental assembly of sparse matrices from batches of triplets"""
+
+from __future__ import division, print_function, absolute_import
+
+__all__ = ['SparseAssembler', 'csr_from_chunks']
+
+import numpy as np
+
+from ._sparsetools import (coo_tocsr, coo_count_rows, coo_tocsr_chunk,
+                           csr_sort_indices, csr_sum_duplicates)
+from .sputils import getdtype, isshape, get_index_dtype, upcast
+
+
+# Initial number of triplets of the buffers, when not given.
+_DEFAULT_CAPACITY = 1024
+
+
+class SparseAssembler(object):
+    """
+    Assemble a sparse matrix from batches of ``(row, col, value)`` triplets.
+
+    The triplets are appended to growable buffers, and converted to CSR or
+    CSC format with the values of duplicate triplets summed, as in the
+    assembly of finite element matrices.  Unlike adding elements one by one
+    to a `lil_matrix` or `dok_matrix`, adding a batch of triplets costs a few
+    array operations, and unlike ``coo_matrix(...).tocsr()``, the conversion
+    sorts the indices with two linear time counting sorts.
+
+    The sparsity pattern computed by the first conversion is kept, so that
+    the matrix of new values of the same triplets (as in the time steps of
+    a simulation on a fixed mesh) is computed without sorting the indices
+    again.
+
+    Parameters
+    ----------
+    shape : tuple of ints
+        Shape of the matrix ``(M, N)``.
+    dtype : dtype, optional
+        Data type of the matrix.  Default: float64.
+    capacity : int, optional
+        Initial number of triplets that can be added without growing the
+        buffers.
+
+    Attributes
+    ----------
+    shape : tuple of ints
+        Shape of the matrix.
+    dtype : dtype
+        Data type of the matrix.
+    nnz : int
+        Number of triplets added, including duplicates.
+
+    See Also
+    --------
+    coo_matrix, lil_matrix, dok_matrix
+
+    Notes
+    -----
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    Assemble the stiffness matrix of linear elements on a 1-D mesh, adding
+    the ``2 x 2`` matrices of all elements at once:
+
+    >>> from scipy.sparse import SparseAssembler
+    >>> n = 5
+    >>> nodes = np.array([np.arange(n - 1), np.arange(1, n)]).T
+    >>> element = np.array([[1., -1.], [-1., 1.]])
+    >>> asm = SparseAssembler((n, n))
+    >>> asm.add(nodes[:, :, None], nodes[:, None, :], element)
+    >>> K = asm.tocsr()
+    >>> K.toarray()
+    array([[ 1., -1.,  0.,  0.,  0.],
+           [-1.,  2., -1.,  0.,  0.],
+           [ 0., -1.,  2., -1.,  0.],
+           [ 0.,  0., -1.,  2., -1.],
+           [ 0.,  0.,  0., -1.,  1.]])
+
+    Assemble the matrix of new values of the same triplets, reusing the
+    sparsity pattern:
+
+    >>> K2 = asm.tocsr(np.tile(2 * element, (n - 1, 1, 1)))
+    >>> (K2 != 2 * K).nnz
+    0
+
+    """
+
+    def __init__(self, shape, dtype=None, capacity=None):
+        if not isshape(shape):
+            raise TypeError('expected a shape tuple (M, N)')
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.dtype = getdtype(dtype, default=float)
+        if capacity is None:
+            capacity = _DEFAULT_CAPACITY
+        capacity = int(capacity)
+        if capacity < 0:
+            raise ValueError('capacity must be non-negative')
+
+        self._idx_dtype = get_index_dtype(
+            maxval=max(self.shape + (capacity,)))
+        self._rows = np.empty(capacity, dtype=self._idx_dtype)
+        self._cols = np.empty(capacity, dtype=self._idx_dtype)
+        self._vals = np.empty(capacity, dtype=self.dtype)
+        self.nnz = 0
+        self._patterns = {}
+
+    def add(self, rows, cols, vals):
+        """
+        Add a batch of triplets.
+
+        Parameters
+        ----------
+        rows, cols, vals : array_like
+            Row indices, column indices and values of the triplets.  They
+            are broadcast against each other.
+        """
+        rows, cols, vals = np.broadcast_arrays(rows, cols, vals)
+        n = rows.size
+        if n == 0:
+            return
+        rows = rows.ravel()
+        cols = cols.ravel()
+        for idx, dim, name in [(rows, self.shape[0], 'row'),
+                               (cols, self.shape[1], 'column')]:
+            if idx.dtype.kind not in 'iu':
+                raise TypeError('%s indices must be integers' % name)
+            if idx.min() < 0 or idx.max() >= dim:
+                raise ValueError('%s index out of bounds' % name)
+
+        self._reserve(self.nnz + n)
+        stop = self.nnz + n
+        self._rows[self.nnz:stop] = rows
+        self._cols[self.nnz:stop] = cols
+        self._vals[self.nnz:stop] = vals.ravel()
+        self.nnz = stop
+        self._patterns = {}
+
+    def _reserve(self, size):
+        """Grow the buffers to hold at least `size` triplets."""
+        capacity = len(self._rows)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        idx_dtype = get_index_dtype((self._rows,),
+                                    maxval=max(self.shape + (capacity,)))
+        for name, dtype in [('_rows', idx_dtype), ('_cols', idx_dtype),
+                            ('_vals', self.dtype)]:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=dtype)
+            new[:self.nnz] = old[:self.nnz]
+            setattr(self, name, new)
+        self._idx_dtype = idx_dtype
+
+    def clear(self):
+        """Remove all triplets, keeping the buffers."""
+        self.nnz = 0
+        self._patterns = {}
+
+    def _pattern(self, fmt):
+        """
+        Return ``(indptr, indices, perm, starts)`` for the CSR or CSC matrix
+        of the triplets: the triplets sorted by their indices are
+        ``perm``, and the duplicates of the stored entry ``k`` are
+        ``perm[starts[k]:starts[k + 1]]``.
+        """
+        if fmt in self._patterns:
+            return self._patterns[fmt]
+
+        n = self.nnz
+        if fmt == 'csr':
+            n_major, n_minor = self.shape
+            major, minor = self._rows[:n], self._cols[:n]
+        else:
+            n_minor, n_major = self.shape
+            major, minor = self._cols[:n], self._rows[:n]
+        idx_dtype = self._idx_dtype
+
+        # Least significant digit radix sort: counting sort by the minor
+        # index, then a stable counting sort by the major index.
+        minor_ptr = np.empty(n_minor + 1, dtype=idx_dtype)
+        major_by_minor = np.empty(n, dtype=idx_dtype)
+        perm_by_minor = np.empty(n, dtype=idx_dtype)
+        coo_tocsr(n_minor, n_major, n, minor, major,
+                  np.arange(n, dtype=idx_dtype),
+                  minor_ptr, major_by_minor, perm_by_minor)
+
+        indptr = np.empty(n_major + 1, dtype=idx_dtype)
+        indices = np.empty(n, dtype=idx_dtype)
+        perm = np.empty(n, dtype=idx_dtype)
+        minor_sorted = np.repeat(np.arange(n_minor, dtype=idx_dtype),
+                                 np.diff(minor_ptr))
+        coo_tocsr(n_major, n_minor, n, major_by_minor, minor_sorted,
+                  perm_by_minor, indptr, indices, perm)
+
+        # The duplicates are now adjacent
+        is_new = np.ones(n, dtype=bool)
+        is_new[1:] = indices[1:] != indices[:-1]
+        row_starts = indptr[:-1]
+        is_new[row_starts[row_starts < n]] = True
+        starts = np.flatnonzero(is_new)
+
+        n_stored = np.concatenate(([0], np.cumsum(is_new, dtype=idx_dtype)))
+        indptr = np.asarray(n_stored[indptr], dtype=idx_dtype)
+        indices = indices[starts]
+        self._patterns[fmt] = indptr, indices, perm, starts
+        return self._patterns[fmt]
+
+    def _assemble(self, fmt, values):
+        from .csr import csr_matrix
+        from .csc import csc_matrix
+
+        if values is None:
+            values = self._vals[:self.nnz]
+        else:
+            values = np.asarray(values, dtype=self.dtype).ravel()
+            if values.shape != (self.nnz,):
+                raise ValueError('expected %d values, got %d'
+                                 % (self.nnz, values.size))
+
+        indptr, indices, perm, starts = self._pattern(fmt)
+        if self.nnz == 0:
+            data = np.zeros(0, dtype=self.dtype)
+        else:
+            data = np.add.reduceat(values[perm], starts)
+
+        cls = csr_matrix if fmt == 'csr' else csc_matrix
+        matrix = cls((data, indices.copy(), indptr.copy()), shape=self.shape,
+                     dtype=self.dtype)
+        matrix.has_sorted_indices = True
+        matrix.has_canonical_format = True
+        return matrix
+
+    def tocsr(self, values=None):
+        """
+        Return the CSR matrix of the triplets, with duplicates summed.
+
+        Parameters
+        ----------
+        values : array_like, optional
+            New values of all the triplets added, in the order in which they
+            were added.  The indices of the triplets are not sorted again.
+            By default, the values that were added are used.
+
+        Returns
+        -------
+        A : csr_matrix
+            The matrix, in canonical format.  Entries whose sum is zero are
+            stored, so that the sparsity pattern is the same for all values.
+        """
+        return self._assemble('csr', values)
+
+    def tocsc(self, values=None):
+        """
+        Return the CSC matrix of the triplets, with duplicates summed.
+
+        Parameters
+        ----------
+        values : array_like, optional
+            New values of all the triplets added, in the order in which they
+            were added.  The indices of the triplets are not sorted again.
+            By default, the values that were added are used.
+
+        Returns
+        -------
+        A : csc_matrix
+            The matrix, in canonical format.  Entries whose sum is zero are
+            stored, so that the sparsity pattern is the same for all values.
+        """
+        return self._assemble('csc', values)
+
+
+def _iter_chunks(chunks):
+    """Return a new iterator over the chunks of triplets."""
+    if callable(chunks):
+        return iter(chunks())
+    if iter(chunks) is chunks:
+        raise TypeError('the chunks are read twice: expected a callable '
+                        'returning an iterable of chunks, or a sequence of '
+                        'chunks, not an iterator')
+    return iter(chunks)
+
+
+def _check_chunk(chunk, shape):
+    """Return the raveled ``(rows, cols, vals)`` arrays of a chunk."""
+    try:
+        rows, cols, vals = chunk
+    except (TypeError, ValueError):
+        raise ValueError('expected chunks of (rows, cols, vals) arrays')
+    rows, cols, vals = np.broadcast_arrays(rows, cols, vals)
+    rows = rows.ravel()
+    cols = cols.ravel()
+    if rows.size == 0:
+        return rows, cols, vals.ravel()
+    for idx, dim, name in [(rows, shape[0], 'row'),
+                           (cols, shape[1], 'column')]:
+        if idx.dtype.kind not in 'iu':
+            raise TypeError('%s indices must be integers' % name)
+        if idx.min() < 0 or idx.max() >= dim:
+            raise ValueError('%s index out of bounds' % name)
+    return rows, cols, vals.ravel()
+
+
+def _check_output(arr, name, size, dtype):
+    if not isinstance(arr, np.ndarray) or arr.ndim != 1:
+        raise ValueError('%s must be a 1-D array' % name)
+    if len(arr) < size:
+        raise ValueError('%s must have at least %d elements, got %d'
+                         % (name, size, len(arr)))
+    if arr.dtype != dtype:
+        raise ValueError('%s must have dtype %s, got %s'
+                         % (name, dtype, arr.dtype))
+    if not (arr.flags.c_contiguous and arr.flags.writeable):
+        raise ValueError('%s must be contiguous and writeable' % name)
+
+
+def csr_from_chunks(chunks, shape, dtype=None, out=None,
+                    sum_duplicates=False):
+    """
+    Build a CSR matrix from chunks of ``(row, col, value)`` triplets.
+
+    The chunks are read twice: the first pass counts the entries of each
+    row, and the second pass writes the entries of each chunk to their
+    rows.  Apart from the result, the memory used is that of a chunk and
+    of one index per row, so that matrices built from edge lists that do
+    not fit in memory can be written to memory-mapped arrays.  The index
+    dtype (int32 or int64) is chosen from the number of triplets, known
+    after the first pass.
+
+    Parameters
+    ----------
+    chunks : callable or sequence
+        Callable returning a new iterable of ``(rows, cols, vals)`` chunks
+        each time it is called, such as a generator function reading the
+        triplets from a file, or a sequence of chunks.  The arrays of a
+        chunk are broadcast against each other.  The callable must return
+        the same triplets in both passes.
+    shape : tuple of ints
+        Shape of the matrix ``(M, N)``.
+    dtype : dtype, optional
+        Data type of the matrix.  Default: the common data type of the
+        values of all chunks, or the dtype of the ``data`` array of `out`.
+    out : callable or tuple of ndarrays, optional
+        Output arrays.  Either a tuple of contiguous 1-D arrays
+        ``(indptr, indices, data)``, of ``M + 1`` and at least ``nnz``
+        elements, or a callable ``out(name, size, dtype)`` returning a
+        contiguous 1-D array of the given size and dtype, which is called
+        after the first pass for the names ``'indptr'``, ``'indices'`` and
+        ``'data'``, such as a function creating memory-mapped arrays.
+        Default: allocate the arrays in memory.
+    sum_duplicates : bool, optional
+        If True, sort the indices of each row and sum duplicate entries,
+        in the output arrays.  Otherwise (default), the entries of each
+        row are in the order in which they were read, with duplicates.
+
+    Returns
+    -------
+    A : csr_matrix
+        The matrix.  Its arrays are views of the output arrays.
+
+    See Also
+    --------
+    SparseAssembler, coo_matrix
+
+    Notes
+    -----
+    Unlike ``coo_matrix((vals, (rows, cols))).tocsr()``, the triplets are
+    never all in memory, and duplicates are only summed if requested.  With
+    a tuple of output arrays of insufficient index dtype for the number of
+    triplets, a ValueError is raised.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    Build the adjacency matrix of a graph from an edge list read in
+    chunks of 2 edges:
+
+    >>> from scipy.sparse import csr_from_chunks
+    >>> edges = np.array([[0, 1], [1, 2], [2, 0], [0, 2], [2, 1]])
+    >>> def read_edges():
+    ...     for start in range(0, len(edges), 2):
+    ...         chunk = edges[start:start + 2]
+    ...         yield chunk[:, 0], chunk[:, 1], 1.0
+    >>> A = csr_from_chunks(read_edges, (3, 3))
+    >>> A.toarray()
+    array([[ 0.,  1.,  1.],
+           [ 0.,  0.,  1.],
+           [ 1.,  1.,  0.]])
+
+    The arrays of a large matrix can be written to ``.npy`` files instead:
+
+    >>> from numpy.lib.format import open_memmap
+    >>> def memmap_npy(name, size, dtype):
+    ...     return open_memmap(name + '.npy', mode='w+', dtype=dtype,
+    ...                        shape=(size,))
+    >>> A = csr_from_chunks(read_edges, (3, 3), out=memmap_npy)  # doctest: +SKIP
+
+    """
+    from .csr import csr_matrix
+
+    if not isshape(shape):
+        raise TypeError('expected a shape tuple (M, N)')
+    M, N = int(shape[0]), int(shape[1])
+
+    # First pass: count the entries of each row, shifted by one
+    counts = np.zeros(M + 1, dtype=np.int64)
+    val_dtypes = set()
+    for chunk in _iter_chunks(chunks):
+        rows, cols, vals = _check_chunk(chunk, (M, N))
+        if rows.size:
+            coo_count_rows(M, rows.size, rows.astype(np.int64, copy=False),
+                           counts)
+            val_dtypes.add(vals.dtype)
+    np.cumsum(counts, out=counts)
+    nnz = int(counts[-1])
+
+    if out is None:
+        out = lambda name, size, dtype: np.empty(size, dtype=dtype)
+
+    if callable(out):
+        if dtype is None:
+            dtype = upcast(*val_dtypes) if val_dtypes else np.float64
+        dtype = getdtype(dtype)
+        idx_dtype = get_index_dtype(maxval=max(M, N, nnz))
+        indptr = out('indptr', M + 1, idx_dtype)
+        indices = out('indices', nnz, idx_dtype)
+        data = out('data', nnz, dtype)
+    else:
+        try:
+            indptr, indices, data = out
+        except (TypeError, ValueError):
+            raise ValueError('out must be a callable or a tuple of arrays '
+                             '(indptr, indices, data)')
+        if dtype is not None and getdtype(dtype) != data.dtype:
+            raise ValueError('dtype does not match the dtype of data')
+        dtype = data.dtype
+        idx_dtype = indptr.dtype
+        if idx_dtype not in (np.int32, np.int64):
+            raise ValueError('indptr must have dtype int32 or int64')
+        if np.iinfo(idx_dtype).max < max(M, N, nnz):
+            raise ValueError('index dtype %s is too small for the matrix, '
+                             'use int64' % idx_dtype)
+    _check_output(indptr, 'indptr', M + 1, idx_dtype)
+    _check_output(indices, 'indices', nnz, idx_dtype)
+    _check_output(data, 'data', nnz, dtype)
+    indptr = indptr[:M + 1]
+    indices = indices[:nnz]
+    data = data[:nnz]
+    indptr[...] = counts
+    del counts
+
+    # Second pass: write the entries of each chunk after the entries of
+    # their rows already written
+    next_entry = np.array(indptr[:-1], dtype=idx_dtype)
+    n_read = 0
+    for chunk in _iter_chunks(chunks):
+        rows, cols, vals = _check_chunk(chunk, (M, N))
+        n_read += rows.size
+        if n_read > nnz:
+            raise ValueError('the chunks changed between the two passes')
+        if rows.size:
+            try:
+                coo_tocsr_chunk(rows.size,
+                                rows.astype(idx_dtype, copy=False),
+                                cols.astype(idx_dtype, copy=False),
+                                vals.astype(dtype, copy=False),
+                                indptr, next_entry, indices, data)
+            except RuntimeError:
+                raise ValueError('the chunks changed between the two passes')
+    if n_read != nnz:
+        raise ValueError('the chunks changed between the two passes')
+    del next_entry
+
+    if sum_duplicates:
+        csr_sort_indices(M, indptr, indices, data)
+        csr_sum_duplicates(M, N, indptr, indices, data)
+        nnz = int(indptr[-1])
+        indices = indices[:nnz]
+        data = data[:nnz]
+
+    # The constructor may read the whole index arrays to check their
+    # contents, set them directly instead
+    A = csr_matrix((M, N), dtype=dtype)
+    A.data = data
+    A.indices = indices
+    A.indptr = indptr
+    A.check_format(full_check=False)
+    if sum_duplicates:
+        A.has_sorted_indices = True
+        A.has_canonical_format = True
+    return A
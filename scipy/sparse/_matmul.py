@@ -0,0 +1,321 @@
+"""Multithreaded sparse matrix - sparse matrix products"""
+
+from __future__ import division, print_function, absolute_import
+
+__all__ = ['estimate_nnz', 'masked_matmul']
+
+import numpy as np
+
+from . import _sparsetools
+from .sputils import get_index_dtype, upcast
+from scipy._lib._util import _run_threads
+from ._threads import _get_workers, _use_threads, _split_major
+
+
+def _cumulative_flops(Ap, Aj, Bp):
+    """
+    Return the cumulative numbers of scalar products of the rows of the
+    product of CSR matrices A and B, as an indptr-like array.
+    """
+    products = np.diff(Bp)[Aj[:Ap[-1]]]
+    cumsum = np.concatenate(([0], np.cumsum(products, dtype=np.int64)))
+    return cumsum[Ap]
+
+
+def _row_blocks(Ap, Aj, Bp, workers):
+    """
+    Split the rows of A * B in `workers` blocks with similar numbers of
+    scalar products; return None if the product is too small for threads.
+    """
+    if workers == 1:
+        return None
+    flops = _cumulative_flops(Ap, Aj, Bp)
+    if not _use_threads(workers, flops[-1]):
+        return None
+    return _split_major(flops, workers)
+
+
+def _csr_matmat(n_row, n_col, A, B, workers):
+    """
+    Compute the product of the CSR matrices A and B, with shape
+    ``(n_row, n_col)``, and return its ``(data, indices, indptr)`` arrays.
+
+    A and B may also be the CSC matrices B.T and A.T.
+    """
+    idx_dtype = get_index_dtype((A.indptr, A.indices,
+                                 B.indptr, B.indices),
+                                maxval=n_row*n_col)
+    Ap = np.asarray(A.indptr, dtype=idx_dtype)
+    Aj = np.asarray(A.indices, dtype=idx_dtype)
+    Bp = np.asarray(B.indptr, dtype=idx_dtype)
+    Bj = np.asarray(B.indices, dtype=idx_dtype)
+    bounds = _row_blocks(Ap, Aj, Bp, workers)
+
+    if bounds is None:
+        indptr = np.empty(n_row + 1, dtype=idx_dtype)
+        _sparsetools.csr_matmat_pass1(n_row, n_col, Ap, Aj, Bp, Bj, indptr)
+
+        nnz = indptr[-1]
+        idx_dtype = get_index_dtype((A.indptr, A.indices,
+                                     B.indptr, B.indices),
+                                    maxval=nnz)
+        indptr = np.asarray(indptr, dtype=idx_dtype)
+        indices = np.empty(nnz, dtype=idx_dtype)
+        data = np.empty(nnz, dtype=upcast(A.dtype, B.dtype))
+
+        _sparsetools.csr_matmat_pass2(n_row, n_col,
+                                      np.asarray(Ap, dtype=idx_dtype),
+                                      np.asarray(Aj, dtype=idx_dtype),
+                                      A.data,
+                                      np.asarray(Bp, dtype=idx_dtype),
+                                      np.asarray(Bj, dtype=idx_dtype),
+                                      B.data,
+                                      indptr, indices, data)
+        return data, indices, indptr
+
+    n_blocks = len(bounds) - 1
+
+    # Pass 1: the number of entries of the rows of each block.  The blocks
+    # have their own row pointers, which start at 0.
+    block_indptr = [np.empty(bounds[j + 1] - bounds[j] + 1, dtype=idx_dtype)
+                    for j in range(n_blocks)]
+
+    def pass1(j):
+        start, stop = bounds[j], bounds[j + 1]
+        _sparsetools.csr_matmat_pass1(stop - start, n_col,
+                                      Ap[start:stop + 1], Aj, Bp, Bj,
+                                      block_indptr[j])
+
+    _run_threads(pass1, range(n_blocks), n_blocks)
+
+    block_nnz = np.array([p[-1] for p in block_indptr], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(block_nnz)))
+    nnz = offsets[-1]
+    idx_dtype = get_index_dtype((A.indptr, A.indices,
+                                 B.indptr, B.indices),
+                                maxval=nnz)
+    Ap, Aj, Bp, Bj = [np.asarray(a, dtype=idx_dtype)
+                      for a in (Ap, Aj, Bp, Bj)]
+    data_dtype = upcast(A.dtype, B.dtype)
+    # Cast once here instead of in every thread.
+    Ax = np.asarray(A.data, dtype=data_dtype)
+    Bx = np.asarray(B.data, dtype=data_dtype)
+    indices = np.empty(nnz, dtype=idx_dtype)
+    data = np.empty(nnz, dtype=data_dtype)
+
+    # Pass 2: each block fills its part of indices and data.  The entries
+    # that cancel out are dropped, so a block may use less than its part.
+    for j in range(n_blocks):
+        block_indptr[j] = np.asarray(block_indptr[j], dtype=idx_dtype)
+
+    def pass2(j):
+        start, stop = bounds[j], bounds[j + 1]
+        part = slice(offsets[j], offsets[j + 1])
+        _sparsetools.csr_matmat_pass2(stop - start, n_col,
+                                      Ap[start:stop + 1], Aj, Ax,
+                                      Bp, Bj, Bx,
+                                      block_indptr[j], indices[part],
+                                      data[part])
+
+    _run_threads(pass2, range(n_blocks), n_blocks)
+
+    block_used = np.array([p[-1] for p in block_indptr], dtype=np.int64)
+    if np.any(block_used < block_nnz):
+        parts = [slice(offsets[j], offsets[j] + block_used[j])
+                 for j in range(n_blocks)]
+        indices = np.concatenate([indices[part] for part in parts])
+        data = np.concatenate([data[part] for part in parts])
+
+    used_offsets = np.concatenate(([0], np.cumsum(block_used)))
+    indptr = np.empty(n_row + 1, dtype=idx_dtype)
+    indptr[0] = 0
+    for j in range(n_blocks):
+        indptr[bounds[j] + 1:bounds[j + 1] + 1] = (block_indptr[j][1:] +
+                                                   used_offsets[j])
+    return data, indices, indptr
+
+
+def _as_csr_operands(A, B):
+    from .csr import csr_matrix
+
+    A = csr_matrix(A)
+    B = csr_matrix(B)
+    if A.shape[1] != B.shape[0]:
+        raise ValueError('dimension mismatch')
+    return A, B
+
+
+def estimate_nnz(A, B, exact=False, workers=None):
+    """
+    Estimate the number of stored entries of the sparse matrix product A * B.
+
+    This predicts the memory needed by the product before computing it.
+
+    Parameters
+    ----------
+    A, B : sparse matrix or array_like
+        The factors of the product.
+    exact : bool, optional
+        If False (default), return an upper bound computed in
+        ``O(nnz(A) + A.shape[0])`` time: the sum over the rows of the product
+        of the number of scalar products contributing to the row, capped at
+        the number of columns.  If True, return the number of entries of the
+        product whose index appears in a scalar product, which costs about as
+        much as the first of the two passes of the matrix product.
+    workers : int, optional
+        Number of threads of the exact count; -1 uses all CPUs.  By default,
+        the value set by `scipy.sparse.set_workers` is used.
+
+    Returns
+    -------
+    nnz : int
+        The estimate.  The product ``A * B`` stores at most `nnz` entries:
+        entries whose scalar products cancel out are not stored.
+
+    See Also
+    --------
+    masked_matmul
+
+    Notes
+    -----
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy.sparse import random, estimate_nnz
+    >>> A = random(1000, 1000, density=0.01, format='csr', random_state=0)
+    >>> bound = estimate_nnz(A, A.T)
+    >>> nnz = estimate_nnz(A, A.T, exact=True)
+    >>> nnz <= bound
+    True
+    >>> (A * A.T).nnz == nnz
+    True
+
+    """
+    A, B = _as_csr_operands(A, B)
+    n_row, n_col = A.shape[0], B.shape[1]
+    idx_dtype = get_index_dtype((A.indptr, A.indices,
+                                 B.indptr, B.indices),
+                                maxval=n_row*n_col)
+    Ap = np.asarray(A.indptr, dtype=idx_dtype)
+    Aj = np.asarray(A.indices, dtype=idx_dtype)
+    Bp = np.asarray(B.indptr, dtype=idx_dtype)
+    Bj = np.asarray(B.indices, dtype=idx_dtype)
+
+    if not exact:
+        row_flops = np.diff(_cumulative_flops(Ap, Aj, Bp))
+        return int(np.minimum(row_flops, n_col).sum())
+
+    bounds = _row_blocks(Ap, Aj, Bp, _get_workers(workers))
+    if bounds is None:
+        bounds = np.array([0, n_row])
+    n_blocks = len(bounds) - 1
+    block_nnz = [0] * n_blocks
+
+    def pass1(j):
+        start, stop = bounds[j], bounds[j + 1]
+        indptr = np.empty(stop - start + 1, dtype=idx_dtype)
+        _sparsetools.csr_matmat_pass1(stop - start, n_col,
+                                      Ap[start:stop + 1], Aj, Bp, Bj,
+                                      indptr)
+        block_nnz[j] = int(indptr[-1])
+
+    _run_threads(pass1, range(n_blocks), n_blocks)
+    return sum(block_nnz)
+
+
+def masked_matmul(A, B, mask, workers=None):
+    """
+    Compute the entries of the sparse matrix product A * B in a given
+    sparsity pattern.
+
+    Only the entries of the product at the stored entries of `mask` are
+    computed, which avoids computing and storing the whole product when it
+    fills in, as for ``A * A.T`` with graph adjacency matrices.
+
+    Parameters
+    ----------
+    A, B : sparse matrix or array_like
+        The factors of the product.
+    mask : sparse matrix or array_like, shape (A.shape[0], B.shape[1])
+        The sparsity pattern.  Its values are not used; stored zeros are
+        part of the pattern, and duplicate entries are merged into one.
+    workers : int, optional
+        Number of threads; -1 uses all CPUs.  By default, the value set by
+        `scipy.sparse.set_workers` is used.
+
+    Returns
+    -------
+    C : csr_matrix
+        The matrix with the sparsity pattern of `mask` (in CSR format)
+        holding the entries of ``A * B``.  Entries of the product that are
+        zero are stored explicitly.
+
+    See Also
+    --------
+    estimate_nnz
+
+    Notes
+    -----
+    The rows of the product are split between the threads, which gives the
+    same result as a single thread.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    Count the triangles of a graph with ``trace(A^3) / 6``, using only the
+    entries of ``A^2`` at the edges of the graph:
+
+    >>> from scipy.sparse import csr_matrix, masked_matmul
+    >>> A = csr_matrix([[0, 1, 1, 0],
+    ...                 [1, 0, 1, 1],
+    ...                 [1, 1, 0, 1],
+    ...                 [0, 1, 1, 0]])
+    >>> masked_matmul(A, A, A).sum() // 6
+    2
+
+    """
+    from .csr import csr_matrix
+
+    A, B = _as_csr_operands(A, B)
+    mask = csr_matrix(mask)
+    if not mask.has_canonical_format:
+        # the product is computed once per entry of the pattern
+        mask = mask.copy()
+        mask.sum_duplicates()
+    n_row, n_col = A.shape[0], B.shape[1]
+    if mask.shape != (n_row, n_col):
+        raise ValueError('mask has shape %s, expected %s'
+                         % (mask.shape, (n_row, n_col)))
+
+    idx_dtype = get_index_dtype((A.indptr, A.indices,
+                                 B.indptr, B.indices,
+                                 mask.indptr, mask.indices),
+                                maxval=max(n_row, n_col))
+    Ap = np.asarray(A.indptr, dtype=idx_dtype)
+    Aj = np.asarray(A.indices, dtype=idx_dtype)
+    Bp = np.asarray(B.indptr, dtype=idx_dtype)
+    Bj = np.asarray(B.indices, dtype=idx_dtype)
+    Mp = np.array(mask.indptr, dtype=idx_dtype)
+    Mj = np.array(mask.indices, dtype=idx_dtype)
+    data_dtype = upcast(A.dtype, B.dtype)
+    Ax = np.asarray(A.data, dtype=data_dtype)
+    Bx = np.asarray(B.data, dtype=data_dtype)
+    data = np.empty(len(Mj), dtype=data_dtype)
+
+    bounds = _row_blocks(Ap, Aj, Bp, _get_workers(workers))
+    if bounds is None:
+        bounds = np.array([0, n_row])
+
+    def compute(j):
+        # The blocks write disjoint parts of data.
+        start, stop = bounds[j], bounds[j + 1]
+        _sparsetools.csr_matmat_masked(stop - start, n_col,
+                                       Ap[start:stop + 1], Aj, Ax,
+                                       Bp, Bj, Bx,
+                                       Mp[start:stop + 1], Mj, data)
+
+    n_blocks = len(bounds) - 1
+    _run_threads(compute, range(n_blocks), n_blocks)
+    return csr_matrix((data, Mj, Mp), shape=(n_row, n_col))
@@ -1,10 +1,13 @@
 from __future__ import division, print_function, absolute_import
 
 import sys
+import struct
+import zipfile
 import numpy as np
 import scipy.sparse
 
 from scipy._lib._version import NumpyVersion
+from scipy._lib.six import string_types
 
 __all__ = ['save_npz', 'load_npz']
 
@@ -16,6 +19,82 @@ else:
     PICKLE_KWARGS = dict()
 
 
+# The data of the arrays of uncompressed files starts at a multiple of this
+# offset, so that memory-mapped arrays are aligned.
+_ALIGNMENT = 64
+
+# Size of the blocks in which the arrays are written.
+_WRITE_BLOCK_BYTES = 2**24
+
+_NPY_MAGIC = b'\x93NUMPY'
+_ZIP_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+
+
+def _savez_aligned(file, arrays_dict):
+    """
+    Save arrays in an uncompressed ``.npz`` file like `numpy.savez`, padding
+    the ``.npy`` headers so that the data of the arrays is aligned in the
+    file.
+    """
+    if sys.version_info[:2] < (3, 6):
+        # zipfile can't stream a member of the archive
+        np.savez(file, **arrays_dict)
+        return
+
+    if isinstance(file, string_types) and not file.endswith('.npz'):
+        file = file + '.npz'
+
+    with zipfile.ZipFile(file, mode='w', compression=zipfile.ZIP_STORED,
+                         allowZip64=True) as zf:
+        for name in sorted(arrays_dict):
+            arr = np.ascontiguousarray(arrays_dict[name])
+            if arr.dtype.hasobject:
+                raise ValueError('object arrays can not be saved')
+            with zf.open(name + '.npy', 'w', force_zip64=True) as dest:
+                # the local header of the member has just been written
+                offset = zf.fp.tell()
+                header = ("{'descr': %r, 'fortran_order': False, "
+                          "'shape': %r, }" % (
+                              np.lib.format.dtype_to_descr(arr.dtype),
+                              arr.shape))
+                start = offset + len(_NPY_MAGIC) + 4 + len(header) + 1
+                header += ' ' * (-start % _ALIGNMENT) + '\n'
+                dest.write(_NPY_MAGIC + struct.pack('<BBH', 1, 0, len(header))
+                           + header.encode('latin1'))
+                buf = arr.reshape(-1).view(np.uint8)
+                for i in range(0, len(buf), _WRITE_BLOCK_BYTES):
+                    dest.write(memoryview(buf[i:i + _WRITE_BLOCK_BYTES]))
+
+
+def _memmap_npz_array(fid, zf, name, mmap_mode):
+    """
+    Memory-map the array `name` of the ``.npz`` file `fid`, whose members
+    are listed by the ZipFile `zf`.
+    """
+    zinfo = zf.getinfo(name + '.npy')
+    if zinfo.compress_type != zipfile.ZIP_STORED:
+        raise ValueError('Compressed files can not be memory-mapped; '
+                         'save the matrix with compressed=False.')
+    fid.seek(zinfo.header_offset)
+    fields = _ZIP_LOCAL_HEADER.unpack(fid.read(_ZIP_LOCAL_HEADER.size))
+    fid.seek(zinfo.header_offset + _ZIP_LOCAL_HEADER.size +
+             fields[-2] + fields[-1])
+
+    version = np.lib.format.read_magic(fid)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fid)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fid)
+    if dtype.hasobject:
+        raise ValueError('Object arrays can not be memory-mapped.')
+    order = 'F' if fortran_order else 'C'
+    if np.prod(shape) == 0:
+        # mmap can't map an empty range
+        return np.empty(shape, dtype=dtype, order=order)
+    return np.memmap(fid, dtype=dtype, mode=mmap_mode, shape=shape,
+                     order=order, offset=fid.tell())
+
+
 def save_npz(file, matrix, compressed=True):
     """ Save a sparse matrix to a file using ``.npz`` format.
 
@@ -37,6 +116,12 @@ def save_npz(file, matrix, compressed=True):
     numpy.savez: Save several arrays into a ``.npz`` archive.
     numpy.savez_compressed : Save several arrays into a compressed ``.npz`` archive.
 
+    Notes
+    -----
+    Uncompressed files can be memory-mapped by `load_npz`.  Their arrays are
+    stored aligned to 64 bytes in the file (with Python >= 3.6), which is
+    still a valid ``.npz`` file.
+
     Examples
     --------
     Store sparse matrix to disk, and load it again:
@@ -77,10 +162,10 @@ def save_npz(file, matrix, compressed=True):
     if compressed:
         np.savez_compressed(file, **arrays_dict)
     else:
-        np.savez(file, **arrays_dict)
+        _savez_aligned(file, arrays_dict)
 
 
-def load_npz(file):
+def load_npz(file, mmap_mode=None):
     """ Load a sparse matrix from a file using ``.npz`` format.
 
     Parameters
@@ -88,6 +173,14 @@ def load_npz(file):
     file : str or file-like object
         Either the file name (string) or an open file (file-like object)
         where the data will be loaded.
+    mmap_mode : {None, 'r', 'r+', 'c'}, optional
+        If not None, memory-map the arrays of the matrix from the file
+        instead of reading them, with the given mode (see `numpy.memmap`).
+        The file must have been saved with ``compressed=False``.  If `file`
+        is a file-like object, it must be a real file opened in a compatible
+        mode.
+
+        .. versionadded:: 1.1.0
 
     Returns
     -------
@@ -104,6 +197,14 @@ def load_npz(file):
     scipy.sparse.save_npz: Save a sparse matrix to a file using ``.npz`` format.
     numpy.load: Load several arrays from a ``.npz`` archive.
 
+    Notes
+    -----
+    A memory-mapped CSR or CSC matrix is created without reading its arrays,
+    and operations touching only some rows (for CSR) or columns (for CSC),
+    such as slicing, only read the parts of the file that they need.  The
+    pages of a file memory-mapped read-only by several processes are shared
+    between them.
+
     Examples
     --------
     Store sparse matrix to disk, and load it again:
@@ -124,9 +225,26 @@ def load_npz(file):
     <2x3 sparse matrix of type '<class 'numpy.int64'>'
         with 2 stored elements in Compressed Sparse Column format>
     >>> sparse_matrix.todense()
+    matrix([[0, 0, 3],
+            [4, 0, 0]], dtype=int64)
+
+    Memory-map the arrays of a matrix saved without compression:
+
+    >>> scipy.sparse.save_npz('/tmp/sparse_matrix.npz', sparse_matrix,
+    ...                       compressed=False)
+    >>> sparse_matrix = scipy.sparse.load_npz('/tmp/sparse_matrix.npz',
+    ...                                       mmap_mode='r')
+    >>> sparse_matrix.todense()
     matrix([[0, 0, 3],
             [4, 0, 0]], dtype=int64)
     """
+    if mmap_mode not in (None, 'r', 'r+', 'c'):
+        raise ValueError("mmap_mode must be one of None, 'r', 'r+' or 'c', "
+                         "got %r" % (mmap_mode,))
+
+    if mmap_mode is not None and not hasattr(file, 'read'):
+        with open(file, 'r+b' if mmap_mode == 'r+' else 'rb') as fid:
+            return load_npz(fid, mmap_mode)
 
     with np.load(file, **PICKLE_KWARGS) as loaded:
         try:
@@ -146,12 +264,30 @@ def load_npz(file):
         except AttributeError:
             raise ValueError('Unknown matrix format "{}"'.format(matrix_format))
 
-        if matrix_format in ('csc', 'csr', 'bsr'):
-            return cls((loaded['data'], loaded['indices'], loaded['indptr']), shape=loaded['shape'])
+        if mmap_mode is None:
+            arrays = loaded
+        else:
+            arrays = dict((name, _memmap_npz_array(file, loaded.zip, name,
+                                                   mmap_mode))
+                          for name in loaded.files
+                          if name not in ('format', 'shape'))
+
+        if mmap_mode is not None and matrix_format in ('csc', 'csr'):
+            # The constructor may read the whole index arrays to check their
+            # contents, set them directly instead
+            shape = tuple(int(n) for n in loaded['shape'])
+            matrix = cls(shape, dtype=arrays['data'].dtype)
+            matrix.data = arrays['data']
+            matrix.indices = arrays['indices']
+            matrix.indptr = arrays['indptr']
+            matrix.check_format(full_check=False)
+            return matrix
+        elif matrix_format in ('csc', 'csr', 'bsr'):
+            return cls((arrays['data'], arrays['indices'], arrays['indptr']), shape=loaded['shape'])
         elif matrix_format == 'dia':
-            return cls((loaded['data'], loaded['offsets']), shape=loaded['shape'])
+            return cls((arrays['data'], arrays['offsets']), shape=loaded['shape'])
         elif matrix_format == 'coo':
-            return cls((loaded['data'], (loaded['row'], loaded['col'])), shape=loaded['shape'])
+            return cls((arrays['data'], (arrays['row'], arrays['col'])), shape=loaded['shape'])
         else:
             raise NotImplementedError('Load is not implemented for '
                                       'sparse matrix of format {}.'.format(matrix_format))
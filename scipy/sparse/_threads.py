@@ -0,0 +1,220 @@
+"""Threading of sparse matrix products and reductions"""
+
+from __future__ import division, print_function, absolute_import
+
+__all__ = ['get_workers', 'set_workers']
+
+import numpy as np
+
+from scipy._lib._util import _init_workers, _run_threads
+
+
+# Default number of threads of the sparse matrix products.
+_workers = 1
+
+# Products of matrices with fewer nonzeros than this are not split between
+# threads: the cost of starting the threads would dominate.
+_MIN_THREADED_NNZ = 2**16
+
+
+def _get_workers(workers):
+    """Return the number of threads for the `workers` argument of a call."""
+    if workers is None:
+        return _workers
+    return _init_workers(workers)
+
+
+def _use_threads(workers, n_ops):
+    """Return whether `n_ops` operations are worth splitting in threads."""
+    return workers > 1 and n_ops >= _MIN_THREADED_NNZ
+
+
+def get_workers():
+    """
+    Return the default number of threads of sparse matrix products.
+
+    See Also
+    --------
+    set_workers
+
+    Notes
+    -----
+    .. versionadded:: 1.1.0
+
+    """
+    return _workers
+
+
+def set_workers(workers):
+    """
+    Set the default number of threads of sparse matrix products.
+
+    The products of CSR and CSC matrices with dense vectors and dense
+    matrices (``A * x``, ``A.dot(x)`` and the ``matvec`` of
+    `scipy.sparse.linalg.aslinearoperator`) are split between `workers`
+    threads when the matrix is large enough.  This speeds up the iterative
+    solvers of `scipy.sparse.linalg`, whose inner loop is such a product.
+    The products of two CSR or CSC matrices, `masked_matmul` and
+    `estimate_nnz` are threaded as well.  The ``workers`` argument of
+    `spmatrix.dot` overrides the default for a single product.
+
+    The sums, maxima, minima, ``argmax``, ``argmin`` and ``count_nonzero``
+    of CSR and CSC matrices along an axis, their norms computed by
+    `scipy.sparse.linalg.norm`, and the element-wise functions of the data
+    of sparse matrices (such as ``expm1``) also use this number of threads.
+
+    Parameters
+    ----------
+    workers : int
+        Number of threads; -1 uses all CPUs.  The initial value is 1.
+
+    Returns
+    -------
+    old_workers : int
+        The previous default number of threads.
+
+    See Also
+    --------
+    get_workers
+
+    Notes
+    -----
+    The rows of a CSR matrix are split between the threads, which gives the
+    same result as a single thread.  The columns of a CSC matrix are split
+    between the threads, and the partial products are then added in a fixed
+    order, so that the result depends on the number of threads but is the
+    same for every call with the same number of threads.  The products of
+    two sparse matrices split the rows of the result, and also give the same
+    result as a single thread.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy import sparse
+    >>> A = sparse.random(10000, 10000, density=1e-3, format='csr')
+    >>> old = sparse.set_workers(4)
+    >>> y = A * np.ones(10000)
+    >>> sparse.set_workers(old)
+    4
+
+    """
+    global _workers
+    old_workers = _workers
+    _workers = _init_workers(workers)
+    return old_workers
+
+
+def _split_major(indptr, n_parts):
+    """Split the major axis in `n_parts` ranges with similar nonzero counts."""
+    nnz = indptr[-1]
+    targets = np.arange(1, n_parts) * (nnz // n_parts)
+    bounds = np.searchsorted(indptr, targets)
+    return np.concatenate(([0], bounds, [len(indptr) - 1]))
+
+
+def _cs_matvecs(fn, fmt, M, N, indptr, indices, data, other, result,
+                workers):
+    """
+    Compute ``result += A * other`` for a CSR or CSC matrix `A` with the
+    sparsetools function `fn` (``csr_matvec[s]`` or ``csc_matvec[s]``),
+    splitting the major axis of `A` between `workers` threads.
+
+    `other` and `result` are 1-D for a matrix-vector product and 2-D
+    C-contiguous otherwise.
+    """
+    # Cast once here instead of in every thread.
+    data = np.asarray(data, dtype=result.dtype)
+    other = np.ascontiguousarray(other, dtype=result.dtype)
+    bounds = _split_major(indptr, workers)
+    n_vecs = None if other.ndim == 1 else other.shape[1]
+
+    def call(start, stop, x, y):
+        # The indptr entries index the full indices and data arrays.
+        shape = (stop - start, N) if fmt == 'csr' else (M, stop - start)
+        if n_vecs is None:
+            fn(shape[0], shape[1], indptr[start:stop + 1], indices, data,
+               x, y)
+        else:
+            fn(shape[0], shape[1], n_vecs, indptr[start:stop + 1], indices,
+               data, x.ravel(), y.ravel())
+
+    if fmt == 'csr':
+        # Each thread computes a block of rows of the result.
+        def thread_func(j):
+            start, stop = bounds[j], bounds[j + 1]
+            call(start, stop, other, result[start:stop])
+
+        _run_threads(thread_func, range(workers), workers)
+    else:
+        # Each thread computes the product of a block of columns in its own
+        # output; these are added in order for a deterministic result.
+        partials = [result] + [np.zeros_like(result)
+                               for j in range(workers - 1)]
+
+        def thread_func(j):
+            start, stop = bounds[j], bounds[j + 1]
+            call(start, stop, other[start:stop], partials[j])
+
+        _run_threads(thread_func, range(workers), workers)
+        for partial in partials[1:]:
+            result += partial
+
+
+def _cs_reduce(fn, n_minor, indptr, indices, data, args, result, accumulate,
+               workers):
+    """
+    Call the sparsetools reduction `fn` (``csr_row_*`` or ``csr_column_*``)
+    of the major axis of a CSR or CSC matrix, splitting the major axis
+    between `workers` threads.
+
+    If `accumulate` is false, `fn` computes one value per major index,
+    written in `result`; otherwise `fn` adds its values, one per minor
+    index, to `result`.  `args` are the arguments of `fn` between the data
+    and the output arrays.
+    """
+    bounds = _split_major(indptr, workers)
+
+    def call(start, stop, y):
+        # The indptr entries index the full indices and data arrays.
+        fn(stop - start, n_minor, indptr[start:stop + 1], indices, data,
+           *(args + (y,)))
+
+    if not accumulate:
+        # Each thread reduces a block of the major axis.
+        def thread_func(j):
+            start, stop = bounds[j], bounds[j + 1]
+            call(start, stop, result[start:stop])
+
+        _run_threads(thread_func, range(workers), workers)
+    else:
+        # Each thread reduces a block of the major axis in its own output;
+        # these are added in order for a deterministic result.
+        partials = [result] + [np.zeros_like(result)
+                               for j in range(workers - 1)]
+
+        def thread_func(j):
+            call(bounds[j], bounds[j + 1], partials[j])
+
+        _run_threads(thread_func, range(workers), workers)
+        for partial in partials[1:]:
+            result += partial
+
+
+def _apply_ufunc(ufunc, data, workers):
+    """
+    Return ``ufunc(data)`` for a 1-D array `data`, splitting `data` between
+    `workers` threads.
+    """
+    if workers == 1:
+        return ufunc(data)
+
+    out = np.empty(data.shape, dtype=ufunc(data[:0]).dtype)
+    bounds = np.linspace(0, len(data), workers + 1).astype(np.intp)
+
+    def thread_func(j):
+        chunk = slice(bounds[j], bounds[j + 1])
+        ufunc(data[chunk], out=out[chunk])
+
+    _run_threads(thread_func, range(workers), workers)
+    return out
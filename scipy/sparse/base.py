@@ -185,14 +185,29 @@ class spmatrix(object):
         """Maximum number of elements to display when printed."""
         return self.maxprint
 
-    def count_nonzero(self):
+    def count_nonzero(self, axis=None):
         """Number of non-zero entries, equivalent to
 
-        np.count_nonzero(a.toarray())
+        np.count_nonzero(a.toarray(), axis=axis)
 
         Unlike getnnz() and the nnz property, which return the number of stored
         entries (the length of the data attribute), this method counts the
         actual number of non-zero entries in data.
+
+        Parameters
+        ----------
+        axis : {-2, -1, 0, 1, None} optional
+            Axis along which the non-zero entries are counted.  By default,
+            the non-zero entries of the whole matrix are counted.
+
+            .. versionadded:: 1.1.0
+
+        Returns
+        -------
+        count : int or ndarray
+            The number of non-zero entries, or a 1-D array of the numbers
+            of non-zero entries of the columns (``axis=0``) or of the rows
+            (``axis=1``).
         """
         raise NotImplementedError("count_nonzero not implemented for %s." %
                                   self.__class__.__name__)
@@ -309,9 +324,22 @@ class spmatrix(object):
         """Element-wise minimum between this and another matrix."""
         return self.tocsr().minimum(other)
 
-    def dot(self, other):
+    def dot(self, other, workers=None):
         """Ordinary dot product
 
+        Parameters
+        ----------
+        other : scalar, array_like or sparse matrix
+            The other operand.
+        workers : int, optional
+            Number of threads of the products of CSR and CSC matrices with
+            dense vectors, dense matrices and sparse matrices; -1 uses all
+            CPUs.  By default, the
+            value set by `scipy.sparse.set_workers` is used.  The products
+            of the other formats are not threaded.
+
+            .. versionadded:: 1.1.0
+
         Examples
         --------
         >>> import numpy as np
@@ -322,7 +350,9 @@ class spmatrix(object):
         array([ 1, -3, -1], dtype=int64)
 
         """
-        return self * other
+        if workers is None:
+            return self * other
+        return self._mul_dispatch(other, workers)
 
     def power(self, n, dtype=None):
         """Element-wise power."""
@@ -414,6 +444,9 @@ class spmatrix(object):
             return NotImplemented
 
     def __mul__(self, other):
+        return self._mul_dispatch(other)
+
+    def _mul_dispatch(self, other, workers=None):
         """interpret other and call one of the following
 
         self._mul_scalar()
@@ -427,11 +460,11 @@ class spmatrix(object):
         if other.__class__ is np.ndarray:
             # Fast path for the most common case
             if other.shape == (N,):
-                return self._mul_vector(other)
+                return self._mul_vector(other, workers)
             elif other.shape == (N, 1):
-                return self._mul_vector(other.ravel()).reshape(M, 1)
+                return self._mul_vector(other.ravel(), workers).reshape(M, 1)
             elif other.ndim == 2 and other.shape[0] == N:
-                return self._mul_multivector(other)
+                return self._mul_multivector(other, workers)
 
         if isscalarlike(other):
             # scalar value
@@ -440,7 +473,7 @@ class spmatrix(object):
         if issparse(other):
             if self.shape[1] != other.shape[0]:
                 raise ValueError('dimension mismatch')
-            return self._mul_sparse_matrix(other)
+            return self._mul_sparse_matrix(other, workers)
 
         # If it's a list or whatever, treat it like a matrix
         other_a = np.asanyarray(other)
@@ -460,7 +493,7 @@ class spmatrix(object):
             if other.shape != (N,) and other.shape != (N, 1):
                 raise ValueError('dimension mismatch')
 
-            result = self._mul_vector(np.ravel(other))
+            result = self._mul_vector(np.ravel(other), workers)
 
             if isinstance(other, np.matrix):
                 result = np.asmatrix(result)
@@ -478,7 +511,7 @@ class spmatrix(object):
             if other.shape[0] != self.shape[1]:
                 raise ValueError('dimension mismatch')
 
-            result = self._mul_multivector(np.asarray(other))
+            result = self._mul_multivector(np.asarray(other), workers)
 
             if isinstance(other, np.matrix):
                 result = np.asmatrix(result)
@@ -492,14 +525,14 @@ class spmatrix(object):
     def _mul_scalar(self, other):
         return self.tocsr()._mul_scalar(other)
 
-    def _mul_vector(self, other):
-        return self.tocsr()._mul_vector(other)
+    def _mul_vector(self, other, workers=None):
+        return self.tocsr()._mul_vector(other, workers)
 
-    def _mul_multivector(self, other):
-        return self.tocsr()._mul_multivector(other)
+    def _mul_multivector(self, other, workers=None):
+        return self.tocsr()._mul_multivector(other, workers)
 
-    def _mul_sparse_matrix(self, other):
-        return self.tocsr()._mul_sparse_matrix(other)
+    def _mul_sparse_matrix(self, other, workers=None):
+        return self.tocsr()._mul_sparse_matrix(other, workers)
 
     def __rmul__(self, other):  # other * self
         if isscalarlike(other):
@@ -337,7 +337,7 @@ class bsr_matrix(_cs_matrix, _minmax_mixin):
     def _add_dense(self, other):
         return self.tocoo(copy=False)._add_dense(other)
 
-    def _mul_vector(self, other):
+    def _mul_vector(self, other, workers=None):
         M,N = self.shape
         R,C = self.blocksize
 
@@ -349,7 +349,7 @@ class bsr_matrix(_cs_matrix, _minmax_mixin):
 
         return result
 
-    def _mul_multivector(self,other):
+    def _mul_multivector(self, other, workers=None):
         R,C = self.blocksize
         M,N = self.shape
         n_vecs = other.shape[1]  # number of column vectors
@@ -362,7 +362,7 @@ class bsr_matrix(_cs_matrix, _minmax_mixin):
 
         return result
 
-    def _mul_sparse_matrix(self, other):
+    def _mul_sparse_matrix(self, other, workers=None):
         M, K1 = self.shape
         K2, N = other.shape
 
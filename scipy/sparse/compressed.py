@@ -14,9 +14,18 @@ from .base import spmatrix, isspmatrix, SparseEfficiencyWarning
 from .data import _data_matrix, _minmax_mixin
 from .dia import dia_matrix
 from . import _sparsetools
+from ._threads import _get_workers, _use_threads, _cs_matvecs, _cs_reduce
+from ._matmul import _csr_matmat
 from .sputils import (upcast, upcast_char, to_native, isdense, isshape,
                       getdtype, isscalarlike, IndexMixin, get_index_dtype,
-                      downcast_intp_index, get_sum_dtype, check_shape)
+                      downcast_intp_index, get_sum_dtype, check_shape,
+                      validateaxis)
+
+
+# Codes of the reductions of sparsetools csr_row_reduce and
+# csr_column_reduce (the latter only computes the sums)
+_REDUCE_OPS = {'sum': 0, 'max': 1, 'min': 2, 'abs_sum': 3,
+               'squared_abs_sum': 4, 'abs_max': 5, 'abs_min': 6}
 
 
 class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
@@ -448,7 +457,7 @@ class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
     # Multiplication handlers #
     ###########################
 
-    def _mul_vector(self, other):
+    def _mul_vector(self, other, workers=None):
         M,N = self.shape
 
         # output array
@@ -457,11 +466,16 @@ class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
 
         # csr_matvec or csc_matvec
         fn = getattr(_sparsetools,self.format + '_matvec')
-        fn(M, N, self.indptr, self.indices, self.data, other, result)
+        workers = _get_workers(workers)
+        if _use_threads(workers, self.nnz):
+            _cs_matvecs(fn, self.format, M, N, self.indptr, self.indices,
+                        self.data, other, result, workers)
+        else:
+            fn(M, N, self.indptr, self.indices, self.data, other, result)
 
         return result
 
-    def _mul_multivector(self, other):
+    def _mul_multivector(self, other, workers=None):
         M,N = self.shape
         n_vecs = other.shape[1]  # number of column vectors
 
@@ -470,46 +484,30 @@ class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
 
         # csr_matvecs or csc_matvecs
         fn = getattr(_sparsetools,self.format + '_matvecs')
-        fn(M, N, n_vecs, self.indptr, self.indices, self.data, other.ravel(), result.ravel())
+        workers = _get_workers(workers)
+        if _use_threads(workers, self.nnz):
+            _cs_matvecs(fn, self.format, M, N, self.indptr, self.indices,
+                        self.data, other, result, workers)
+        else:
+            fn(M, N, n_vecs, self.indptr, self.indices, self.data,
+               other.ravel(), result.ravel())
 
         return result
 
-    def _mul_sparse_matrix(self, other):
+    def _mul_sparse_matrix(self, other, workers=None):
         M, K1 = self.shape
         K2, N = other.shape
 
-        major_axis = self._swap((M,N))[0]
         other = self.__class__(other)  # convert to this format
 
-        idx_dtype = get_index_dtype((self.indptr, self.indices,
-                                     other.indptr, other.indices),
-                                    maxval=M*N)
-        indptr = np.empty(major_axis + 1, dtype=idx_dtype)
-
-        fn = getattr(_sparsetools, self.format + '_matmat_pass1')
-        fn(M, N,
-           np.asarray(self.indptr, dtype=idx_dtype),
-           np.asarray(self.indices, dtype=idx_dtype),
-           np.asarray(other.indptr, dtype=idx_dtype),
-           np.asarray(other.indices, dtype=idx_dtype),
-           indptr)
-
-        nnz = indptr[-1]
-        idx_dtype = get_index_dtype((self.indptr, self.indices,
-                                     other.indptr, other.indices),
-                                    maxval=nnz)
-        indptr = np.asarray(indptr, dtype=idx_dtype)
-        indices = np.empty(nnz, dtype=idx_dtype)
-        data = np.empty(nnz, dtype=upcast(self.dtype, other.dtype))
-
-        fn = getattr(_sparsetools, self.format + '_matmat_pass2')
-        fn(M, N, np.asarray(self.indptr, dtype=idx_dtype),
-           np.asarray(self.indices, dtype=idx_dtype),
-           self.data,
-           np.asarray(other.indptr, dtype=idx_dtype),
-           np.asarray(other.indices, dtype=idx_dtype),
-           other.data,
-           indptr, indices, data)
+        # C = A * B for CSC matrices is C.T = B.T * A.T for the CSR
+        # matrices A.T and B.T with the same arrays
+        if self.format == 'csr':
+            data, indices, indptr = _csr_matmat(M, N, self, other,
+                                                _get_workers(workers))
+        else:
+            data, indices, indptr = _csr_matmat(N, M, other, self,
+                                                _get_workers(workers))
 
         return self.__class__((data,indices,indptr),shape=(M,N))
 
@@ -571,48 +569,110 @@ class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
         """Sum the matrix over the given axis.  If the axis is None, sum
         over both rows and columns, returning a scalar.
         """
-        # The spmatrix base class already does axis=0 and axis=1 efficiently
-        # so we only do the case axis=None here
-        if (not hasattr(self, 'blocksize') and
-                    axis in self._swap(((1, -1), (0, 2)))[0]):
-            # faster than multiplication for large minor axis in CSC/CSR
-            res_dtype = get_sum_dtype(self.dtype)
-            ret = np.zeros(len(self.indptr) - 1, dtype=res_dtype)
-
-            major_index, value = self._minor_reduce(np.add)
-            ret[major_index] = value
-            ret = np.asmatrix(ret)
-            if axis % 2 == 1:
-                ret = ret.T
-
-            if out is not None and out.shape != ret.shape:
-                raise ValueError('dimensions do not match')
-
-            return ret.sum(axis=(), dtype=dtype, out=out)
-        # spmatrix will handle the remaining situations when axis
-        # is in {None, -1, 0, 1}
-        else:
+        # The sums of the rows and columns of CSR/CSC matrices are computed
+        # by sparsetools, faster than multiplication with a vector of ones
+        if hasattr(self, 'blocksize'):
             return spmatrix.sum(self, axis=axis, dtype=dtype, out=out)
 
+        validateaxis(axis)
+        res_dtype = get_sum_dtype(self.dtype)
+
+        if axis is None:
+            ret = np.asmatrix(self._reduce('sum', 1, dtype=res_dtype))
+            return ret.sum(dtype=dtype, out=out)
+
+        if axis < 0:
+            axis += 2
+
+        ret = np.asmatrix(self._reduce('sum', axis, dtype=res_dtype))
+        if axis == 1:
+            ret = ret.T
+
+        if out is not None and out.shape != ret.shape:
+            raise ValueError('dimensions do not match')
+
+        return ret.sum(axis=(), dtype=dtype, out=out)
+
     sum.__doc__ = spmatrix.sum.__doc__
 
-    def _minor_reduce(self, ufunc):
-        """Reduce nonzeros with a ufunc over the minor axis when non-empty
+    def count_nonzero(self, axis=None):
+        if axis is None or hasattr(self, 'blocksize'):
+            return _data_matrix.count_nonzero(self, axis=axis)
+
+        validateaxis(axis)
+        if axis < 0:
+            axis += 2
 
-        Warning: this does not call sum_duplicates()
+        self.sum_duplicates()
+        M, N = self._swap(self.shape)
+        if self._swap((axis, 1 - axis))[0] == 1:
+            fn = _sparsetools.csr_row_count_nonzero
+            result = np.empty(M, dtype=self.indices.dtype)
+            accumulate = False
+        else:
+            fn = _sparsetools.csr_column_count_nonzero
+            result = np.zeros(N, dtype=self.indices.dtype)
+            accumulate = True
+        _cs_reduce(fn, N, self.indptr, self.indices, self.data, (), result,
+                   accumulate, self._reduce_workers())
+        return result
+
+    count_nonzero.__doc__ = spmatrix.count_nonzero.__doc__
+
+    def _reduce_workers(self):
+        """Number of threads of the reductions of this matrix"""
+        workers = _get_workers(None)
+        if not _use_threads(workers, self.nnz):
+            workers = 1
+        return workers
+
+    def _reduce(self, op, axis, dtype=None):
+        """Reduce the entries along `axis` (0 or 1) with sparsetools
+
+        Parameters
+        ----------
+        op : str
+            Reduction, one of the keys of `_REDUCE_OPS`
+        axis : {0, 1}
+            Axis along which the entries are reduced
+        dtype : dtype, optional
+            Type of the entries and of the result, by default the type
+            of the entries.
 
         Returns
         -------
-        major_index : array of ints
-            Major indices where nonzero
+        value : ndarray
+            Reductions of the columns (``axis=0``) or rows (``axis=1``),
+            including the implicit zeros.  The magnitudes of complex
+            entries are complex numbers with a zero imaginary part.
 
-        value : array of self.dtype
-            Reduce result for nonzeros in each major_index
+        Warning: the maxima and minima require that there are no duplicate
+        entries.
         """
-        major_index = np.flatnonzero(np.diff(self.indptr))
-        value = ufunc.reduceat(self.data,
-                               downcast_intp_index(self.indptr[major_index]))
-        return major_index, value
+        data = self.data
+        if dtype is not None:
+            data = np.asarray(data, dtype=dtype)
+
+        M, N = self._swap(self.shape)
+        if self._swap((axis, 1 - axis))[0] == 1:
+            # reduce the rows of CSR / the columns of CSC
+            fn = _sparsetools.csr_row_reduce
+            result = np.empty(M, dtype=data.dtype)
+            accumulate = False
+        elif op in ('sum', 'abs_sum', 'squared_abs_sum'):
+            fn = _sparsetools.csr_column_reduce
+            result = np.zeros(N, dtype=data.dtype)
+            accumulate = True
+        else:
+            # The maxima and minima are only computed for the major axis
+            other = self.tocsc() if self.format == 'csr' else self.tocsr()
+            other.sum_duplicates()
+            return other._reduce(op, axis, dtype=dtype)
+
+        _cs_reduce(fn, N, self.indptr, self.indices, data,
+                   (_REDUCE_OPS[op],), result, accumulate,
+                   self._reduce_workers())
+        return result
 
     #######################
     # Getting and Setting #
@@ -549,14 +549,14 @@ class coo_matrix(_data_matrix, _minmax_mixin):
                     result.ravel('A'), fortran)
         return np.matrix(result, copy=False)
 
-    def _mul_vector(self, other):
+    def _mul_vector(self, other, workers=None):
         #output array
         result = np.zeros(self.shape[0], dtype=upcast_char(self.dtype.char,
                                                             other.dtype.char))
         coo_matvec(self.nnz, self.row, self.col, self.data, other, result)
         return result
 
-    def _mul_multivector(self, other):
+    def _mul_multivector(self, other, workers=None):
         result = np.zeros((other.shape[1], self.shape[0]),
                           dtype=upcast_char(self.dtype.char, other.dtype.char))
         for i, col in enumerate(other.T):
@@ -13,7 +13,8 @@ from scipy._lib.six import xrange
 from .base import spmatrix
 
 from ._sparsetools import csr_tocsc, csr_tobsr, csr_count_blocks, \
-        get_csr_submatrix, csr_sample_values
+        get_csr_submatrix, csr_sample_values, csr_row_index, csr_row_slice, \
+        csr_column_index1, csr_column_index2
 from .sputils import (upcast, isintlike, IndexMixin, issequence,
                       get_index_dtype, ismatrix)
 
@@ -234,51 +235,6 @@ class csr_matrix(_cs_matrix, IndexMixin):
         return x
 
     def __getitem__(self, key):
-        def asindices(x):
-            try:
-                x = np.asarray(x)
-
-                # Check index contents to avoid creating 64bit arrays needlessly
-                idx_dtype = get_index_dtype((x,), check_contents=True)
-                if idx_dtype != x.dtype:
-                    x = x.astype(idx_dtype)
-            except:
-                raise IndexError('invalid index')
-            else:
-                return x
-
-        def check_bounds(indices, N):
-            if indices.size == 0:
-                return (0, 0)
-
-            max_indx = indices.max()
-            if max_indx >= N:
-                raise IndexError('index (%d) out of range' % max_indx)
-
-            min_indx = indices.min()
-            if min_indx < -N:
-                raise IndexError('index (%d) out of range' % (N + min_indx))
-
-            return min_indx, max_indx
-
-        def extractor(indices,N):
-            """Return a sparse matrix P so that P*self implements
-            slicing of the form self[[1,2,3],:]
-            """
-            indices = asindices(indices).copy()
-
-            min_indx, max_indx = check_bounds(indices, N)
-
-            if min_indx < 0:
-                indices[indices < 0] += N
-
-            indptr = np.arange(len(indices)+1, dtype=indices.dtype)
-            data = np.ones(len(indices), dtype=self.dtype)
-            shape = (len(indices),N)
-
-            return csr_matrix((data,indices,indptr), shape=shape,
-                              dtype=self.dtype, copy=False)
-
         row, col = self._unpack_index(key)
 
         # First attempt to use original row optimized methods
@@ -292,8 +248,7 @@ class csr_matrix(_cs_matrix, IndexMixin):
                 return self._get_row_slice(row, col)
             # [i, [1, 2]]
             elif issequence(col):
-                P = extractor(col,self.shape[1]).T
-                return self[row, :] * P
+                return self[row, :]._minor_index_fancy(col)
         elif isinstance(row, slice):
             # [1:2,??]
             if ((isintlike(col) and row.step in (1, None)) or
@@ -302,19 +257,21 @@ class csr_matrix(_cs_matrix, IndexMixin):
                      row.step in (1, None))):
                 # col is int or slice with step 1, row is slice with step 1.
                 return self._get_submatrix(row, col)
+            elif isintlike(col):
+                # [::2, j]
+                return self._major_slice(row)._get_submatrix(slice(None), col)
+            elif isinstance(col, slice):
+                # [::2, 1:2] or [:, ::2]
+                return self._major_slice(row)._minor_slice(col)
             elif issequence(col):
                 # row is slice, col is sequence.
-                P = extractor(col,self.shape[1]).T        # [1:2,[1,2]]
-                sliced = self
-                if row != slice(None, None, None):
-                    sliced = sliced[row,:]
-                return sliced * P
+                return self._major_slice(row)._minor_index_fancy(col)
 
         elif issequence(row):
             # [[1,2],??]
             if isintlike(col) or isinstance(col,slice):
-                P = extractor(row, self.shape[0])     # [[1,2],j] or [[1,2],1:2]
-                extracted = P * self
+                # [[1,2],j] or [[1,2],1:2]
+                extracted = self._major_index_fancy(row)
                 if col == slice(None, None, None):
                     return extracted
                 else:
@@ -323,17 +280,16 @@ class csr_matrix(_cs_matrix, IndexMixin):
         elif ismatrix(row) and issequence(col):
             if len(row[0]) == 1 and isintlike(row[0][0]):
                 # [[[1],[2]], [1,2]], outer indexing
-                row = asindices(row)
-                P_row = extractor(row[:,0], self.shape[0])
-                P_col = extractor(col, self.shape[1]).T
-                return P_row * self * P_col
+                row = _asindices(row)
+                extracted = self._major_index_fancy(row[:,0])
+                return extracted._minor_index_fancy(col)
 
         if not (issequence(col) and issequence(row)):
             # Sample elementwise
             row, col = self._index_to_arrays(row, col)
 
-        row = asindices(row)
-        col = asindices(col)
+        row = _asindices(row)
+        col = _asindices(col)
         if row.shape != col.shape:
             raise IndexError('number of row and column indices differ')
         assert row.ndim <= 2
@@ -341,8 +297,8 @@ class csr_matrix(_cs_matrix, IndexMixin):
         num_samples = np.size(row)
         if num_samples == 0:
             return csr_matrix(np.atleast_2d(row).shape, dtype=self.dtype)
-        check_bounds(row, self.shape[0])
-        check_bounds(col, self.shape[1])
+        _check_bounds(row, self.shape[0])
+        _check_bounds(col, self.shape[1])
 
         val = np.empty(num_samples, dtype=self.dtype)
         csr_sample_values(self.shape[0], self.shape[1],
@@ -426,10 +382,130 @@ class csr_matrix(_cs_matrix, IndexMixin):
                 row_data = row_data[::-1]
                 row_indices = abs(row_indices[::-1])
 
-        shape = (1, int(np.ceil(float(stop - start) / stride)))
+        shape = (1, len(xrange(start, stop, stride)))
         return csr_matrix((row_data, row_indices, row_indptr), shape=shape,
                           dtype=self.dtype, copy=False)
 
+    def _wrap_indices(self, idx, N):
+        """Return `idx` as a 1-D array of indices in [0, N), with negative
+        indices wrapped around
+        """
+        indices = _asindices(idx)
+        if indices.ndim != 1:
+            raise IndexError('index results in >2 dimensions')
+        min_indx, max_indx = _check_bounds(indices, N)
+        if min_indx < 0:
+            indices = indices.copy()
+            indices[indices < 0] += N
+        return indices
+
+    def _major_index_fancy(self, idx):
+        """Returns a copy of the rows self[idx, :] given by an array of
+        row indices, possibly repeated and in any order.
+        """
+        M, N = self.shape
+        indices = self._wrap_indices(idx, M)
+        n = len(indices)
+
+        # pass 1: the rows of the result are copies of the rows of self
+        row_nnz = self.indptr[indices + 1] - self.indptr[indices]
+        res_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(row_nnz, out=res_indptr[1:])
+        nnz = int(res_indptr[-1])
+
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(nnz, N))
+        res_indptr = res_indptr.astype(idx_dtype)
+        res_indices = np.empty(nnz, dtype=idx_dtype)
+        res_data = np.empty(nnz, dtype=self.dtype)
+
+        # pass 2: copy the rows
+        csr_row_index(n, indices.astype(idx_dtype),
+                      self.indptr.astype(idx_dtype, copy=False),
+                      self.indices.astype(idx_dtype, copy=False),
+                      self.data, res_indices, res_data)
+
+        return self.__class__((res_data, res_indices, res_indptr),
+                              shape=(n, N), copy=False)
+
+    def _major_slice(self, idx):
+        """Returns a copy of the rows self[idx, :] given by a slice.
+        """
+        M, N = self.shape
+        start, stop, step = idx.indices(M)
+
+        if step == 1:
+            stop = max(start, stop)
+            return self._get_submatrix(slice(start, stop), slice(None))
+
+        # pass 1: the rows of the result are copies of the rows of self
+        row_nnz = self.indptr[1:][idx] - self.indptr[:-1][idx]
+        n = len(row_nnz)
+        res_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(row_nnz, out=res_indptr[1:])
+        nnz = int(res_indptr[-1])
+
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(nnz, M, N))
+        res_indptr = res_indptr.astype(idx_dtype)
+        res_indices = np.empty(nnz, dtype=idx_dtype)
+        res_data = np.empty(nnz, dtype=self.dtype)
+
+        # pass 2: copy the rows
+        csr_row_slice(start, stop, step,
+                      self.indptr.astype(idx_dtype, copy=False),
+                      self.indices.astype(idx_dtype, copy=False),
+                      self.data, res_indices, res_data)
+
+        return self.__class__((res_data, res_indices, res_indptr),
+                              shape=(n, N), copy=False)
+
+    def _minor_index_fancy(self, idx):
+        """Returns a copy of the columns self[:, idx] given by an array of
+        column indices, possibly repeated and in any order.
+        """
+        M, N = self.shape
+        indices = self._wrap_indices(idx, N)
+        k = len(indices)
+        nnz = int(self.indptr[-1])
+
+        # Each entry of self is copied once per occurrence of its column
+        maxval = nnz * k
+        if maxval > np.iinfo(np.int32).max and k > 0:
+            maxval = nnz * np.bincount(indices).max()
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(maxval, M, k))
+        indices = indices.astype(idx_dtype)
+
+        # pass 1: count the occurrences of the columns, and the entries of
+        # the rows of the result
+        col_offsets = np.zeros(N, dtype=idx_dtype)
+        res_indptr = np.empty(M + 1, dtype=idx_dtype)
+        indptr = self.indptr.astype(idx_dtype, copy=False)
+        col_indices = self.indices.astype(idx_dtype, copy=False)
+        csr_column_index1(k, indices, M, N, indptr, col_indices,
+                          col_offsets, res_indptr)
+
+        # pass 2: copy the entries of the selected columns
+        col_order = np.argsort(indices, kind='mergesort').astype(idx_dtype)
+        res_nnz = res_indptr[-1]
+        res_indices = np.empty(res_nnz, dtype=idx_dtype)
+        res_data = np.empty(res_nnz, dtype=self.dtype)
+        csr_column_index2(col_order, col_offsets, nnz, col_indices,
+                          self.data, res_indices, res_data)
+
+        return self.__class__((res_data, res_indices, res_indptr),
+                              shape=(M, k), copy=False)
+
+    def _minor_slice(self, idx):
+        """Returns a copy of the columns self[:, idx] given by a slice.
+        """
+        start, stop, step = idx.indices(self.shape[1])
+        if step == 1:
+            stop = max(start, stop)
+            return self._get_submatrix(slice(None), slice(start, stop))
+        return self._minor_index_fancy(np.arange(start, stop, step))
+
     def _get_submatrix(self, row_slice, col_slice):
         """Return a submatrix of this matrix (new matrix is created)."""
 
@@ -463,6 +539,35 @@ class csr_matrix(_cs_matrix, IndexMixin):
                               dtype=self.dtype, copy=False)
 
 
+def _asindices(x):
+    try:
+        x = np.asarray(x)
+
+        # Check index contents to avoid creating 64bit arrays needlessly
+        idx_dtype = get_index_dtype((x,), check_contents=True)
+        if idx_dtype != x.dtype:
+            x = x.astype(idx_dtype)
+    except:
+        raise IndexError('invalid index')
+    else:
+        return x
+
+
+def _check_bounds(indices, N):
+    if indices.size == 0:
+        return (0, 0)
+
+    max_indx = indices.max()
+    if max_indx >= N:
+        raise IndexError('index (%d) out of range' % max_indx)
+
+    min_indx = indices.min()
+    if min_indx < -N:
+        raise IndexError('index (%d) out of range' % (N + min_indx))
+
+    return min_indx, max_indx
+
+
 def isspmatrix_csr(x):
     """Is x of csr_matrix type?
 
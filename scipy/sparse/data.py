@@ -12,6 +12,8 @@ import numpy as np
 
 from .base import spmatrix, _ufuncs_with_fixed_point_at_zero
 from .sputils import isscalarlike, validateaxis
+from . import _sparsetools
+from ._threads import _get_workers, _use_threads, _cs_reduce, _apply_ufunc
 
 __all__ = []
 
@@ -87,7 +89,9 @@ class _data_matrix(spmatrix):
 
     copy.__doc__ = spmatrix.copy.__doc__
 
-    def count_nonzero(self):
+    def count_nonzero(self, axis=None):
+        if axis is not None:
+            return self.tocsr().count_nonzero(axis=axis)
         return np.count_nonzero(self._deduped_data())
 
     count_nonzero.__doc__ = spmatrix.count_nonzero.__doc__
@@ -124,8 +128,11 @@ for npfunc in _ufuncs_with_fixed_point_at_zero:
 
     def _create_method(op):
         def method(self):
-            result = op(self.data)
-            x = self._with_data(result, copy=True)
+            workers = _get_workers(None)
+            if not _use_threads(workers, self.data.size):
+                workers = 1
+            result = _apply_ufunc(op, self.data.ravel(), workers)
+            x = self._with_data(result.reshape(self.data.shape), copy=True)
             return x
 
         method.__doc__ = ("Element-wise %s.\n\n"
@@ -164,13 +171,10 @@ class _minmax_mixin(object):
         mat = self.tocsc() if axis == 0 else self.tocsr()
         mat.sum_duplicates()
 
-        major_index, value = mat._minor_reduce(min_or_max)
-        not_full = np.diff(mat.indptr)[major_index] < N
-        value[not_full] = min_or_max(value[not_full], 0)
-
-        mask = value != 0
-        major_index = np.compress(mask, major_index)
-        value = np.compress(mask, value)
+        value = mat._reduce('max' if min_or_max is np.maximum else 'min',
+                            axis)
+        major_index = np.flatnonzero(value)
+        value = value[major_index]
 
         from . import coo_matrix
         if axis == 0:
@@ -215,29 +219,16 @@ class _minmax_mixin(object):
         if axis < 0:
             axis += 2
 
-        zero = self.dtype.type(0)
-
         mat = self.tocsc() if axis == 0 else self.tocsr()
         mat.sum_duplicates()
 
         ret_size, line_size = mat._swap(mat.shape)
-        ret = np.zeros(ret_size, dtype=int)
-
-        nz_lines, = np.nonzero(np.diff(mat.indptr))
-        for i in nz_lines:
-            p, q = mat.indptr[i:i + 2]
-            data = mat.data[p:q]
-            indices = mat.indices[p:q]
-            am = op(data)
-            m = data[am]
-            if compare(m, zero) or q - p == line_size:
-                ret[i] = indices[am]
-            else:
-                zero_ind = _find_missing_index(indices, line_size)
-                if m == zero:
-                    ret[i] = min(am, zero_ind)
-                else:
-                    ret[i] = zero_ind
+        fn = _sparsetools.csr_row_argmax if op is np.argmax else \
+            _sparsetools.csr_row_argmin
+        ret = np.empty(ret_size, dtype=mat.indices.dtype)
+        _cs_reduce(fn, line_size, mat.indptr, mat.indices, mat.data, (),
+                   ret, False, mat._reduce_workers())
+        ret = ret.astype(int)
 
         if axis == 1:
             ret = ret.reshape(-1, 1)
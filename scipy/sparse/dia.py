@@ -163,7 +163,9 @@ class dia_matrix(_data_matrix):
         mask &= (offset_inds < num_cols)
         return mask
 
-    def count_nonzero(self):
+    def count_nonzero(self, axis=None):
+        if axis is not None:
+            return self.tocsr().count_nonzero(axis=axis)
         mask = self._data_mask()
         return np.count_nonzero(self.data[mask])
 
@@ -226,7 +228,7 @@ class dia_matrix(_data_matrix):
 
     sum.__doc__ = spmatrix.sum.__doc__
 
-    def _mul_vector(self, other):
+    def _mul_vector(self, other, workers=None):
         x = other
 
         y = np.zeros(self.shape[0], dtype=upcast_char(self.dtype.char,
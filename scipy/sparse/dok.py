@@ -138,7 +138,9 @@ class dok_matrix(spmatrix, IndexMixin, dict):
                                       "for DOK format.")
         return dict.__len__(self)
 
-    def count_nonzero(self):
+    def count_nonzero(self, axis=None):
+        if axis is not None:
+            return self.tocsr().count_nonzero(axis=axis)
         return sum(x != 0 for x in itervalues(self))
 
     getnnz.__doc__ = spmatrix.getnnz.__doc__
@@ -377,14 +379,14 @@ class dok_matrix(spmatrix, IndexMixin, dict):
         dict.update(new, ((k, v * other) for k, v in iteritems(self)))
         return new
 
-    def _mul_vector(self, other):
+    def _mul_vector(self, other, workers=None):
         # matrix * vector
         result = np.zeros(self.shape[0], dtype=upcast(self.dtype, other.dtype))
         for (i, j), v in iteritems(self):
             result[i] += v * other[j]
         return result
 
-    def _mul_multivector(self, other):
+    def _mul_multivector(self, other, workers=None):
         # matrix * multivector
         result_shape = (self.shape[0], other.shape[1])
         result_dtype = upcast(self.dtype, other.dtype)
@@ -76,12 +76,17 @@ csc_ge_csc          v iiIITIIT*I*I*B
 CSR_ROUTINES = """
 csr_matmat_pass1    v iiIIII*I
 csr_matmat_pass2    v iiIITIIT*I*I*T
+csr_matmat_masked   v iiIITIITII*T
 csr_diagonal        v iiiIIT*T
 csr_tocsc           v iiIIT*I*I*T
 csr_tobsr           v iiiiIIT*I*I*T
 csr_todense         v iiIIT*T
 csr_matvec          v iiIITT*T
 csr_matvecs         v iiiIITT*T
+csr_trisolve        v iiIITii*T
+csr_ilu0            i iII*T
+csr_ic0             i iII*T
+csr_aggregate       i iII*I
 csr_elmul_csr       v iiIITIIT*I*I*T
 csr_eldiv_csr       v iiIITIIT*I*I*T
 csr_plus_csr        v iiIITIIT*I*I*T
@@ -99,6 +104,16 @@ csr_sort_indices    v iI*I*T
 csr_eliminate_zeros v ii*I*I*T
 csr_sum_duplicates  v ii*I*I*T
 get_csr_submatrix   v iiIITiiii*V*V*W
+csr_row_index       v iIIIT*I*T
+csr_row_slice       v iiiIIT*I*T
+csr_column_index1   v iIiiII*I*I
+csr_column_index2   v IIiIT*I*T
+csr_row_reduce      v iiIITi*T
+csr_column_reduce   v iiIITi*T
+csr_row_argmax      v iiIIT*I
+csr_row_argmin      v iiIIT*I
+csr_row_count_nonzero v iiIIT*I
+csr_column_count_nonzero v iiIIT*I
 csr_sample_values   v iiIITiII*T
 csr_count_blocks    i iiiiII
 csr_sample_offsets  i iiIIiII*I
@@ -111,6 +126,8 @@ csr_has_canonical_format  i iII
 # coo.h, dia.h, csgraph.h
 OTHER_ROUTINES = """
 coo_tocsr           v iiiIIT*I*I*T
+coo_count_rows      v ilI*I
+coo_tocsr_chunk     v lIITI*I*I*T
 coo_todense         v iilIIT*Ti
 coo_matvec          v lIITT*T
 dia_matvec          v iiiiITT*T
@@ -168,7 +168,9 @@ class lil_matrix(spmatrix, IndexMixin):
         else:
             raise ValueError('axis out of bounds')
 
-    def count_nonzero(self):
+    def count_nonzero(self, axis=None):
+        if axis is not None:
+            return self.tocsr().count_nonzero(axis=axis)
         return sum(np.count_nonzero(rowvals) for rowvals in self.data)
 
     getnnz.__doc__ = spmatrix.getnnz.__doc__
@@ -61,6 +61,8 @@ Iterative methods for linear equation systems:
    minres -- Use MINimum RESidual iteration to solve Ax = b
    qmr -- Use Quasi-Minimal Residual iteration to solve A x = b
    gcrotmk -- Solve a matrix equation using the GCROT(m,k) algorithm
+   block_cg -- Use block Conjugate Gradient iteration to solve A X = B
+   block_gmres -- Use block Generalized Minimal RESidual iteration to solve A X = B
 
 Iterative methods for least-squares problems:
 
@@ -70,6 +72,18 @@ Iterative methods for least-squares problems:
    lsqr -- Find the least-squares solution to a sparse linear equation system
    lsmr -- Find the least-squares solution to a sparse linear equation system
 
+Preconditioners for the iterative methods:
+
+.. autosummary::
+   :toctree: generated/
+
+   jacobi_preconditioner -- Jacobi (diagonal) preconditioner
+   block_jacobi_preconditioner -- Block Jacobi preconditioner
+   ssor_preconditioner -- Symmetric successive over-relaxation preconditioner
+   ilu0_preconditioner -- Incomplete LU factorization with zero fill-in
+   ic0_preconditioner -- Incomplete Cholesky factorization with zero fill-in
+   smoothed_aggregation_preconditioner -- Two-level algebraic multigrid preconditioner
+
 Matrix factorizations
 ---------------------
 
@@ -119,6 +133,7 @@ from .matfuncs import *
 from ._onenormest import *
 from ._norm import *
 from ._expm_multiply import *
+from ._precond import *
 
 __all__ = [s for s in dir() if not s.startswith('_')]
 
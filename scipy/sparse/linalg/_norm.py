@@ -6,17 +6,33 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 from scipy.sparse import issparse
 
+from scipy.sparse.sputils import get_sum_dtype
+
 from numpy.core import Inf, sqrt, abs
 
 __all__ = ['norm']
 
 
 def _sparse_frobenius_norm(x):
-    if np.issubdtype(x.dtype, np.complexfloating):
-        sqnorm = abs(x).power(2).sum()
-    else:
-        sqnorm = x.power(2).sum()
-    return sqrt(sqnorm)
+    if x.format not in ('csr', 'csc'):
+        x = x.tocsr()
+    return np.linalg.norm(x._deduped_data())
+
+
+def _abs_reduce(x, op, axis):
+    """Reduce the magnitudes of the entries of the CSR or CSC matrix `x`
+    along `axis`, with the reduction `op` of ``x._reduce``.
+    """
+    dtype = None
+    if x.dtype.kind not in 'fc':
+        if op == 'abs_sum':
+            dtype = get_sum_dtype(x.dtype)
+        elif op == 'squared_abs_sum':
+            dtype = np.float64
+    value = x._reduce(op, axis % 2, dtype=dtype)
+    if value.dtype.kind == 'c':
+        value = value.real
+    return value
 
 
 def norm(x, ord=None, axis=None):
@@ -114,8 +130,10 @@ def norm(x, ord=None, axis=None):
     if axis is None and ord in (None, 'fro', 'f'):
         return _sparse_frobenius_norm(x)
 
-    # Some norms require functions that are not implemented for all types.
-    x = x.tocsr()
+    # The norms are computed by the reductions of CSR and CSC matrices.
+    if x.format not in ('csr', 'csc'):
+        x = x.tocsr()
+    x.sum_duplicates()
 
     if axis is None:
         axis = (0, 1)
@@ -144,13 +162,13 @@ def norm(x, ord=None, axis=None):
             raise NotImplementedError
             #return _multi_svd_norm(x, row_axis, col_axis, amin)
         elif ord == 1:
-            return abs(x).sum(axis=row_axis).max(axis=col_axis)[0,0]
+            return _abs_reduce(x, 'abs_sum', row_axis).max()
         elif ord == Inf:
-            return abs(x).sum(axis=col_axis).max(axis=row_axis)[0,0]
+            return _abs_reduce(x, 'abs_sum', col_axis).max()
         elif ord == -1:
-            return abs(x).sum(axis=row_axis).min(axis=col_axis)[0,0]
+            return _abs_reduce(x, 'abs_sum', row_axis).min()
         elif ord == -Inf:
-            return abs(x).sum(axis=col_axis).min(axis=row_axis)[0,0]
+            return _abs_reduce(x, 'abs_sum', col_axis).min()
         elif ord in (None, 'f', 'fro'):
             # The axis order does not matter for this norm.
             return _sparse_frobenius_norm(x)
@@ -162,17 +180,17 @@ def norm(x, ord=None, axis=None):
             raise ValueError('Invalid axis %r for an array with shape %r' %
                              (axis, x.shape))
         if ord == Inf:
-            M = abs(x).max(axis=a)
+            return _abs_reduce(x, 'abs_max', a)
         elif ord == -Inf:
-            M = abs(x).min(axis=a)
+            return _abs_reduce(x, 'abs_min', a)
         elif ord == 0:
             # Zero norm
-            M = (x != 0).sum(axis=a)
+            return x.count_nonzero(axis=a)
         elif ord == 1:
             # special case for speedup
-            M = abs(x).sum(axis=a)
+            return _abs_reduce(x, 'abs_sum', a)
         elif ord in (2, None):
-            M = sqrt(abs(x).power(2).sum(axis=a))
+            return sqrt(_abs_reduce(x, 'squared_abs_sum', a))
         else:
             try:
                 ord + 1
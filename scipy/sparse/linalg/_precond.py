@@ -0,0 +1,533 @@
+"""Preconditioners for the iterative solvers"""
+
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+from numpy.linalg import LinAlgError
+
+from scipy.sparse import csr_matrix, bsr_matrix
+from scipy.sparse._sparsetools import (csr_trisolve, csr_ilu0, csr_ic0,
+                                       csr_aggregate)
+from scipy.sparse.linalg.interface import LinearOperator
+from scipy.sparse.linalg.dsolve import splu
+
+__all__ = ['jacobi_preconditioner', 'block_jacobi_preconditioner',
+           'ssor_preconditioner', 'ilu0_preconditioner', 'ic0_preconditioner',
+           'smoothed_aggregation_preconditioner']
+
+
+def _canonical_csr(A):
+    """Copy of `A` as a square CSR matrix in canonical format, with a
+    floating point dtype."""
+    A = csr_matrix(A, copy=True)
+    if A.shape[0] != A.shape[1]:
+        raise ValueError('expected square matrix, but got shape=%s'
+                         % (A.shape,))
+    if A.dtype.char not in 'fdFD':
+        A = A.astype(np.float64)
+    A.sum_duplicates()
+    return A
+
+
+def _row_indices(A):
+    return np.repeat(np.arange(A.shape[0], dtype=A.indices.dtype),
+                     np.diff(A.indptr))
+
+
+def _nonzero_diagonal(A):
+    D = A.diagonal()
+    zero = np.flatnonzero(D == 0)
+    if zero.size:
+        raise LinAlgError('zero diagonal entry in row %d' % zero[0])
+    return D
+
+
+def _copy_vectors(X, dtype):
+    return np.array(X, dtype=dtype, order='C')
+
+
+def _trisolve(A, X, lower, unit_diagonal=False):
+    """Solve in place with the lower or upper triangular part of `A`."""
+    n_vecs = 1 if X.ndim == 1 else X.shape[1]
+    csr_trisolve(A.shape[0], n_vecs, A.indptr, A.indices, A.data,
+                 int(lower), int(unit_diagonal), X)
+    return X
+
+
+def _scale_rows(d, X):
+    if X.ndim == 1:
+        return d * X
+    return d[:, np.newaxis] * X
+
+
+def _operator(A, matvec, rmatvec):
+    def real_to_complex(func):
+        # A preconditioner built from a real matrix is applied to the real
+        # and imaginary parts of complex vectors separately
+        def wrapper(X):
+            X = np.asarray(X)
+            if np.iscomplexobj(X) and not np.iscomplexobj(A.data):
+                return func(X.real) + 1j * func(X.imag)
+            return func(X)
+        return wrapper
+
+    matvec = real_to_complex(matvec)
+    rmatvec = real_to_complex(rmatvec)
+    return LinearOperator(A.shape, matvec=matvec, rmatvec=rmatvec,
+                          matmat=matvec, dtype=A.dtype)
+
+
+def jacobi_preconditioner(A, omega=1.0):
+    """
+    Jacobi (diagonal) preconditioner.
+
+    Parameters
+    ----------
+    A : (N, N) {sparse matrix, dense matrix}
+        Matrix of the linear system.
+    omega : float, optional
+        Damping factor.  Default is 1.
+
+    Returns
+    -------
+    M : LinearOperator
+        The operator ``omega * inv(D)``, with ``D`` the diagonal of `A`.
+
+    Raises
+    ------
+    LinAlgError
+        If `A` has a zero diagonal entry.
+
+    See Also
+    --------
+    block_jacobi_preconditioner, ssor_preconditioner
+
+    Notes
+    -----
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy.sparse import diags
+    >>> from scipy.sparse.linalg import cg, jacobi_preconditioner
+    >>> A = diags([-1, np.linspace(3, 300, 100), -1], [-1, 0, 1],
+    ...           shape=(100, 100))
+    >>> M = jacobi_preconditioner(A)
+    >>> x, info = cg(A, np.ones(100), M=M)
+    >>> info
+    0
+
+    """
+    A = _canonical_csr(A)
+    d = omega / _nonzero_diagonal(A)
+    d_conj = d.conj()
+
+    def matvec(X):
+        return _scale_rows(d, np.asarray(X))
+
+    def rmatvec(X):
+        return _scale_rows(d_conj, np.asarray(X))
+
+    return _operator(A, matvec, rmatvec)
+
+
+def block_jacobi_preconditioner(A, blocksize):
+    """
+    Block Jacobi preconditioner.
+
+    The diagonal of `A` is divided into dense blocks of `blocksize`
+    consecutive rows and columns (the last block may be smaller), which are
+    inverted.
+
+    Parameters
+    ----------
+    A : (N, N) {sparse matrix, dense matrix}
+        Matrix of the linear system.
+    blocksize : int
+        Size of the diagonal blocks.
+
+    Returns
+    -------
+    M : LinearOperator
+        The inverse of the block diagonal part of `A`, applied as a block
+        sparse (BSR) matrix.
+
+    Raises
+    ------
+    LinAlgError
+        If a diagonal block is singular.
+
+    See Also
+    --------
+    jacobi_preconditioner
+
+    Notes
+    -----
+    Block Jacobi preconditioning is suited to systems with several unknowns
+    per node, numbered consecutively, such as those of linear elasticity.
+
+    .. versionadded:: 1.1.0
+
+    """
+    A = _canonical_csr(A)
+    blocksize = int(blocksize)
+    if blocksize < 1:
+        raise ValueError('blocksize must be positive')
+    n = A.shape[0]
+    n_blocks = -(-n // blocksize)
+    n_padded = n_blocks * blocksize
+
+    rows = _row_indices(A)
+    cols = A.indices
+    in_block = rows // blocksize == cols // blocksize
+    rows, cols = rows[in_block], cols[in_block]
+    blocks = np.zeros((n_blocks, blocksize, blocksize), dtype=A.dtype)
+    blocks[rows // blocksize, rows % blocksize,
+           cols % blocksize] = A.data[in_block]
+    # The padding of the last block is the identity
+    pad = np.arange(n, n_padded)
+    blocks[pad // blocksize, pad % blocksize, pad % blocksize] = 1
+
+    inv = bsr_matrix((np.linalg.inv(blocks), np.arange(n_blocks),
+                      np.arange(n_blocks + 1)), shape=(n_padded, n_padded))
+    inv_h = inv.conj().transpose().tobsr(blocksize=(blocksize, blocksize))
+
+    def apply(B, X):
+        X = np.asarray(X)
+        if n_padded == n:
+            return B.dot(X)
+        X_padded = np.zeros((n_padded,) + X.shape[1:],
+                            dtype=np.result_type(X, B.dtype))
+        X_padded[:n] = X
+        return B.dot(X_padded)[:n]
+
+    return _operator(A, lambda X: apply(inv, X), lambda X: apply(inv_h, X))
+
+
+def ssor_preconditioner(A, omega=1.0):
+    """
+    Symmetric successive over-relaxation (SSOR) preconditioner.
+
+    Parameters
+    ----------
+    A : (N, N) {sparse matrix, dense matrix}
+        Matrix of the linear system.
+    omega : float, optional
+        Relaxation factor, between 0 and 2.  Default is 1 (symmetric
+        Gauss-Seidel).
+
+    Returns
+    -------
+    M : LinearOperator
+        The inverse of ``(D/omega + L) inv(D/omega) (D/omega + U)
+        * omega / (2 - omega)``, where ``L``, ``D`` and ``U`` are the
+        strictly lower triangular, diagonal and strictly upper triangular
+        parts of `A`.
+
+    Raises
+    ------
+    LinAlgError
+        If `A` has a zero diagonal entry.
+
+    See Also
+    --------
+    jacobi_preconditioner, ilu0_preconditioner
+
+    Notes
+    -----
+    The preconditioner is applied with two triangular solves on the
+    sparsity pattern of `A`, and needs no storage besides a copy of `A`.
+    It is hermitian positive definite if `A` is.
+
+    .. versionadded:: 1.1.0
+
+    """
+    if not 0 < omega < 2:
+        raise ValueError('omega must be between 0 and 2')
+    S = _canonical_csr(A)
+    D = _nonzero_diagonal(S) / omega
+    scale = (2 - omega) / omega
+
+    # Replace the diagonal of A by D / omega
+    rows = _row_indices(S)
+    on_diagonal = rows == S.indices
+    S.data[on_diagonal] = D[rows[on_diagonal]]
+    S_h = []
+
+    def matvec(X):
+        X = _copy_vectors(X, S.dtype)
+        _trisolve(S, X, lower=True)
+        X = _scale_rows(D, X)
+        _trisolve(S, X, lower=False)
+        X *= scale
+        return X
+
+    def rmatvec(X):
+        if not S_h:
+            S_h.append(S.conj().transpose().tocsr())
+        X = _copy_vectors(X, S.dtype)
+        _trisolve(S_h[0], X, lower=True)
+        X = _scale_rows(D.conj(), X)
+        _trisolve(S_h[0], X, lower=False)
+        X *= scale
+        return X
+
+    return _operator(S, matvec, rmatvec)
+
+
+def ilu0_preconditioner(A):
+    """
+    Incomplete LU factorization preconditioner with zero fill-in, ILU(0).
+
+    Parameters
+    ----------
+    A : (N, N) {sparse matrix, dense matrix}
+        Matrix of the linear system.
+
+    Returns
+    -------
+    M : LinearOperator
+        The inverse of ``L U``, where the unit lower triangular factor ``L``
+        and the upper triangular factor ``U`` have the sparsity pattern of
+        the lower and upper triangular parts of `A`, and ``L U`` is equal
+        to `A` on the sparsity pattern of `A`.
+
+    Raises
+    ------
+    LinAlgError
+        If a pivot is zero, or a diagonal entry is not in the sparsity
+        pattern of `A`.
+
+    See Also
+    --------
+    ic0_preconditioner, spilu
+
+    Notes
+    -----
+    The factors are stored in a single matrix with the sparsity pattern of
+    `A`, which includes its explicitly stored zeros, so that more fill-in
+    can be allowed by storing zeros in `A`.  They are computed without
+    pivoting.  Unlike `spilu`, the memory use is known in advance and no
+    reordering is done, which makes ILU(0) faster to build for matrices
+    such as discretizations of partial differential equations, whose
+    diagonal entries are large.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy.sparse import diags
+    >>> from scipy.sparse.linalg import gmres, ilu0_preconditioner
+    >>> A = diags([-1, 3, -1.5], [-1, 0, 1], shape=(100, 100))
+    >>> M = ilu0_preconditioner(A)
+    >>> x, info = gmres(A, np.ones(100), M=M)
+    >>> info
+    0
+
+    """
+    LU = _canonical_csr(A)
+    row = csr_ilu0(LU.shape[0], LU.indptr, LU.indices, LU.data)
+    if row != -1:
+        raise LinAlgError('zero pivot in row %d' % row)
+    LU_h = []
+
+    def matvec(X):
+        X = _copy_vectors(X, LU.dtype)
+        _trisolve(LU, X, lower=True, unit_diagonal=True)
+        _trisolve(LU, X, lower=False)
+        return X
+
+    def rmatvec(X):
+        if not LU_h:
+            LU_h.append(LU.conj().transpose().tocsr())
+        X = _copy_vectors(X, LU.dtype)
+        _trisolve(LU_h[0], X, lower=True)
+        _trisolve(LU_h[0], X, lower=False, unit_diagonal=True)
+        return X
+
+    return _operator(LU, matvec, rmatvec)
+
+
+def ic0_preconditioner(A):
+    """
+    Incomplete Cholesky factorization preconditioner with zero fill-in,
+    IC(0).
+
+    Parameters
+    ----------
+    A : (N, N) {sparse matrix, dense matrix}
+        Hermitian positive definite matrix of the linear system.  Only its
+        upper triangular part is used.
+
+    Returns
+    -------
+    M : LinearOperator
+        The inverse of ``U^H inv(D) U``, where the upper triangular factor
+        ``U`` has the sparsity pattern of the upper triangular part of `A`,
+        ``D`` is its diagonal, and ``U^H inv(D) U`` is equal to `A` on the
+        sparsity pattern of `A`.
+
+    Raises
+    ------
+    LinAlgError
+        If a pivot is not positive, or a diagonal entry is not in the
+        sparsity pattern of `A`.
+
+    See Also
+    --------
+    ilu0_preconditioner
+
+    Notes
+    -----
+    The preconditioner is hermitian, which is required by `cg` and
+    `minres`.  The factorization exists for M-matrices, such as
+    discretizations of the Laplacian, but it may break down for other
+    positive definite matrices.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy.sparse import diags
+    >>> from scipy.sparse.linalg import cg, ic0_preconditioner
+    >>> A = diags([-1, 2.5, -1], [-1, 0, 1], shape=(100, 100))
+    >>> M = ic0_preconditioner(A)
+    >>> x, info = cg(A, np.ones(100), M=M)
+    >>> info
+    0
+
+    """
+    A = _canonical_csr(A)
+    n = A.shape[0]
+    rows = _row_indices(A)
+    upper = A.indices >= rows
+    indptr = np.empty(n + 1, dtype=A.indptr.dtype)
+    indptr[0] = 0
+    np.cumsum(np.bincount(rows[upper], minlength=n), out=indptr[1:])
+    U = csr_matrix((A.data[upper], A.indices[upper], indptr), shape=A.shape)
+
+    row = csr_ic0(n, U.indptr, U.indices, U.data)
+    if row != -1:
+        raise LinAlgError('zero pivot in row %d' % row)
+    D = U.diagonal()
+    nonpositive = np.flatnonzero(D.real <= 0)
+    if nonpositive.size:
+        raise LinAlgError('nonpositive pivot in row %d' % nonpositive[0])
+    U_h = U.conj().transpose().tocsr()
+
+    def matvec(X):
+        X = _copy_vectors(X, U.dtype)
+        _trisolve(U_h, X, lower=True)
+        X = _scale_rows(D, X)
+        _trisolve(U, X, lower=False)
+        return X
+
+    return _operator(U, matvec, matvec)
+
+
+def smoothed_aggregation_preconditioner(A, theta=0.08, omega=4/3):
+    """
+    Two-level smoothed aggregation algebraic multigrid preconditioner.
+
+    Parameters
+    ----------
+    A : (N, N) {sparse matrix, dense matrix}
+        Hermitian positive definite matrix of the linear system.
+    theta : float, optional
+        Strength of connection threshold: the unknowns ``i`` and ``j`` are
+        aggregated together only if ``abs(A[i, j]) >= theta *
+        sqrt(abs(A[i, i] * A[j, j]))``.  Default is 0.08.
+    omega : float, optional
+        Damping factor of the Jacobi smoothing of the prolongator, relative
+        to the inverse of the spectral radius of ``inv(D) A``.  Default is
+        4/3.
+
+    Returns
+    -------
+    M : LinearOperator
+        The two-level cycle described below.
+
+    Raises
+    ------
+    LinAlgError
+        If `A` has a zero diagonal entry.
+
+    See Also
+    --------
+    ic0_preconditioner
+
+    Notes
+    -----
+    The unknowns are partitioned into aggregates of strongly connected
+    neighbors [1]_.  The tentative prolongator ``T`` interpolates constant
+    vectors on the aggregates, and the prolongator is smoothed by a step of
+    damped Jacobi, ``P = (I - omega/rho inv(D) A) T``, where ``rho`` is a
+    bound of the spectral radius of ``inv(D) A``.  The coarse matrix
+    ``P^H A P`` is factorized with `splu`.
+
+    The preconditioner applies a forward Gauss-Seidel sweep, a coarse grid
+    correction and a backward Gauss-Seidel sweep, so that it is hermitian
+    positive definite for use with `cg`.  Unlike the other preconditioners,
+    the number of iterations it needs for discretized elliptic partial
+    differential equations grows slowly with the size of the problem, but
+    the coarse matrix is factorized with a direct solver, which limits the
+    size of the problems that can be handled.
+
+    .. versionadded:: 1.1.0
+
+    References
+    ----------
+    .. [1] P. Vanek, J. Mandel and M. Brezina, "Algebraic multigrid by
+           smoothed aggregation for second and fourth order elliptic
+           problems", Computing, 56, pp. 179-196, 1996.
+
+    Examples
+    --------
+    >>> from scipy.sparse import diags, kronsum
+    >>> from scipy.sparse.linalg import cg
+    >>> from scipy.sparse.linalg import smoothed_aggregation_preconditioner
+    >>> T = diags([-1, 2, -1], [-1, 0, 1], shape=(100, 100))
+    >>> A = kronsum(T, T).tocsr()
+    >>> M = smoothed_aggregation_preconditioner(A)
+    >>> x, info = cg(A, np.ones(A.shape[0]), M=M)
+    >>> info
+    0
+
+    """
+    A = _canonical_csr(A)
+    n = A.shape[0]
+    D = _nonzero_diagonal(A)
+    rows = _row_indices(A)
+    cols = A.indices
+
+    # Aggregate the strongly connected unknowns
+    strong = ((rows != cols) &
+              (abs(A.data)**2 >= theta**2 * abs(D[rows] * D[cols])))
+    S = csr_matrix((A.data[strong], (rows[strong], cols[strong])),
+                   shape=A.shape)
+    aggregates = np.empty(n, dtype=S.indices.dtype)
+    n_aggregates = csr_aggregate(n, S.indptr, S.indices, aggregates)
+
+    # Tentative prolongator, with orthonormal columns
+    sizes = np.bincount(aggregates, minlength=n_aggregates)
+    T = csr_matrix((1 / np.sqrt(sizes[aggregates]), aggregates,
+                    np.arange(n + 1)), shape=(n, n_aggregates),
+                   dtype=A.dtype)
+
+    # Smoothed prolongator
+    DA = A.copy()
+    DA.data /= D[rows]
+    rho = abs(DA).sum(axis=1).max()
+    P = (T - (omega / rho) * DA.dot(T)).tocsr()
+    P_h = P.conj().transpose().tocsr()
+    coarse = splu(P_h.dot(A).dot(P).tocsc())
+
+    def matvec(X):
+        X = np.asarray(X)
+        Y = _copy_vectors(X, A.dtype)
+        _trisolve(A, Y, lower=True)
+        Y += P.dot(coarse.solve(P_h.dot(X - A.dot(Y))))
+        Y += _trisolve(A, _copy_vectors(X - A.dot(Y), A.dtype), lower=False)
+        return Y
+
+    return _operator(A, matvec, matvec)
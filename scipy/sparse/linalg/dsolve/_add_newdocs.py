@@ -19,10 +19,12 @@ add_newdoc('scipy.sparse.linalg.dsolve._superlu', 'SuperLU',
     perm_r
     L
     U
+    stats
 
     Methods
     -------
     solve
+    refactor
 
     Notes
     -----
@@ -108,6 +110,74 @@ add_newdoc('scipy.sparse.linalg.dsolve._superlu', 'SuperLU', ('solve',
         Solution vector(s)
     """))
 
+add_newdoc('scipy.sparse.linalg.dsolve._superlu', 'SuperLU', ('refactor',
+    """
+    refactor(data[, same_row_perm])
+
+    Factorize a matrix with the same sparsity pattern and new values.
+
+    The column permutation and the elimination tree of the first
+    factorization are reused, so that only the numeric factorization is
+    done again.
+
+    Parameters
+    ----------
+    data : ndarray, shape (nnz,)
+        Values of the new matrix, in the order of the ``data`` attribute of
+        the CSC matrix given to `splu` or `spilu` (with sorted indices).
+    same_row_perm : bool, optional
+        If True, also reuse the row permutation (the pivots) and the storage
+        of the L and U factors.  A pivot is replaced by partial pivoting
+        only if it is smaller than the pivoting threshold, so this is
+        fastest for matrices with values close to those of the previous
+        factorization.  Default is False.
+
+    Notes
+    -----
+    The `perm_r` arrays obtained before the call refer to the new row
+    permutation.  If the factorization fails with ``same_row_perm=True``,
+    the object can't be used until it is refactored with
+    ``same_row_perm=False``.  Otherwise, the previous factorization is kept.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy.sparse import csc_matrix, linalg as sla
+    >>> A = csc_matrix([[1,2,0,4],[1,0,0,1],[1,0,2,1],[2,2,1,0.]])
+    >>> lu = sla.splu(A)
+    >>> B = 2 * A
+    >>> lu.refactor(B.data)
+    >>> x = lu.solve(np.array([1., 2., 3., 4.]))
+    >>> B.dot(x)
+    array([ 1.,  2.,  3.,  4.])
+    >>> lu.stats['n_factor']
+    2
+    """))
+
+add_newdoc('scipy.sparse.linalg.dsolve._superlu', 'SuperLU', ('stats',
+    """
+    Statistics of the factorizations, as a dict with keys:
+
+    ``ordering_time``
+        Time in seconds of the computation of the column permutation.
+    ``symbolic_time``
+        Time of the column elimination tree of the last factorization.
+    ``factor_time``
+        Time of the numeric factorization of the last factorization.
+    ``total_factor_time``
+        Total time of the numeric factorizations.
+    ``factor_flops``
+        Number of floating point operations of the last numeric
+        factorization.
+    ``n_factor``
+        Number of numeric factorizations, counting the first one.
+
+    The times are wall clock times.
+
+    .. versionadded:: 1.1.0
+    """))
+
 add_newdoc('scipy.sparse.linalg.dsolve._superlu', 'SuperLU', ('L',
     """
     Lower triangular factor with unit diagonal as a
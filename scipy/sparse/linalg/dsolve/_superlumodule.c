@@ -251,6 +251,10 @@ static PyObject *Py_gstrf(PyObject * self, PyObject * args,
     if (result == NULL) {
 	goto fail;
     }
+    if (SuperLU_set_pattern((SuperLUObject*)result, nnz, rowind, colptr)) {
+        Py_DECREF(result);
+        goto fail;
+    }
 
     /* arrays of input matrix will not be freed */
     Destroy_SuperMatrix_Store(&A);
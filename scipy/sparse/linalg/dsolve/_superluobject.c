@@ -13,6 +13,26 @@
 #include "_superluobject.h"
 #include "numpy/npy_3kcompat.h"
 #include <ctype.h>
+#include <time.h>
+#ifndef _WIN32
+#include <sys/time.h>
+#endif
+
+
+/*
+ * Wall clock time in seconds, for the statistics of the factorizations.
+ */
+static double wall_time(void)
+{
+#ifdef _WIN32
+    /* clock() measures the wall clock time on Windows */
+    return (double)clock() / CLOCKS_PER_SEC;
+#else
+    struct timeval tv;
+    gettimeofday(&tv, NULL);
+    return tv.tv_sec + 1e-6 * tv.tv_usec;
+#endif
+}
 
 
 /*********************************************************************** 
@@ -41,6 +61,12 @@ static PyObject *SuperLU_solve(SuperLUObject * self, PyObject * args,
         return NULL;
     }
 
+    if (!self->valid) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "the last refactorization failed");
+        return NULL;
+    }
+
 #ifndef NPY_PY3K
     if (!PyArg_ParseTupleAndKeywords(args, kwds, "O!|c", kwlist,
                                      &PyArray_Type, &b, &itrans))
@@ -115,10 +141,178 @@ static PyObject *SuperLU_solve(SuperLUObject * self, PyObject * args,
     return NULL;
 }
 
+static PyObject *SuperLU_refactor(SuperLUObject * self, PyObject * args,
+                                  PyObject * kwds)
+{
+    PyObject *py_nzvals;
+    volatile PyArrayObject *nzvals = NULL;
+    volatile SuperMatrix A = { 0 };
+    volatile SuperMatrix AC = { 0 };
+    volatile SuperMatrix L = { 0 }, U = { 0 };
+    volatile int *perm_r = NULL;
+    volatile int info;
+    volatile int same_row_perm = 0;
+    volatile int nnz;
+    volatile superlu_options_t options;
+    volatile SuperLUStat_t stat = { 0 };
+    volatile GlobalLU_t Glu;
+    volatile double t0, t1, t2;
+    volatile jmp_buf *jmpbuf_ptr;
+    SLU_BEGIN_THREADS_DEF;
+    static char *kwlist[] = { "data", "same_row_perm", NULL };
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|i", kwlist,
+                                     &py_nzvals, &same_row_perm))
+        return NULL;
+
+    if (self->rowind == NULL) {
+        PyErr_SetString(PyExc_ValueError,
+                        "the sparsity pattern of the matrix is not known");
+        return NULL;
+    }
+
+    if (same_row_perm && !self->valid) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "the last refactorization failed, the row "
+                        "permutation can not be reused");
+        return NULL;
+    }
+
+    nnz = PyArray_DIM(self->rowind, 0);
+    nzvals = (PyArrayObject*)PyArray_FROMANY(py_nzvals, self->type, 1, 1,
+                                             NPY_ARRAY_IN_ARRAY);
+    if (nzvals == NULL) {
+        return NULL;
+    }
+    if (PyArray_DIM((PyArrayObject*)nzvals, 0) != nnz) {
+        PyErr_Format(PyExc_ValueError,
+                     "data has %d entries, expected %d",
+                     (int)PyArray_DIM((PyArrayObject*)nzvals, 0), (int)nnz);
+        goto fail;
+    }
+
+    if (NCFormat_from_spMatrix((SuperMatrix*)&A, self->m, self->n, nnz,
+                               (PyArrayObject*)nzvals, self->rowind,
+                               self->colptr, self->type)) {
+        goto fail;
+    }
+
+    /* Reuse the column permutation and the elimination tree, and possibly
+     * the row permutation and the storage of L and U */
+    memcpy((void*)&options, &self->options, sizeof(superlu_options_t));
+    options.Fact = same_row_perm ? SamePattern_SameRowPerm : SamePattern;
+
+    jmpbuf_ptr = (volatile jmp_buf *)superlu_python_jmpbuf();
+    if (setjmp(*(jmp_buf*)jmpbuf_ptr)) {
+	goto fail;
+    }
+
+    if (!same_row_perm) {
+        perm_r = intMalloc(self->n);
+    }
+    StatInit((SuperLUStat_t *)&stat);
+
+    t0 = wall_time();
+    sp_preorder((superlu_options_t*)&options, (SuperMatrix*)&A, self->perm_c,
+                self->etree, (SuperMatrix*)&AC);
+    t1 = wall_time();
+
+    if (same_row_perm) {
+        /* L and U are overwritten */
+        self->valid = 0;
+        Py_CLEAR(self->cached_L);
+        Py_CLEAR(self->cached_U);
+    }
+
+    jmpbuf_ptr = (volatile jmp_buf *)superlu_python_jmpbuf();
+    SLU_BEGIN_THREADS;
+    if (setjmp(*(jmp_buf*)jmpbuf_ptr)) {
+        SLU_END_THREADS;
+        goto fail;
+    }
+
+    if (self->ilu) {
+        gsitrf(self->type,
+               (superlu_options_t*)&options, (SuperMatrix*)&AC,
+               self->relax, self->panel_size, self->etree, NULL, 0,
+               self->perm_c, same_row_perm ? self->perm_r : (int*)perm_r,
+               same_row_perm ? &self->L : (SuperMatrix*)&L,
+               same_row_perm ? &self->U : (SuperMatrix*)&U,
+               same_row_perm ? &self->Glu : (GlobalLU_t*)&Glu,
+               (SuperLUStat_t*)&stat, (int*)&info);
+    }
+    else {
+        gstrf(self->type,
+              (superlu_options_t*)&options, (SuperMatrix*)&AC,
+              self->relax, self->panel_size, self->etree, NULL, 0,
+              self->perm_c, same_row_perm ? self->perm_r : (int*)perm_r,
+              same_row_perm ? &self->L : (SuperMatrix*)&L,
+              same_row_perm ? &self->U : (SuperMatrix*)&U,
+              same_row_perm ? &self->Glu : (GlobalLU_t*)&Glu,
+              (SuperLUStat_t*)&stat, (int*)&info);
+    }
+
+    SLU_END_THREADS;
+    t2 = wall_time();
+
+    if (info) {
+	if (info < 0)
+	    PyErr_SetString(PyExc_SystemError,
+			    "gstrf was called with invalid arguments");
+	else {
+	    if (info <= self->n)
+		PyErr_SetString(PyExc_RuntimeError,
+				"Factor is exactly singular");
+	    else
+		PyErr_NoMemory();
+	}
+	goto fail;
+    }
+
+    if (!same_row_perm) {
+        Destroy_SuperNode_Matrix(&self->L);
+        Destroy_CompCol_Matrix(&self->U);
+        self->L = L;
+        self->U = U;
+        /* Keep the buffer of perm_r, which the perm_r arrays refer to */
+        memcpy(self->perm_r, (int*)perm_r, self->n * sizeof(int));
+        SUPERLU_FREE((void*)perm_r);
+        memcpy(&self->Glu, (void*)&Glu, sizeof(GlobalLU_t));
+        Py_CLEAR(self->cached_L);
+        Py_CLEAR(self->cached_U);
+    }
+    self->valid = 1;
+
+    self->symbolic_time = t1 - t0;
+    self->factor_time = t2 - t1;
+    self->total_factor_time += t2 - t1;
+    self->factor_flops = stat.ops[FACT];
+    self->n_factor += 1;
+
+    /* free memory */
+    Destroy_CompCol_Permuted((SuperMatrix*)&AC);
+    Destroy_SuperMatrix_Store((SuperMatrix*)&A);
+    StatFree((SuperLUStat_t*)&stat);
+    Py_DECREF(nzvals);
+    Py_RETURN_NONE;
+
+  fail:
+    SUPERLU_FREE((void*)perm_r);
+    XDestroy_SuperNode_Matrix((SuperMatrix*)&L);
+    XDestroy_CompCol_Matrix((SuperMatrix*)&U);
+    XDestroy_CompCol_Permuted((SuperMatrix*)&AC);
+    XDestroy_SuperMatrix_Store((SuperMatrix*)&A);
+    XStatFree((SuperLUStat_t*)&stat);
+    Py_XDECREF(nzvals);
+    return NULL;
+}
+
 /** table of object methods
  */
 PyMethodDef SuperLU_methods[] = {
     {"solve", (PyCFunction) SuperLU_solve, METH_VARARGS | METH_KEYWORDS, NULL},
+    {"refactor", (PyCFunction) SuperLU_refactor, METH_VARARGS | METH_KEYWORDS,
+     NULL},
     {NULL, NULL}		/* sentinel */
 };
 
@@ -135,8 +329,12 @@ static void SuperLU_dealloc(SuperLUObject * self)
     self->cached_L = NULL;
     SUPERLU_FREE(self->perm_r);
     SUPERLU_FREE(self->perm_c);
+    SUPERLU_FREE(self->etree);
     self->perm_r = NULL;
     self->perm_c = NULL;
+    self->etree = NULL;
+    Py_XDECREF(self->rowind);
+    Py_XDECREF(self->colptr);
     XDestroy_SuperNode_Matrix(&self->L);
     XDestroy_CompCol_Matrix(&self->U);
     PyObject_Del(self);
@@ -201,6 +399,15 @@ static PyObject *SuperLU_getter(PyObject *selfp, void *data)
             return self->cached_L;
         }
     }
+    else if (strcmp(name, "stats") == 0) {
+        return Py_BuildValue("{s:d,s:d,s:d,s:d,s:d,s:i}",
+                             "ordering_time", self->ordering_time,
+                             "symbolic_time", self->symbolic_time,
+                             "factor_time", self->factor_time,
+                             "total_factor_time", self->total_factor_time,
+                             "factor_flops", self->factor_flops,
+                             "n_factor", self->n_factor);
+    }
     else {
         PyErr_SetString(PyExc_RuntimeError,
                         "internal error (this is a bug)");
@@ -220,6 +427,7 @@ PyGetSetDef SuperLU_getset[] = {
     {"perm_c", SuperLU_getter, (setter)NULL, (char*)NULL, (void*)"perm_c"},
     {"U", SuperLU_getter, (setter)NULL, (char*)NULL, (void*)"U"},
     {"L", SuperLU_getter, (setter)NULL, (char*)NULL, (void*)"L"},
+    {"stats", SuperLU_getter, (setter)NULL, (char*)NULL, (void*)"stats"},
     NULL
 };
 
@@ -705,6 +913,7 @@ PyObject *newSuperLUObject(SuperMatrix * A, PyObject * option_dict,
     volatile GlobalLU_t Glu;
     static volatile GlobalLU_t static_Glu;
     volatile GlobalLU_t *Glu_ptr;
+    volatile double t0, t1, t2, t3;
     volatile jmp_buf *jmpbuf_ptr;
     SLU_BEGIN_THREADS_DEF;
 
@@ -728,6 +937,20 @@ PyObject *newSuperLUObject(SuperMatrix * A, PyObject * option_dict,
     self->cached_U = NULL;
     self->cached_L = NULL;
     self->type = intype;
+    self->ilu = ilu;
+    self->valid = 1;
+    self->panel_size = panel_size;
+    self->relax = relax;
+    self->etree = NULL;
+    self->rowind = NULL;
+    self->colptr = NULL;
+    memcpy((void*)&self->options, (void*)&options, sizeof(superlu_options_t));
+    self->ordering_time = 0;
+    self->symbolic_time = 0;
+    self->factor_time = 0;
+    self->total_factor_time = 0;
+    self->factor_flops = 0;
+    self->n_factor = 0;
 
     jmpbuf_ptr = (volatile jmp_buf *)superlu_python_jmpbuf();
     if (setjmp(*(jmp_buf*)jmpbuf_ptr)) {
@@ -741,11 +964,14 @@ PyObject *newSuperLUObject(SuperMatrix * A, PyObject * option_dict,
     StatInit((SuperLUStat_t *)&stat);
 
     /* calc column permutation */
+    t0 = wall_time();
     get_perm_c(options.ColPerm, A, self->perm_c);	
+    t1 = wall_time();
 
     /* apply column permutation */
     sp_preorder((superlu_options_t*)&options, A, self->perm_c, (int*)etree,
                 (SuperMatrix*)&AC);
+    t2 = wall_time();
 
     /* Perform factorization */
     if (!CHECK_SLU_TYPE(SLU_TYPECODE_TO_NPY(A->Dtype))) {
@@ -783,6 +1009,7 @@ PyObject *newSuperLUObject(SuperMatrix * A, PyObject * option_dict,
     }
 
     SLU_END_THREADS;
+    t3 = wall_time();
 
     if (info) {
 	if (info < 0)
@@ -798,8 +1025,19 @@ PyObject *newSuperLUObject(SuperMatrix * A, PyObject * option_dict,
 	goto fail;
     }
 
+    /* keep the elimination tree and the sizes of the L and U storage for
+     * refactorizations */
+    self->etree = (int*)etree;
+    memcpy((void*)&self->Glu, (void*)Glu_ptr, sizeof(GlobalLU_t));
+
+    self->ordering_time = t1 - t0;
+    self->symbolic_time = t2 - t1;
+    self->factor_time = t3 - t2;
+    self->total_factor_time = t3 - t2;
+    self->factor_flops = stat.ops[FACT];
+    self->n_factor = 1;
+
     /* free memory */
-    SUPERLU_FREE((void*)etree);
     Destroy_CompCol_Permuted((SuperMatrix*)&AC);
     StatFree((SuperLUStat_t*)&stat);
 
@@ -814,6 +1052,29 @@ PyObject *newSuperLUObject(SuperMatrix * A, PyObject * option_dict,
 }
 
 
+/*
+ * Keep a copy of the sparsity pattern of the factored matrix, for
+ * refactorizations.
+ */
+int SuperLU_set_pattern(SuperLUObject *self, int nnz, PyArrayObject *rowind,
+                        PyArrayObject *colptr)
+{
+    npy_intp n_rowind = nnz;
+    npy_intp n_colptr = self->n + 1;
+
+    self->rowind = (PyArrayObject*)PyArray_SimpleNew(1, &n_rowind, NPY_INT);
+    self->colptr = (PyArrayObject*)PyArray_SimpleNew(1, &n_colptr, NPY_INT);
+    if (self->rowind == NULL || self->colptr == NULL) {
+        return -1;
+    }
+    memcpy(PyArray_DATA(self->rowind), PyArray_DATA(rowind),
+           n_rowind * sizeof(int));
+    memcpy(PyArray_DATA(self->colptr), PyArray_DATA(colptr),
+           n_colptr * sizeof(int));
+    return 0;
+}
+
+
 /***********************************************************************
  * Preparing superlu_options_t
  */
@@ -38,6 +38,23 @@ typedef struct {
     PyObject *cached_U;
     PyObject *cached_L;
     int type;
+    /* Kept for numeric refactorizations of matrices of the same pattern */
+    int ilu;
+    int valid;
+    int panel_size;
+    int relax;
+    int *etree;
+    PyArrayObject *rowind;
+    PyArrayObject *colptr;
+    superlu_options_t options;
+    GlobalLU_t Glu;
+    /* Statistics of the factorizations */
+    double ordering_time;
+    double symbolic_time;
+    double factor_time;
+    double total_factor_time;
+    double factor_flops;
+    int n_factor;
 } SuperLUObject;
 
 typedef struct {
@@ -59,6 +76,8 @@ int LU_to_csc_matrix(SuperMatrix *L, SuperMatrix *U,
                      PyObject **L_csc, PyObject **U_csc);
 colperm_t superlu_module_getpermc(int);
 PyObject *newSuperLUObject(SuperMatrix *, PyObject *, int, int);
+int SuperLU_set_pattern(SuperLUObject *, int, PyArrayObject *,
+                        PyArrayObject *);
 int set_superlu_options_from_dict(superlu_options_t * options,
 				  int ilu, PyObject * option_dict,
 				  int *panel_size, int *relax);
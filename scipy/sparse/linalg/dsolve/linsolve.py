@@ -117,6 +117,10 @@ def spsolve(A, b, permc_spec=None, use_umfpack=True):
     relatively expensive.  In that case, consider converting A to a dense
     matrix and using scipy.linalg.solve or its variants.
 
+    Each call computes the column ordering of A again.  To solve systems with
+    many matrices of the same sparsity pattern, factorize the first one with
+    `splu` and the next ones with the ``refactor`` method of the result.
+
     Examples
     --------
     >>> from scipy.sparse import csc_matrix
@@ -271,6 +275,10 @@ def splu(A, permc_spec=None, diag_pivot_thresh=None,
     -----
     This function uses the SuperLU library.
 
+    The ``refactor`` method of the result factorizes a matrix with the same
+    sparsity pattern, reusing the column permutation, which is faster for
+    repeated factorizations.
+
     References
     ----------
     .. [1] SuperLU http://crd.lbl.gov/~xiaoye/SuperLU/
@@ -635,6 +635,85 @@ class TestSplu(object):
         check(np.complex64, True)
         check(np.complex128, True)
 
+    def test_refactor(self):
+        rng = random.RandomState(1234)
+        for dtype in [np.float32, np.float64, np.complex64, np.complex128]:
+            A = (self.A + 1j*self.A.T) if dtype in (np.complex64,
+                                                    np.complex128) else self.A
+            A = csc_matrix(A, dtype=dtype)
+            A.sort_indices()
+            eps = np.finfo(dtype).eps
+            b = rng.rand(self.n).astype(dtype)
+            for spxlu in [splu, spilu]:
+                lu = spxlu(A)
+                perm_c = lu.perm_c.copy()
+                for same_row_perm in [False, True, False]:
+                    data = (A.data * (1 + rng.rand(A.nnz))).astype(dtype)
+                    B = csc_matrix((data, A.indices, A.indptr), shape=A.shape)
+                    lu.refactor(data, same_row_perm=same_row_perm)
+                    assert_array_equal(lu.perm_c, perm_c)
+                    x = lu.solve(b)
+                    if spxlu is splu:
+                        assert_(abs(B * x - b).max() < 1e4*eps)
+                        Pc = np.zeros((self.n, self.n))
+                        Pc[np.arange(self.n), lu.perm_c] = 1
+                        Pr = np.zeros((self.n, self.n))
+                        Pr[lu.perm_r, np.arange(self.n)] = 1
+                        assert_allclose(Pr.dot(B.toarray()).dot(Pc),
+                                        (lu.L * lu.U).toarray(),
+                                        atol=1e3*eps)
+                    else:
+                        assert_(abs(B * x - b).max() < 1e-2)
+                assert_equal(lu.stats['n_factor'], 4)
+
+    def test_refactor_pivoting(self):
+        # the pivots of the previous factorization can't be used
+        a = np.array([[1., 1e-3], [1e-3, 1.]])
+        lu = splu(csc_matrix(a), permc_spec='NATURAL')
+        assert_array_equal(lu.perm_r, [0, 1])
+        a = a[::-1]
+        A = csc_matrix(a)
+        A.sort_indices()
+        lu.refactor(A.data, same_row_perm=True)
+        assert_array_equal(lu.perm_r, [1, 0])
+        assert_allclose(a.dot(lu.solve(np.ones(2))), np.ones(2))
+
+    def test_refactor_errors(self):
+        A = csc_matrix(self.A)
+        lu = splu(A)
+        b = np.ones(self.n)
+        x = lu.solve(b)
+        assert_raises(ValueError, lu.refactor, A.data[:-1])
+        assert_raises(RuntimeError, lu.refactor, np.zeros(A.nnz))
+        # the previous factorization is kept
+        assert_array_equal(lu.solve(b), x)
+
+        assert_raises(RuntimeError, lu.refactor, np.zeros(A.nnz),
+                      same_row_perm=True)
+        assert_raises(RuntimeError, lu.solve, b)
+        assert_raises(RuntimeError, lu.refactor, A.data, same_row_perm=True)
+        lu.refactor(A.data)
+        assert_allclose(lu.solve(b), x)
+
+    def test_stats(self):
+        lu = splu(csc_matrix(self.A))
+        stats = lu.stats
+        assert_equal(sorted(stats.keys()),
+                     ['factor_flops', 'factor_time', 'n_factor',
+                      'ordering_time', 'symbolic_time', 'total_factor_time'])
+        assert_equal(stats['n_factor'], 1)
+        assert_(stats['factor_flops'] > 0)
+        for key in ['ordering_time', 'symbolic_time', 'factor_time']:
+            assert_(stats[key] >= 0)
+        assert_equal(stats['total_factor_time'], stats['factor_time'])
+
+        lu.refactor(2*csc_matrix(self.A).data)
+        new_stats = lu.stats
+        assert_equal(new_stats['n_factor'], 2)
+        assert_equal(new_stats['ordering_time'], stats['ordering_time'])
+        assert_allclose(new_stats['total_factor_time'],
+                        stats['factor_time'] + new_stats['factor_time'])
+
     @sup_sparse_efficiency
     def test_threads_parallel(self):
         oks = []
@@ -9,6 +9,7 @@ from .lgmres import lgmres
 from .lsqr import lsqr
 from .lsmr import lsmr
 from ._gcrotmk import gcrotmk
+from ._block import block_cg, block_gmres
 
 __all__ = [s for s in dir() if not s.startswith('_')]
 
@@ -0,0 +1,368 @@
+"""Block Krylov methods for linear systems with many right-hand sides"""
+
+from __future__ import division, print_function, absolute_import
+
+__all__ = ['block_cg', 'block_gmres']
+
+import numpy as np
+from numpy.linalg import LinAlgError
+from scipy._lib.six import xrange
+from scipy.linalg import qr, cho_factor, cho_solve, lstsq
+
+from scipy.sparse.linalg.interface import aslinearoperator, IdentityOperator
+from .utils import coerce
+
+
+def _make_block_system(A, M, X0, B):
+    """Make a linear system ``A X = B`` with a block of right-hand sides.
+
+    Returns ``(A, M, X, B, postprocess)``, with `A` and `M` linear operators
+    and `X` and `B` arrays of shape ``(N, K)``.
+    """
+    A = aslinearoperator(A)
+    if A.shape[0] != A.shape[1]:
+        raise ValueError('expected square matrix, but got shape=%s'
+                         % (A.shape,))
+    N = A.shape[0]
+
+    B = np.asarray(B)
+    ndim = B.ndim
+    if ndim == 1:
+        B = B.reshape(-1, 1)
+    if B.ndim != 2 or B.shape[0] != N:
+        raise ValueError('A and B have incompatible dimensions')
+
+    xtype = coerce(A.dtype.char, B.dtype.char)
+    B = np.asarray(B, dtype=xtype)
+
+    if X0 is None:
+        X = np.zeros(B.shape, dtype=xtype)
+    else:
+        X = np.array(X0, dtype=xtype)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        if X.shape != B.shape:
+            raise ValueError('X0 and B have incompatible dimensions')
+
+    if M is None:
+        M = IdentityOperator(shape=A.shape, dtype=A.dtype)
+    else:
+        M = aslinearoperator(M)
+        if A.shape != M.shape:
+            raise ValueError('matrix and preconditioner have different '
+                             'shapes')
+
+    def postprocess(X):
+        if ndim == 1:
+            return X[:, 0]
+        return X
+
+    return A, M, X, B, postprocess
+
+
+def _col_norms(X):
+    return np.sqrt(np.sum(abs(X)**2, axis=0))
+
+
+def _orthonormalize(W):
+    """Orthonormal basis of the range of `W`.
+
+    The columns of `W` are scaled to unit norm, and the directions of a
+    pivoted QR factorization that are numerically dependent on the previous
+    ones are dropped, so that the basis may have fewer columns than `W`.
+    """
+    norms = _col_norms(W)
+    W = W[:, norms > 0] / norms[norms > 0]
+    if W.shape[1] == 0:
+        return W
+    Q, R, _ = qr(W, mode='economic', pivoting=True)
+    d = abs(R.diagonal())
+    rank = np.count_nonzero(d > d[0] * max(W.shape) * np.finfo(W.dtype).eps)
+    return Q[:, :rank]
+
+
+def _dot(X, Y):
+    return np.dot(X.T.conj(), Y)
+
+
+def block_cg(A, B, X0=None, tol=1e-5, maxiter=None, M=None, callback=None):
+    """
+    Use block Conjugate Gradient iteration to solve ``A X = B``.
+
+    All the right-hand sides are solved for at once: each iteration makes a
+    single product of `A` (and of `M`) with a block of vectors, instead of
+    one product per right-hand side.
+
+    Parameters
+    ----------
+    A : {sparse matrix, dense matrix, LinearOperator}
+        The real or complex N-by-N matrix of the linear system.
+        `A` must represent a hermitian, positive definite matrix.
+    B : array_like
+        Right-hand sides of the linear system, with shape (N, K), or (N,)
+        for a single right-hand side.
+
+    Returns
+    -------
+    X : ndarray
+        The solution, with the same shape as `B`.
+    info : ndarray of ints
+        Convergence information of each right-hand side, with shape (K,):
+            0  : successful exit
+            >0 : convergence to tolerance not achieved, number of iterations
+            <0 : breakdown (`A` or `M` is not positive definite)
+
+    Other Parameters
+    ----------------
+    X0 : array_like, optional
+        Starting guess for the solution, with the same shape as `B`.
+    tol : float, optional
+        Tolerance to achieve.  The iteration stops for a column ``b`` of `B`
+        when the norm of its residual is below ``tol * norm(b)``.
+    maxiter : int, optional
+        Maximum number of iterations.  Default is ``10 * N``.
+    M : {sparse matrix, dense matrix, LinearOperator}, optional
+        Preconditioner for `A`.  The preconditioner should approximate the
+        inverse of `A`, and be hermitian positive definite.
+    callback : function, optional
+        User-supplied function to call after each iteration.  It is called
+        as ``callback(Xk)``, where ``Xk`` is the current solution.
+
+    See Also
+    --------
+    cg, block_gmres
+
+    Notes
+    -----
+    This is the breakdown-free block CG of [1]_, which keeps a block of
+    A-conjugate search directions for all the right-hand sides.  The search
+    space of each iteration is spanned by the residuals of all the columns,
+    so block CG generally needs fewer iterations than CG applied to each
+    column.  A column is deflated (removed from the block) as soon as its
+    residual satisfies the tolerance, and search directions that are
+    numerically linearly dependent, e.g. for identical right-hand sides,
+    are dropped from the block.
+
+    .. versionadded:: 1.1.0
+
+    References
+    ----------
+    .. [1] H. Ji and Y. Li, "A breakdown-free block conjugate gradient
+           method", BIT Numerical Mathematics, 57, pp. 379-403, 2017.
+
+    Examples
+    --------
+    >>> from scipy.sparse import diags
+    >>> from scipy.sparse.linalg import block_cg
+    >>> A = diags([-1, 2.5, -1], [-1, 0, 1], shape=(100, 100))
+    >>> B = np.random.rand(100, 8)
+    >>> X, info = block_cg(A, B, tol=1e-10)
+    >>> info
+    array([0, 0, 0, 0, 0, 0, 0, 0])
+    >>> np.allclose(A.dot(X), B)
+    True
+
+    """
+    A, M, X, B, postprocess = _make_block_system(A, M, X0, B)
+    n, k = B.shape
+    if maxiter is None:
+        maxiter = n*10
+
+    bnrm = _col_norms(B)
+    bnrm[bnrm == 0] = 1
+    threshold = tol * bnrm
+    info = np.zeros(k, dtype=int)
+
+    R = B - A.matmat(X)
+    active = np.flatnonzero(_col_norms(R) > threshold)
+    R = R[:, active]
+    if active.size == 0:
+        return postprocess(X), info
+
+    P = _orthonormalize(M.matmat(R))
+    for it in xrange(maxiter):
+        if P.shape[1] == 0:
+            info[active] = -1
+            break
+
+        Q = A.matmat(P)
+        try:
+            PQ = cho_factor(_dot(P, Q))
+        except LinAlgError:
+            info[active] = -1
+            break
+
+        alpha = cho_solve(PQ, _dot(P, R))
+        X[:, active] += np.dot(P, alpha)
+        R -= np.dot(Q, alpha)
+        if callback is not None:
+            callback(postprocess(X))
+
+        # Deflate the converged columns
+        keep = _col_norms(R) > threshold[active]
+        active = active[keep]
+        R = R[:, keep]
+        if active.size == 0:
+            break
+
+        Z = M.matmat(R)
+        beta = cho_solve(PQ, _dot(Q, Z))
+        P = _orthonormalize(Z - np.dot(P, beta))
+    else:
+        info[active] = maxiter
+
+    return postprocess(X), info
+
+
+def block_gmres(A, B, X0=None, tol=1e-5, restart=None, maxiter=None, M=None,
+                callback=None):
+    """
+    Use block Generalized Minimal RESidual iteration to solve ``A X = B``.
+
+    All the right-hand sides are solved for at once: each iteration makes a
+    single product of `A` (and of `M`) with a block of vectors, instead of
+    one product per right-hand side.
+
+    Parameters
+    ----------
+    A : {sparse matrix, dense matrix, LinearOperator}
+        The real or complex N-by-N matrix of the linear system.
+    B : array_like
+        Right-hand sides of the linear system, with shape (N, K), or (N,)
+        for a single right-hand side.
+
+    Returns
+    -------
+    X : ndarray
+        The solution, with the same shape as `B`.
+    info : ndarray of ints
+        Convergence information of each right-hand side, with shape (K,):
+            0  : successful exit
+            >0 : convergence to tolerance not achieved, number of iterations
+                 (restart cycles)
+
+    Other Parameters
+    ----------------
+    X0 : array_like, optional
+        Starting guess for the solution, with the same shape as `B`.
+    tol : float, optional
+        Tolerance to achieve.  The iteration stops for a column ``b`` of `B`
+        when the norm of its residual is below ``tol * norm(b)``.
+    restart : int, optional
+        Number of block iterations between restarts.  The Krylov basis
+        stores up to ``(restart + 1) * K`` vectors.  Default is 20.
+    maxiter : int, optional
+        Maximum number of iterations (restart cycles).  Default is ``10 * N``.
+    M : {sparse matrix, dense matrix, LinearOperator}, optional
+        Preconditioner for `A`.  The preconditioner should approximate the
+        inverse of `A`.  It is applied on the right, so that the residuals
+        that are minimized are those of the original system.
+    callback : function, optional
+        User-supplied function to call after each restart cycle.  It is
+        called as ``callback(Xk)``, where ``Xk`` is the current solution.
+
+    See Also
+    --------
+    gmres, block_cg
+
+    Notes
+    -----
+    Each cycle builds a block Krylov basis from the residuals of the
+    columns that have not converged yet, and minimizes the residual of
+    each column over the whole basis, which is shared by all the columns.
+    The cycle ends when the residuals of all the columns satisfy the
+    tolerance.  The converged columns are deflated (removed from the block)
+    at the next restart, and basis vectors that are numerically linearly
+    dependent on the previous ones are dropped.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy.sparse import diags
+    >>> from scipy.sparse.linalg import block_gmres
+    >>> A = diags([-1, 3, -2], [-1, 0, 1], shape=(100, 100))
+    >>> B = np.random.rand(100, 8)
+    >>> X, info = block_gmres(A, B, tol=1e-10)
+    >>> info
+    array([0, 0, 0, 0, 0, 0, 0, 0])
+    >>> np.allclose(A.dot(X), B)
+    True
+
+    """
+    A, M, X, B, postprocess = _make_block_system(A, M, X0, B)
+    n, k = B.shape
+    if maxiter is None:
+        maxiter = n*10
+    if restart is None:
+        restart = 20
+    restart = min(restart, n)
+
+    bnrm = _col_norms(B)
+    bnrm[bnrm == 0] = 1
+    threshold = tol * bnrm
+    info = np.zeros(k, dtype=int)
+
+    active = np.arange(k)
+    R = B - A.matmat(X)
+    for it in xrange(maxiter):
+        # Deflate the converged columns
+        keep = _col_norms(R) > threshold[active]
+        active = active[keep]
+        R = R[:, keep]
+        if active.size == 0:
+            break
+
+        V = _orthonormalize(R)
+        # The block Hessenberg matrix H of the Arnoldi relation
+        # A M V[:, :m] = V H is kept as its QR factorization, Q^H H = T.
+        # The least squares problems min ||G - H Y|| of all the columns
+        # share it, with G[:V.shape[1]] = V^H R.
+        G = _dot(V, R)
+        Q = np.eye(V.shape[1], dtype=V.dtype)
+        T = np.zeros((0, 0), dtype=V.dtype)
+        start = 0
+        for j in xrange(restart):
+            W = A.matmat(M.matmat(V[:, start:]))
+
+            # Block Gram-Schmidt, twice for stability
+            h = _dot(V, W)
+            W -= np.dot(V, h)
+            h2 = _dot(V, W)
+            W -= np.dot(V, h2)
+            h += h2
+            V_new = _orthonormalize(W)
+            h = np.vstack([h, _dot(V_new, W)])
+
+            # Update the QR factorization with the new block column
+            m, p, q = T.shape[1], W.shape[1], V_new.shape[1]
+            Q = np.vstack([np.hstack([Q, np.zeros((Q.shape[0], q), Q.dtype)]),
+                           np.hstack([np.zeros((q, Q.shape[1]), Q.dtype),
+                                      np.eye(q, dtype=Q.dtype)])])
+            G = np.vstack([G, np.zeros((q, G.shape[1]), G.dtype)])
+            h = _dot(Q, h)
+            Qb, Rb = qr(h[m:], mode='full')
+            Q[:, m:] = np.dot(Q[:, m:], Qb)
+            G[m:] = _dot(Qb, G[m:])
+            T_new = np.zeros((m + p, m + p), dtype=T.dtype)
+            T_new[:m, :m] = T
+            T_new[:m, m:] = h[:m]
+            T_new[m:, m:] = Rb[:p]
+            T = T_new
+
+            start = V.shape[1]
+            V = np.hstack([V, V_new])
+            res = _col_norms(G[T.shape[0]:])
+            if q == 0 or np.all(res <= threshold[active]):
+                break
+
+        Y = lstsq(T, G[:T.shape[0]])[0]
+        X[:, active] += M.matmat(np.dot(V[:, :T.shape[0]], Y))
+        R = B[:, active] - A.matmat(X[:, active])
+        if callback is not None:
+            callback(postprocess(X))
+    else:
+        keep = _col_norms(R) > threshold[active]
+        info[active[keep]] = maxiter
+
+    return postprocess(X), info
@@ -0,0 +1,145 @@
+"""Tests for the linalg.isolve._block module
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+from numpy.testing import assert_, assert_equal, assert_allclose
+from pytest import raises as assert_raises
+import pytest
+
+from scipy.sparse import csr_matrix, diags, kronsum
+from scipy.sparse.linalg.interface import LinearOperator
+from scipy.sparse.linalg.isolve import block_cg, block_gmres, cg
+
+
+def poisson2d(n):
+    T = diags([-1, 2, -1], [-1, 0, 1], shape=(n, n))
+    return csr_matrix(kronsum(T, T))
+
+
+def rel_residuals(A, X, B):
+    bnrm = np.linalg.norm(B, axis=0)
+    bnrm[bnrm == 0] = 1
+    return np.linalg.norm(A.dot(X) - B, axis=0) / bnrm
+
+
+@pytest.mark.parametrize('solver', [block_cg, block_gmres])
+class TestBlockSolvers(object):
+    def setup_method(self):
+        self.A = poisson2d(12)
+        rng = np.random.RandomState(1234)
+        self.B = rng.rand(self.A.shape[0], 6)
+
+    def test_solve(self, solver):
+        X, info = solver(self.A, self.B, tol=1e-10)
+        assert_equal(info, np.zeros(6))
+        assert_(np.all(rel_residuals(self.A, X, self.B) <= 1e-10))
+
+    def test_one_matmat_per_iteration(self, solver):
+        calls = []
+
+        def matmat(X):
+            calls.append(X.shape[1])
+            return self.A.dot(X)
+
+        A = LinearOperator(self.A.shape, matvec=matmat, matmat=matmat,
+                           dtype=self.A.dtype)
+        X, info = solver(A, self.B, tol=1e-10)
+        assert_equal(info, np.zeros(6))
+        assert_(max(calls) <= self.B.shape[1])
+
+        # Fewer products with A than solving the columns one by one
+        n_products = [0]
+
+        def matvec(x):
+            n_products[0] += 1
+            return self.A.dot(x)
+
+        A1 = LinearOperator(self.A.shape, matvec=matvec, dtype=self.A.dtype)
+        for b in self.B.T:
+            cg(A1, b, tol=1e-10)
+        assert_(len(calls) < n_products[0])
+
+    def test_deflation(self, solver):
+        # Zero, identical and linearly dependent right-hand sides
+        B = self.B.copy()
+        B[:, 1] = 0
+        B[:, 2] = B[:, 0]
+        B[:, 3] = 2 * B[:, 0] - B[:, 4]
+        X, info = solver(self.A, B, tol=1e-10)
+        assert_equal(info, np.zeros(6))
+        assert_(np.all(rel_residuals(self.A, X, B) <= 1e-10))
+        assert_equal(X[:, 1], 0)
+
+    def test_single_rhs(self, solver):
+        x, info = solver(self.A, self.B[:, 0], tol=1e-10)
+        assert_equal(x.shape, (self.A.shape[0],))
+        assert_equal(info, [0])
+        assert_(rel_residuals(self.A, x[:, None], self.B[:, :1]) <= 1e-10)
+
+    def test_x0(self, solver):
+        X, info = solver(self.A, self.B, tol=1e-10)
+        calls = []
+
+        def matmat(X):
+            calls.append(X.shape[1])
+            return self.A.dot(X)
+
+        A = LinearOperator(self.A.shape, matvec=matmat, matmat=matmat,
+                           dtype=self.A.dtype)
+        X2, info = solver(A, self.B, X0=X, tol=1e-10)
+        assert_equal(info, np.zeros(6))
+        assert_allclose(X2, X)
+        assert_equal(len(calls), 1)
+
+    def test_preconditioner(self, solver):
+        A = diags(np.linspace(1, 1e3, self.A.shape[0])) + self.A
+        M = diags(1 / A.diagonal())
+        X, info = solver(A, self.B, tol=1e-10, M=M)
+        assert_equal(info, np.zeros(6))
+        assert_(np.all(rel_residuals(A, X, self.B) <= 1e-10))
+
+    def test_complex(self, solver):
+        A = self.A * (1 + 0j)
+        B = self.B * (1 - 2j)
+        X, info = solver(A, B, tol=1e-10)
+        assert_equal(X.dtype, np.complex128)
+        assert_equal(info, np.zeros(6))
+        assert_(np.all(rel_residuals(A, X, B) <= 1e-10))
+
+    def test_maxiter(self, solver):
+        B = self.B.copy()
+        B[:, 1] = 0
+        kw = {'restart': 2} if solver is block_gmres else {}
+        X, info = solver(self.A, B, tol=1e-10, maxiter=2, **kw)
+        assert_equal(info, [2, 0, 2, 2, 2, 2])
+
+    def test_callback(self, solver):
+        res = []
+        kw = {'restart': 2} if solver is block_gmres else {}
+        X, info = solver(self.A, self.B, tol=1e-10, maxiter=3,
+                         callback=lambda X: res.append(
+                             rel_residuals(self.A, X, self.B).max()), **kw)
+        assert_equal(len(res), 3)
+        assert_(res[-1] < res[0])
+
+    def test_invalid(self, solver):
+        assert_raises(ValueError, solver, self.A, self.B[:-1])
+        assert_raises(ValueError, solver, self.A, self.B, X0=self.B[:, :2])
+        assert_raises(ValueError, solver, self.A[:, :-1], self.B[:-1])
+
+
+def test_block_gmres_nonsymmetric():
+    A = poisson2d(12) + diags([0.5, -0.3], [1, -3], shape=(144, 144))
+    B = np.random.RandomState(1234).rand(144, 5)
+    X, info = block_gmres(A, B, tol=1e-10, restart=30)
+    assert_equal(info, np.zeros(5))
+    assert_(np.all(rel_residuals(A, X, B) <= 1e-10))
+
+
+def test_block_cg_indefinite():
+    A = -poisson2d(6)
+    B = np.ones((36, 2))
+    X, info = block_cg(A, B)
+    assert_(np.all(info < 0))
@@ -0,0 +1,209 @@
+"""Tests for the preconditioners of the iterative solvers
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+from numpy.testing import assert_, assert_equal, assert_allclose
+from numpy.linalg import LinAlgError
+from pytest import raises as assert_raises
+import pytest
+
+from scipy.sparse import csr_matrix, diags, kronsum, random, eye
+from scipy.sparse.linalg import (cg, gmres, jacobi_preconditioner,
+                                 block_jacobi_preconditioner,
+                                 ssor_preconditioner, ilu0_preconditioner,
+                                 ic0_preconditioner,
+                                 smoothed_aggregation_preconditioner)
+
+
+def poisson2d(n):
+    T = diags([-1, 2, -1], [-1, 0, 1], shape=(n, n))
+    A = kronsum(T, T).tocsr()
+    A.eliminate_zeros()
+    return A
+
+
+def nonsymmetric(n):
+    A = random(n, n, density=5 / n, random_state=1234)
+    return csr_matrix(A + A.T + diags(np.arange(1, n + 1) + 10.) +
+                      random(n, n, density=1 / n, random_state=4321))
+
+
+def cg_iterations(A, M):
+    iterations = []
+    b = np.ones(A.shape[0])
+    x, info = cg(A, b, tol=1e-8, M=M,
+                 callback=lambda x: iterations.append(None))
+    assert_equal(info, 0)
+    assert_(np.linalg.norm(A.dot(x) - b) <= 1e-8 * np.linalg.norm(b))
+    return len(iterations)
+
+
+def ssor_reference(A, omega):
+    A = A.toarray()
+    D = np.diag(np.diag(A)) / omega
+    return omega / (2 - omega) * np.dot(np.dot(np.tril(A, -1) + D,
+                                               np.linalg.inv(D)),
+                                        np.triu(A, 1) + D)
+
+
+def ilu0_reference(A):
+    # ILU(0) by Gaussian elimination of a dense copy, dropping the fill-in
+    pattern = A.toarray() != 0
+    LU = A.toarray()
+    n = LU.shape[0]
+    for k in range(n):
+        for i in range(k + 1, n):
+            if pattern[i, k]:
+                LU[i, k] /= LU[k, k]
+                LU[i, k+1:] -= np.where(pattern[i, k+1:],
+                                        LU[i, k] * LU[k, k+1:], 0)
+    return np.dot(np.tril(LU, -1) + np.eye(n), np.triu(LU))
+
+
+class TestPreconditioners(object):
+    def check_operator(self, M, M_ref):
+        # The operator M is the inverse of M_ref
+        n = M_ref.shape[0]
+        rng = np.random.RandomState(1234)
+        x = rng.rand(n)
+        X = rng.rand(n, 3)
+        assert_allclose(np.dot(M_ref, M.matvec(x)), x, atol=1e-12)
+        assert_allclose(np.dot(M_ref, M.matmat(X)), X, atol=1e-12)
+        assert_allclose(np.dot(M_ref.T.conj(), M.rmatvec(x)), x, atol=1e-12)
+        z = x * (1 + 2j)
+        assert_allclose(np.dot(M_ref, M.matvec(z)), z, atol=1e-12)
+
+    def test_jacobi(self):
+        A = nonsymmetric(30)
+        self.check_operator(jacobi_preconditioner(A),
+                            np.diag(A.diagonal()))
+        self.check_operator(jacobi_preconditioner(A, omega=0.5),
+                            2 * np.diag(A.diagonal()))
+
+    @pytest.mark.parametrize('blocksize', [1, 3, 4])
+    def test_block_jacobi(self, blocksize):
+        A = nonsymmetric(30)
+        dense = A.toarray()
+        block_diagonal = np.zeros_like(dense)
+        for i in range(0, 30, blocksize):
+            block = slice(i, i + blocksize)
+            block_diagonal[block, block] = dense[block, block]
+        self.check_operator(block_jacobi_preconditioner(A, blocksize),
+                            block_diagonal)
+
+    @pytest.mark.parametrize('omega', [0.5, 1.0, 1.5])
+    def test_ssor(self, omega):
+        A = nonsymmetric(30)
+        self.check_operator(ssor_preconditioner(A, omega),
+                            ssor_reference(A, omega))
+
+    def test_ilu0(self):
+        A = nonsymmetric(30)
+        M_ref = ilu0_reference(A)
+        self.check_operator(ilu0_preconditioner(A), M_ref)
+        # L U is equal to A on the pattern of A
+        mask = A.toarray() != 0
+        assert_allclose(M_ref[mask], A.toarray()[mask])
+
+    def test_ilu0_complex(self):
+        A = nonsymmetric(30) * (1 - 1j) + 1j * eye(30)
+        self.check_operator(ilu0_preconditioner(A), ilu0_reference(A))
+
+    def test_ic0(self):
+        A = poisson2d(6) + diags(np.linspace(0, 1, 36))
+        # IC(0) is ILU(0) for hermitian matrices
+        self.check_operator(ic0_preconditioner(A), ilu0_reference(A))
+        self.check_operator(ic0_preconditioner(A.astype(complex)),
+                            ilu0_reference(A))
+
+        # Only the upper triangle is used
+        U = csr_matrix(np.triu(A.toarray()))
+        self.check_operator(ic0_preconditioner(U), ilu0_reference(A))
+
+    def test_ic0_hermitian(self):
+        A = poisson2d(6).astype(complex)
+        A = A + 0.5j * (diags([1], [1], shape=(36, 36)) -
+                        diags([1], [-1], shape=(36, 36)))
+        self.check_operator(ic0_preconditioner(A), ilu0_reference(A))
+
+    def test_input_unchanged(self):
+        A = nonsymmetric(30)
+        A_copy = A.copy()
+        for f in [jacobi_preconditioner, ssor_preconditioner,
+                  ilu0_preconditioner, ic0_preconditioner,
+                  smoothed_aggregation_preconditioner]:
+            f(A)
+            assert_equal(A.toarray(), A_copy.toarray())
+
+    def test_dense_and_integer_input(self):
+        A = poisson2d(5)
+        M = ilu0_preconditioner(A.toarray())
+        assert_equal(M.dtype, np.float64)
+        M_int = ilu0_preconditioner(A.astype(int))
+        assert_allclose(M_int.matvec(np.ones(25)), M.matvec(np.ones(25)))
+
+    def test_explicit_zeros(self):
+        # Explicitly stored zeros are part of the sparsity pattern
+        A = poisson2d(5)
+        A_full = csr_matrix(A.toarray() + 1e-300)
+        A_full.data[abs(A_full.data) < 1] = 0
+        assert_equal(A_full.nnz, 25 * 25)
+        M = ilu0_preconditioner(A_full)
+        assert_allclose(M.matvec(A.dot(np.arange(25.))), np.arange(25.),
+                        atol=1e-12)
+
+    def test_errors(self):
+        A = poisson2d(5).tolil()
+        A[3, 3] = 0
+        A = A.tocsr()
+        A.eliminate_zeros()
+        for f in [jacobi_preconditioner, ssor_preconditioner,
+                  ilu0_preconditioner, ic0_preconditioner,
+                  smoothed_aggregation_preconditioner]:
+            assert_raises(LinAlgError, f, A)
+        assert_raises(LinAlgError, block_jacobi_preconditioner,
+                      csr_matrix(np.ones((4, 4))), 2)
+        assert_raises(LinAlgError, ic0_preconditioner, -poisson2d(5))
+
+        assert_raises(ValueError, ilu0_preconditioner, csr_matrix((3, 4)))
+        assert_raises(ValueError, ssor_preconditioner, poisson2d(5), 2.0)
+        assert_raises(ValueError, block_jacobi_preconditioner,
+                      poisson2d(5), 0)
+
+
+class TestConvergence(object):
+    @pytest.mark.parametrize('make', [
+        lambda A: ssor_preconditioner(A, 1.5),
+        ilu0_preconditioner,
+        ic0_preconditioner,
+        smoothed_aggregation_preconditioner])
+    def test_cg(self, make):
+        A = poisson2d(32)
+        assert_(cg_iterations(A, make(A)) < cg_iterations(A, None) / 2)
+
+    def test_smoothed_aggregation_scaling(self):
+        # The number of iterations hardly depends on the size
+        iterations = [cg_iterations(A, smoothed_aggregation_preconditioner(A))
+                      for A in [poisson2d(16), poisson2d(64)]]
+        assert_(iterations[1] <= iterations[0] + 3)
+        assert_(iterations[1] <= 15)
+
+    def test_smoothed_aggregation_anisotropic(self):
+        T = diags([-1, 2, -1], [-1, 0, 1], shape=(32, 32))
+        A = (kronsum(T, 1e-3 * T) + 1e-4 * eye(32 * 32)).tocsr()
+        assert_(cg_iterations(A, smoothed_aggregation_preconditioner(A)) <
+                cg_iterations(A, None) / 4)
+
+    @pytest.mark.parametrize('make', [
+        jacobi_preconditioner,
+        lambda A: block_jacobi_preconditioner(A, 5),
+        ssor_preconditioner,
+        ilu0_preconditioner])
+    def test_gmres(self, make):
+        A = nonsymmetric(200)
+        b = np.ones(200)
+        x, info = gmres(A, b, tol=1e-10, M=make(A))
+        assert_equal(info, 0)
+        assert_allclose(A.dot(x), b, atol=1e-8)
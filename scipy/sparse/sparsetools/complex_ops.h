@@ -160,4 +160,48 @@ typedef complex_wrapper<float,npy_cfloat> npy_cfloat_wrapper;
 typedef complex_wrapper<double,npy_cdouble> npy_cdouble_wrapper;
 typedef complex_wrapper<long double,npy_clongdouble> npy_clongdouble_wrapper;
 
+/*
+ * Complex conjugate, which is the identity for the other types
+ */
+template <class T>
+inline T conjugate(const T& x) {
+    return x;
+}
+
+template <class c_type, class npy_type>
+inline complex_wrapper<c_type,npy_type> conjugate(const complex_wrapper<c_type,npy_type>& x) {
+    return complex_wrapper<c_type,npy_type>(x.real, -x.imag);
+}
+
+/*
+ * Magnitude and squared magnitude, of the type of the argument (with a zero
+ * imaginary part for the complex types)
+ */
+template <class T>
+inline T magnitude(const T& x) {
+    if (x < T(0)) {
+        return T(0) - x;
+    }
+    return x;
+}
+
+inline float hypot_(float x, float y) { return hypotf(x, y); }
+inline double hypot_(double x, double y) { return hypot(x, y); }
+inline long double hypot_(long double x, long double y) { return hypotl(x, y); }
+
+template <class c_type, class npy_type>
+inline complex_wrapper<c_type,npy_type> magnitude(const complex_wrapper<c_type,npy_type>& x) {
+    return complex_wrapper<c_type,npy_type>(hypot_(x.real, x.imag));
+}
+
+template <class T>
+inline T squared_magnitude(const T& x) {
+    return x * x;
+}
+
+template <class c_type, class npy_type>
+inline complex_wrapper<c_type,npy_type> squared_magnitude(const complex_wrapper<c_type,npy_type>& x) {
+    return complex_wrapper<c_type,npy_type>(x.real * x.real + x.imag * x.imag);
+}
+
 #endif
@@ -2,6 +2,7 @@
 #define __COO_H__
 
 #include <algorithm>
+#include <stdexcept>
 
 /*
  * Compute B = A for COO matrix A, CSR matrix B
@@ -76,6 +77,92 @@ void coo_tocsr(const I n_row,
     //now Bp,Bj,Bx form a CSR representation (with possible duplicates)
 }
 
+/*
+ * Count the entries of each row of a chunk of COO triplets, adding them
+ * to the counts of the previous chunks
+ *
+ *
+ * Input Arguments:
+ *   I  n_row           - number of rows
+ *   npy_int64  nnz     - number of triplets in the chunk
+ *   I  Ai[nnz]         - row indices
+ *
+ * Output Arguments:
+ *   I  Bp[n_row + 1]   - counts of the entries of the rows, shifted by
+ *                        one: Bp[i + 1] is incremented for each entry of
+ *                        row i
+ *
+ * Note:
+ *   Input:  Bp must be initialized (to zero before the first chunk)
+ *
+ *   The cumulative sum of Bp gives the row pointer of the CSR matrix
+ *   of all chunks, which is filled by coo_tocsr_chunk.
+ *
+ *   Complexity: Linear.  Specifically O(nnz)
+ *
+ */
+template <class I>
+void coo_count_rows(const I n_row,
+                    const npy_int64 nnz,
+                    const I Ai[],
+                          I Bp[])
+{
+    for (npy_int64 n = 0; n < nnz; n++){
+        Bp[Ai[n] + 1]++;
+    }
+}
+
+/*
+ * Write a chunk of COO triplets into a CSR matrix, whose row pointer was
+ * computed by coo_count_rows from all chunks
+ *
+ *
+ * Input Arguments:
+ *   npy_int64  nnz     - number of triplets in the chunk
+ *   I  Ai[nnz]         - row indices
+ *   I  Aj[nnz]         - column indices
+ *   T  Ax[nnz]         - values
+ *   I  Bp[n_row + 1]   - row pointer
+ *
+ * Output Arguments:
+ *   I  next[n_row]     - positions where the next entries of the rows
+ *                        are written, updated
+ *   I  Bj              - column indices
+ *   T  Bx              - values
+ *
+ * Note:
+ *   Input:  next must be initialized to the row pointer of the matrix,
+ *           without its last element, before the first chunk.
+ *
+ *   The entries of each row are in the order of the chunks, and of the
+ *   triplets within a chunk.  Duplicate entries are carried over.  An
+ *   exception is thrown if a row has more entries than counted.
+ *
+ *   Complexity: Linear.  Specifically O(nnz)
+ *
+ */
+template <class I, class T>
+void coo_tocsr_chunk(const npy_int64 nnz,
+                     const I Ai[],
+                     const I Aj[],
+                     const T Ax[],
+                     const I Bp[],
+                           I next[],
+                           I Bj[],
+                           T Bx[])
+{
+    for (npy_int64 n = 0; n < nnz; n++){
+        const I row = Ai[n];
+        if (next[row] == Bp[row + 1]) {
+            throw std::length_error("row has more entries than counted");
+        }
+        I dest = next[row]++;
+
+        Bj[dest] = Aj[n];
+        Bx[dest] = Ax[n];
+    }
+}
+
 /*
  * Compute B += A for COO matrix A, dense matrix B
  *
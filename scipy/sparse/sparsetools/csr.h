@@ -5,6 +5,7 @@
 #include <vector>
 #include <algorithm>
 #include <functional>
+#include <stdexcept>
 
 #include "util.h"
 #include "dense.h"
@@ -670,6 +671,76 @@ void csr_matmat_pass2(const I n_row,
 }
 
 
+/*
+ * Compute the entries of the matrix product C = A * B in the sparsity
+ * pattern of a CSR matrix M.
+ *
+ * Input Arguments:
+ *   I  n_row       - number of rows in A and M
+ *   I  n_col       - number of columns in B and M
+ *   I  Ap[n_row+1] - row pointer
+ *   I  Aj[nnz(A)]  - column indices
+ *   T  Ax[nnz(A)]  - nonzeros
+ *   I  Bp[?]       - row pointer
+ *   I  Bj[nnz(B)]  - column indices
+ *   T  Bx[nnz(B)]  - nonzeros
+ *   I  Mp[n_row+1] - row pointer of the pattern
+ *   I  Mj[nnz(M)]  - column indices of the pattern
+ * Output Arguments:
+ *   T  Cx[nnz(M)]  - nonzeros, Cx[k] is the entry at Mj[k]
+ *
+ * Note:
+ *   Output array Cx must be preallocated
+ *   Only the entries of Cx at the positions Mp[0] to Mp[n_row] are
+ *   written, so that Mp may point into the middle of Mj and Cx.
+ *   Duplicate entries of M get the same value.
+ *
+ *   Products of the entries of A and B outside of the pattern are not
+ *   computed, and the temporary storage is O(n_col) as for
+ *   csr_matmat_pass2.
+ */
+template <class I, class T>
+void csr_matmat_masked(const I n_row,
+                       const I n_col,
+                       const I Ap[],
+                       const I Aj[],
+                       const T Ax[],
+                       const I Bp[],
+                       const I Bj[],
+                       const T Bx[],
+                       const I Mp[],
+                       const I Mj[],
+                             T Cx[])
+{
+    std::vector<I> flag(n_col, -1);
+    std::vector<T> sums(n_col, 0);
+
+    for(I i = 0; i < n_row; i++){
+        for(I mm = Mp[i]; mm < Mp[i+1]; mm++){
+            flag[Mj[mm]] = i;
+        }
+
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I j = Aj[jj];
+            const T v = Ax[jj];
+            for(I kk = Bp[j]; kk < Bp[j+1]; kk++){
+                const I k = Bj[kk];
+                if(flag[k] == i){
+                    sums[k] += v*Bx[kk];
+                }
+            }
+        }
+
+        for(I mm = Mp[i]; mm < Mp[i+1]; mm++){
+            Cx[mm] = sums[Mj[mm]];
+        }
+        for(I mm = Mp[i]; mm < Mp[i+1]; mm++){
+            sums[Mj[mm]] = 0;
+        }
+    }
+}
+
+
 /*
  * Compute C = A (binary_op) B for CSR matrices that are not
  * necessarily canonical CSR format.  Specifically, this method
@@ -1176,6 +1247,465 @@ void csr_matvecs(const I n_row,
 }
 
 
+/*
+ * Solve T*X = B in place for dense block vectors X and B, where T is the
+ * lower or upper triangular part of a square CSR matrix A
+ *
+ *
+ * Input Arguments:
+ *   I  n_row            - number of rows (and columns) in A
+ *   I  n_vecs           - number of column vectors in X
+ *   I  Ap[n_row+1]      - row pointer
+ *   I  Aj[nnz(A)]       - column indices
+ *   T  Ax[nnz(A)]       - nonzeros
+ *   I  lower            - nonzero for the lower triangular part of A,
+ *                         zero for the upper triangular part
+ *   I  unit_diagonal    - nonzero if the diagonal of T is taken to be one
+ *
+ * Input/Output Arguments:
+ *   T  Xx[n_row,n_vecs] - right hand sides on input, solution on output
+ *
+ * Note:
+ *   The entries of the other triangular part of A are ignored, so that
+ *   the L and U factors of an incomplete factorization can be stored in
+ *   the same matrix.  Unless unit_diagonal is set, the diagonal entries
+ *   must be present in A and nonzero.
+ *
+ *   Complexity: Linear.  Specifically O(n_vecs * (nnz(A) + n_row))
+ *
+ */
+template <class I, class T>
+void csr_trisolve(const I n_row,
+                  const I n_vecs,
+                  const I Ap[],
+                  const I Aj[],
+                  const T Ax[],
+                  const I lower,
+                  const I unit_diagonal,
+                        T Xx[])
+{
+    for(I n = 0; n < n_row; n++){
+        const I i = lower ? n : n_row - 1 - n;
+        T * x = Xx + (npy_intp)n_vecs * i;
+        T diag = 1;
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            const I j = Aj[jj];
+            if(j == i){
+                diag = Ax[jj];
+            }
+            else if(lower ? j < i : j > i){
+                const T a = Ax[jj];
+                const T * y = Xx + (npy_intp)n_vecs * j;
+                for(I k = 0; k < n_vecs; k++){
+                    x[k] = x[k] - a * y[k];
+                }
+            }
+        }
+        if(!unit_diagonal){
+            for(I k = 0; k < n_vecs; k++){
+                x[k] = x[k] / diag;
+            }
+        }
+    }
+}
+
+
+/*
+ * Compute the incomplete LU factorization with zero fill-in, ILU(0),
+ * of a square CSR matrix A in place
+ *
+ * The strictly lower triangular part of A is overwritten by the unit
+ * lower triangular factor L (without its diagonal) and the upper
+ * triangular part by U, such that L*U is equal to A on the sparsity
+ * pattern of A.
+ *
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows (and columns) in A
+ *   I  Ap[n_row+1]   - row pointer
+ *   I  Aj[nnz(A)]    - column indices
+ *
+ * Input/Output Arguments:
+ *   T  Ax[nnz(A)]    - nonzeros of A on input, of L and U on output
+ *
+ * Returns:
+ *   -1 on success, or the first row whose pivot (diagonal entry of U)
+ *   is zero or missing from the pattern
+ *
+ * Note:
+ *   A must be in canonical format (sorted indices, no duplicates)
+ *
+ *   Complexity: O(sum of nnz(U[k,:]) over the entries A[i,k], k < i)
+ *
+ */
+template <class I, class T>
+I csr_ilu0(const I n_row,
+           const I Ap[],
+           const I Aj[],
+                 T Ax[])
+{
+    std::vector<I> diag(n_row);
+    std::vector<I> pos(n_row, -1);
+
+    for(I i = 0; i < n_row; i++){
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            pos[Aj[jj]] = jj;
+        }
+
+        // Eliminate the entries left of the diagonal, in increasing
+        // column order, dropping the fill-in outside of the pattern
+        I kk = Ap[i];
+        for(; kk < Ap[i+1] && Aj[kk] < i; kk++){
+            const I k = Aj[kk];
+            const T l = Ax[kk] / Ax[diag[k]];
+            Ax[kk] = l;
+            for(I jj = diag[k] + 1; jj < Ap[k+1]; jj++){
+                const I p = pos[Aj[jj]];
+                if(p != -1){
+                    Ax[p] = Ax[p] - l * Ax[jj];
+                }
+            }
+        }
+
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            pos[Aj[jj]] = -1;
+        }
+
+        if(kk == Ap[i+1] || Aj[kk] != i || Ax[kk] == 0){
+            return i;
+        }
+        diag[i] = kk;
+    }
+    return -1;
+}
+
+
+/*
+ * Compute the incomplete Cholesky factorization with zero fill-in,
+ * IC(0), of a hermitian matrix A in place
+ *
+ * The matrix is given by its upper triangular part U in CSR format,
+ * which is overwritten by the factor such that U^H * inv(D) * U is
+ * equal to A on the sparsity pattern of A, where D is the diagonal
+ * of U.
+ *
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows (and columns) in U
+ *   I  Up[n_row+1]   - row pointer
+ *   I  Uj[nnz(U)]    - column indices
+ *
+ * Input/Output Arguments:
+ *   T  Ux[nnz(U)]    - nonzeros of the upper triangle of A on input,
+ *                      of the factor on output
+ *
+ * Returns:
+ *   -1 on success, or the first row whose pivot (diagonal entry of U)
+ *   is zero or missing from the pattern
+ *
+ * Note:
+ *   U must be upper triangular and in canonical format (sorted indices,
+ *   no duplicates)
+ *
+ *   Complexity: O(sum of nnz(U[k,:]) * (nnz(U[k,:]) + nnz(U[i,:]))
+ *   over the entries U[k,i], k < i)
+ *
+ */
+template <class I, class T>
+I csr_ic0(const I n_row,
+          const I Up[],
+          const I Uj[],
+                T Ux[])
+{
+    for(I k = 0; k < n_row; k++){
+        const I kd = Up[k];
+        if(kd == Up[k+1] || Uj[kd] != k || Ux[kd] == 0){
+            return k;
+        }
+        const T d = Ux[kd];
+
+        // Subtract conj(U[k,i]) * U[k,j] / d from the entries U[i,j],
+        // j >= i, of the pattern
+        for(I ii = kd + 1; ii < Up[k+1]; ii++){
+            const I i = Uj[ii];
+            const T l = conjugate(Ux[ii]) / d;
+            I pp = Up[i];
+            for(I jj = ii; jj < Up[k+1]; jj++){
+                const I j = Uj[jj];
+                while(pp < Up[i+1] && Uj[pp] < j){
+                    pp++;
+                }
+                if(pp == Up[i+1]){
+                    break;
+                }
+                if(Uj[pp] == j){
+                    Ux[pp] = Ux[pp] - l * Ux[jj];
+                }
+            }
+        }
+    }
+    return -1;
+}
+
+
+/*
+ * Partition the nodes of a graph into aggregates of neighboring nodes,
+ * for aggregation-based multigrid methods
+ *
+ * Each node not yet aggregated whose neighbors are not aggregated either
+ * forms an aggregate with its neighbors.  The remaining nodes then join
+ * the aggregate of one of their neighbors.  Isolated nodes form their
+ * own aggregate.
+ *
+ *
+ * Input Arguments:
+ *   I  n_row         - number of nodes
+ *   I  Sp[n_row+1]   - row pointer of the adjacency matrix
+ *   I  Sj[nnz(S)]    - column indices of the adjacency matrix
+ *
+ * Output Arguments:
+ *   I  x[n_row]      - aggregate of each node
+ *
+ * Returns:
+ *   The number of aggregates
+ *
+ * Note:
+ *   Output array x must be preallocated
+ *
+ *   Complexity: Linear.  Specifically O(nnz(S) + n_row)
+ *
+ */
+template <class I>
+I csr_aggregate(const I n_row,
+                const I Sp[],
+                const I Sj[],
+                      I x[])
+{
+    std::fill(x, x + n_row, -1);
+
+    I n_agg = 0;
+    for(I i = 0; i < n_row; i++){
+        if(x[i] != -1){
+            continue;
+        }
+        bool has_aggregated_neighbors = false;
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+            if(x[Sj[jj]] != -1){
+                has_aggregated_neighbors = true;
+                break;
+            }
+        }
+        if(!has_aggregated_neighbors){
+            x[i] = n_agg;
+            for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+                x[Sj[jj]] = n_agg;
+            }
+            n_agg++;
+        }
+    }
+
+    // Join the aggregates of the first pass only, so that the aggregates
+    // do not grow in chains
+    std::vector<I> first(x, x + n_row);
+    for(I i = 0; i < n_row; i++){
+        if(x[i] != -1){
+            continue;
+        }
+        for(I jj = Sp[i]; jj < Sp[i+1]; jj++){
+            if(first[Sj[jj]] != -1){
+                x[i] = first[Sj[jj]];
+                break;
+            }
+        }
+    }
+    return n_agg;
+}
+
+
+
+/*
+ * Extract the rows of a CSR matrix given by an array of row indices
+ *
+ *
+ * Input Arguments:
+ *   I  n_row_idx        - number of row indices
+ *   I  rows[n_row_idx]  - row indices, in [0, n_row)
+ *   I  Ap[n_row+1]      - row pointer
+ *   I  Aj[nnz(A)]       - column indices
+ *   T  Ax[nnz(A)]       - nonzeros
+ *
+ * Output Arguments:
+ *   I  Bj[nnz(B)]       - column indices
+ *   T  Bx[nnz(B)]       - nonzeros
+ *
+ * Note:
+ *   Output arrays Bj and Bx must be preallocated, with the sizes given
+ *   by the row pointer of B, which is computed from the lengths of the
+ *   rows of A
+ *
+ *   Complexity: Linear.  Specifically O(nnz(B) + n_row_idx)
+ *
+ */
+template <class I, class T>
+void csr_row_index(const I n_row_idx,
+                   const I rows[],
+                   const I Ap[],
+                   const I Aj[],
+                   const T Ax[],
+                         I Bj[],
+                         T Bx[])
+{
+    for(I n = 0; n < n_row_idx; n++){
+        const I row_start = Ap[rows[n]];
+        const I row_end   = Ap[rows[n] + 1];
+        Bj = std::copy(Aj + row_start, Aj + row_end, Bj);
+        Bx = std::copy(Ax + row_start, Ax + row_end, Bx);
+    }
+}
+
+
+/*
+ * Extract the rows of a CSR matrix given by a slice start:stop:step
+ *
+ *
+ * Input Arguments:
+ *   I  start            - first row
+ *   I  stop             - end of the slice (excluded)
+ *   I  step             - nonzero step between the rows
+ *   I  Ap[n_row+1]      - row pointer
+ *   I  Aj[nnz(A)]       - column indices
+ *   T  Ax[nnz(A)]       - nonzeros
+ *
+ * Output Arguments:
+ *   I  Bj[nnz(B)]       - column indices
+ *   T  Bx[nnz(B)]       - nonzeros
+ *
+ * Note:
+ *   Output arrays Bj and Bx must be preallocated, as for csr_row_index
+ *
+ *   Complexity: Linear.  Specifically O(nnz(B) + number of rows of B)
+ *
+ */
+template <class I, class T>
+void csr_row_slice(const I start,
+                   const I stop,
+                   const I step,
+                   const I Ap[],
+                   const I Aj[],
+                   const T Ax[],
+                         I Bj[],
+                         T Bx[])
+{
+    for(I i = start; step > 0 ? i < stop : i > stop; i += step){
+        const I row_start = Ap[i];
+        const I row_end   = Ap[i+1];
+        Bj = std::copy(Aj + row_start, Aj + row_end, Bj);
+        Bx = std::copy(Ax + row_start, Ax + row_end, Bx);
+    }
+}
+
+
+/*
+ * First pass of the extraction of the columns of a CSR matrix given by
+ * an array of column indices: count the entries of each row of B
+ *
+ *
+ * Input Arguments:
+ *   I  n_idx            - number of column indices
+ *   I  col_idxs[n_idx]  - column indices, in [0, n_col), possibly
+ *                         repeated and in any order
+ *   I  n_row            - number of rows in A
+ *   I  n_col            - number of columns in A
+ *   I  Ap[n_row+1]      - row pointer
+ *   I  Aj[nnz(A)]       - column indices
+ *
+ * Output Arguments:
+ *   I  col_offsets[n_col] - cumulative number of occurrences of the
+ *                           columns in col_idxs
+ *   I  Bp[n_row+1]        - row pointer of B
+ *
+ * Note:
+ *   Output array col_offsets must be preallocated and zeroed, and Bp
+ *   must be preallocated
+ *
+ *   Complexity: Linear.  Specifically O(nnz(A) + n_idx + n_col)
+ *
+ */
+template <class I>
+void csr_column_index1(const I n_idx,
+                       const I col_idxs[],
+                       const I n_row,
+                       const I n_col,
+                       const I Ap[],
+                       const I Aj[],
+                             I col_offsets[],
+                             I Bp[])
+{
+    for(I n = 0; n < n_idx; n++){
+        col_offsets[col_idxs[n]]++;
+    }
+
+    I nnz = 0;
+    Bp[0] = 0;
+    for(I i = 0; i < n_row; i++){
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            nnz += col_offsets[Aj[jj]];
+        }
+        Bp[i+1] = nnz;
+    }
+
+    for(I j = 1; j < n_col; j++){
+        col_offsets[j] += col_offsets[j-1];
+    }
+}
+
+
+/*
+ * Second pass of the extraction of the columns of a CSR matrix given by
+ * an array of column indices: copy the entries
+ *
+ *
+ * Input Arguments:
+ *   I  col_order[n_idx]   - positions in col_idxs sorted by column
+ *                           (a stable argsort of col_idxs)
+ *   I  col_offsets[n_col] - computed by csr_column_index1
+ *   I  nnz                - number of nonzeros in A
+ *   I  Aj[nnz(A)]         - column indices
+ *   T  Ax[nnz(A)]         - nonzeros
+ *
+ * Output Arguments:
+ *   I  Bj[nnz(B)]         - column indices
+ *   T  Bx[nnz(B)]         - nonzeros
+ *
+ * Note:
+ *   Output arrays Bj and Bx must be preallocated, with the size given
+ *   by csr_column_index1
+ *
+ *   Complexity: Linear.  Specifically O(nnz(A) + nnz(B))
+ *
+ */
+template <class I, class T>
+void csr_column_index2(const I col_order[],
+                       const I col_offsets[],
+                       const I nnz,
+                       const I Aj[],
+                       const T Ax[],
+                             I Bj[],
+                             T Bx[])
+{
+    I n = 0;
+    for(I jj = 0; jj < nnz; jj++){
+        const I j = Aj[jj];
+        const I offset_start = (j == 0) ? 0 : col_offsets[j-1];
+        const I offset_end   = col_offsets[j];
+        for(I k = offset_start; k < offset_end; k++){
+            Bj[n] = col_order[k];
+            Bx[n] = Ax[jj];
+            n++;
+        }
+    }
+}
+
 
 
 template<class I, class T>
@@ -1454,6 +1984,390 @@ int csr_sample_offsets(const I n_row,
     return 0;
 }
 
+/*
+ * Reductions of the rows of a CSR matrix
+ *
+ * The reduction of each row is selected by op:
+ *
+ *   0  sum of the entries
+ *   1  maximum of the entries
+ *   2  minimum of the entries
+ *   3  sum of the magnitudes of the entries
+ *   4  sum of the squared magnitudes of the entries
+ *   5  maximum of the magnitudes of the entries
+ *   6  minimum of the magnitudes of the entries
+ *
+ * The maxima and minima include the implicit zeros of the rows that have
+ * fewer than n_col entries, and propagate NaNs.  The magnitudes of complex
+ * entries are returned as complex numbers with a zero imaginary part.
+ *
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows in A
+ *   I  n_col         - number of columns in A
+ *   I  Ap[n_row+1]   - row pointer
+ *   I  Aj[nnz(A)]    - column indices
+ *   T  Ax[nnz(A)]    - nonzeros
+ *   I  op            - reduction
+ *
+ * Output Arguments:
+ *   T  Yx[n_row]     - reductions of the rows
+ *
+ * Note:
+ *   Output array Yx must be preallocated
+ *
+ *   The maxima and minima require that A has no duplicate entries.
+ *
+ *   Complexity: Linear.  Specifically O(nnz(A) + n_row)
+ *
+ */
+template <class T>
+struct identity_op {
+    T operator() (const T& x) const { return x; }
+};
+
+template <class T>
+struct magnitude_op {
+    T operator() (const T& x) const { return magnitude(x); }
+};
+
+template <class T>
+struct squared_magnitude_op {
+    T operator() (const T& x) const { return squared_magnitude(x); }
+};
+
+template <class T>
+inline bool is_nan(const T& x) {
+    return !(x == x);
+}
+
+template <class I, class T, class unary_op>
+void csr_row_sum_op(const I n_row,
+                    const I Ap[],
+                    const T Ax[],
+                          T Yx[],
+                    const unary_op& op)
+{
+    for(I i = 0; i < n_row; i++){
+        T sum = 0;
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            sum += op(Ax[jj]);
+        }
+        Yx[i] = sum;
+    }
+}
+
+template <class I, class T, class unary_op, class binary_op>
+void csr_row_fold_op(const I n_row,
+                     const I n_col,
+                     const I Ap[],
+                     const T Ax[],
+                           T Yx[],
+                     const unary_op& op,
+                     const binary_op& fold)
+{
+    for(I i = 0; i < n_row; i++){
+        const I row_start = Ap[i];
+        const I row_end   = Ap[i+1];
+        T m = (row_start == row_end || row_end - row_start < n_col)
+              ? T(0) : op(Ax[row_start]);
+        for(I jj = row_start; jj < row_end; jj++){
+            const T x = op(Ax[jj]);
+            if (is_nan(x)) {
+                m = x;
+                break;
+            }
+            m = fold(m, x);
+        }
+        Yx[i] = m;
+    }
+}
+
+template <class I, class T>
+void csr_row_reduce(const I n_row,
+                    const I n_col,
+                    const I Ap[],
+                    const I Aj[],
+                    const T Ax[],
+                    const I op,
+                          T Yx[])
+{
+    switch(op){
+        case 0:
+            csr_row_sum_op(n_row, Ap, Ax, Yx, identity_op<T>());
+            break;
+        case 1:
+            csr_row_fold_op(n_row, n_col, Ap, Ax, Yx, identity_op<T>(),
+                            maximum<T>());
+            break;
+        case 2:
+            csr_row_fold_op(n_row, n_col, Ap, Ax, Yx, identity_op<T>(),
+                            minimum<T>());
+            break;
+        case 3:
+            csr_row_sum_op(n_row, Ap, Ax, Yx, magnitude_op<T>());
+            break;
+        case 4:
+            csr_row_sum_op(n_row, Ap, Ax, Yx, squared_magnitude_op<T>());
+            break;
+        case 5:
+            csr_row_fold_op(n_row, n_col, Ap, Ax, Yx, magnitude_op<T>(),
+                            maximum<T>());
+            break;
+        case 6:
+            csr_row_fold_op(n_row, n_col, Ap, Ax, Yx, magnitude_op<T>(),
+                            minimum<T>());
+            break;
+        default:
+            throw std::domain_error("invalid reduction");
+    }
+}
+
+
+/*
+ * Sums of the columns of a CSR matrix
+ *
+ * The sums are selected by op, as for csr_row_reduce:
+ *
+ *   0  sum of the entries
+ *   3  sum of the magnitudes of the entries
+ *   4  sum of the squared magnitudes of the entries
+ *
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows in A
+ *   I  n_col         - number of columns in A
+ *   I  Ap[n_row+1]   - row pointer
+ *   I  Aj[nnz(A)]    - column indices
+ *   T  Ax[nnz(A)]    - nonzeros
+ *   I  op            - reduction
+ *
+ * Output Arguments:
+ *   T  Yx[n_col]     - sums of the columns
+ *
+ * Note:
+ *   Output array Yx must be preallocated
+ *
+ *   The sums are added to the values of Yx.
+ *
+ *   Complexity: Linear.  Specifically O(nnz(A))
+ *
+ */
+template <class I, class T, class unary_op>
+void csr_column_sum_op(const I n_row,
+                       const I Ap[],
+                       const I Aj[],
+                       const T Ax[],
+                             T Yx[],
+                       const unary_op& op)
+{
+    for(I jj = Ap[0]; jj < Ap[n_row]; jj++){
+        Yx[Aj[jj]] += op(Ax[jj]);
+    }
+}
+
+template <class I, class T>
+void csr_column_reduce(const I n_row,
+                       const I n_col,
+                       const I Ap[],
+                       const I Aj[],
+                       const T Ax[],
+                       const I op,
+                             T Yx[])
+{
+    switch(op){
+        case 0:
+            csr_column_sum_op(n_row, Ap, Aj, Ax, Yx, identity_op<T>());
+            break;
+        case 3:
+            csr_column_sum_op(n_row, Ap, Aj, Ax, Yx, magnitude_op<T>());
+            break;
+        case 4:
+            csr_column_sum_op(n_row, Ap, Aj, Ax, Yx,
+                              squared_magnitude_op<T>());
+            break;
+        default:
+            throw std::domain_error("invalid reduction");
+    }
+}
+
+
+/*
+ * Column indices of the maxima (or minima) of the rows of a CSR matrix
+ *
+ * As for numpy.argmax (or numpy.argmin) of the dense rows, the index of
+ * the first occurrence of the maximum (or minimum) of each row is
+ * returned, with the implicit zeros included and NaNs propagated, and 0
+ * for the empty rows.
+ *
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows in A
+ *   I  n_col         - number of columns in A
+ *   I  Ap[n_row+1]   - row pointer
+ *   I  Aj[nnz(A)]    - column indices
+ *   T  Ax[nnz(A)]    - nonzeros
+ *
+ * Output Arguments:
+ *   I  Yj[n_row]     - column indices
+ *
+ * Note:
+ *   Output array Yj must be preallocated
+ *
+ *   A must be in canonical format (sorted indices and no duplicates)
+ *
+ *   Complexity: Linear.  Specifically O(nnz(A) + n_row)
+ *
+ */
+template <class I, class T, class binary_op>
+void csr_row_arg_op(const I n_row,
+                    const I n_col,
+                    const I Ap[],
+                    const I Aj[],
+                    const T Ax[],
+                          I Yj[],
+                    const binary_op& better)
+{
+    for(I i = 0; i < n_row; i++){
+        const I row_start = Ap[i];
+        const I row_end   = Ap[i+1];
+        if (row_start == row_end) {
+            Yj[i] = 0;
+            continue;
+        }
+
+        // the first best entry stored
+        I best = row_start;
+        for(I jj = row_start + 1; jj < row_end && !is_nan(Ax[best]); jj++){
+            if (is_nan(Ax[jj]) || better(Ax[jj], Ax[best])) {
+                best = jj;
+            }
+        }
+        Yj[i] = Aj[best];
+
+        if (row_end - row_start < n_col && !is_nan(Ax[best])) {
+            // the first implicit zero of the row
+            I zero_col = row_end - row_start;
+            for(I jj = row_start; jj < row_end; jj++){
+                if (Aj[jj] != jj - row_start) {
+                    zero_col = jj - row_start;
+                    break;
+                }
+            }
+            if (better(T(0), Ax[best]) ||
+                    (Ax[best] == T(0) && zero_col < Aj[best])) {
+                Yj[i] = zero_col;
+            }
+        }
+    }
+}
+
+template <class I, class T>
+void csr_row_argmax(const I n_row,
+                    const I n_col,
+                    const I Ap[],
+                    const I Aj[],
+                    const T Ax[],
+                          I Yj[])
+{
+    csr_row_arg_op(n_row, n_col, Ap, Aj, Ax, Yj, std::greater<T>());
+}
+
+template <class I, class T>
+void csr_row_argmin(const I n_row,
+                    const I n_col,
+                    const I Ap[],
+                    const I Aj[],
+                    const T Ax[],
+                          I Yj[])
+{
+    csr_row_arg_op(n_row, n_col, Ap, Aj, Ax, Yj, std::less<T>());
+}
+
+
+/*
+ * Count the nonzero entries of the rows of a CSR matrix
+ *
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows in A
+ *   I  n_col         - number of columns in A
+ *   I  Ap[n_row+1]   - row pointer
+ *   I  Aj[nnz(A)]    - column indices
+ *   T  Ax[nnz(A)]    - nonzeros
+ *
+ * Output Arguments:
+ *   I  Yj[n_row]     - number of nonzeros of the rows
+ *
+ * Note:
+ *   Output array Yj must be preallocated
+ *
+ *   Explicit zeros are not counted, and duplicate entries are counted
+ *   separately.
+ *
+ *   Complexity: Linear.  Specifically O(nnz(A) + n_row)
+ *
+ */
+template <class I, class T>
+void csr_row_count_nonzero(const I n_row,
+                           const I n_col,
+                           const I Ap[],
+                           const I Aj[],
+                           const T Ax[],
+                                 I Yj[])
+{
+    const T zero(0);
+    for(I i = 0; i < n_row; i++){
+        I count = 0;
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            if (Ax[jj] != zero) {
+                count++;
+            }
+        }
+        Yj[i] = count;
+    }
+}
+
+
+/*
+ * Count the nonzero entries of the columns of a CSR matrix
+ *
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows in A
+ *   I  n_col         - number of columns in A
+ *   I  Ap[n_row+1]   - row pointer
+ *   I  Aj[nnz(A)]    - column indices
+ *   T  Ax[nnz(A)]    - nonzeros
+ *
+ * Output Arguments:
+ *   I  Yj[n_col]     - number of nonzeros of the columns
+ *
+ * Note:
+ *   Output array Yj must be preallocated
+ *
+ *   The counts are added to the values of Yj.  Explicit zeros are not
+ *   counted, and duplicate entries are counted separately.
+ *
+ *   Complexity: Linear.  Specifically O(nnz(A))
+ *
+ */
+template <class I, class T>
+void csr_column_count_nonzero(const I n_row,
+                              const I n_col,
+                              const I Ap[],
+                              const I Aj[],
+                              const T Ax[],
+                                    I Yj[])
+{
+    const T zero(0);
+    for(I jj = Ap[0]; jj < Ap[n_row]; jj++){
+        if (Ax[jj] != zero) {
+            Yj[Aj[jj]]++;
+        }
+    }
+}
+
 /*
  * A test function checking the error handling
  */
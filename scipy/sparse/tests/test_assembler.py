@@ -0,0 +1,238 @@
+from __future__ import division, print_function, absolute_import
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.testing import assert_equal, assert_allclose, assert_
+from pytest import raises as assert_raises
+
+from scipy.sparse import SparseAssembler, csr_from_chunks, coo_matrix
+
+
+def _random_triplets(shape, n_batches=10):
+    np.random.seed(1234)
+    batches = []
+    for i in range(n_batches):
+        n = np.random.randint(0, 50)
+        batches.append((np.random.randint(0, shape[0], size=n),
+                        np.random.randint(0, shape[1], size=n),
+                        np.random.rand(n)))
+    return batches
+
+
+class TestSparseAssembler(object):
+
+    def test_assembly(self):
+        for shape in [(30, 40), (1, 1), (50, 3)]:
+            batches = _random_triplets(shape)
+            # a small capacity makes the buffers grow
+            assembler = SparseAssembler(shape, capacity=3)
+            for rows, cols, vals in batches:
+                assembler.add(rows, cols, vals)
+            rows, cols, vals = [np.concatenate(a) for a in zip(*batches)]
+            assert_equal(assembler.nnz, len(vals))
+
+            expected = coo_matrix((vals, (rows, cols)), shape=shape)
+            for fmt in ['csr', 'csc']:
+                A = getattr(assembler, 'to' + fmt)()
+                B = expected.asformat(fmt)
+                B.sum_duplicates()
+                assert_equal(A.format, fmt)
+                assert_equal(A.dtype, np.float64)
+                A.check_format(full_check=True)
+                assert_equal(A.indptr, B.indptr)
+                assert_equal(A.indices, B.indices)
+                assert_allclose(A.data, B.data)
+
+                # numeric refill of the same pattern
+                new_vals = np.random.rand(len(vals))
+                A = getattr(assembler, 'to' + fmt)(new_vals)
+                A.check_format(full_check=True)
+                assert_equal(A.indices, B.indices)
+                assert_allclose(A.toarray(), coo_matrix(
+                    (new_vals, (rows, cols)), shape=shape).toarray())
+
+    def test_broadcast(self):
+        # the 2 x 2 element matrices of a 1-D mesh
+        nodes = np.array([[0, 1], [1, 2], [2, 3]])
+        element = np.array([[1., -1.], [-1., 1.]])
+        assembler = SparseAssembler((4, 4), dtype=np.complex128)
+        assembler.add(nodes[:, :, None], nodes[:, None, :], element)
+        assert_equal(assembler.nnz, 12)
+        expected = [[1, -1, 0, 0], [-1, 2, -1, 0], [0, -1, 2, -1],
+                    [0, 0, -1, 1]]
+        A = assembler.tocsr()
+        assert_equal(A.dtype, np.complex128)
+        assert_equal(A.toarray(), expected)
+        A = assembler.tocsc(1j * np.tile(element, (3, 1, 1)))
+        assert_equal(A.toarray(), 1j * np.array(expected))
+
+        # a scalar value
+        assembler.add([0, 3], 3, 5.)
+        assert_equal(assembler.tocsr().toarray()[:, 3], [5, 0, -1, 6])
+
+    def test_explicit_zeros(self):
+        # entries whose sum is zero are kept in the pattern
+        assembler = SparseAssembler((2, 2))
+        assembler.add([0, 0, 1], [1, 1, 0], [1., -1., 2.])
+        A = assembler.tocsr()
+        assert_equal(A.nnz, 2)
+        assert_equal(A.toarray(), [[0, 0], [2, 0]])
+
+    def test_empty(self):
+        assembler = SparseAssembler((3, 4))
+        assembler.add([], [], [])
+        for A in [assembler.tocsr(), assembler.tocsc()]:
+            assert_equal(A.shape, (3, 4))
+            assert_equal(A.nnz, 0)
+
+        assembler.add(2, 3, 1.)
+        assert_equal(assembler.tocsr().toarray()[2, 3], 1)
+        assembler.clear()
+        assert_equal(assembler.nnz, 0)
+        assert_equal(assembler.tocsr().nnz, 0)
+
+    def test_errors(self):
+        assembler = SparseAssembler((3, 4))
+        assert_raises(ValueError, assembler.add, [3], [0], [1.])
+        assert_raises(ValueError, assembler.add, [0], [-1], [1.])
+        assert_raises(TypeError, assembler.add, [0.5], [0], [1.])
+        assert_raises(ValueError, assembler.add, [0, 1], [0, 1, 2], 1.)
+        assert_equal(assembler.nnz, 0)
+
+        assembler.add([0, 1], [1, 2], 1.)
+        assert_raises(ValueError, assembler.tocsr, [1., 2., 3.])
+        assert_raises(TypeError, SparseAssembler, 3)
+        assert_raises(ValueError, SparseAssembler, (3, 3), capacity=-1)
+
+
+class TestCsrFromChunks(object):
+
+    def _expected(self, batches, shape):
+        rows, cols, vals = [np.concatenate(a) for a in zip(*batches)]
+        return coo_matrix((vals, (rows, cols)), shape=shape).tocsr()
+
+    def test_chunks(self):
+        for shape in [(30, 40), (1, 1), (50, 3)]:
+            batches = _random_triplets(shape)
+            B = self._expected(batches, shape)
+            for chunks in [batches, tuple(batches), lambda: iter(batches)]:
+                A = csr_from_chunks(chunks, shape)
+                A.check_format(full_check=True)
+                assert_equal(A.shape, shape)
+                assert_equal(A.dtype, np.float64)
+                assert_equal(A.nnz, sum(len(b[0]) for b in batches))
+                assert_allclose(A.toarray(), B.toarray())
+
+                A = csr_from_chunks(chunks, shape, sum_duplicates=True)
+                A.check_format(full_check=True)
+                assert_equal(A.has_canonical_format, True)
+                B.sum_duplicates()
+                assert_equal(A.indptr, B.indptr)
+                assert_equal(A.indices, B.indices)
+                assert_allclose(A.data, B.data)
+
+    def test_order(self):
+        # the entries of each row are in the order in which they were read
+        chunks = [([1, 0, 1], [2, 1, 0], [1, 2, 3]), ([1], [2], [4])]
+        A = csr_from_chunks(chunks, (2, 3), dtype=np.int64)
+        assert_equal(A.dtype, np.int64)
+        assert_equal(A.indptr, [0, 1, 4])
+        assert_equal(A.indices, [1, 2, 0, 2])
+        assert_equal(A.data, [2, 1, 3, 4])
+
+        A = csr_from_chunks(chunks, (2, 3), sum_duplicates=True)
+        assert_equal(A.dtype, np.int64)
+        assert_equal(A.indices, [1, 0, 2])
+        assert_equal(A.data, [2, 3, 5])
+
+    def test_broadcast_and_dtype(self):
+        chunks = [(np.array([0, 2]), 1, 1.5), ([[1], [2]], [0, 1], 2j)]
+        A = csr_from_chunks(chunks, (3, 2))
+        assert_equal(A.dtype, np.complex128)
+        assert_equal(A.toarray(), [[0, 1.5], [2j, 2j], [2j, 1.5 + 2j]])
+
+    def test_empty(self):
+        for chunks in [[], [([], [], [])]]:
+            A = csr_from_chunks(chunks, (3, 4))
+            assert_equal(A.shape, (3, 4))
+            assert_equal(A.nnz, 0)
+            assert_equal(A.indptr, [0, 0, 0, 0])
+
+    def test_out_arrays(self):
+        shape = (30, 40)
+        batches = _random_triplets(shape)
+        B = self._expected(batches, shape)
+        nnz = sum(len(b[0]) for b in batches)
+        indptr = np.empty(shape[0] + 1, dtype=np.int64)
+        indices = np.empty(nnz + 5, dtype=np.int64)
+        data = np.empty(nnz + 5, dtype=np.float32)
+        A = csr_from_chunks(batches, shape, out=(indptr, indices, data))
+        assert_equal(A.dtype, np.float32)
+        assert_equal(A.indices.dtype, np.int64)
+        assert_(np.may_share_memory(A.indices, indices))
+        assert_(np.may_share_memory(A.data, data))
+        assert_allclose(A.toarray(), B.toarray(), rtol=1e-6)
+
+        assert_raises(ValueError, csr_from_chunks, batches, shape,
+                      out=(indptr, indices[:nnz - 1], data))
+        assert_raises(ValueError, csr_from_chunks, batches, shape,
+                      out=(indptr, indices.astype(np.int32), data))
+        assert_raises(ValueError, csr_from_chunks, batches, shape,
+                      out=(indptr.astype(np.int16), indices, data))
+        assert_raises(ValueError, csr_from_chunks, batches, shape,
+                      out=(indptr, indices, data), dtype=np.float64)
+        assert_raises(ValueError, csr_from_chunks, batches, shape,
+                      out=(indptr, indices[::2], data))
+
+    def test_memmap(self):
+        shape = (30, 40)
+        batches = _random_triplets(shape)
+        B = self._expected(batches, shape)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            def memmap_npy(name, size, dtype):
+                return np.lib.format.open_memmap(
+                    os.path.join(tmpdir, name + '.npy'), mode='w+',
+                    dtype=dtype, shape=(size,))
+
+            A = csr_from_chunks(lambda: iter(batches), shape, out=memmap_npy,
+                                sum_duplicates=True)
+            B.sum_duplicates()
+            assert_allclose(A.toarray(), B.toarray())
+            del A
+
+            indptr = np.load(os.path.join(tmpdir, 'indptr.npy'))
+            assert_equal(indptr, B.indptr)
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_errors(self):
+        assert_raises(TypeError, csr_from_chunks, iter([]), (3, 3))
+        assert_raises(TypeError, csr_from_chunks, [], 3)
+        assert_raises(ValueError, csr_from_chunks, [([0], [3], 1.)], (3, 3))
+        assert_raises(ValueError, csr_from_chunks, [([-1], [0], 1.)], (3, 3))
+        assert_raises(TypeError, csr_from_chunks, [([0.5], [0], 1.)], (3, 3))
+        assert_raises(ValueError, csr_from_chunks, [([0], [0])], (3, 3))
+        assert_raises(ValueError, csr_from_chunks, [], (3, 3), out=3)
+
+        # chunks that change between the passes
+        passes = []
+
+        def changing_chunks():
+            passes.append(None)
+            if len(passes) == 1:
+                yield [0, 0, 1], [0, 1, 2], 1.
+            else:
+                yield [2, 2, 2], [0, 1, 2], 1.
+
+        assert_raises(ValueError, csr_from_chunks, changing_chunks, (3, 3))
+        del passes[:]
+
+        def growing_chunks():
+            passes.append(None)
+            yield [0] * len(passes), 0, 1.
+
+        assert_raises(ValueError, csr_from_chunks, growing_chunks, (3, 3))
@@ -622,6 +622,9 @@ class _TestCommon(object):
         expected = np.count_nonzero(self.datsp.toarray())
         assert_equal(self.datsp.count_nonzero(), expected)
         assert_equal(self.datsp.T.count_nonzero(), expected)
+        for axis in [0, 1, -1, -2]:
+            expected = np.count_nonzero(self.datsp.toarray() != 0, axis=axis)
+            assert_equal(self.datsp.count_nonzero(axis=axis), expected)
 
     def test_invalid_shapes(self):
         assert_raises(ValueError, self.spmatrix, (-1,3))
@@ -4722,7 +4725,6 @@ class Test64Bit(object):
             # These involve indices larger than `downcast_maxval`
             a = csc_matrix([[1, 2], [3, 4], [5, 6]])
             assert_raises(AssertionError, a.getnnz, axis=1)
-            assert_raises(AssertionError, a.sum, axis=0)
 
             a = csr_matrix([[1, 2, 3], [3, 4, 6]])
             assert_raises(AssertionError, a.getnnz, axis=0)
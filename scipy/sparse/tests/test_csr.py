@@ -1,8 +1,9 @@
 from __future__ import division, print_function, absolute_import
 
 import numpy as np
-from numpy.testing import assert_array_almost_equal, assert_
-from scipy.sparse import csr_matrix
+from numpy.testing import assert_array_almost_equal, assert_, assert_equal
+from pytest import raises as assert_raises
+from scipy.sparse import csr_matrix, csc_matrix
 
 
 def _check_csr_rowslice(i, sl, X, Xcsr):
@@ -58,3 +59,55 @@ def test_csr_getcol():
         assert_array_almost_equal(arr_col, csr_col.toarray())
         assert_(type(csr_col) is csr_matrix)
 
+
+def test_csr_fancy_indexing():
+    # Rows and columns given by index arrays (repeated, unsorted and
+    # negative), boolean masks and strided slices
+    np.random.seed(1234)
+    X = np.random.random((20, 15))
+    X[X > 0.4] = 0
+    rows = np.random.randint(-20, 20, size=30)
+    cols = np.random.randint(-15, 15, size=25)
+    row_mask = np.random.random(20) > 0.5
+    col_mask = np.random.random(15) > 0.5
+    slices = [slice(None, None, 2), slice(None, None, -1),
+              slice(-2, 1, -3), slice(1, 20, 4), slice(5, 1, 2)]
+
+    for fmt in [csr_matrix, csc_matrix]:
+        for dtype in [np.float64, np.complex128, np.int8, np.bool_]:
+            B = (10 * X).astype(dtype)
+            A = fmt(B)
+            assert_equal(A[rows].toarray(), B[rows])
+            assert_equal(A[rows, 3].toarray(), B[rows, 3][:, None])
+            assert_equal(A[rows, 2:9].toarray(), B[rows, 2:9])
+            assert_equal(A[:, cols].toarray(), B[:, cols])
+            assert_equal(A[4, cols].toarray(), B[4, cols][None, :])
+            assert_equal(A[3:11, cols].toarray(), B[3:11, cols])
+            assert_equal(A[rows[:, None], cols].toarray(),
+                         B[rows[:, None], cols])
+            assert_equal(A[row_mask].toarray(), B[row_mask])
+            assert_equal(A[:, col_mask].toarray(), B[:, col_mask])
+            assert_equal(A[[], :].shape, (0, 15))
+            assert_equal(A[:, []].shape, (20, 0))
+            for sl in slices:
+                assert_equal(A[sl].toarray(), B[sl])
+                assert_equal(A[:, sl].toarray(), B[:, sl])
+                assert_equal(A[sl, 7].toarray(), B[sl, 7][:, None])
+                assert_equal(A[sl, cols].toarray(), B[sl, cols])
+                assert_equal(A[sl, ::-2].toarray(), B[sl, ::-2])
+                assert_equal(A[rows, sl].toarray(), B[rows, sl])
+
+            assert_raises(IndexError, A.__getitem__, [0, 20])
+            assert_raises(IndexError, A.__getitem__, (slice(None), [-16]))
+            assert_raises(IndexError, A.__getitem__, (slice(None, None, 2),
+                                                      [15]))
+
+
+def test_csr_fancy_indexing_int64():
+    X = np.arange(30.).reshape(5, 6)
+    A = csr_matrix(X)
+    A.indptr = A.indptr.astype(np.int64)
+    A.indices = A.indices.astype(np.int64)
+    assert_equal(A[[4, 0, 4]].toarray(), X[[4, 0, 4]])
+    assert_equal(A[:, [5, 1, 1]].toarray(), X[:, [5, 1, 1]])
+    assert_equal(A[::-2].toarray(), X[::-2])
@@ -0,0 +1,115 @@
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+from numpy.testing import assert_equal, assert_allclose, assert_
+from pytest import raises as assert_raises
+
+from scipy.sparse import (csr_matrix, csc_matrix, coo_matrix, random,
+                          estimate_nnz, masked_matmul)
+from scipy.sparse import _threads
+
+
+def _random_matrices():
+    np.random.seed(1234)
+    A = random(200, 150, density=0.05, format='csr', random_state=1234)
+    B = random(150, 100, density=0.05, format='csr', random_state=4321)
+    # some empty rows and columns
+    A = A.multiply(np.random.rand(200, 1) > 0.2).tocsr()
+    B = B.multiply(np.random.rand(1, 100) > 0.2).tocsr()
+    A.eliminate_zeros()
+    B.eliminate_zeros()
+    return A, B
+
+
+class TestThreadedMatmul(object):
+
+    def setup_method(self):
+        # make sure small matrices are split between the threads
+        self._min_nnz = _threads._MIN_THREADED_NNZ
+        _threads._MIN_THREADED_NNZ = 0
+
+    def teardown_method(self):
+        _threads._MIN_THREADED_NNZ = self._min_nnz
+
+    def test_matmul(self):
+        A, B = _random_matrices()
+        for fmt in [csr_matrix, csc_matrix]:
+            for dtype in [np.float32, np.float64, np.complex128]:
+                AA = fmt(A, dtype=dtype)
+                BB = fmt(B)
+                expected = AA.dot(BB, workers=1)
+                for workers in [2, 3, 16, 500]:
+                    C = AA.dot(BB, workers=workers)
+                    assert_equal(C.format, AA.format)
+                    assert_equal(C.dtype, expected.dtype)
+                    C.check_format(full_check=True)
+                    assert_equal(C.indptr, expected.indptr)
+                    assert_equal(C.indices, expected.indices)
+                    assert_equal(C.data, expected.data)
+                    assert_allclose(C.toarray(),
+                                    AA.toarray().dot(BB.toarray()),
+                                    rtol=1e-5)
+
+    def test_cancellation(self):
+        # entries that cancel out are dropped
+        A = csr_matrix([[1., 1., 0], [0, 1., 1.], [1., 0, 0]])
+        B = csr_matrix([[1., 0], [-1., 1.], [1., 0]])
+        for workers in [1, 2, 3]:
+            C = A.dot(B, workers=workers)
+            C.check_format(full_check=True)
+            assert_equal(C.nnz, 3)
+            assert_equal(C.toarray(), [[0, 1.], [0, 1.], [1., 0]])
+
+    def test_estimate_nnz(self):
+        A, B = _random_matrices()
+        C = A * B
+        bound = estimate_nnz(A, B)
+        assert_(bound >= C.nnz)
+        pattern = [csr_matrix((np.ones(M.nnz, dtype=int), M.indices,
+                               M.indptr), shape=M.shape) for M in (A, B)]
+        flops = (pattern[0] * pattern[1]).sum(axis=1).A.ravel()
+        assert_equal(bound, np.minimum(flops, B.shape[1]).sum())
+        for workers in [1, 2, 7]:
+            assert_equal(estimate_nnz(A, B, exact=True, workers=workers),
+                         C.nnz)
+        assert_equal(estimate_nnz(A.tocsc(), B.toarray(), exact=True), C.nnz)
+
+        # entries that cancel out are counted
+        A = csr_matrix([[1., 1.]])
+        B = csr_matrix([[1.], [-1.]])
+        assert_equal((A * B).nnz, 0)
+        assert_equal(estimate_nnz(A, B, exact=True), 1)
+        assert_(isinstance(estimate_nnz(A, B), int))
+        assert_raises(ValueError, estimate_nnz, A, A)
+
+    def test_masked_matmul(self):
+        A, B = _random_matrices()
+        full = A.toarray().dot(B.toarray())
+        mask = random(200, 100, density=0.1, format='csr', random_state=1)
+        for workers in [1, 2, 5]:
+            for M in [mask, mask.tocoo(), mask.toarray() != 0]:
+                C = masked_matmul(A, B, M, workers=workers)
+                assert_equal(C.format, 'csr')
+                assert_equal(C.indptr, mask.indptr)
+                assert_equal(C.indices, mask.indices)
+                assert_allclose(C.data, full[mask.nonzero()])
+
+        # explicit zeros of the mask and of the product are kept
+        mask = csr_matrix((np.zeros(3), ([0, 1, 1], [0, 0, 1])),
+                          shape=(2, 2))
+        A = csr_matrix([[1., 0], [1., -1.]])
+        C = masked_matmul(A, np.ones((2, 2)), mask)
+        assert_equal(C.nnz, 3)
+        assert_equal(C.toarray(), [[1., 0], [0, 0]])
+
+        # duplicate entries of the mask are merged
+        mask = coo_matrix(([1, 1], ([0, 0], [1, 1])), shape=(2, 2))
+        for M in [mask, csr_matrix((mask.data, mask.col, [0, 2, 2]),
+                                   shape=(2, 2))]:
+            C = masked_matmul(np.eye(2), np.arange(4.).reshape(2, 2), M)
+            assert_equal(C.nnz, 1)
+            assert_equal(C.toarray(), [[0, 1.], [0, 0]])
+
+        assert_raises(ValueError, masked_matmul, A, A, np.eye(3))
+        assert_raises(ValueError, masked_matmul, A, np.ones((3, 3)),
+                      np.eye(2))
@@ -17,12 +17,15 @@ from scipy.sparse import (csc_matrix, csr_matrix, bsr_matrix, dia_matrix,
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
 
 
-def _save_and_load(matrix):
+def _save_and_load(matrix, compressed=True, mmap_mode=None):
     fd, tmpfile = tempfile.mkstemp(suffix='.npz')
     os.close(fd)
     try:
-        save_npz(tmpfile, matrix)
-        loaded_matrix = load_npz(tmpfile)
+        save_npz(tmpfile, matrix, compressed=compressed)
+        loaded_matrix = load_npz(tmpfile, mmap_mode=mmap_mode)
+        if mmap_mode is not None:
+            # the file can't be removed while it is mapped on Windows
+            loaded_matrix = loaded_matrix.copy()
     finally:
         os.remove(tmpfile)
     return loaded_matrix
@@ -30,11 +33,13 @@ def _save_and_load(matrix):
 def _check_save_and_load(dense_matrix):
     for matrix_class in [csc_matrix, csr_matrix, bsr_matrix, dia_matrix, coo_matrix]:
         matrix = matrix_class(dense_matrix)
-        loaded_matrix = _save_and_load(matrix)
-        assert_(type(loaded_matrix) is matrix_class)
-        assert_(loaded_matrix.shape == dense_matrix.shape)
-        assert_(loaded_matrix.dtype == dense_matrix.dtype)
-        assert_equal(loaded_matrix.toarray(), dense_matrix)
+        for compressed, mmap_mode in [(True, None), (False, None),
+                                      (False, 'r'), (False, 'c')]:
+            loaded_matrix = _save_and_load(matrix, compressed, mmap_mode)
+            assert_(type(loaded_matrix) is matrix_class)
+            assert_(loaded_matrix.shape == dense_matrix.shape)
+            assert_(loaded_matrix.dtype == dense_matrix.dtype)
+            assert_equal(loaded_matrix.toarray(), dense_matrix)
 
 def test_save_and_load_random():
     N = 10
@@ -91,3 +96,53 @@ def test_implemented_error():
     x[0,1] = 1
 
     assert_raises(NotImplementedError, save_npz, 'x.npz', x)
+
+
+def _is_file_backed(arr):
+    while arr is not None:
+        if isinstance(arr, np.memmap):
+            return True
+        arr = arr.base
+    return False
+
+def test_load_mmap():
+    np.random.seed(1234)
+    dense_matrix = np.random.random((50, 40))
+    dense_matrix[dense_matrix > 0.2] = 0
+
+    fd, tmpfile = tempfile.mkstemp(suffix='.npz')
+    os.close(fd)
+    try:
+        for matrix_class in [csr_matrix, csc_matrix]:
+            matrix = matrix_class(dense_matrix)
+            save_npz(tmpfile, matrix, compressed=False)
+
+            # the file is also readable without memory-mapping
+            with np.load(tmpfile) as loaded:
+                assert_equal(loaded['indices'], matrix.indices)
+
+            loaded_matrix = load_npz(tmpfile, mmap_mode='r')
+            assert_(type(loaded_matrix) is matrix_class)
+            for name in ['data', 'indices', 'indptr']:
+                arr = getattr(loaded_matrix, name)
+                assert_equal(arr, getattr(matrix, name))
+                assert_(_is_file_backed(arr))
+                assert_(not arr.flags.writeable)
+                if sys.version_info[:2] >= (3, 6):
+                    assert_equal(arr.ctypes.data % 64, 0)
+            assert_equal(loaded_matrix[5:10].toarray(), dense_matrix[5:10])
+            assert_equal(loaded_matrix.T.toarray(), dense_matrix.T)
+            # the file can't be written again while it is mapped on Windows
+            del loaded_matrix, arr
+
+            # copy-on-write
+            loaded_matrix = load_npz(tmpfile, mmap_mode='c')
+            loaded_matrix.data[:] = 0
+            del loaded_matrix
+            assert_equal(load_npz(tmpfile).toarray(), dense_matrix)
+
+        save_npz(tmpfile, csr_matrix(dense_matrix), compressed=True)
+        assert_raises(ValueError, load_npz, tmpfile, mmap_mode='r')
+        assert_raises(ValueError, load_npz, tmpfile, mmap_mode='w+')
+    finally:
+        os.remove(tmpfile)
@@ -0,0 +1,156 @@
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+from numpy.testing import assert_equal, assert_allclose, assert_
+from pytest import raises as assert_raises
+
+from scipy.sparse import (csr_matrix, csc_matrix, coo_matrix, random,
+                          get_workers, set_workers)
+from scipy.sparse import _threads
+
+
+class TestThreadedMatvec(object):
+
+    def setup_method(self):
+        np.random.seed(1234)
+        # make sure small matrices are split between the threads
+        self._min_nnz = _threads._MIN_THREADED_NNZ
+        _threads._MIN_THREADED_NNZ = 0
+
+    def teardown_method(self):
+        _threads._MIN_THREADED_NNZ = self._min_nnz
+
+    def test_matvec(self):
+        A = random(300, 200, density=0.05, random_state=1234)
+        A.data -= 0.5
+        for fmt in [csr_matrix, csc_matrix]:
+            for dtype in [np.float32, np.float64, np.complex128]:
+                B = fmt(A, dtype=dtype)
+                for x in [np.random.rand(200), np.random.rand(200, 1),
+                          np.random.rand(200, 4) + 1j,
+                          np.random.rand(200).astype(np.float32)]:
+                    expected = B.dot(x, workers=1)
+                    for workers in [2, 3, 8, 400]:
+                        y = B.dot(x, workers=workers)
+                        assert_equal(y.dtype, expected.dtype)
+                        assert_equal(y.shape, expected.shape)
+                        assert_allclose(y, expected, rtol=1e-5)
+                        if fmt is csr_matrix:
+                            # the rows are computed as with a single thread
+                            assert_equal(y, expected)
+                        # deterministic for a given number of threads
+                        assert_equal(B.dot(x, workers=workers), y)
+
+    def test_empty_rows(self):
+        A = csr_matrix(([1., 2.], ([0, 0], [1, 3])), shape=(6, 4))
+        x = np.arange(4.)
+        for B in [A, A.tocsc()]:
+            assert_equal(B.dot(x, workers=4), [7., 0, 0, 0, 0, 0])
+        B = csr_matrix((0, 3))
+        assert_equal(B.dot(np.ones(3), workers=2), np.zeros(0))
+
+    def test_global_setting(self):
+        A = random(100, 100, density=0.1, format='csr', random_state=1234)
+        x = np.random.rand(100)
+        expected = A * x
+
+        assert_equal(get_workers(), 1)
+        old = set_workers(3)
+        try:
+            assert_equal(old, 1)
+            assert_equal(get_workers(), 3)
+            assert_equal(A * x, expected)
+            assert_equal(A.dot(x, workers=1), expected)
+            # COO products are not threaded
+            assert_allclose(coo_matrix(A) * x, expected)
+        finally:
+            set_workers(old)
+        assert_equal(get_workers(), 1)
+
+        assert_raises(ValueError, set_workers, 0)
+        assert_raises(ValueError, A.dot, x, workers=-2)
+        assert_(set_workers(-1) == 1)
+        set_workers(1)
+
+
+class TestThreadedReductions(object):
+
+    def setup_method(self):
+        # make sure small matrices are split between the threads
+        self._min_nnz = _threads._MIN_THREADED_NNZ
+        _threads._MIN_THREADED_NNZ = 0
+        self._workers = set_workers(3)
+
+    def teardown_method(self):
+        _threads._MIN_THREADED_NNZ = self._min_nnz
+        set_workers(self._workers)
+
+    def matrices(self):
+        A = random(40, 30, density=0.2, random_state=1234).toarray()
+        A[A > 0] -= 0.5
+        A[3] = 0
+        A[5] = 1 - np.arange(30) % 3
+        A[:, 7] = -1
+        A[8, 2] = np.nan
+        for dtype in [np.float64, np.complex128, np.int8, np.bool_]:
+            if dtype is np.complex128:
+                D = A + 1j * A[::-1]
+            elif dtype is np.float64:
+                D = A
+            else:
+                D = np.nan_to_num(10 * A)
+            D = D.astype(dtype)
+            for fmt in [csr_matrix, csc_matrix]:
+                S = fmt(D)
+                # explicit zeros
+                S.data[::5] = 0
+                yield S, S.toarray()
+
+    def test_sum(self):
+        for S, D in self.matrices():
+            for axis in [None, 0, 1, -1]:
+                expected = np.asmatrix(D).sum(axis=axis)
+                assert_allclose(S.sum(axis=axis), expected, atol=1e-14)
+                assert_allclose(S.mean(axis=axis),
+                                np.asmatrix(D).mean(axis=axis), atol=1e-14)
+
+    def test_max_min(self):
+        for S, D in self.matrices():
+            if D.dtype.kind == 'c':
+                continue
+            for axis in [0, 1]:
+                assert_equal(S.max(axis=axis).toarray().ravel(),
+                             np.max(D, axis=axis))
+                assert_equal(S.min(axis=axis).toarray().ravel(),
+                             np.min(D, axis=axis))
+
+    def test_argmax_argmin(self):
+        for S, D in self.matrices():
+            for axis in [0, 1]:
+                assert_equal(np.asarray(S.argmax(axis=axis)).ravel(),
+                             np.argmax(D, axis=axis))
+                assert_equal(np.asarray(S.argmin(axis=axis)).ravel(),
+                             np.argmin(D, axis=axis))
+
+    def test_count_nonzero(self):
+        for S, D in self.matrices():
+            for axis in [0, 1]:
+                assert_equal(S.count_nonzero(axis=axis),
+                             np.count_nonzero(D, axis=axis))
+
+    def test_ufunc(self):
+        for S, D in self.matrices():
+            if D.dtype.kind == 'f':
+                assert_equal(S.expm1().toarray(), np.expm1(D))
+                assert_equal(S.sign().toarray(), np.sign(D))
+
+    def test_deterministic(self):
+        A = random(500, 400, density=0.1, format='csr', random_state=1234)
+        for B in [A, A.tocsc()]:
+            for axis in [0, 1]:
+                expected = B.sum(axis=axis)
+                for workers in [1, 2, 5]:
+                    set_workers(workers)
+                    assert_allclose(B.sum(axis=axis), expected, rtol=1e-14)
+                    set_workers(3)
+                    assert_equal(B.sum(axis=axis), B.sum(axis=axis))
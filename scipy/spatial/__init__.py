@@ -12,6 +12,7 @@ Nearest-neighbor Queries
 
    KDTree      -- class for efficient nearest-neighbor queries
    cKDTree     -- class for efficient nearest-neighbor queries (faster impl.)
+   DynamicKDTree -- cKDTree supporting insertion and removal of points
    distance    -- module containing many different distance measures
    Rectangle
 
@@ -92,6 +93,7 @@ from __future__ import division, print_function, absolute_import
 
 from .kdtree import *
 from .ckdtree import *
+from ._dynamic_kdtree import DynamicKDTree
 from .qhull import *
 from ._spherical_voronoi import SphericalVoronoi
 from ._plotutils import *
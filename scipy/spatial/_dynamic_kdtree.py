@@ -0,0 +1,799 @@
+"""
+Dynamic kd-tree, supporting insertion and removal of points.
+
+.. versionadded:: 1.1.0
+
+"""
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+import scipy.sparse
+
+from .ckdtree import cKDTree
+
+__all__ = ['DynamicKDTree']
+
+
+# Points inserted one batch at a time are collected in a buffer tree of at
+# most this many points, which is rebuilt on every insertion.
+_BUFFER_SIZE = 1024
+
+# slot of the buffer, and of removed ids, in DynamicKDTree._slot
+_BUFFER = -1
+_REMOVED = -2
+
+
+class _Block(object):
+    """
+    A cKDTree over a batch of points, with tombstones for removed points.
+    """
+
+    def __init__(self, data, ids, tree_kwargs):
+        self.data = data
+        self.ids = ids
+        self.tree = cKDTree(data, **tree_kwargs)
+        self.alive = np.ones(len(ids), dtype=bool)
+        self.n_dead = 0
+
+    @property
+    def n(self):
+        return len(self.ids) - self.n_dead
+
+    def alive_points(self):
+        if self.n_dead == 0:
+            return self.data, self.ids
+        return self.data[self.alive], self.ids[self.alive]
+
+    def weights(self, weights):
+        # Weights of the points of the block for count_neighbors, zero for
+        # the removed points, or None if all the points count as 1.
+        if weights is None:
+            if self.n_dead == 0:
+                return None
+            return self.alive.astype(np.float64)
+        return np.where(self.alive, weights[self.ids], 0.)
+
+
+class DynamicKDTree(object):
+    """
+    DynamicKDTree(data, leafsize=16, compact_nodes=True, balanced_tree=True,
+                  boxsize=None)
+
+    kd-tree supporting the insertion and removal of points.
+
+    The points are stored in a forest of `cKDTree` instances of increasing
+    sizes (the logarithmic method of Bentley and Saxe [1]_): inserted points
+    are added to a small buffer tree, and when the buffer is full it is
+    merged with the smaller trees into a new tree, like a carry propagates
+    in a binary counter. Removed points are marked as deleted, and a tree is
+    rebuilt once half of its points are deleted. The queries combine the
+    results of all the trees, and give the same results as a `cKDTree` built
+    from the current points.
+
+    Each point is identified by an integer id, which does not change while
+    the point is in the tree: the points of `data` have the ids
+    ``0, ..., len(data) - 1`` and `insert` returns the ids of the new points.
+    Ids are not reused, and the query methods return ids instead of indices.
+
+    Parameters
+    ----------
+    data : array_like, shape (n,m)
+        The initial n points of dimension m. n may be 0.
+    leafsize : positive int, optional
+        The number of points at which the algorithm switches over to
+        brute-force. Default: 16.
+    compact_nodes : bool, optional
+        If True, the kd-trees are built to shrink the hyperrectangles to
+        the actual data range. Default: True.
+    balanced_tree : bool, optional
+        If True, the median is used to split the hyperrectangles instead of
+        the midpoint. Default: True.
+    boxsize : array_like or scalar, optional
+        Apply a m-d toroidal topology to the kd-tree, see `cKDTree`.
+
+    Attributes
+    ----------
+    m : int
+        The dimension of a single data-point.
+    n : int
+        The number of points in the tree.
+    ids : ndarray, shape (n,)
+        The ids of the points in the tree, in increasing order.
+    data : ndarray, shape (n,m)
+        The points in the tree, in the order of `ids`.
+    n_trees : int
+        The number of trees in the forest.
+
+    See Also
+    --------
+    cKDTree : static kd-tree
+
+    Notes
+    -----
+    A batch of k points is inserted in :math:`O(k \\log^2 n)` amortized time,
+    and k points are removed in :math:`O(k \\log n)` amortized time, instead
+    of the :math:`O(n \\log n)` of building a new tree. Queries search the
+    :math:`O(\\log n)` trees of the forest, so they are slower than with a
+    single tree; `rebalance` merges all the trees into one.
+
+    Points that are not in the tree have no neighbors: `query` indicates
+    missing neighbors with infinite distances and the id -1, and the
+    results of `query_ball_tree` are indexed by id, so they have empty
+    lists for the removed ids.
+
+    References
+    ----------
+    .. [1] J.L. Bentley and J.B. Saxe, "Decomposable searching problems I:
+           Static-to-dynamic transformation", Journal of Algorithms, 1(4),
+           pp. 301-358, 1980.
+
+    Examples
+    --------
+    >>> from scipy.spatial import DynamicKDTree
+    >>> x, y = np.mgrid[0:5, 2:8]
+    >>> tree = DynamicKDTree(np.c_[x.ravel(), y.ravel()])
+    >>> tree.query([0.1, 2.2])
+    (0.22360679774997913, 0)
+    >>> tree.remove([0])
+    >>> tree.insert([[0.2, 2.1], [3.2, 4.2]])
+    array([30, 31])
+    >>> tree.query([0.1, 2.2])
+    (0.14142135623730956, 30)
+
+    """
+
+    def __init__(self, data, leafsize=16, compact_nodes=True,
+                 balanced_tree=True, boxsize=None):
+        data = np.array(data, dtype=np.float64, ndmin=2)
+        if data.ndim != 2:
+            raise ValueError("data must be 2 dimensional")
+        self.m = data.shape[1]
+        self.leafsize = leafsize
+        self.boxsize = None if boxsize is None else np.array(boxsize)
+        self._tree_kwargs = dict(leafsize=leafsize,
+                                 compact_nodes=compact_nodes,
+                                 balanced_tree=balanced_tree,
+                                 boxsize=boxsize)
+        self._buffer = None
+        self._levels = []
+        self._n_ids = 0
+        self._slot = np.empty(0, dtype=np.int8)
+        self._pos = np.empty(0, dtype=np.intp)
+        if len(data) > 0:
+            self.insert(data)
+
+    # ----------
+    # properties
+    # ----------
+
+    @property
+    def n(self):
+        return sum(block.n for block in self._blocks())
+
+    @property
+    def n_trees(self):
+        return len(list(self._blocks()))
+
+    @property
+    def ids(self):
+        return self._points()[1]
+
+    @property
+    def data(self):
+        return self._points()[0]
+
+    def _blocks(self):
+        if self._buffer is not None:
+            yield self._buffer
+        for block in self._levels:
+            if block is not None:
+                yield block
+
+    def _points(self):
+        # the points in the tree and their ids, in the order of the ids
+        data = [np.empty((0, self.m))]
+        ids = [np.empty(0, dtype=np.intp)]
+        for block in self._blocks():
+            d, i = block.alive_points()
+            data.append(d)
+            ids.append(i)
+        data = np.concatenate(data)
+        ids = np.concatenate(ids)
+        order = np.argsort(ids)
+        return data[order], ids[order]
+
+    # -------
+    # updates
+    # -------
+
+    def _new_block(self, data, ids, slot):
+        block = _Block(data, ids, self._tree_kwargs)
+        self._slot[ids] = slot
+        self._pos[ids] = np.arange(len(ids))
+        return block
+
+    def insert(self, x):
+        """
+        insert(self, x)
+
+        Insert points into the tree.
+
+        Parameters
+        ----------
+        x : array_like, shape (k,m) or (m,)
+            The points to insert.
+
+        Returns
+        -------
+        ids : ndarray of ints, shape (k,)
+            The ids of the new points.
+
+        """
+        x = np.array(x, dtype=np.float64, ndmin=2)
+        if x.ndim != 2 or x.shape[1] != self.m:
+            raise ValueError("x must consist of vectors of length %d but "
+                             "has shape %s" % (self.m, np.shape(x)))
+        k = x.shape[0]
+        ids = np.arange(self._n_ids, self._n_ids + k, dtype=np.intp)
+        if k == 0:
+            return ids
+
+        # build the new tree before changing the state, so that an invalid
+        # point (e.g. outside of the periodic box) leaves the tree unchanged
+        data = [x]
+        block_ids = [ids]
+        if self._buffer is not None:
+            d, i = self._buffer.alive_points()
+            data.insert(0, d)
+            block_ids.insert(0, i)
+        size = sum(len(i) for i in block_ids)
+
+        if size <= _BUFFER_SIZE:
+            level = _BUFFER
+        else:
+            # merge with the smaller trees until a free level is large
+            # enough, as a carry propagates in a binary counter
+            level = 0
+            while True:
+                if (level < len(self._levels) and
+                        self._levels[level] is not None):
+                    d, i = self._levels[level].alive_points()
+                    data.append(d)
+                    block_ids.append(i)
+                    size += len(i)
+                elif size <= _BUFFER_SIZE << level:
+                    break
+                level += 1
+        data = np.concatenate(data)
+        block_ids = np.concatenate(block_ids)
+        block = _Block(data, block_ids, self._tree_kwargs)
+
+        # commit
+        if self._n_ids + k > len(self._slot):
+            n = max(self._n_ids + k, 2 * len(self._slot))
+            self._slot = np.concatenate(
+                [self._slot, np.full(n - len(self._slot), _REMOVED,
+                                     dtype=np.int8)])
+            self._pos = np.concatenate(
+                [self._pos, np.zeros(n - len(self._pos), dtype=np.intp)])
+        self._n_ids += k
+        self._slot[block_ids] = level
+        self._pos[block_ids] = np.arange(len(block_ids))
+
+        self._buffer = None
+        if level == _BUFFER:
+            self._buffer = block
+        else:
+            if level >= len(self._levels):
+                self._levels.extend([None] * (level + 1 - len(self._levels)))
+            for j in range(level):
+                self._levels[j] = None
+            self._levels[level] = block
+        return ids
+
+    def remove(self, ids):
+        """
+        remove(self, ids)
+
+        Remove points from the tree.
+
+        Parameters
+        ----------
+        ids : array_like of ints
+            The ids of the points to remove.
+
+        """
+        ids = np.unique(np.asarray(ids, dtype=np.intp))
+        if len(ids) == 0:
+            return
+        if (ids[0] < 0 or ids[-1] >= self._n_ids or
+                (self._slot[ids] == _REMOVED).any()):
+            raise ValueError("Some of the points are not in the tree.")
+
+        slots = self._slot[ids]
+        for slot in np.unique(slots):
+            if slot == _BUFFER:
+                block = self._buffer
+            else:
+                block = self._levels[slot]
+            pos = self._pos[ids[slots == slot]]
+            block.alive[pos] = False
+            block.n_dead += len(pos)
+
+            if 2 * block.n_dead > len(block.ids):
+                # rebuild the tree without the removed points
+                data, block_ids = block.alive_points()
+                if len(block_ids) > 0:
+                    block = self._new_block(data, block_ids, slot)
+                else:
+                    block = None
+                if slot == _BUFFER:
+                    self._buffer = block
+                else:
+                    self._levels[slot] = block
+        self._slot[ids] = _REMOVED
+
+    def rebalance(self):
+        """
+        rebalance(self)
+
+        Merge all the trees of the forest into a single tree.
+
+        This removes the overhead of searching several trees, and of the
+        removed points, from the queries.
+
+        """
+        data, ids = self._points()
+        self._buffer = None
+        self._levels = []
+        if len(ids) == 0:
+            return
+        if len(ids) <= _BUFFER_SIZE:
+            self._buffer = self._new_block(data, ids, _BUFFER)
+        else:
+            level = 0
+            while len(ids) > _BUFFER_SIZE << level:
+                level += 1
+            self._levels = [None] * (level + 1)
+            self._levels[level] = self._new_block(data, ids, level)
+
+    # -------
+    # queries
+    # -------
+
+    def _check_x(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 0 or x.shape[-1] != self.m:
+            raise ValueError("x must consist of vectors of length %d but "
+                             "has shape %s" % (self.m, np.shape(x)))
+        return x
+
+    def _check_other(self, other):
+        if not isinstance(other, DynamicKDTree):
+            raise TypeError("other must be a DynamicKDTree")
+        if self.m != other.m:
+            raise ValueError("Trees have different dimensionality")
+
+    def _query_block(self, block, x, k, eps, p, distance_upper_bound,
+                     n_jobs):
+        # The k nearest points of x in the block which are not removed. The
+        # queries for which removed points are found are repeated with twice
+        # as many neighbors, until k points are found.
+        n = block.tree.n
+        dd = np.empty((len(x), k))
+        ii = np.empty((len(x), k), dtype=np.intp)
+        rows = np.arange(len(x))
+        kq = min(k, n)
+        while len(rows) > 0:
+            d, i = block.tree.query(x[rows], k=np.arange(1, kq + 1), eps=eps,
+                                    p=p,
+                                    distance_upper_bound=distance_upper_bound,
+                                    n_jobs=n_jobs)
+            if kq < k:
+                d = np.hstack([d, np.full((len(rows), k - kq), np.inf)])
+                i = np.hstack([i, np.full((len(rows), k - kq), n,
+                                          dtype=np.intp)])
+            missing = i == n
+            found = ~missing
+            found[found] = block.alive[i[found]]
+            done = ((found.sum(axis=1) >= k) | missing.any(axis=1) |
+                    (kq == n))
+
+            # the first k points found, in order of distance
+            d = d[done]
+            i = i[done]
+            found = found[done]
+            order = np.argsort(~found, axis=1, kind='mergesort')[:, :k]
+            sel = np.arange(len(d))[:, np.newaxis], order
+            d = d[sel]
+            i = i[sel]
+            found = found[sel]
+            d[~found] = np.inf
+            i[found] = block.ids[i[found]]
+            i[~found] = -1
+            dd[rows[done]] = d
+            ii[rows[done]] = i
+
+            rows = rows[~done]
+            kq = min(2 * kq, n)
+        return dd, ii
+
+    def query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf,
+              n_jobs=1):
+        """
+        query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf, n_jobs=1)
+
+        Query the kd-tree for nearest neighbors
+
+        The arguments and results are the same as in `cKDTree.query`, except
+        that the ids of the neighbors are returned, and that missing
+        neighbors are indicated with the id -1.
+
+        Parameters
+        ----------
+        x : array_like, last dimension self.m
+            An array of points to query.
+        k : list of integer or integer
+            The list of k-th nearest neighbors to return. If k is an
+            integer it is treated as a list of [1, ... k] (range(1, k+1)).
+            Note that the counting starts from 1.
+        eps : non-negative float
+            Return approximate nearest neighbors; the k-th returned value
+            is guaranteed to be no further than (1+eps) times the
+            distance to the real k-th nearest neighbor.
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use.
+        distance_upper_bound : nonnegative float
+            Return only neighbors within this distance.
+        n_jobs : int, optional
+            Number of jobs to schedule for parallel processing. If -1 is given
+            all processors are used. Default: 1.
+
+        Returns
+        -------
+        d : array of floats
+            The distances to the nearest neighbors.
+            If ``x`` has shape ``tuple+(self.m,)``, then ``d`` has shape
+            ``tuple+(k,)``. When k == 1, the last dimension of the output is
+            squeezed. Missing neighbors are indicated with infinite distances.
+        i : ndarray of ints
+            The ids of the neighbors.
+            If ``x`` has shape ``tuple+(self.m,)``, then ``i`` has shape
+            ``tuple+(k,)``. When k == 1, the last dimension of the output is
+            squeezed. Missing neighbors are indicated with -1.
+
+        """
+        x = self._check_x(x)
+        if p < 1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        nearest = False
+        if np.isscalar(k):
+            if k == 1:
+                nearest = True
+            k = np.arange(1, k + 1)
+        k = np.asarray(k, dtype=np.intp)
+        kmax = np.max(k)
+
+        retshape = x.shape[:-1]
+        xx = x.reshape(-1, self.m)
+        n = xx.shape[0]
+        rows = np.arange(n)[:, np.newaxis]
+
+        # the kmax nearest neighbors found so far
+        dd = np.full((n, kmax), np.inf)
+        ii = np.full((n, kmax), -1, dtype=np.intp)
+        for block in self._blocks():
+            d, i = self._query_block(block, xx, kmax, eps, p,
+                                     distance_upper_bound, n_jobs)
+            d = np.hstack([dd, d])
+            i = np.hstack([ii, i])
+            order = np.argsort(d, axis=1, kind='mergesort')[:, :kmax]
+            dd = d[rows, order]
+            ii = i[rows, order]
+
+        dd = dd[:, k - 1].reshape(retshape + (len(k),))
+        ii = ii[:, k - 1].reshape(retshape + (len(k),))
+        if nearest:
+            dd = dd[..., 0]
+            ii = ii[..., 0]
+            if len(retshape) == 0:
+                dd = float(dd)
+                ii = int(ii)
+        return dd, ii
+
+    def query_ball_point(self, x, r, p=2., eps=0, n_jobs=1,
+                         output_type='list'):
+        """
+        query_ball_point(self, x, r, p=2., eps=0, n_jobs=1, output_type='list')
+
+        Find all points within distance r of point(s) x.
+
+        The arguments and results are the same as in
+        `cKDTree.query_ball_point`, except that the ids of the neighbors are
+        returned.
+
+        Parameters
+        ----------
+        x : array_like, shape tuple + (self.m,)
+            The point or points to search for neighbors of.
+        r : positive float
+            The radius of points to return.
+        p : float, optional
+            Which Minkowski p-norm to use.  Should be in the range [1, inf].
+        eps : nonnegative float, optional
+            Approximate search.
+        n_jobs : int, optional
+            Number of jobs to schedule for parallel processing. If -1 is given
+            all processors are used. Default: 1.
+        output_type : string, optional
+            Choose the output container, 'list' or 'csr'. Default: 'list'
+
+        Returns
+        -------
+        results : list or array of lists
+            If `x` is a single point, returns a sorted list of the ids of the
+            neighbors of `x`. If `x` is an array of points, returns an object
+            array of shape tuple containing lists of neighbors.
+        indptr, indices, distances : ndarray
+            Returned instead of `results` if `output_type` is 'csr', see
+            `cKDTree.query_ball_point`.
+
+        """
+        if output_type not in ('list', 'csr'):
+            raise ValueError("Invalid output type")
+        x = self._check_x(x)
+        retshape = x.shape[:-1]
+        xx = x.reshape(-1, self.m)
+        n = xx.shape[0]
+
+        rows = [np.empty(0, dtype=np.intp)]
+        ids = [np.empty(0, dtype=np.intp)]
+        distances = [np.empty(0)]
+        if n > 0:
+            for block in self._blocks():
+                indptr, i, d = block.tree.query_ball_point(
+                    xx, r, p=p, eps=eps, n_jobs=n_jobs, output_type='csr')
+                row = np.repeat(np.arange(n), np.diff(indptr))
+                keep = block.alive[i]
+                rows.append(row[keep])
+                ids.append(block.ids[i[keep]])
+                distances.append(d[keep])
+        rows = np.concatenate(rows)
+        ids = np.concatenate(ids)
+        distances = np.concatenate(distances)
+        order = np.lexsort((ids, rows))
+        ids = ids[order]
+        distances = distances[order]
+        indptr = np.searchsorted(rows[order], np.arange(n + 1))
+
+        if output_type == 'csr':
+            return indptr, ids, distances
+        if len(retshape) == 0:
+            return ids.tolist()
+        result = np.empty(retshape, dtype=object)
+        for i, c in enumerate(np.ndindex(retshape)):
+            result[c] = ids[indptr[i]:indptr[i + 1]].tolist()
+        return result
+
+    def _neighbor_pairs(self, other, r, p):
+        # The pairs of points of self and other within distance r, as
+        # arrays of ids in self, ids in other and distances.
+        i = [np.empty(0, dtype=np.intp)]
+        j = [np.empty(0, dtype=np.intp)]
+        v = [np.empty(0)]
+        for a in self._blocks():
+            for b in other._blocks():
+                e = a.tree.sparse_distance_matrix(b.tree, r, p=p,
+                                                  output_type='ndarray')
+                keep = a.alive[e['i']] & b.alive[e['j']]
+                i.append(a.ids[e['i'][keep]])
+                j.append(b.ids[e['j'][keep]])
+                v.append(e['v'][keep])
+        return np.concatenate(i), np.concatenate(j), np.concatenate(v)
+
+    def query_ball_tree(self, other, r, p=2., eps=0):
+        """
+        query_ball_tree(self, other, r, p=2., eps=0)
+
+        Find all pairs of points whose distance is at most r
+
+        Parameters
+        ----------
+        other : DynamicKDTree instance
+            The tree containing points to search against.
+        r : float
+            The maximum distance, has to be positive.
+        p : float, optional
+            Which Minkowski norm to use.  `p` has to meet the condition
+            ``1 <= p <= infinity``.
+        eps : float, optional
+            Approximate search, see `cKDTree.query_ball_tree`. The results
+            are exact in the current implementation.
+
+        Returns
+        -------
+        results : list of lists
+            For each id ``i`` of this tree, ``results[i]`` is a sorted list
+            of the ids of its neighbors in `other`. The lists of the ids
+            which are not in the tree are empty.
+
+        """
+        self._check_other(other)
+        i, j, v = self._neighbor_pairs(other, r, p)
+        order = np.lexsort((j, i))
+        i = i[order]
+        j = j[order]
+        bounds = np.searchsorted(i, np.arange(self._n_ids + 1))
+        return [j[bounds[k]:bounds[k + 1]].tolist()
+                for k in range(self._n_ids)]
+
+    def query_pairs(self, r, p=2., eps=0, output_type='set'):
+        """
+        query_pairs(self, r, p=2., eps=0, output_type='set')
+
+        Find all pairs of points whose distance is at most r.
+
+        Parameters
+        ----------
+        r : positive float
+            The maximum distance.
+        p : float, optional
+            Which Minkowski norm to use.  ``p`` has to meet the condition
+            ``1 <= p <= infinity``.
+        eps : float, optional
+            Approximate search, see `cKDTree.query_pairs`.
+        output_type : string, optional
+            Choose the output container, 'set' or 'ndarray'. Default: 'set'
+
+        Returns
+        -------
+        results : set or ndarray
+            Set of pairs of ids ``(i,j)``, with ``i < j``, for which the
+            corresponding positions are close. If output_type is 'ndarray',
+            an ndarray is returned instead of a set.
+
+        """
+        if output_type not in ('set', 'ndarray'):
+            raise ValueError("Invalid output type")
+        pairs = [np.empty((0, 2), dtype=np.intp)]
+        blocks = list(self._blocks())
+        for k, a in enumerate(blocks):
+            pr = a.tree.query_pairs(r, p=p, eps=eps, output_type='ndarray')
+            keep = a.alive[pr[:, 0]] & a.alive[pr[:, 1]]
+            pairs.append(a.ids[pr[keep]])
+            for b in blocks[k + 1:]:
+                e = a.tree.sparse_distance_matrix(b.tree, r, p=p,
+                                                  output_type='ndarray')
+                keep = a.alive[e['i']] & b.alive[e['j']]
+                pairs.append(np.column_stack([a.ids[e['i'][keep]],
+                                              b.ids[e['j'][keep]]]))
+        pairs = np.sort(np.concatenate(pairs), axis=1)
+        if output_type == 'set':
+            return set(map(tuple, pairs.tolist()))
+        return pairs
+
+    def count_neighbors(self, other, r, p=2., weights=None, cumulative=True):
+        """
+        count_neighbors(self, other, r, p=2., weights=None, cumulative=True)
+
+        Count how many nearby pairs can be formed. (pair-counting)
+
+        The arguments and results are the same as in
+        `cKDTree.count_neighbors`, except that the weights are indexed by
+        the ids of the points.
+
+        Parameters
+        ----------
+        other : DynamicKDTree instance
+            The other tree to draw points from, can be the same tree as self.
+        r : float or one-dimensional array of floats
+            The radius to produce a count for.
+        p : float, optional
+            1<=p<=infinity. Which Minkowski p-norm to use. Default 2.0.
+        weights : tuple, array_like, or None, optional
+            If None, the pair-counting is unweighted. If given as a tuple,
+            weights[0] is the weights of points in ``self``, and weights[1]
+            is the weights of points in ``other``; either can be None to
+            indicate the points are unweighted. If given as an array_like,
+            weights is the weights of points in ``self`` and ``other``, which
+            must be the same tree. The weight of the point with id ``i`` is
+            ``weights[i]``. Default: None
+        cumulative : bool, optional
+            Whether the returned counts are cumulative. Default: True
+
+        Returns
+        -------
+        result : scalar or 1-D array
+            The number of pairs. For unweighted counts, the result is integer.
+            For weighted counts, the result is float.
+
+        """
+        self._check_other(other)
+        if weights is None:
+            self_weights = other_weights = None
+        elif isinstance(weights, tuple):
+            self_weights, other_weights = weights
+        else:
+            self_weights = other_weights = weights
+            if other is not self:
+                raise ValueError("Two different trees are used. Specify "
+                                 "weights for both in a tuple.")
+        if self_weights is not None:
+            self_weights = np.asarray(self_weights, dtype=np.float64)
+        if other_weights is not None:
+            other_weights = np.asarray(other_weights, dtype=np.float64)
+        int_result = self_weights is None and other_weights is None
+
+        result = np.zeros(np.shape(r),
+                          dtype=np.intp if int_result else np.float64)
+        for a in self._blocks():
+            wa = a.weights(self_weights)
+            for b in other._blocks():
+                wb = b.weights(other_weights)
+                if wa is None and wb is None:
+                    c = a.tree.count_neighbors(b.tree, r, p=p,
+                                               cumulative=cumulative)
+                else:
+                    # the removed points have zero weight
+                    c = a.tree.count_neighbors(b.tree, r, p=p,
+                                               weights=(wa, wb),
+                                               cumulative=cumulative)
+                    if int_result:
+                        c = np.rint(c).astype(np.intp)
+                result = result + c
+
+        if np.ndim(r) == 0:
+            return int(result) if int_result else float(result)
+        return result
+
+    def sparse_distance_matrix(self, other, max_distance, p=2.,
+                               output_type='dok_matrix'):
+        """
+        sparse_distance_matrix(self, other, max_distance, p=2.,
+                               output_type='dok_matrix')
+
+        Compute a sparse distance matrix
+
+        Computes a distance matrix between two DynamicKDTrees, leaving as
+        zero any distance greater than max_distance. The rows and columns
+        are indexed by the ids of the points.
+
+        Parameters
+        ----------
+        other : DynamicKDTree
+
+        max_distance : positive float
+
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use.
+
+        output_type : string, optional
+            Which container to use for output data. Options: 'dok_matrix',
+            'coo_matrix', 'dict', or 'ndarray'. Default: 'dok_matrix'.
+
+        Returns
+        -------
+        result : dok_matrix, coo_matrix, dict or ndarray
+            See `cKDTree.sparse_distance_matrix`.
+
+        """
+        self._check_other(other)
+        if output_type not in ('dok_matrix', 'coo_matrix', 'dict',
+                               'ndarray'):
+            raise ValueError('Invalid output type')
+        i, j, v = self._neighbor_pairs(other, max_distance, p)
+        if output_type == 'dict':
+            return dict(zip(zip(i.tolist(), j.tolist()), v.tolist()))
+        elif output_type == 'ndarray':
+            dtype = np.dtype([('i', np.intp), ('j', np.intp),
+                              ('v', np.float64)], align=True)
+            res = np.empty(len(i), dtype=dtype)
+            res['i'] = i
+            res['j'] = j
+            res['v'] = v
+            return res
+        res = scipy.sparse.coo_matrix((v, (i, j)),
+                                      shape=(self._n_ids, other._n_ids))
+        if output_type == 'coo_matrix':
+            return res
+        return res.todok()
@@ -22,6 +22,8 @@ cimport cython
 from multiprocessing import cpu_count
 import threading
 
+from scipy._lib._util import _run_threads
+
 cdef extern from "limits.h":
     long LONG_MAX
 
@@ -89,6 +91,10 @@ cdef extern from "cpp_utils.h":
     void *tree_buffer_pointer(vector[ckdtreenode] *buf)
     np.intp_t *npy_intp_vector_buf(vector[np.intp_t] *buf)
     np.float64_t *npy_float64_vector_buf(vector[np.float64_t] *buf)
+    void extend_ordered_pair_vector(vector[ordered_pair] *buf,
+                                    vector[ordered_pair] *src) except +
+    void extend_coo_entry_vector(vector[coo_entry] *buf,
+                                 vector[coo_entry] *src) except +
     ctypedef void *intvector_ptr_t 
 
 
@@ -363,12 +369,15 @@ cdef extern from "ckdtree_methods.h":
                      const np.intp_t    kmax, 
                      const np.float64_t eps, 
                      const np.float64_t p, 
-                     const np.float64_t distance_upper_bound) 
+                     const np.float64_t distance_upper_bound,
+                     const np.intp_t    max_leaves)
                      
     object query_pairs(const ckdtree *self, 
                        const np.float64_t r, 
                        const np.float64_t p, 
                        const np.float64_t eps,
+                       const np.intp_t *tasks,
+                       const np.intp_t n_tasks,
                        vector[ordered_pair] *results)
 
     object count_neighbors_unweighted(const ckdtree *self,
@@ -377,7 +386,9 @@ cdef extern from "ckdtree_methods.h":
                            np.float64_t  *real_r,
                            np.intp_t     *results,
                            const np.float64_t p,
-                           int cumulative)
+                           int cumulative,
+                           const np.intp_t *tasks,
+                           const np.intp_t n_tasks)
 
     object count_neighbors_weighted(const ckdtree *self,
                            const ckdtree *other,
@@ -389,7 +400,9 @@ cdef extern from "ckdtree_methods.h":
                            np.float64_t  *real_r,
                            np.float64_t     *results,
                            const np.float64_t p,
-                           int cumulative)
+                           int cumulative,
+                           const np.intp_t *tasks,
+                           const np.intp_t n_tasks)
 
     object query_ball_point(const ckdtree *self,
                             const np.float64_t *x,
@@ -404,12 +417,16 @@ cdef extern from "ckdtree_methods.h":
                            const np.float64_t r,
                            const np.float64_t p,
                            const np.float64_t eps,
+                           const np.intp_t *tasks,
+                           const np.intp_t n_tasks,
                            vector[np.intp_t] **results)                     
      
     object sparse_distance_matrix(const ckdtree *self,
                                   const ckdtree *other,
                                   const np.float64_t p,
                                   const np.float64_t max_distance,
+                                  const np.intp_t *tasks,
+                                  const np.intp_t n_tasks,
                                   vector[coo_entry] *results)                    
                       
                       
@@ -630,6 +647,49 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             self._post_init_traverse(node.greater)
                 
         return 0
+
+    cdef list _subtrees(cKDTree self, np.intp_t n):
+        # Split the tree into (at least) n disjoint subtrees, or into its
+        # leaves if there are fewer than n, by repeatedly splitting the
+        # largest subtree. Returns the indices of the subtree roots in the
+        # tree buffer.
+        cdef:
+            ckdtreenode *node
+            np.intp_t k, best
+            list nodes = [0]
+
+        while len(nodes) < n:
+            best = -1
+            for k in range(len(nodes)):
+                node = self.ctree + <np.intp_t> nodes[k]
+                if node.split_dim != -1 and (best == -1 or node.children >
+                        (self.ctree + <np.intp_t> nodes[best]).children):
+                    best = k
+            if best == -1:
+                break
+            node = self.ctree + <np.intp_t> nodes[best]
+            nodes[best] = node._less
+            nodes.append(node._greater)
+        return nodes
+
+    cdef list _traversal_tasks(cKDTree self, np.intp_t n_jobs, int pairs):
+        # Split a dual tree traversal of self into tasks, i.e. pairs of node
+        # indices to start the traversal from, for n_jobs threads. The
+        # subtrees of self are traversed against the root of the other tree,
+        # or against each other if pairs is true (traversals of self with
+        # itself). Returns a list with an array of tasks per thread.
+        if n_jobs <= 1:
+            return [np.zeros((1, 2), dtype=np.intp)]
+
+        # a few subtrees per thread for load balancing
+        nodes = self._subtrees(4 * n_jobs)
+        if pairs:
+            tasks = [(a, b) for k, a in enumerate(nodes) for b in nodes[k:]]
+        else:
+            tasks = [(a, 0) for a in nodes]
+        tasks = np.array(tasks, dtype=np.intp)
+        return [np.ascontiguousarray(tasks[j::n_jobs])
+                for j in range(min(n_jobs, len(tasks)))]
         
 
     def __dealloc__(cKDTree self):
@@ -643,9 +703,10 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
     @cython.boundscheck(False)
     def query(cKDTree self, object x, object k=1, np.float64_t eps=0,
               np.float64_t p=2, np.float64_t distance_upper_bound=INFINITY,
-              np.intp_t n_jobs=1):
+              np.intp_t n_jobs=1, object max_leaves=None):
         """
-        query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf, n_jobs=1)
+        query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf, n_jobs=1,
+              max_leaves=None)
 
         Query the kd-tree for nearest neighbors
 
@@ -674,7 +735,17 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
         n_jobs : int, optional
             Number of jobs to schedule for parallel processing. If -1 is given
             all processors are used. Default: 1.
-                        
+        max_leaves : int, optional
+            Stop the search of each point after visiting this many leaves of
+            the tree, returning the nearest neighbors found so far. The
+            leaves are visited in order of increasing distance from the point
+            (best-bin-first search), so this gives approximate nearest
+            neighbors at a bounded cost, which is useful in high dimensions
+            where an exact search visits most of the leaves. Default is None,
+            for an exact search.
+
+            .. versionadded:: 1.1.0
+
         Returns
         -------
         d : array of floats
@@ -697,6 +768,14 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
         only columns that store the requested values of k are preserved. This is 
         implemented in a manner that reduces memory usage.
 
+        With ``max_leaves``, fewer than k neighbors may be found when the
+        visited leaves hold fewer than k points; each leaf holds at least
+        ``leafsize / 2`` points for the default median split
+        (``balanced_tree=True``), so ``max_leaves >= 2 * k / leafsize`` avoids
+        missing neighbors. The returned neighbors are not guaranteed to be
+        within the ``eps`` bound; the fraction of true nearest neighbors found
+        (the recall) increases with ``max_leaves``.
+
         Examples
         --------
 
@@ -746,9 +825,16 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
         """
         
         cdef:
-            np.intp_t n, i, j
+            np.intp_t n, i, j, _max_leaves
             int overflown
         
+        if max_leaves is None:
+            _max_leaves = 0
+        else:
+            _max_leaves = max_leaves
+            if _max_leaves < 1:
+                raise ValueError("max_leaves must be a positive integer")
+
         x_arr = np.asarray(x, dtype=np.float64)
         if x_arr.ndim == 0 or x_arr.shape[x_arr.ndim - 1] != self.m:
             raise ValueError("x must consist of vectors of length %d but "
@@ -789,7 +875,8 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             kmax = np.max(k)
 
             query_knn(<ckdtree*>self, &_dd[start,0], &_ii[start,0], 
-                &_xx[start,0], stop-start, &_k[0], len(k), kmax, eps, p, distance_upper_bound)
+                &_xx[start,0], stop-start, &_k[0], len(k), kmax, eps, p, distance_upper_bound,
+                _max_leaves)
         
         if (n_jobs == -1): 
             n_jobs = number_of_processors
@@ -856,9 +943,10 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
     # ----------------
 
     def query_ball_point(cKDTree self, object x, np.float64_t r,
-                         np.float64_t p=2., np.float64_t eps=0, n_jobs=1):
+                         np.float64_t p=2., np.float64_t eps=0, n_jobs=1,
+                         output_type='list'):
         """
-        query_ball_point(self, x, r, p=2., eps=0)
+        query_ball_point(self, x, r, p=2., eps=0, n_jobs=1, output_type='list')
         
         Find all points within distance r of point(s) x.
 
@@ -878,6 +966,8 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
         n_jobs : int, optional
             Number of jobs to schedule for parallel processing. If -1 is given
             all processors are used. Default: 1.
+        output_type : string, optional
+            Choose the output container, 'list' or 'csr'. Default: 'list'
 
         Returns
         -------
@@ -885,6 +975,13 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             If `x` is a single point, returns a list of the indices of the
             neighbors of `x`. If `x` is an array of points, returns an object
             array of shape tuple containing lists of neighbors.
+        indptr, indices, distances : ndarray
+            Returned instead of `results` if `output_type` is 'csr'. The
+            neighbors of the ``i``-th point of ``x.reshape(-1, self.m)`` are
+            ``indices[indptr[i]:indptr[i+1]]``, sorted in increasing order,
+            and their distances to the point are
+            ``distances[indptr[i]:indptr[i+1]]``, as in the index arrays of a
+            CSR matrix.
 
         Notes
         -----
@@ -892,6 +989,15 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
         substantial amounts of time by putting them in a cKDTree and using
         query_ball_tree.
 
+        The 'csr' output avoids creating a Python list per point, which is
+        much faster and uses less memory when there are many points, e.g.
+        to build a sparse neighborhood graph::
+
+            indptr, indices, distances = tree.query_ball_point(
+                x, r, output_type='csr')
+            graph = scipy.sparse.csr_matrix((distances, indices, indptr),
+                                            shape=(len(x), tree.n))
+
         Examples
         --------
         >>> from scipy import spatial
@@ -900,6 +1006,14 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
         >>> tree = spatial.cKDTree(points)
         >>> tree.query_ball_point([2, 0], 1)
         [4, 8, 9, 12]
+        >>> indptr, indices, distances = tree.query_ball_point(
+        ...     [[2, 0], [0, 0]], 1, output_type='csr')
+        >>> indptr
+        array([0, 4, 7])
+        >>> indices
+        array([ 4,  8,  9, 12,  0,  1,  4])
+        >>> distances
+        array([ 1.,  0.,  1.,  1.,  0.,  1.,  1.])
 
         """
         
@@ -909,12 +1023,16 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             vector[np.intp_t] *vres
             vector[np.intp_t] **vvres
             np.uintp_t vvres_uintp
+            np.ndarray[np.intp_t, ndim=1, mode="c"] indptr, indices
             np.intp_t *cur
             list tmp
             np.intp_t i, j, n, m
         
         vres = NULL
         vvres = NULL
+
+        if output_type not in ('list', 'csr'):
+            raise ValueError("Invalid output type")
         
         try:
                
@@ -923,6 +1041,9 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
                 raise ValueError("Searching for a %d-dimensional point in a "
                                  "%d-dimensional KDTree" % 
                                      (int(x.shape[-1]), int(self.m)))
+            if len(x.shape) == 1 and output_type == 'csr':
+                x = x[np.newaxis, :]
+
             if len(x.shape) == 1:
                 vres = new vector[np.intp_t]()
                 xx = np.ascontiguousarray(x, dtype=np.float64)
@@ -996,6 +1117,20 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
                 
                     query_ball_point(<ckdtree*>self, &vxx[0,0], r, p, eps, 
                         n, vvres)
+
+                if output_type == 'csr':
+                    indptr = np.empty(n + 1, dtype=np.intp)
+                    indptr[0] = 0
+                    for i in range(n):
+                        indptr[i + 1] = indptr[i] + <np.intp_t> vvres[i].size()
+                    indices = np.empty(indptr[n], dtype=np.intp)
+                    for i in range(n):
+                        m = <np.intp_t> vvres[i].size()
+                        if NPY_LIKELY(m > 0):
+                            memcpy(<void*> &indices[indptr[i]],
+                                   <void*> npy_intp_vector_buf(vvres[i]),
+                                   m * sizeof(np.intp_t))
+                    return self._ball_point_csr(vxx, indptr, indices, p)
                 
                 i = 0
                 for c in np.ndindex(retshape):
@@ -1022,6 +1157,31 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
                 PyMem_Free(vvres)
                 
         return result   
+
+    cdef tuple _ball_point_csr(cKDTree self, np.ndarray x, np.ndarray indptr,
+                               np.ndarray indices, np.float64_t p):
+        # Sort the neighbors of the points x and compute their distances,
+        # for the 'csr' output of query_ball_point.
+        rows = np.repeat(np.arange(x.shape[0]), np.diff(indptr))
+        indices = indices[np.lexsort((indices, rows))]
+
+        diff = np.abs(self.data[indices] - x[rows])
+        if self.boxsize is not None:
+            # the distance to the nearest periodic image
+            periodic = self.boxsize > 0
+            box = self.boxsize[periodic]
+            d = np.mod(diff[:, periodic], box)
+            diff[:, periodic] = np.minimum(d, box - d)
+
+        if p == 2:
+            distances = np.sqrt(np.sum(diff * diff, axis=-1))
+        elif p == 1:
+            distances = np.sum(diff, axis=-1)
+        elif ckdtree_isinf(p):
+            distances = np.amax(diff, axis=-1)
+        else:
+            distances = np.sum(diff ** p, axis=-1) ** (1. / p)
+        return indptr, indices, distances
             
 
     # ---------------
@@ -1029,9 +1189,10 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
     # ---------------
     
     def query_ball_tree(cKDTree self, cKDTree other,
-                        np.float64_t r, np.float64_t p=2., np.float64_t eps=0):
+                        np.float64_t r, np.float64_t p=2., np.float64_t eps=0,
+                        n_jobs=1):
         """
-        query_ball_tree(self, other, r, p=2., eps=0)
+        query_ball_tree(self, other, r, p=2., eps=0, n_jobs=1)
 
         Find all pairs of points whose distance is at most r
 
@@ -1049,6 +1210,9 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             if their nearest points are further than ``r/(1+eps)``, and
             branches are added in bulk if their furthest points are nearer
             than ``r * (1+eps)``.  `eps` has to be non-negative.
+        n_jobs : int, optional
+            Number of jobs to schedule for parallel processing. If -1 is given
+            all processors are used. Default: 1.
 
         Returns
         -------
@@ -1060,6 +1224,7 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
         
         cdef: 
             vector[np.intp_t] **vvres
+            np.uintp_t vvres_uintp
             np.intp_t i, j, n, m
             np.intp_t *cur
             list results
@@ -1071,6 +1236,14 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
                              "dimensionality")
      
         n = self.n
+        vvres = NULL
+
+        if (n_jobs == -1): 
+            n_jobs = number_of_processors
+
+        # the subtrees of self are disjoint, so the threads write the
+        # results of different points
+        tasks = self._traversal_tasks(n_jobs, False)
         
         try:
         
@@ -1087,8 +1260,17 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
         
             # query in C++
             # the GIL will be released in the C++ code
-            query_ball_tree(
-                <ckdtree*> self, <ckdtree*> other, r, p, eps, vvres)
+            vvres_uintp = <np.uintp_t> (<void*> vvres)
+
+            def _thread_func(_j):
+                cdef: 
+                    np.ndarray[np.intp_t, ndim=2] _tasks = tasks[_j]
+                query_ball_tree(
+                    <ckdtree*> self, <ckdtree*> other, r, p, eps,
+                    &_tasks[0,0], _tasks.shape[0],
+                    <vector[np.intp_t] **> (<void*> vvres_uintp))
+
+            _run_threads(_thread_func, range(len(tasks)), len(tasks))
                           
             # store the results in a list of lists                                        
             results = n * [None]
@@ -1118,9 +1300,9 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
     # -----------
     
     def query_pairs(cKDTree self, np.float64_t r, np.float64_t p=2.,
-                    np.float64_t eps=0, output_type='set'):
+                    np.float64_t eps=0, output_type='set', n_jobs=1):
         """
-        query_pairs(self, r, p=2., eps=0)
+        query_pairs(self, r, p=2., eps=0, output_type='set', n_jobs=1)
 
         Find all pairs of points whose distance is at most r.
 
@@ -1138,6 +1320,9 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             than ``r * (1+eps)``.  `eps` has to be non-negative.
         output_type : string, optional
             Choose the output container, 'set' or 'ndarray'. Default: 'set'
+        n_jobs : int, optional
+            Number of jobs to schedule for parallel processing. If -1 is given
+            all processors are used. Default: 1.
 
         Returns
         -------
@@ -1148,10 +1333,31 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
 
         """
                  
-        cdef ordered_pairs results
+        cdef:
+            ordered_pairs results
+            list buffers
+            np.intp_t j
+
+        if (n_jobs == -1): 
+            n_jobs = number_of_processors
+
+        # each thread collects the pairs of its tasks in a separate buffer
+        tasks = self._traversal_tasks(n_jobs, True)
+        buffers = [ordered_pairs() for j in range(len(tasks))]
+
+        def _thread_func(_j):
+            cdef: 
+                np.ndarray[np.intp_t, ndim=2] _tasks = tasks[_j]
+                ordered_pairs _results = buffers[_j]
+            query_pairs(<ckdtree*> self, r, p, eps,
+                        &_tasks[0,0], _tasks.shape[0], _results.buf)
+
+        _run_threads(_thread_func, range(len(tasks)), len(tasks))
 
-        results = ordered_pairs()
-        query_pairs(<ckdtree*> self, r, p, eps, results.buf)
+        results = buffers[0]
+        for j in range(1, len(buffers)):
+            extend_ordered_pair_vector(results.buf,
+                                       (<ordered_pairs> buffers[j]).buf)
         
         if output_type == 'set':
             return results.set()
@@ -1204,9 +1410,10 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
 
     @cython.boundscheck(False)
     def count_neighbors(cKDTree self, cKDTree other, object r, np.float64_t p=2., 
-                        object weights=None, int cumulative=True):
+                        object weights=None, int cumulative=True, n_jobs=1):
         """
-        count_neighbors(self, other, r, p=2., weights=None, cumulative=True)
+        count_neighbors(self, other, r, p=2., weights=None, cumulative=True,
+                        n_jobs=1)
 
         Count how many nearby pairs can be formed. (pair-counting)
 
@@ -1247,6 +1454,9 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             the algorithm is optimized to work with a large number of bins (>10) specified
             by ``r``. When ``cumulative`` is set to True, the algorithm is optimized to work
             with a small number of ``r``. Default: True
+        n_jobs : int, optional
+            Number of jobs to schedule for parallel processing. If -1 is given
+            all processors are used. Default: 1.
 
         Returns
         -------
@@ -1329,20 +1539,25 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             int r_ndim
             np.intp_t n_queries, i
             np.ndarray[np.float64_t, ndim=1, mode="c"] real_r
-            np.ndarray[np.float64_t, ndim=1, mode="c"] fresults
-            np.ndarray[np.intp_t, ndim=1, mode="c"] iresults
             np.ndarray[np.float64_t, ndim=1, mode="c"] w1, w1n
             np.ndarray[np.float64_t, ndim=1, mode="c"] w2, w2n
             np.float64_t *w1p
             np.float64_t *w1np
             np.float64_t *w2p
             np.float64_t *w2np
+            np.uintp_t w1p_uintp, w1np_uintp, w2p_uintp, w2np_uintp
 
         # Make sure trees are compatible
         if self.m != other.m:
             raise ValueError("Trees passed to count_neighbors have different "
                              "dimensionality")
 
+        if (n_jobs == -1): 
+            n_jobs = number_of_processors
+
+        # each thread counts the pairs of its tasks in a separate array
+        tasks = self._traversal_tasks(n_jobs, False)
+
         # Make a copy of r array to ensure it's contiguous and to modify it
         # below
         r_ndim = len(np.shape(r))
@@ -1362,6 +1577,9 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
                 if not ckdtree_isinf(real_r[i]):
                     real_r[i] = real_r[i] ** p
 
+        # the threads take the radii from a Python reference
+        r_arr = <object> real_r
+
         if weights is None:
             self_weights = other_weights = None
         elif isinstance(weights, tuple):
@@ -1374,11 +1592,18 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
         if self_weights is None and other_weights is None:
             int_result = True
             # unweighted, use the integer arithmetics
-            results = np.zeros(n_queries + 1, dtype=np.intp)
+            counts = np.zeros((len(tasks), n_queries + 1), dtype=np.intp)
 
-            iresults = results
-            count_neighbors_unweighted(<ckdtree*> self, <ckdtree*> other, n_queries,
-                            &real_r[0], &iresults[0], p, cumulative)
+            def _count_unweighted(_j):
+                cdef:
+                    np.ndarray[np.intp_t, ndim=2] _tasks = tasks[_j]
+                    np.ndarray[np.float64_t, ndim=1, mode="c"] _r = r_arr
+                    np.ndarray[np.intp_t, ndim=1, mode="c"] _results = counts[_j]
+                count_neighbors_unweighted(<ckdtree*> self, <ckdtree*> other, 
+                                n_queries, &_r[0], &_results[0], p, 
+                                cumulative, &_tasks[0,0], _tasks.shape[0])
+
+            _run_threads(_count_unweighted, range(len(tasks)), len(tasks))
 
         else:
             int_result = False
@@ -1400,12 +1625,29 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
                 w2p = NULL
                 w2np = NULL
 
-            results = np.zeros(n_queries + 1, dtype=np.float64)
-            fresults = results
-            count_neighbors_weighted(<ckdtree*> self, <ckdtree*> other,
-                                    w1p, w2p, w1np, w2np,
-                                    n_queries,
-                                    &real_r[0], &fresults[0], p, cumulative)
+            counts = np.zeros((len(tasks), n_queries + 1), dtype=np.float64)
+            w1p_uintp = <np.uintp_t> (<void*> w1p)
+            w1np_uintp = <np.uintp_t> (<void*> w1np)
+            w2p_uintp = <np.uintp_t> (<void*> w2p)
+            w2np_uintp = <np.uintp_t> (<void*> w2np)
+
+            def _count_weighted(_j):
+                cdef:
+                    np.ndarray[np.intp_t, ndim=2] _tasks = tasks[_j]
+                    np.ndarray[np.float64_t, ndim=1, mode="c"] _r = r_arr
+                    np.ndarray[np.float64_t, ndim=1, mode="c"] _results = counts[_j]
+                count_neighbors_weighted(<ckdtree*> self, <ckdtree*> other,
+                                <np.float64_t*> (<void*> w1p_uintp),
+                                <np.float64_t*> (<void*> w2p_uintp),
+                                <np.float64_t*> (<void*> w1np_uintp),
+                                <np.float64_t*> (<void*> w2np_uintp),
+                                n_queries, &_r[0], &_results[0], p,
+                                cumulative, &_tasks[0,0], _tasks.shape[0])
+
+            _run_threads(_count_weighted, range(len(tasks)), len(tasks))
+
+        # add up the counts of the threads
+        results = counts.sum(axis=0)
 
         results2 = np.zeros(inverse.shape, results.dtype)
         if cumulative:
@@ -1432,9 +1674,10 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
     def sparse_distance_matrix(cKDTree self, cKDTree other,
                                np.float64_t max_distance,
                                np.float64_t p=2.,
-                               output_type='dok_matrix'):
+                               output_type='dok_matrix', n_jobs=1):
         """
-        sparse_distance_matrix(self, other, max_distance, p=2.)
+        sparse_distance_matrix(self, other, max_distance, p=2.,
+                               output_type='dok_matrix', n_jobs=1)
 
         Compute a sparse distance matrix
 
@@ -1454,6 +1697,10 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             Which container to use for output data. Options: 'dok_matrix',
             'coo_matrix', 'dict', or 'ndarray'. Default: 'dok_matrix'.
 
+        n_jobs : int, optional
+            Number of jobs to schedule for parallel processing. If -1 is given
+            all processors are used. Default: 1.
+
         Returns
         -------
         result : dok_matrix, coo_matrix, dict or ndarray
@@ -1463,16 +1710,37 @@ cdef public class cKDTree [object ckdtree, type ckdtree_type]:
             and 'k' is returned,
         """
         
-        cdef coo_entries res
+        cdef:
+            coo_entries res
+            list buffers
+            np.intp_t j
 
         # Make sure trees are compatible
         if self.m != other.m:
             raise ValueError("Trees passed to sparse_distance_matrix have "
                              "different dimensionality")                                      
-        # do the query
-        res = coo_entries()
-        sparse_distance_matrix(
-                <ckdtree*> self, <ckdtree*> other, p, max_distance, res.buf)
+
+        if (n_jobs == -1): 
+            n_jobs = number_of_processors
+
+        # do the query, each thread collects the entries of its tasks in a
+        # separate buffer
+        tasks = self._traversal_tasks(n_jobs, False)
+        buffers = [coo_entries() for j in range(len(tasks))]
+
+        def _thread_func(_j):
+            cdef: 
+                np.ndarray[np.intp_t, ndim=2] _tasks = tasks[_j]
+                coo_entries _res = buffers[_j]
+            sparse_distance_matrix(
+                <ckdtree*> self, <ckdtree*> other, p, max_distance,
+                &_tasks[0,0], _tasks.shape[0], _res.buf)
+
+        _run_threads(_thread_func, range(len(tasks)), len(tasks))
+
+        res = buffers[0]
+        for j in range(1, len(buffers)):
+            extend_coo_entry_vector(res.buf, (<coo_entries> buffers[j]).buf)
                 
         if output_type == 'dict':
             return res.dict()
@@ -155,13 +155,16 @@ query_knn(const ckdtree     *self,
           const npy_intp     kmax,
           const npy_float64  eps,
           const npy_float64  p,
-          const npy_float64  distance_upper_bound);
+          const npy_float64  distance_upper_bound,
+          const npy_intp     max_leaves);
 
 CKDTREE_EXTERN PyObject*
 query_pairs(const ckdtree *self,
             const npy_float64 r,
             const npy_float64 p,
             const npy_float64 eps,
+            const npy_intp *tasks,
+            const npy_intp n_tasks,
             std::vector<ordered_pair> *results);
 
 CKDTREE_EXTERN PyObject*
@@ -171,7 +174,9 @@ count_neighbors_unweighted(const ckdtree *self,
                 npy_float64 *real_r,
                 npy_intp *results,
                 const npy_float64 p,
-                int cumulative);
+                int cumulative,
+                const npy_intp *tasks,
+                const npy_intp n_tasks);
 
 CKDTREE_EXTERN PyObject*
 count_neighbors_weighted(const ckdtree *self,
@@ -184,7 +189,9 @@ count_neighbors_weighted(const ckdtree *self,
                 npy_float64 *real_r,
                 npy_float64 *results,
                 const npy_float64 p,
-                int cumulative);
+                int cumulative,
+                const npy_intp *tasks,
+                const npy_intp n_tasks);
 
 CKDTREE_EXTERN PyObject*
 query_ball_point(const ckdtree *self,
@@ -201,6 +208,8 @@ query_ball_tree(const ckdtree *self,
                 const npy_float64 r,
                 const npy_float64 p,
                 const npy_float64 eps,
+                const npy_intp *tasks,
+                const npy_intp n_tasks,
                 std::vector<npy_intp> **results);
 
 CKDTREE_EXTERN PyObject*
@@ -208,6 +217,8 @@ sparse_distance_matrix(const ckdtree *self,
                        const ckdtree *other,
                        const npy_float64 p,
                        const npy_float64 max_distance,
+                       const npy_intp *tasks,
+                       const npy_intp n_tasks,
                        std::vector<coo_entry> *results);
 
 
@@ -32,6 +32,8 @@ struct CNBParams
     void * results; /* will be casted inside */
     WeightedTree self, other;
     int cumulative;
+    const npy_intp *tasks; /* pairs of node indices to start from */
+    npy_intp n_tasks;
 };
 
 template <typename MinMaxDist, typename WeightType, typename ResultType> static void
@@ -142,13 +144,13 @@ traverse(
                         for (l = start; l < end; ++l) {
                             if (d <= *l) {
                                 results[l - params->r] += WeightType::get_weight(&params->self, sindices[i])
-                                                        * WeightType::get_weight(&params->other, sindices[j]);
+                                                        * WeightType::get_weight(&params->other, oindices[j]);
                             }
                         }
                     } else {
                         const npy_float64 *l = std::lower_bound(start, end, d);
                         results[l - params->r] += WeightType::get_weight(&params->self, sindices[i])
-                                                * WeightType::get_weight(&params->other, sindices[j]);
+                                                * WeightType::get_weight(&params->other, oindices[j]);
                     }
                 }
             }
@@ -208,13 +210,17 @@ count_neighbors(struct CNBParams *params,
 
 #define HANDLE(cond, kls) \
     if (cond) { \
-        RectRectDistanceTracker<kls> tracker(self, r1, r2, p, 0.0, 0.0);\
-        traverse<kls, WeightType, ResultType>(&tracker, params, params->r, params->r+n_queries, \
-                 self->ctree, other->ctree); \
+        for (npy_intp t = 0; t < params->n_tasks; ++t) { \
+            Rectangle r1(self->m, self->raw_mins, self->raw_maxes); \
+            Rectangle r2(other->m, other->raw_mins, other->raw_maxes); \
+            const ckdtreenode *node1 = subtree_rectangle(self, params->tasks[2*t], r1); \
+            const ckdtreenode *node2 = subtree_rectangle(other, params->tasks[2*t+1], r2); \
+            RectRectDistanceTracker<kls> tracker(self, r1, r2, p, 0.0, 0.0); \
+            traverse<kls, WeightType, ResultType>(&tracker, params, params->r, params->r+n_queries, \
+                     node1, node2); \
+        } \
     } else
 
-    Rectangle r1(self->m, self->raw_mins, self->raw_maxes);
-    Rectangle r2(other->m, other->raw_mins, other->raw_maxes);
 
     if (NPY_LIKELY(self->raw_boxsize_data == NULL)) {
         HANDLE(NPY_LIKELY(p == 2), MinkowskiDistP2)
@@ -248,7 +254,8 @@ struct Unweighted {
 extern "C" PyObject*
 count_neighbors_unweighted(const ckdtree *self, const ckdtree *other,
                 npy_intp n_queries, npy_float64 *real_r, npy_intp *results,
-                const npy_float64 p, int cumulative) {
+                const npy_float64 p, int cumulative,
+                const npy_intp *tasks, const npy_intp n_tasks) {
 
     CNBParams params = {0};
 
@@ -257,6 +264,8 @@ count_neighbors_unweighted(const ckdtree *self, const ckdtree *other,
     params.self.tree = self;
     params.other.tree = other;
     params.cumulative = cumulative;
+    params.tasks = tasks;
+    params.n_tasks = n_tasks;
 
     /* release the GIL */
     NPY_BEGIN_ALLOW_THREADS
@@ -302,7 +311,8 @@ count_neighbors_weighted(const ckdtree *self, const ckdtree *other,
                 npy_float64 *self_weights, npy_float64 *other_weights,
                 npy_float64 *self_node_weights, npy_float64 *other_node_weights,
                 npy_intp n_queries, npy_float64 *real_r, npy_float64 *results,
-                const npy_float64 p, int cumulative)
+                const npy_float64 p, int cumulative,
+                const npy_intp *tasks, const npy_intp n_tasks)
 {
 
     CNBParams params = {0};
@@ -310,6 +320,8 @@ count_neighbors_weighted(const ckdtree *self, const ckdtree *other,
     params.r = real_r;
     params.results = (void*) results;
     params.cumulative = cumulative;
+    params.tasks = tasks;
+    params.n_tasks = n_tasks;
 
     params.self.tree = self;
     params.other.tree = other;
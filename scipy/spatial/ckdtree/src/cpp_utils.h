@@ -77,6 +77,22 @@ coo_entry_vector_buf(std::vector<coo_entry> *buf)
     return &tmp[0];
 }
 
+/* append the entries of src to buf, used to merge the results of threads */
+
+inline void
+extend_ordered_pair_vector(std::vector<ordered_pair> *buf,
+                           std::vector<ordered_pair> *src)
+{
+    buf->insert(buf->end(), src->begin(), src->end());
+}
+
+inline void
+extend_coo_entry_vector(std::vector<coo_entry> *buf,
+                        std::vector<coo_entry> *src)
+{
+    buf->insert(buf->end(), src->begin(), src->end());
+}
+
 
 static PyObject *
 pickle_tree_buffer(std::vector<ckdtreenode> *buf)
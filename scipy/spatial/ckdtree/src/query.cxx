@@ -213,7 +213,8 @@ query_single_point(const ckdtree *self,
                    const npy_intp     kmax,
                    const npy_float64  eps,
                    const npy_float64  p,
-                   npy_float64  distance_upper_bound)
+                   npy_float64  distance_upper_bound,
+                   const npy_intp     max_leaves)
 {
     /* memory pool to allocate and automatically reclaim nodeinfo structs */
     nodeinfo_pool nipool(self->m);
@@ -237,6 +238,7 @@ query_single_point(const ckdtree *self,
     heap neighbors(kmax);
 
     npy_intp      i;
+    npy_intp      n_leaves = 0;
     const npy_intp m = self->m;
     nodeinfo      *ni1;
     nodeinfo      *ni2;
@@ -327,7 +329,15 @@ query_single_point(const ckdtree *self,
                     }
                 }
             }
-            /* done with this node, get another */
+            /*
+             * done with this node, get another; the cells are visited
+             * nearest first, so stopping after max_leaves leaves gives
+             * the best-bin-first approximate search
+             */
+            ++n_leaves;
+            if (max_leaves > 0 && n_leaves >= max_leaves) {
+                break;
+            }
             if (q.n == 0) {
                 /* no more nodes to visit */
                 break;
@@ -489,11 +499,12 @@ query_knn(const ckdtree      *self,
           const npy_intp     kmax,
           const npy_float64  eps,
           const npy_float64  p,
-          const npy_float64  distance_upper_bound)
+          const npy_float64  distance_upper_bound,
+          const npy_intp     max_leaves)
 {
 #define HANDLE(cond, kls) \
     if(cond) { \
-        query_single_point<kls>(self, dd_row, ii_row, xx_row, k, nk, kmax, eps, p, distance_upper_bound); \
+        query_single_point<kls>(self, dd_row, ii_row, xx_row, k, nk, kmax, eps, p, distance_upper_bound, max_leaves); \
     } else
 
     npy_intp m = self->m;
@@ -190,23 +190,26 @@ traverse_checking(const ckdtree *self, const ckdtree *other,
 extern "C" PyObject*
 query_ball_tree(const ckdtree *self, const ckdtree *other,
                 const npy_float64 r, const npy_float64 p, const npy_float64 eps,
+                const npy_intp *tasks, const npy_intp n_tasks,
                 std::vector<npy_intp> **results)
 {
 
 #define HANDLE(cond, kls) \
     if(cond) { \
-        RectRectDistanceTracker<kls> tracker(self, r1, r2, p, eps, r); \
-        traverse_checking(self, other, results, self->ctree, other->ctree, \
-            &tracker); \
+        for (npy_intp t = 0; t < n_tasks; ++t) { \
+            Rectangle r1(self->m, self->raw_mins, self->raw_maxes); \
+            Rectangle r2(other->m, other->raw_mins, other->raw_maxes); \
+            const ckdtreenode *node1 = subtree_rectangle(self, tasks[2*t], r1); \
+            const ckdtreenode *node2 = subtree_rectangle(other, tasks[2*t+1], r2); \
+            RectRectDistanceTracker<kls> tracker(self, r1, r2, p, eps, r); \
+            traverse_checking(self, other, results, node1, node2, &tracker); \
+        } \
     } else
 
     /* release the GIL */
     NPY_BEGIN_ALLOW_THREADS
     {
         try {
-            Rectangle r1(self->m, self->raw_mins, self->raw_maxes);
-            Rectangle r2(other->m, other->raw_mins, other->raw_maxes);
-
             if(NPY_LIKELY(self->raw_boxsize_data == NULL)) {
                 HANDLE(NPY_LIKELY(p == 2), MinkowskiDistP2)
                 HANDLE(p == 1, MinkowskiDistP1)
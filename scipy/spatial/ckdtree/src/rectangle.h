@@ -243,5 +243,47 @@ template<typename MinMaxDist>
 
 };
 
+/*
+ * Rectangles of subtrees
+ * ======================
+ *
+ * The dual tree traversals can start from any pair of nodes, provided the
+ * distance tracker is set up with the rectangles of these nodes.  This lets
+ * the traversal be split into independent tasks, e.g. for multithreading.
+ *
+ * subtree_rectangle shrinks rect, the bounding rectangle of the tree, to the
+ * rectangle of the node with index node_index in the tree buffer, by applying
+ * the splits along the path from the root.  This is the rectangle held by a
+ * traversal starting at the root when it reaches the node.  The nodes are
+ * stored in depth-first order, so the less subtree of a node is stored before
+ * its greater subtree.  A pointer to the node is returned.
+ */
+
+inline const ckdtreenode *
+subtree_rectangle(const ckdtree *tree, const npy_intp node_index,
+                  Rectangle &rect)
+{
+    const ckdtreenode *node = tree->ctree;
+    npy_intp index = 0;
+
+    while (index != node_index) {
+        if (NPY_UNLIKELY(node->split_dim == -1)) {
+            const char *msg = "Invalid node index. This error should never occur.";
+            throw std::logic_error(msg);
+        }
+        if (node_index < node->_greater) {
+            rect.maxes()[node->split_dim] = node->split;
+            index = node->_less;
+            node = node->less;
+        }
+        else {
+            rect.mins()[node->split_dim] = node->split;
+            index = node->_greater;
+            node = node->greater;
+        }
+    }
+    return node;
+}
+
 
 #endif
@@ -16,6 +16,8 @@ stored in a rectangular array.
 
    pdist   -- pairwise distances between observation vectors.
    cdist   -- distances between two collections of observation vectors
+   cdist_chunked -- distances between two collections, by blocks of rows
+   cdist_topk -- smallest distances from each observation to a collection
    squareform -- convert distance matrix to a condensed one and vice versa
    directed_hausdorff -- directed Hausdorff distance between arrays
 
@@ -79,6 +81,8 @@ __all__ = [
     'braycurtis',
     'canberra',
     'cdist',
+    'cdist_chunked',
+    'cdist_topk',
     'chebyshev',
     'cityblock',
     'correlation',
@@ -109,6 +113,7 @@ __all__ = [
 ]
 
 
+import operator
 import warnings
 import numpy as np
 
@@ -116,6 +121,7 @@ from functools import partial
 from collections import namedtuple
 from scipy._lib.six import callable, string_types
 from scipy._lib.six import xrange
+from scipy._lib._util import _init_workers as _init_threads, _run_threads
 
 from . import _distance_wrap
 from . import _hausdorff
@@ -1654,6 +1660,14 @@ def pdist(X, metric='euclidean', *args, **kwargs):
         Note: metric independent, it will become a regular keyword arg in a
         future scipy version
 
+        workers : int or map-like callable
+        The number of threads between which the distance computation is
+        split, or -1 for all the CPUs.  Alternatively, a map-like callable,
+        such as `multiprocessing.Pool.map`, used to compute the blocks of
+        rows in parallel; the metric must then be picklable.  The compiled
+        metrics release the GIL, but a Python `metric` only gains from a
+        process pool.  Default: 1.
+
     Returns
     -------
     Y : ndarray
@@ -1863,6 +1877,7 @@ def pdist(X, metric='euclidean', *args, **kwargs):
     # with a more succinct, verifiable, but less efficient implementation.
 
     kwargs = _args_to_kwargs_xdist(args, kwargs, metric, "pdist")
+    workers = _init_workers(kwargs.pop("workers", 1))
 
     X = np.asarray(X, order='c')
 
@@ -1911,11 +1926,14 @@ def pdist(X, metric='euclidean', *args, **kwargs):
             X, typ, kwargs = _validate_pdist_input(X, m, n,
                                                    metric_name, **kwargs)
 
-        k = 0
-        for i in xrange(0, m - 1):
-            for j in xrange(i + 1, m):
-                dm[k] = metric(X[i], X[j], **kwargs)
-                k = k + 1
+        if workers == 1:
+            k = 0
+            for i in xrange(0, m - 1):
+                for j in xrange(i + 1, m):
+                    dm[k] = metric(X[i], X[j], **kwargs)
+                    k = k + 1
+        else:
+            _fill_condensed(_PdistRows(X, metric, kwargs), dm, workers)
 
     elif isinstance(metric, string_types):
         mstr = metric.lower()
@@ -1935,10 +1953,17 @@ def pdist(X, metric='euclidean', *args, **kwargs):
             X, typ, kwargs = _validate_pdist_input(X, m, n,
                                                    metric_name, **kwargs)
 
-            # get pdist wrapper
-            pdist_fn = getattr(_distance_wrap,
-                               "pdist_%s_%s_wrap" % (metric_name, typ))
-            pdist_fn(X, dm, **kwargs)
+            if workers == 1:
+                # get pdist wrapper
+                pdist_fn = getattr(_distance_wrap,
+                                   "pdist_%s_%s_wrap" % (metric_name, typ))
+                pdist_fn(X, dm, **kwargs)
+            else:
+                # the blocks of rows are computed with the cdist wrapper
+                cdist_fn = getattr(_distance_wrap,
+                                   "cdist_%s_%s_wrap" % (metric_name, typ))
+                _fill_condensed(_PdistRows(X, cdist_fn, kwargs, compiled=True),
+                                dm, workers)
             return dm
 
         elif mstr in ['old_cosine', 'old_cos']:
@@ -1958,7 +1983,7 @@ def pdist(X, metric='euclidean', *args, **kwargs):
             dm = squareform(dm)
         elif mstr.startswith("test_"):
             if mstr in _TEST_METRICS:
-                dm = pdist(X, _TEST_METRICS[mstr], **kwargs)
+                dm = pdist(X, _TEST_METRICS[mstr], workers=workers, **kwargs)
             else:
                 raise ValueError('Unknown "Test" Distance Metric: %s' % mstr[5:])
         else:
@@ -2336,6 +2361,14 @@ def cdist(XA, XB, metric='euclidean', *args, **kwargs):
         Note: metric independent, it will become a regular keyword arg in a
         future scipy version
 
+        workers : int or map-like callable
+        The number of threads between which the rows of `XA` are split, or
+        -1 for all the CPUs.  Alternatively, a map-like callable, such as
+        `multiprocessing.Pool.map`, used to compute the blocks of rows in
+        parallel; the metric must then be picklable.  The compiled metrics
+        release the GIL, but a Python `metric` only gains from a process
+        pool.  Default: 1.
+
     Returns
     -------
     Y : ndarray
@@ -2581,7 +2614,197 @@ def cdist(XA, XB, metric='euclidean', *args, **kwargs):
     # but with a more succinct, verifiable, but less efficient implementation.
 
     kwargs = _args_to_kwargs_xdist(args, kwargs, metric, "cdist")
+    out = kwargs.pop("out", None)
+    workers = _init_workers(kwargs.pop("workers", 1))
 
+    rows = _cdist_rows(XA, XB, metric, kwargs)
+    mA, mB = rows.shape
+    if out is None:
+        dm = np.empty((mA, mB), dtype=np.double)
+    else:
+        if out.shape != (mA, mB):
+            raise ValueError("Output array has incorrect shape.")
+        if not out.flags.c_contiguous:
+            raise ValueError("Output array must be C-contiguous.")
+        if out.dtype != np.double:
+            raise ValueError("Output array must be double type.")
+        dm = out
+
+    _fill_rows(rows, dm, workers)
+    return dm
+
+
+def cdist_chunked(XA, XB, metric='euclidean', chunk_size=None, workers=1,
+                  **kwargs):
+    """
+    Compute the distances between two collections of inputs by blocks of rows.
+
+    This computes the distance matrix of `cdist` in consecutive blocks of
+    rows, so that only one block is held in memory at a time.
+
+    Parameters
+    ----------
+    XA : ndarray
+        An :math:`m_A` by :math:`n` array of :math:`m_A`
+        original observations in an :math:`n`-dimensional space.
+    XB : ndarray
+        An :math:`m_B` by :math:`n` array of :math:`m_B`
+        original observations in an :math:`n`-dimensional space.
+    metric : str or callable, optional
+        The distance metric to use, as in `cdist`.
+    chunk_size : int, optional
+        The number of rows of each block.  By default, the blocks take
+        about 64 MiB.
+    workers : int or map-like callable, optional
+        The number of threads computing each block, or a map-like callable,
+        as in `cdist`.  Default is 1.
+    **kwargs : dict, optional
+        Extra arguments to `metric`, as in `cdist`.
+
+    Yields
+    ------
+    D : ndarray
+        The distances between the next `chunk_size` rows of `XA` (fewer for
+        the last block) and the rows of `XB`, as a block of rows of the
+        distance matrix of `cdist`.
+
+    See Also
+    --------
+    cdist, cdist_topk
+
+    Notes
+    -----
+    The arguments are checked when `cdist_chunked` is called, and the
+    blocks are computed as they are requested.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    Find the mean cosine distance of each row of ``a`` to the rows of
+    ``b``, in blocks of 100 rows:
+
+    >>> from scipy.spatial import distance
+    >>> a = np.random.rand(1000, 5)
+    >>> b = np.random.rand(2000, 5)
+    >>> blocks = distance.cdist_chunked(a, b, 'cosine', chunk_size=100)
+    >>> means = np.concatenate([D.mean(axis=1) for D in blocks])
+    >>> np.allclose(means, distance.cdist(a, b, 'cosine').mean(axis=1))
+    True
+
+    """
+    workers = _init_workers(workers)
+    rows = _cdist_rows(XA, XB, metric, kwargs)
+    chunk_size = _chunk_rows(chunk_size, rows.shape[1], _CHUNK_BYTES)
+    return _iter_chunks(rows, chunk_size, workers)
+
+
+def _iter_chunks(rows, chunk_size, workers):
+    mA, mB = rows.shape
+    for start in xrange(0, mA, chunk_size):
+        stop = min(start + chunk_size, mA)
+        dm = np.empty((stop - start, mB), dtype=np.double)
+        _fill_rows(rows, dm, workers, start)
+        yield dm
+
+
+def cdist_topk(XA, XB, k, metric='euclidean', chunk_size=None, workers=1,
+               **kwargs):
+    """
+    Compute the `k` smallest distances from each input to a collection.
+
+    This gives the `k` smallest entries of each row of the distance matrix
+    of `cdist`, without holding the whole matrix in memory.
+
+    Parameters
+    ----------
+    XA : ndarray
+        An :math:`m_A` by :math:`n` array of :math:`m_A`
+        original observations in an :math:`n`-dimensional space.
+    XB : ndarray
+        An :math:`m_B` by :math:`n` array of :math:`m_B`
+        original observations in an :math:`n`-dimensional space.
+    k : int
+        The number of distances to return for each row of `XA`, at most
+        :math:`m_B`.
+    metric : str or callable, optional
+        The distance metric to use, as in `cdist`.
+    chunk_size : int, optional
+        The number of rows of `XA` whose distances are computed at once (by
+        each thread).  By default, the blocks of distances take about
+        4 MiB.
+    workers : int or map-like callable, optional
+        The number of threads, or a map-like callable, between which the
+        blocks of rows are split, as in `cdist`.  Default is 1.
+    **kwargs : dict, optional
+        Extra arguments to `metric`, as in `cdist`.
+
+    Returns
+    -------
+    D : ndarray
+        An :math:`m_A` by `k` array of the smallest distances from each row
+        of `XA` to the rows of `XB`, in increasing order.
+    I : ndarray
+        An :math:`m_A` by `k` array of the indices of the rows of `XB` at
+        the distances `D`.
+
+    See Also
+    --------
+    cdist, cdist_chunked, scipy.spatial.cKDTree.query
+
+    Notes
+    -----
+    Equal distances are in an arbitrary order.
+
+    For the Minkowski metrics, `scipy.spatial.cKDTree.query` is usually
+    much faster, because it does not compute all the distances.
+
+    .. versionadded:: 1.1.0
+
+    Examples
+    --------
+    >>> from scipy.spatial import distance
+    >>> a = np.array([[0, 0], [3, 3]])
+    >>> b = np.array([[0, 1], [1, 1], [4, 4], [6, 6]])
+    >>> D, I = distance.cdist_topk(a, b, 2, 'cityblock')
+    >>> D
+    array([[ 1.,  2.],
+           [ 2.,  4.]])
+    >>> I
+    array([[0, 1],
+           [2, 1]])
+
+    """
+    workers = _init_workers(workers)
+    rows = _cdist_rows(XA, XB, metric, kwargs)
+    mA, mB = rows.shape
+    k = operator.index(k)
+    if not 1 <= k <= mB:
+        raise ValueError("k must be between 1 and the number of rows of XB "
+                         "(%d), got %d" % (mB, k))
+    chunk_size = _chunk_rows(chunk_size, mB, _BLOCK_BYTES)
+
+    topk = _TopK(rows, k)
+    D = np.empty((mA, k), dtype=np.double)
+    I = np.empty((mA, k), dtype=np.intp)
+    blocks = _row_blocks(0, mA, chunk_size)
+    if callable(workers):
+        for (start, stop), (d, i) in zip(blocks, workers(topk, blocks)):
+            D[start:stop] = d
+            I[start:stop] = i
+    else:
+        def fill(block):
+            start, stop = block
+            D[start:stop], I[start:stop] = topk(block)
+        _run_threads(fill, blocks, workers)
+    return D, I
+
+
+def _cdist_rows(XA, XB, metric, kwargs):
+    """
+    Validate the arguments of `cdist`, and return a `_CdistRows` computing
+    the distance matrix.
+    """
     XA = np.asarray(XA, order='c')
     XB = np.asarray(XB, order='c')
 
@@ -2603,17 +2826,6 @@ def cdist(XA, XB, metric='euclidean', *args, **kwargs):
     mA = s[0]
     mB = sB[0]
     n = s[1]
-    out = kwargs.pop("out", None)
-    if out is None:
-        dm = np.empty((mA, mB), dtype=np.double)
-    else:
-        if out.shape != (mA, mB):
-            raise ValueError("Output array has incorrect shape.")
-        if not out.flags.c_contiguous:
-            raise ValueError("Output array must be C-contiguous.")
-        if out.dtype != np.double:
-            raise ValueError("Output array must be double type.")
-        dm = out
 
     # compute blacklist for deprecated kwargs
     if(metric in _METRICS['minkowski'].aka or
@@ -2639,10 +2851,7 @@ def cdist(XA, XB, metric='euclidean', *args, **kwargs):
 
         XA, XB, typ, kwargs = _validate_cdist_input(XA, XB, mA, mB, n,
                                                     metric_name, **kwargs)
-
-        for i in xrange(0, mA):
-            for j in xrange(0, mB):
-                dm[i, j] = metric(XA[i], XB[j], **kwargs)
+        return _CdistRows(XA, XB, metric, kwargs)
 
     elif isinstance(metric, string_types):
         mstr = metric.lower()
@@ -2653,7 +2862,6 @@ def cdist(XA, XB, metric='euclidean', *args, **kwargs):
                mstr in _METRICS['mahalanobis'].aka):
                 raise ValueError("metric %s incompatible with weights" % mstr)
             # need to use python version for weighting
-            kwargs['out'] = out
             mstr = "test_%s" % mstr
 
         metric_name = _METRIC_ALIAS.get(mstr, None)
@@ -2663,12 +2871,11 @@ def cdist(XA, XB, metric='euclidean', *args, **kwargs):
             # get cdist wrapper
             cdist_fn = getattr(_distance_wrap,
                                "cdist_%s_%s_wrap" % (metric_name, typ))
-            cdist_fn(XA, XB, dm, **kwargs)
-            return dm
+            return _CdistRows(XA, XB, cdist_fn, kwargs, compiled=True)
 
         elif mstr.startswith("test_"):
             if mstr in _TEST_METRICS:
-                dm = cdist(XA, XB, _TEST_METRICS[mstr], **kwargs)
+                return _cdist_rows(XA, XB, _TEST_METRICS[mstr], kwargs)
             else:
                 raise ValueError('Unknown "Test" Distance Metric: %s' % mstr[5:])
         else:
@@ -2676,4 +2883,178 @@ def cdist(XA, XB, metric='euclidean', *args, **kwargs):
     else:
         raise TypeError('2nd argument metric must be a string identifier '
                         'or a function.')
-    return dm
+
+
+# Size in bytes of the blocks of distances computed at once by the threads
+# or the map-like workers of pdist and cdist_topk, and of the blocks of
+# cdist_chunked
+_BLOCK_BYTES = 2**22
+_CHUNK_BYTES = 2**26
+
+
+class _CdistRows(object):
+    """
+    Distances between the rows of `XA` and `XB`, computed for blocks of
+    rows of `XA` by a `_distance_wrap` function or a Python metric.
+
+    Instances can be pickled, to compute the blocks in other processes.
+    """
+    def __init__(self, XA, XB, metric, kwargs, compiled=False):
+        self.XA = XA
+        self.XB = XB
+        self.metric = metric
+        self.kwargs = kwargs
+        self.compiled = compiled
+        self.shape = (XA.shape[0], XB.shape[0])
+
+    def fill(self, start, stop, dm):
+        """Store the distances of ``XA[start:stop]`` in the rows of `dm`."""
+        if self.compiled:
+            self.metric(self.XA[start:stop], self.XB, dm, **self.kwargs)
+            return
+
+        XA, XB, metric, kwargs = self.XA, self.XB, self.metric, self.kwargs
+        for i in xrange(start, stop):
+            for j in xrange(0, self.shape[1]):
+                dm[i - start, j] = metric(XA[i], XB[j], **kwargs)
+
+    def __call__(self, block):
+        start, stop = block
+        dm = np.empty((stop - start, self.shape[1]), dtype=np.double)
+        self.fill(start, stop, dm)
+        return dm
+
+
+class _PdistRows(object):
+    """
+    Condensed distances between the rows of `X`, computed for blocks of
+    rows by a `_distance_wrap` cdist function or a Python metric.
+
+    Instances can be pickled, to compute the blocks in other processes.
+    """
+    def __init__(self, X, metric, kwargs, compiled=False):
+        self.X = X
+        self.metric = metric
+        self.kwargs = kwargs
+        self.compiled = compiled
+        self.m = X.shape[0]
+
+    def size(self, start, stop):
+        """The number of distances of the rows ``start:stop``."""
+        return _condensed_index(stop, self.m) - _condensed_index(start, self.m)
+
+    def fill(self, start, stop, dm):
+        """Store the distances of ``X[start:stop]`` to the next rows in `dm`."""
+        X, m, kwargs = self.X, self.m, self.kwargs
+        k = 0
+        if self.compiled:
+            # The distances to all the rows after `start`, of which those
+            # below the diagonal are dropped
+            block = np.empty((stop - start, m - start - 1), dtype=np.double)
+            self.metric(X[start:stop], X[start + 1:], block, **kwargs)
+            for i in xrange(start, stop):
+                dm[k:k + m - i - 1] = block[i - start, i - start:]
+                k += m - i - 1
+            return
+
+        metric = self.metric
+        for i in xrange(start, stop):
+            for j in xrange(i + 1, m):
+                dm[k] = metric(X[i], X[j], **kwargs)
+                k += 1
+
+    def __call__(self, block):
+        start, stop = block
+        dm = np.empty(self.size(start, stop), dtype=np.double)
+        self.fill(start, stop, dm)
+        return dm
+
+
+class _TopK(object):
+    """Smallest distances of blocks of rows of a `_CdistRows`."""
+    def __init__(self, rows, k):
+        self.rows = rows
+        self.k = k
+
+    def __call__(self, block):
+        d = self.rows(block)
+        if self.k < d.shape[1]:
+            i = np.argpartition(d, self.k - 1, axis=1)[:, :self.k]
+        else:
+            i = np.argsort(d, axis=1)
+        r = np.arange(d.shape[0])[:, None]
+        d = d[r, i]
+        order = np.argsort(d, axis=1)
+        return d[r, order], i[r, order]
+
+
+def _condensed_index(i, m):
+    """Index in a condensed distance matrix of the first distance of row i."""
+    return m * i - (i * (i + 1)) // 2
+
+
+def _init_workers(workers):
+    """Check the `workers` argument, and return the number of threads."""
+    if callable(workers):
+        return workers
+    return _init_threads(workers)
+
+
+def _chunk_rows(chunk_size, row_length, nbytes):
+    """Number of rows of the blocks, `nbytes` of doubles by default."""
+    if chunk_size is None:
+        return max(1, nbytes // (8 * max(row_length, 1)))
+    chunk_size = operator.index(chunk_size)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer, got %d"
+                         % chunk_size)
+    return chunk_size
+
+
+def _row_blocks(start, stop, size):
+    return [(i, min(i + size, stop)) for i in xrange(start, stop, size)]
+
+
+def _fill_rows(rows, dm, workers, start=0):
+    """
+    Store the distances of ``rows.XA[start:start + len(dm)]`` in `dm`, in
+    parallel with `workers`.
+    """
+    stop = start + dm.shape[0]
+    if workers == 1:
+        rows.fill(start, stop, dm)
+        return
+
+    if callable(workers):
+        blocks = _row_blocks(start, stop,
+                             _chunk_rows(None, rows.shape[1], _BLOCK_BYTES))
+        for (i, j), block in zip(blocks, workers(rows, blocks)):
+            dm[i - start:j - start] = block
+        return
+
+    def fill(block):
+        i, j = block
+        rows.fill(i, j, dm[i - start:j - start])
+
+    size = max(1, -(-(stop - start) // (4 * workers)))
+    _run_threads(fill, _row_blocks(start, stop, size), workers)
+
+
+def _fill_condensed(rows, dm, workers):
+    """Store the condensed distance matrix of `rows` in `dm`."""
+    m = rows.m
+    size = _chunk_rows(None, m, _BLOCK_BYTES)
+    if not callable(workers):
+        size = min(size, max(1, -(-(m - 1) // (4 * workers))))
+    blocks = _row_blocks(0, m - 1, size)
+
+    if callable(workers):
+        for (i, j), block in zip(blocks, workers(rows, blocks)):
+            dm[_condensed_index(i, m):_condensed_index(j, m)] = block
+        return
+
+    def fill(block):
+        i, j = block
+        rows.fill(i, j, dm[_condensed_index(i, m):_condensed_index(j, m)])
+
+    _run_threads(fill, blocks, workers)
@@ -50,7 +50,8 @@ from pytest import raises as assert_raises
 from scipy._lib._numpy_compat import suppress_warnings
 from scipy.spatial.distance import (squareform, pdist, cdist, num_obs_y,
                                     num_obs_dm, is_valid_dm, is_valid_y,
-                                    _validate_vector, _METRICS_NAMES)
+                                    _validate_vector, _METRICS_NAMES,
+                                    cdist_chunked, cdist_topk)
 
 # these were missing: chebyshev cityblock kulsinski
 from scipy.spatial.distance import (braycurtis, canberra, chebyshev, cityblock,
@@ -615,6 +616,69 @@ class TestCdist(object):
             out5 = np.empty((out_r, out_c), dtype=np.int64)
             assert_raises(ValueError, cdist, X1, X2, metric, out=out5, **kwargs)
 
+    def test_cdist_workers(self):
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in _METRICS_NAMES:
+            kwargs = dict()
+            if metric in ['minkowski', 'wminkowski']:
+                kwargs['p'] = 1.23
+            if metric == 'wminkowski':
+                kwargs['w'] = 1.0 / X1.std(axis=0)
+            Y1 = cdist(X1, X2, metric, **kwargs)
+            for workers in [2, 3, -1, map]:
+                Y2 = cdist(X1, X2, metric, workers=workers, **kwargs)
+                assert_allclose(Y1, Y2, rtol=1e-13, err_msg=metric)
+
+        # Python metrics and weights
+        w = np.arange(1, X1.shape[1] + 1)
+        for metric in [cityblock, 'test_euclidean']:
+            assert_allclose(cdist(X1, X2, metric, workers=3),
+                            cdist(X1, X2, metric), rtol=1e-13)
+        assert_allclose(cdist(X1, X2, 'minkowski', p=3, w=w, workers=3),
+                        cdist(X1, X2, 'minkowski', p=3, w=w), rtol=1e-13)
+
+        assert_raises(ValueError, cdist, X1, X2, workers=0)
+        assert_raises(TypeError, cdist, X1, X2, workers=1.5)
+
+    def test_cdist_chunked(self):
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'cosine', 'seuclidean', 'jaccard']:
+            Y1 = cdist(X1, X2, metric)
+            for workers in [1, 2, map]:
+                blocks = list(cdist_chunked(X1, X2, metric, chunk_size=3,
+                                            workers=workers))
+                assert_equal([len(b) for b in blocks],
+                             [3]*(len(X1) // 3) + [len(X1) % 3])
+                assert_allclose(np.vstack(blocks), Y1, rtol=1e-13)
+
+        blocks = list(cdist_chunked(X1, X2, 'minkowski', p=3))
+        assert_equal(len(blocks), 1)
+        assert_allclose(blocks[0], cdist(X1, X2, 'minkowski', p=3))
+
+        # the arguments are checked when called
+        assert_raises(ValueError, cdist_chunked, X1, X2, 'unknown')
+        assert_raises(ValueError, cdist_chunked, X1, X2, chunk_size=0)
+
+    def test_cdist_topk(self):
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'cityblock', 'cosine', cityblock]:
+            Y = cdist(X1, X2, metric)
+            for k in [1, 3, X2.shape[0]]:
+                for workers in [1, 3, map]:
+                    D, I = cdist_topk(X1, X2, k, metric, chunk_size=2,
+                                      workers=workers)
+                    assert_equal(D.shape, (X1.shape[0], k))
+                    assert_equal(I.shape, (X1.shape[0], k))
+                    assert_allclose(D, np.sort(Y, axis=1)[:, :k], rtol=1e-13)
+                    assert_allclose(Y[np.arange(len(Y))[:, None], I], D,
+                                    rtol=1e-13)
+
+        assert_raises(ValueError, cdist_topk, X1, X2, 0)
+        assert_raises(ValueError, cdist_topk, X1, X2, X2.shape[0] + 1)
+
 
 class TestPdist(object):
 
@@ -1373,6 +1437,31 @@ class TestPdist(object):
             out5 = np.empty(out_size, dtype=np.int64)
             assert_raises(ValueError, pdist, X, metric, out=out5, **kwargs)
 
+    def test_pdist_workers(self):
+        X = eo['random-double-data']
+        for metric in _METRICS_NAMES:
+            kwargs = dict()
+            X1 = X
+            if metric in ['minkowski', 'wminkowski']:
+                kwargs['p'] = 1.23
+            if metric == 'wminkowski':
+                kwargs['w'] = 1.0 / X.std(axis=0)
+            if metric in ['dice', 'kulsinski', 'rogerstanimoto', 'russellrao',
+                          'sokalmichener', 'sokalsneath', 'yule']:
+                X1 = X > 0.5
+            Y1 = pdist(X1, metric, **kwargs)
+            for workers in [2, 3, -1, map]:
+                Y2 = pdist(X1, metric, workers=workers, **kwargs)
+                assert_allclose(Y1, Y2, rtol=1e-13, err_msg=metric)
+
+        # Python metrics, and fewer rows than threads
+        for metric in [cityblock, 'test_euclidean']:
+            assert_allclose(pdist(X, metric, workers=3),
+                            pdist(X, metric), rtol=1e-13)
+        for m in range(3):
+            Y = pdist(X[:m], workers=4)
+            assert_equal(Y.shape, (m * (m - 1) // 2,))
+
 
 class TestSomeDistanceFunctions(object):
 
@@ -0,0 +1,174 @@
+from __future__ import division, print_function, absolute_import
+
+from numpy.testing import (assert_equal, assert_array_equal,
+    assert_array_almost_equal, assert_)
+from pytest import raises as assert_raises
+
+import numpy as np
+from scipy.spatial import cKDTree, DynamicKDTree
+from scipy.spatial import _dynamic_kdtree
+
+
+def _random_updates(tree, n_updates, m):
+    # insert and remove random batches of points
+    for step in range(n_updates):
+        if np.random.rand() < 0.6:
+            tree.insert(np.random.rand(np.random.randint(0, 80), m))
+        elif tree.n > 0:
+            ids = tree.ids
+            k = min(len(ids), np.random.randint(1, 60))
+            tree.remove(np.random.permutation(ids)[:k])
+        yield step
+
+
+class TestDynamicKDTree(object):
+
+    def setup_method(self):
+        np.random.seed(1234)
+        # small buffer to exercise the merging of trees
+        self._buffer_size = _dynamic_kdtree._BUFFER_SIZE
+        _dynamic_kdtree._BUFFER_SIZE = 32
+
+    def teardown_method(self):
+        _dynamic_kdtree._BUFFER_SIZE = self._buffer_size
+
+    def test_ids(self):
+        data = np.random.rand(50, 2)
+        tree = DynamicKDTree(data)
+        assert_array_equal(tree.ids, np.arange(50))
+        assert_array_equal(tree.data, data)
+
+        new = np.random.rand(40, 2)
+        assert_array_equal(tree.insert(new), np.arange(50, 90))
+        tree.remove([3, 60, 4])
+        assert_equal(tree.n, 87)
+        keep = np.ones(90, dtype=bool)
+        keep[[3, 4, 60]] = False
+        assert_array_equal(tree.ids, np.arange(90)[keep])
+        assert_array_equal(tree.data, np.vstack([data, new])[keep])
+
+        # ids are not reused
+        assert_array_equal(tree.insert(new[0]), [90])
+
+        assert_raises(ValueError, tree.remove, [3])
+        assert_raises(ValueError, tree.remove, [91])
+        assert_raises(ValueError, tree.insert, np.zeros((2, 3)))
+
+    def test_query(self):
+        for boxsize in [None, 1.0]:
+            tree = DynamicKDTree(np.random.rand(100, 3), leafsize=4,
+                                 boxsize=boxsize)
+            x = np.random.rand(20, 3)
+            for step in _random_updates(tree, 30, 3):
+                ids = tree.ids
+                ref = cKDTree(tree.data, boxsize=boxsize)
+                for p in [1, 2, np.inf]:
+                    for k, dub in [([1, 3, 7], np.inf), (5, 0.2)]:
+                        d, i = tree.query(x, k=k, p=p,
+                                          distance_upper_bound=dub)
+                        dr, ir = ref.query(x, k=k, p=p,
+                                           distance_upper_bound=dub)
+                        assert_array_almost_equal(d, dr)
+                        found = ir < ref.n
+                        assert_array_equal(i[found], ids[ir[found]])
+                        assert_(np.all(i[~found] == -1))
+
+        d, i = tree.query(x[0])
+        dr, ir = ref.query(x[0])
+        assert_(isinstance(i, int))
+        assert_equal(i, ids[ir])
+
+    def test_query_ball_point(self):
+        tree = DynamicKDTree(np.random.rand(100, 3), leafsize=4)
+        x = np.random.rand(4, 5, 3)
+        for step in _random_updates(tree, 30, 3):
+            ids = tree.ids
+            ref = cKDTree(tree.data)
+            for p in [1, 2, np.inf]:
+                l = tree.query_ball_point(x, 0.3, p=p)
+                lr = ref.query_ball_point(x, 0.3, p=p)
+                assert_equal(l.shape, (4, 5))
+                for a, b in zip(l.ravel(), lr.ravel()):
+                    assert_equal(a, sorted(ids[b]))
+
+        indptr, indices, distances = tree.query_ball_point(
+            x, 0.3, output_type='csr')
+        indptr_r, indices_r, distances_r = ref.query_ball_point(
+            x, 0.3, output_type='csr')
+        assert_array_equal(indptr, indptr_r)
+        assert_array_equal(indices, ids[indices_r])
+        assert_array_almost_equal(distances, distances_r)
+
+    def test_dual_tree_queries(self):
+        for boxsize in [None, 1.0]:
+            tree1 = DynamicKDTree(np.random.rand(100, 3), leafsize=4,
+                                  boxsize=boxsize)
+            tree2 = DynamicKDTree(np.random.rand(80, 3), leafsize=4,
+                                  boxsize=boxsize)
+            r = np.linspace(0, 0.5, 4)
+            for step in _random_updates(tree1, 20, 3):
+                if step % 3 == 0:
+                    tree2.remove(tree2.ids[:3])
+                    tree2.insert(np.random.rand(5, 3))
+                ids1 = tree1.ids
+                ids2 = tree2.ids
+                ref1 = cKDTree(tree1.data, boxsize=boxsize)
+                ref2 = cKDTree(tree2.data, boxsize=boxsize)
+                for p in [1, 2, np.inf]:
+                    pairs = set((min(ids1[i], ids1[j]), max(ids1[i], ids1[j]))
+                                for i, j in ref1.query_pairs(0.2, p=p))
+                    assert_equal(tree1.query_pairs(0.2, p=p), pairs)
+
+                    assert_array_equal(
+                        tree1.count_neighbors(tree2, r, p=p),
+                        ref1.count_neighbors(ref2, r, p=p))
+                    assert_equal(tree1.count_neighbors(tree1, 0.3, p=p),
+                                 ref1.count_neighbors(ref1, 0.3, p=p))
+                    w = np.random.rand(tree1._n_ids)
+                    assert_array_almost_equal(
+                        tree1.count_neighbors(tree1, r, p=p, weights=w),
+                        ref1.count_neighbors(ref1, r, p=p, weights=w[ids1]))
+
+                    s = tree1.sparse_distance_matrix(
+                        tree2, 0.3, p=p, output_type='coo_matrix').tocsr()
+                    sr = ref1.sparse_distance_matrix(
+                        ref2, 0.3, p=p, output_type='coo_matrix')
+                    assert_array_almost_equal(s[ids1][:, ids2].toarray(),
+                                              sr.toarray())
+
+                    l = tree1.query_ball_tree(tree2, 0.3, p=p)
+                    lr = ref1.query_ball_tree(ref2, 0.3, p=p)
+                    assert_equal(len(l), tree1._n_ids)
+                    for i, b in zip(ids1, lr):
+                        assert_equal(l[i], sorted(ids2[b]))
+
+    def test_rebalance(self):
+        tree = DynamicKDTree(np.random.rand(100, 3))
+        x = np.random.rand(20, 3)
+        for step in _random_updates(tree, 30, 3):
+            pass
+        d, i = tree.query(x, k=3)
+        ids, data = tree.ids, tree.data
+        tree.rebalance()
+        assert_equal(tree.n_trees, 1)
+        assert_array_equal(tree.ids, ids)
+        assert_array_equal(tree.data, data)
+        d2, i2 = tree.query(x, k=3)
+        assert_array_equal(d2, d)
+        assert_array_equal(i2, i)
+
+    def test_empty(self):
+        tree = DynamicKDTree(np.empty((0, 2)))
+        assert_equal(tree.n, 0)
+        assert_equal(tree.n_trees, 0)
+        d, i = tree.query(np.zeros((3, 2)), k=2)
+        assert_array_equal(d, np.inf)
+        assert_array_equal(i, -1)
+        assert_equal(tree.query_ball_point([0, 0], 1.), [])
+        assert_equal(tree.query_pairs(1.), set())
+        assert_array_equal(tree.count_neighbors(tree, [1., 2.]), [0, 0])
+
+        ids = tree.insert(np.random.rand(10, 2))
+        tree.remove(ids)
+        assert_equal(tree.n, 0)
+        assert_equal(tree.query(np.zeros(2)), (np.inf, -1))
@@ -462,6 +462,38 @@ def test_query_ball_point_multithreading():
             assert_array_equal(l1[i],l3[i])
          
 
+def test_query_ball_point_csr():
+    np.random.seed(1234)
+    points = np.random.rand(200, 3)
+    x = np.random.rand(4, 5, 3)
+    for boxsize in [None, 1.0]:
+        T = cKDTree(points, leafsize=4, boxsize=boxsize)
+        for p in [1, 2, 3, np.inf]:
+            l = T.query_ball_point(x, 0.2, p=p)
+            indptr, indices, distances = T.query_ball_point(x, 0.2, p=p,
+                    output_type='csr', n_jobs=3)
+            assert_equal(indptr[0], 0)
+            assert_array_equal(np.diff(indptr), [len(li) for li in l.ravel()])
+            for i, li in enumerate(l.ravel()):
+                start, stop = indptr[i], indptr[i + 1]
+                assert_array_equal(indices[start:stop], sorted(li))
+                if boxsize is None:
+                    d = minkowski_distance(x.reshape(-1, 3)[i], points[li], p)
+                else:
+                    d = distance_box(x.reshape(-1, 3)[i], points[li], p,
+                                     boxsize)
+                assert_array_almost_equal(distances[start:stop], d)
+
+    # a single point
+    indptr, indices, distances = T.query_ball_point(x[0, 0], 0.2,
+                                                    output_type='csr')
+    assert_array_equal(indptr, [0, len(indices)])
+    assert_array_equal(indices, sorted(T.query_ball_point(x[0, 0], 0.2)))
+
+    assert_raises(ValueError, T.query_ball_point, x, 0.2,
+                  output_type='bad')
+
+
 class two_trees_consistency:
 
     def distance(self, a, b, p):
@@ -972,6 +1004,68 @@ def test_ckdtree_parallel():
     assert_array_equal(T1, T2)
     assert_array_equal(T1, T3)
 
+def test_ckdtree_parallel_dual_tree():
+    # the dual tree queries split into subtrees shall give the same
+    # results as the serial traversals
+    np.random.seed(1234)
+    points1 = np.random.rand(1000, 3)
+    points2 = np.random.rand(500, 3)
+    w1 = np.random.rand(1000)
+    w2 = np.random.rand(500)
+    r = np.linspace(0, 0.3, 5)
+    for boxsize in [None, 1.0]:
+        T1 = cKDTree(points1, leafsize=4, boxsize=boxsize)
+        T2 = cKDTree(points2, leafsize=8, boxsize=boxsize)
+        for p in [1, 2, np.inf]:
+            l = T1.query_ball_tree(T2, 0.1, p=p)
+            pairs = T1.query_pairs(0.1, p=p)
+            c = T1.count_neighbors(T2, r, p=p)
+            cw = T1.count_neighbors(T2, r, p=p, weights=(w1, w2),
+                                    cumulative=False)
+            s = T1.sparse_distance_matrix(T2, 0.1, p=p,
+                                          output_type='coo_matrix')
+            for n_jobs in [2, 7, -1]:
+                assert_equal(T1.query_ball_tree(T2, 0.1, p=p, n_jobs=n_jobs), l)
+                assert_equal(T1.query_pairs(0.1, p=p, n_jobs=n_jobs), pairs)
+                a = T1.query_pairs(0.1, p=p, output_type='ndarray',
+                                   n_jobs=n_jobs)
+                assert_equal(set(map(tuple, a)), pairs)
+                assert_array_equal(T1.count_neighbors(T2, r, p=p,
+                                                      n_jobs=n_jobs), c)
+                assert_array_almost_equal(
+                    T1.count_neighbors(T2, r, p=p, weights=(w1, w2),
+                                       cumulative=False, n_jobs=n_jobs), cw)
+                assert_equal(T1.count_neighbors(T2, 0.1, p=p, n_jobs=n_jobs),
+                             T1.count_neighbors(T2, 0.1, p=p))
+                s2 = T1.sparse_distance_matrix(T2, 0.1, p=p,
+                                               output_type='coo_matrix',
+                                               n_jobs=n_jobs)
+                assert_array_equal(s2.toarray(), s.toarray())
+
+    # a tree with a single leaf
+    T = cKDTree(points1[:3])
+    assert_equal(T.query_pairs(1, n_jobs=4), T.query_pairs(1))
+    assert_equal(T.count_neighbors(T, 1, n_jobs=4), 9)
+
+
+def test_ckdtree_weights_two_trees():
+    # weighted pair counts between trees of different sizes
+    np.random.seed(1234)
+    points1 = np.random.rand(40, 2)
+    points2 = np.random.rand(70, 2)
+    w1 = np.random.rand(40)
+    w2 = np.random.rand(70)
+    T1 = cKDTree(points1, leafsize=4)
+    T2 = cKDTree(points2, leafsize=4)
+    r = np.linspace(0, 1, 6)
+    d = distance_matrix(points1, points2)
+    expected = [np.sum(np.outer(w1, w2)[d <= ri]) for ri in r]
+    assert_array_almost_equal(T1.count_neighbors(T2, r, weights=(w1, w2)),
+                              expected)
+    assert_array_almost_equal(T2.count_neighbors(T1, r, weights=(w2, w1)),
+                              expected)
+
+
 def test_ckdtree_view():        
     # Check that the nodes can be correctly viewed from Python.
     # This test also sanity checks each node in the cKDTree, and
@@ -1330,3 +1424,40 @@ def test_short_knn():
             [0., 0.01, np.inf, np.inf],
             [0., 0.01, np.inf, np.inf],
             [0., np.inf, np.inf, np.inf]])
+
+def test_ckdtree_query_max_leaves():
+    np.random.seed(1234)
+    data = np.random.rand(2000, 10)
+    x = np.random.rand(50, 10)
+    for boxsize in [None, 1.0]:
+        T = cKDTree(data, leafsize=8, boxsize=boxsize)
+        d, i = T.query(x, k=5)
+
+        # a large enough budget gives the exact result
+        da, ia = T.query(x, k=5, max_leaves=len(data))
+        assert_array_equal(da, d)
+        assert_array_equal(ia, i)
+
+        # the approximate neighbors are sorted, at least as far as the
+        # exact ones, and their distances are correct
+        prev = 0
+        for max_leaves in [1, 4, 16, 64]:
+            da, ia = T.query(x, k=5, max_leaves=max_leaves)
+            assert_equal(da.shape, d.shape)
+            assert_(np.all(np.diff(da, axis=1) >= 0))
+            assert_(np.all(da >= d - 1e-12))
+            found = ia < T.n
+            diff = x[:, None, :] - data[np.where(found, ia, 0)]
+            if boxsize is not None:
+                diff -= np.round(diff)
+            assert_array_almost_equal(
+                da[found], np.sqrt((diff**2).sum(-1))[found])
+            # the recall increases with the budget
+            recall = np.mean([len(set(a) & set(b))
+                              for a, b in zip(ia, i)])
+            assert_(recall >= prev)
+            prev = recall
+
+    assert_equal(T.query(x[0], max_leaves=1)[1], T.query(x[0], k=[1],
+                                                         max_leaves=1)[1][0])
+    assert_raises(ValueError, T.query, x, max_leaves=0)
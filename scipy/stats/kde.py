@@ -20,12 +20,12 @@
 from __future__ import division, print_function, absolute_import
 
 # Standard library imports.
+import itertools
 import warnings
 
 # Scipy imports.
 from scipy._lib.six import callable, string_types
 from scipy import linalg, special
-from scipy.special import logsumexp
 
 from numpy import atleast_2d, reshape, zeros, newaxis, dot, exp, pi, sqrt, \
      ravel, power, atleast_1d, squeeze, sum, transpose
@@ -39,6 +39,16 @@ from . import mvn
 __all__ = ['gaussian_kde']
 
 
+# Default upper bound, in bytes, on the size of the temporary arrays that are
+# created while evaluating sums of Gaussian kernels.
+_MAX_MEMORY = 2**26
+
+# Default truncation radius of the kernels (in units of the bandwidth), and
+# default grid spacing for ``method='binned'`` (in units of the bandwidth).
+_CUTOFF = 6.0
+_BIN_WIDTH = 0.25
+
+
 class gaussian_kde(object):
     """Representation of a kernel-density estimate using Gaussian kernels.
 
@@ -171,7 +181,8 @@ class gaussian_kde(object):
         self.d, self.n = self.dataset.shape
         self.set_bandwidth(bw_method=bw_method)
 
-    def evaluate(self, points):
+    def evaluate(self, points, method='exact', cutoff=None, bin_width=None,
+                 max_memory=None):
         """Evaluate the estimated pdf on a set of points.
 
         Parameters
@@ -179,6 +190,29 @@ class gaussian_kde(object):
         points : (# of dimensions, # of points)-array
             Alternatively, a (# of dimensions,) vector can be passed in and
             treated as a single point.
+        method : {'exact', 'tree', 'binned'}, optional
+            How the sum over the kernels is computed:
+
+              - 'exact' (default) sums all the kernels, processing the points
+                and the dataset in blocks whose size is bounded by
+                `max_memory`.
+              - 'tree' only sums the kernels of datapoints that lie within
+                `cutoff` bandwidths of each point, found with a `cKDTree`.
+              - 'binned' linearly bins the dataset on a regular grid with a
+                spacing of `bin_width` bandwidths, convolves the grid with the
+                kernel using FFTs, and linearly interpolates the result to the
+                points.  Only available for ``d <= 3``.
+
+            See Notes for the accuracy of the approximate methods.
+        cutoff : float, optional
+            Radius, in units of the bandwidth, beyond which kernels are
+            neglected by the approximate methods.  Default is 6.
+        bin_width : float, optional
+            Grid spacing, in units of the bandwidth, used by
+            ``method='binned'``.  Default is 0.25.
+        max_memory : int, optional
+            Approximate upper bound, in bytes, on the temporary arrays used
+            during the evaluation.  Default is 64 MiB.
 
         Returns
         -------
@@ -190,40 +224,28 @@ class gaussian_kde(object):
         ValueError : if the dimensionality of the input points is different than
                      the dimensionality of the KDE.
 
-        """
-        points = atleast_2d(points)
+        Notes
+        -----
+        The approximate methods neglect the kernels beyond `cutoff`
+        bandwidths, each of which is smaller than ``exp(-cutoff**2 / 2)``
+        times the peak of a kernel.  With ``c = cutoff`` and
+        ``h = bin_width``, the absolute error of the returned pdf values is
+        therefore bounded by::
 
-        d, m = points.shape
-        if d != self.d:
-            if d == 1 and m == self.d:
-                # points was passed in as a row vector
-                points = reshape(points, (self.d, 1))
-                m = 1
-            else:
-                msg = "points have dimension %s, dataset has dimension %s" % (d,
-                    self.d)
-                raise ValueError(msg)
+            exp(-c**2 / 2) / sqrt(det(2*pi*covariance))
 
-        result = zeros((m,), dtype=float)
+        for ``method='tree'``, and (linear binning and interpolation each
+        contribute at most ``d * h**2 / 8`` times the kernel peak) by::
 
-        if m >= self.n:
-            # there are more points than data, so loop over data
-            for i in range(self.n):
-                diff = self.dataset[:, i, newaxis] - points
-                tdiff = dot(self.inv_cov, diff)
-                energy = sum(diff*tdiff,axis=0) / 2.0
-                result = result + exp(-energy)
-        else:
-            # loop over points
-            for i in range(m):
-                diff = self.dataset - points[:, i, newaxis]
-                tdiff = dot(self.inv_cov, diff)
-                energy = sum(diff * tdiff, axis=0) / 2.0
-                result[i] = sum(exp(-energy), axis=0)
+            (d * h**2 / 4 + exp(-c**2 / 2)) / sqrt(det(2*pi*covariance))
 
-        result = result / self._norm_factor
+        for ``method='binned'``.
 
-        return result
+        """
+        points = self._check_points(points)
+        kernel_sum = self._kernel_sum(points, method, cutoff, bin_width,
+                                      max_memory)
+        return kernel_sum / self._norm_factor
 
     __call__ = evaluate
 
@@ -265,18 +287,12 @@ class gaussian_kde(object):
         sum_cov = self.covariance + cov
 
         # This will raise LinAlgError if the new cov matrix is not s.p.d
-        # cho_factor returns (ndarray, bool) where bool is a flag for whether
-        # or not ndarray is upper or lower triangular
-        sum_cov_chol = linalg.cho_factor(sum_cov)
+        whitening, sqrt_det = _cov_whitening(sum_cov)
+        data, mean = _whiten(whitening, self.dataset, mean)
 
-        diff = self.dataset - mean
-        tdiff = linalg.cho_solve(sum_cov_chol, diff)
-
-        sqrt_det = np.prod(np.diagonal(sum_cov_chol[0]))
         norm_const = power(2 * pi, sum_cov.shape[0] / 2.0) * sqrt_det
 
-        energies = sum(diff * tdiff, axis=0) / 2.0
-        result = sum(exp(-energies), axis=0) / norm_const / self.n
+        result = _gaussian_kernel_sum(data, mean)[0] / norm_const / self.n
 
         return result
 
@@ -379,17 +395,11 @@ class gaussian_kde(object):
             large = other
 
         sum_cov = small.covariance + large.covariance
-        sum_cov_chol = linalg.cho_factor(sum_cov)
-        result = 0.0
-        for i in range(small.n):
-            mean = small.dataset[:, i, newaxis]
-            diff = large.dataset - mean
-            tdiff = linalg.cho_solve(sum_cov_chol, diff)
+        whitening, sqrt_det = _cov_whitening(sum_cov)
 
-            energies = sum(diff * tdiff, axis=0) / 2.0
-            result += sum(exp(-energies), axis=0)
+        data, points = _whiten(whitening, large.dataset, small.dataset)
+        result = sum(_gaussian_kernel_sum(data, points))
 
-        sqrt_det = np.prod(np.diagonal(sum_cov_chol[0]))
         norm_const = power(2 * pi, sum_cov.shape[0] / 2.0) * sqrt_det
 
         result /= norm_const * large.n * small.n
@@ -513,52 +523,319 @@ class gaussian_kde(object):
         self.inv_cov = self._data_inv_cov / self.factor**2
         self._norm_factor = sqrt(linalg.det(2*pi*self.covariance)) * self.n
 
-    def pdf(self, x):
+    def pdf(self, x, **kwds):
         """
         Evaluate the estimated pdf on a provided set of points.
 
         Notes
         -----
         This is an alias for `gaussian_kde.evaluate`.  See the ``evaluate``
-        docstring for more details.
+        docstring for more details, and for the keyword arguments selecting
+        the evaluation method.
 
         """
-        return self.evaluate(x)
+        return self.evaluate(x, **kwds)
 
-    def logpdf(self, x):
+    def logpdf(self, x, method='exact', cutoff=None, bin_width=None,
+               max_memory=None):
         """
         Evaluate the log of the estimated pdf on a provided set of points.
+
+        The keyword arguments are the same as for `gaussian_kde.evaluate`.
+        For ``method='exact'`` the sum over the kernels is accumulated in the
+        log domain, so that points far away from the dataset do not underflow.
+        The approximate methods return ``-inf`` where all the kernels have been
+        neglected.
         """
+        points = self._check_points(x)
+
+        if method != 'exact':
+            kernel_sum = self._kernel_sum(points, method, cutoff, bin_width,
+                                          max_memory)
+            with np.errstate(divide='ignore'):
+                return np.log(kernel_sum / self._norm_factor)
 
-        points = atleast_2d(x)
+        data, points = _whiten(self._inv_cov_whitening(), self.dataset,
+                               points)
+        result = _gaussian_kernel_sum(data, points, max_memory, log=True)
+
+        return result - np.log(self._norm_factor)
+
+    def _check_points(self, points):
+        """Return `points` as a 2-D array of shape (# of dimensions, # of
+        points), checking its dimensionality against the dataset.
+        """
+        points = atleast_2d(points)
 
         d, m = points.shape
         if d != self.d:
             if d == 1 and m == self.d:
                 # points was passed in as a row vector
                 points = reshape(points, (self.d, 1))
-                m = 1
             else:
                 msg = "points have dimension %s, dataset has dimension %s" % (d,
                     self.d)
                 raise ValueError(msg)
 
-        result = zeros((m,), dtype=float)
+        return points
 
-        if m >= self.n:
-            # there are more points than data, so loop over data
-            energy = zeros((self.n, m), dtype=float)
-            for i in range(self.n):
-                diff = self.dataset[:, i, newaxis] - points
-                tdiff = dot(self.inv_cov, diff)
-                energy[i] = sum(diff*tdiff,axis=0) / 2.0
-            result = logsumexp(-energy, b=1/self._norm_factor, axis=0)
+    def _inv_cov_whitening(self):
+        """Whitening matrix ``W`` with ``W^T W = inv_cov``.  Only `inv_cov` is
+        used, as that is all that subclasses are required to provide.
+        """
+        return linalg.cholesky(atleast_2d(self.inv_cov), lower=False)
+
+    def _kernel_sum(self, points, method, cutoff, bin_width, max_memory):
+        """Sum of the (unnormalized) kernels of the dataset at `points`."""
+        if cutoff is None:
+            cutoff = _CUTOFF
+        if bin_width is None:
+            bin_width = _BIN_WIDTH
+        if cutoff <= 0 or bin_width <= 0:
+            raise ValueError("`cutoff` and `bin_width` must be positive.")
+
+        data, points = _whiten(self._inv_cov_whitening(), self.dataset,
+                               points)
+
+        if method == 'exact':
+            return _gaussian_kernel_sum(data, points, max_memory)
+        elif method == 'tree':
+            return _tree_kernel_sum(data, points, cutoff, max_memory)
+        elif method == 'binned':
+            if self.d > 3:
+                raise ValueError("method='binned' is only available for "
+                                 "datasets with at most 3 dimensions.")
+            return _binned_kernel_sum(data, points, cutoff, bin_width,
+                                      max_memory)
         else:
-            # loop over points
-            for i in range(m):
-                diff = self.dataset - points[:, i, newaxis]
-                tdiff = dot(self.inv_cov, diff)
-                energy = sum(diff * tdiff, axis=0) / 2.0
-                result[i] = logsumexp(-energy, b=1/self._norm_factor)
+            raise ValueError("`method` should be 'exact', 'tree' or "
+                             "'binned'.")
 
-        return result
+
+def _cov_whitening(cov):
+    """Whitening matrix ``W`` with ``W^T W = inv(cov)``, and the square root
+    of the determinant of `cov`.
+    """
+    # This will raise LinAlgError if the cov matrix is not s.p.d
+    cov_chol = linalg.cholesky(cov, lower=True)
+    whitening = linalg.solve_triangular(cov_chol, np.eye(cov.shape[0]),
+                                        lower=True)
+    return whitening, np.prod(np.diagonal(cov_chol))
+
+
+def _whiten(whitening, dataset, points):
+    """Map `dataset` and `points` to coordinates in which a kernel with
+    inverse covariance ``whitening^T whitening`` is the standard normal.
+
+    Both arrays are centered on the mean of `dataset` first, which keeps the
+    squared norms used by `_gaussian_kernel_sum` small.
+    """
+    center = np.mean(dataset, axis=1)[:, newaxis]
+    data = dot(whitening, dataset - center)
+    points = dot(whitening, points - center)
+    return data, points
+
+
+def _block_sizes(n, m, max_memory):
+    """Number of data points and of evaluation points per block such that
+    an ``(m_block, n_block)`` array of doubles fits in `max_memory` bytes.
+    """
+    if max_memory is None:
+        max_memory = _MAX_MEMORY
+    size = max(1, int(max_memory) // 8)
+    n_block = max(1, min(n, size))
+    m_block = max(1, min(m, size // n_block))
+    return n_block, m_block
+
+
+def _gaussian_kernel_sum(data, points, max_memory=None, log=False):
+    """Sum of ``exp(-|x - y|**2 / 2)`` over the columns ``y`` of `data`, for
+    every column ``x`` of `points` (or its logarithm if `log` is True).
+
+    The data and points are processed in blocks, the squared distances of a
+    block being computed with a single matrix product as
+    ``|x|**2 + |y|**2 - 2 x.y``.
+    """
+    n = data.shape[1]
+    m = points.shape[1]
+    n_block, m_block = _block_sizes(n, m, max_memory)
+
+    half_data_sq = sum(data * data, axis=0) / 2.0
+    half_points_sq = sum(points * points, axis=0) / 2.0
+
+    if log:
+        # running maximum and scaled sum of the exponents, per point
+        result_max = np.full(m, -np.inf)
+        result = zeros(m, dtype=float)
+    else:
+        result = zeros(m, dtype=float)
+
+    for i in range(0, m, m_block):
+        pts = points[:, i:i + m_block]
+        for j in range(0, n, n_block):
+            # minus the energies, computed in place
+            arg = dot(pts.T, data[:, j:j + n_block])
+            arg -= half_points_sq[i:i + m_block, newaxis]
+            arg -= half_data_sq[newaxis, j:j + n_block]
+            np.minimum(arg, 0, out=arg)
+
+            if log:
+                new_max = np.maximum(result_max[i:i + m_block],
+                                     arg.max(axis=1))
+                arg -= new_max[:, newaxis]
+                result[i:i + m_block] *= exp(result_max[i:i + m_block] -
+                                             new_max)
+                result[i:i + m_block] += exp(arg, out=arg).sum(axis=1)
+                result_max[i:i + m_block] = new_max
+            else:
+                result[i:i + m_block] += exp(arg, out=arg).sum(axis=1)
+
+    if log:
+        result = np.log(result) + result_max
+
+    return result
+
+
+def _tree_kernel_sum(data, points, cutoff, max_memory=None):
+    """Approximate `_gaussian_kernel_sum`, neglecting the kernels farther
+    than `cutoff` from each point.
+    """
+    from scipy.spatial import cKDTree
+
+    if max_memory is None:
+        max_memory = _MAX_MEMORY
+    m = points.shape[1]
+    result = zeros(m, dtype=float)
+
+    data_tree = cKDTree(data.T)
+
+    # Each neighbour pair costs roughly 48 bytes (the pair and its distance
+    # as built by the tree, then as an array).  The number of pairs per block
+    # is not known in advance, so the block size is adapted to the number of
+    # pairs found in the previous block.
+    max_pairs = max(1, int(max_memory) // 48)
+    m_block = max(1, min(m, max_pairs // max(1, data.shape[1])))
+    i = 0
+    while i < m:
+        pts = points[:, i:i + m_block]
+        pairs = cKDTree(pts.T).sparse_distance_matrix(
+            data_tree, cutoff, output_type='ndarray')
+        if len(pairs):
+            result[i:i + m_block] = np.bincount(
+                pairs['i'], weights=exp(-pairs['v']**2 / 2.0),
+                minlength=pts.shape[1])
+        i += pts.shape[1]
+
+        per_point = max(1.0, len(pairs) / float(pts.shape[1]))
+        m_block = max(1, int(max_pairs / per_point))
+
+    return result
+
+
+def _next_5_smooth(n):
+    """The smallest integer ``>= n`` with no prime factors above 5, a fast
+    length for the FFTs of NumPy.
+    """
+    best = 1
+    while best < n:
+        best *= 2
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            # the smallest multiple p35 * 2**k >= n
+            quotient = -(-n // p35)
+            p2 = 1
+            while p2 < quotient:
+                p2 *= 2
+            best = min(best, p35 * p2)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _grid_corners(positions, shape):
+    """Yield the raveled grid indices and multilinear weights of the
+    ``2**d`` grid nodes surrounding each of `positions`, given in units of
+    the grid spacing.
+    """
+    d = len(shape)
+    lower = np.floor(positions).astype(np.intp)
+    for k in range(d):
+        np.clip(lower[k], 0, shape[k] - 2, out=lower[k])
+    frac = positions - lower
+
+    for corner in itertools.product((0, 1), repeat=d):
+        index = zeros(positions.shape[1], dtype=np.intp)
+        weight = np.ones(positions.shape[1])
+        for k in range(d):
+            index *= shape[k]
+            index += lower[k] + corner[k]
+            weight *= frac[k] if corner[k] else 1 - frac[k]
+        yield index, weight
+
+
+def _binned_kernel_sum(data, points, cutoff, bin_width, max_memory=None):
+    """Approximate `_gaussian_kernel_sum` by linear binning of `data` on a
+    regular grid, FFT convolution of the grid with the (truncated) kernel
+    and multilinear interpolation at `points`.
+    """
+    if max_memory is None:
+        max_memory = _MAX_MEMORY
+    d, n = data.shape
+    m = points.shape[1]
+
+    # grid nodes lo + k * bin_width covering the data, padded by the kernel
+    # half-width so that the convolution covers everything within cutoff.
+    half = int(np.ceil(cutoff / bin_width))
+    lo = data.min(axis=1) - half * bin_width
+    nodes = (np.floor((data.max(axis=1) - lo) / bin_width).astype(np.intp) +
+             half + 2)
+    fft_shape = tuple(_next_5_smooth(int(k) + 2 * half) for k in nodes)
+    # the FFT of the grid and of the kernel, and the padded grid itself
+    if 3 * 8 * np.prod(fft_shape, dtype=float) > max_memory:
+        raise ValueError("The grid required by method='binned' exceeds "
+                         "`max_memory`; increase `bin_width` or "
+                         "`max_memory`, or use method='tree'.")
+    shape = tuple(int(k) for k in nodes)
+
+    # linear binning of the data, in blocks
+    n_block = _block_sizes(n, 1, max_memory // 4)[0]
+    grid = zeros(np.prod(shape), dtype=float)
+    for j in range(0, n, n_block):
+        positions = (data[:, j:j + n_block] - lo[:, newaxis]) / bin_width
+        for index, weight in _grid_corners(positions, shape):
+            grid += np.bincount(index, weights=weight, minlength=grid.size)
+    grid = grid.reshape(shape)
+
+    # the kernel, tabulated on the grid offsets -half, ..., half
+    offsets = np.arange(-half, half + 1) * bin_width
+    kernel = exp(-offsets**2 / 2.0)
+    for k in range(1, d):
+        kernel = np.multiply.outer(kernel, exp(-offsets**2 / 2.0))
+    kernel = atleast_1d(kernel)
+
+    # linear convolution of the grid with the kernel; the kernel is centered
+    # so the result is cropped by `half` nodes along each axis.
+    axes = tuple(range(d))
+    conv = np.fft.irfftn(np.fft.rfftn(grid, fft_shape, axes) *
+                         np.fft.rfftn(kernel, fft_shape, axes),
+                         fft_shape, axes)
+    conv = conv[tuple(slice(half, half + k) for k in shape)]
+    conv = np.ravel(conv)
+
+    # multilinear interpolation at the points inside the grid
+    result = zeros(m, dtype=float)
+    m_block = _block_sizes(m, 1, max_memory // 4)[0]
+    for i in range(0, m, m_block):
+        positions = (points[:, i:i + m_block] - lo[:, newaxis]) / bin_width
+        inside = np.all((positions >= 0) &
+                        (positions <= np.array(shape)[:, newaxis] - 1),
+                        axis=0)
+        values = zeros(positions.shape[1], dtype=float)
+        for index, weight in _grid_corners(positions[:, inside], shape):
+            values[inside] += weight * conv[index]
+        result[i:i + m_block] = values
+
+    # round-off in the FFT can make values slightly negative
+    return np.maximum(result, 0)
@@ -2,7 +2,7 @@ from __future__ import division, print_function, absolute_import
 
 from scipy import stats
 import numpy as np
-from numpy.testing import (assert_almost_equal, assert_,
+from numpy.testing import (assert_almost_equal, assert_, assert_allclose,
     assert_array_almost_equal, assert_array_almost_equal_nulp)
 from pytest import raises as assert_raises
 
@@ -242,3 +242,71 @@ def test_pdf_logpdf():
     pdf2 = gkde.logpdf(xn)
     assert_almost_equal(pdf, pdf2, decimal=12)
 
+
+def test_evaluate_blocks():
+    # evaluating in small blocks gives the same result as in one go
+    np.random.seed(1234)
+    xn = np.random.randn(2, 200)
+    xs = np.random.randn(2, 300) * 2
+    gkde = stats.gaussian_kde(xn)
+
+    pdf = gkde.evaluate(xs)
+    assert_allclose(gkde.evaluate(xs, max_memory=1000), pdf, rtol=1e-13)
+    assert_allclose(gkde.logpdf(xs, max_memory=1000), np.log(pdf),
+                    rtol=1e-13)
+
+    # and is the same as the direct sum over the kernels
+    diff = xs[:, :, np.newaxis] - xn[:, np.newaxis, :]
+    energy = np.einsum('imn,ij,jmn->mn', diff, gkde.inv_cov, diff) / 2
+    assert_allclose(pdf, np.exp(-energy).sum(axis=1) / gkde._norm_factor,
+                    rtol=1e-13)
+
+
+def test_logpdf_far_points():
+    # the log-domain accumulation does not underflow far from the data
+    xn = np.array([-1., 0., 1., 2.])
+    gkde = stats.gaussian_kde(xn)
+    xs = np.array([100., 1000.])
+    logpdf = gkde.logpdf(xs)
+    assert_(np.all(np.isfinite(logpdf)))
+
+    # only the nearest kernel matters so far away
+    var = gkde.covariance[0, 0]
+    expected = (-(xs - 2)**2 / (2 * var) - np.log(gkde._norm_factor))
+    assert_allclose(logpdf, expected, rtol=1e-10)
+
+
+def test_approximate_methods():
+    np.random.seed(8765678)
+    for d in [1, 2, 3]:
+        mean = np.arange(d, dtype=float)
+        cov = np.eye(d) + 0.5
+        xn = np.random.multivariate_normal(mean, cov, size=500).T
+        xs = np.random.multivariate_normal(mean, 4 * cov, size=200).T
+        gkde = stats.gaussian_kde(xn)
+        pdf = gkde(xs)
+        peak = 1 / np.sqrt(np.linalg.det(2 * np.pi * gkde.covariance))
+
+        for cutoff in [3., 5.]:
+            bound = np.exp(-cutoff**2 / 2) * peak
+            tree = gkde(xs, method='tree', cutoff=cutoff)
+            assert_(np.all(np.abs(tree - pdf) <= bound))
+
+            bin_width = 0.2
+            bound += d * bin_width**2 / 4 * peak
+            binned = gkde(xs, method='binned', cutoff=cutoff,
+                          bin_width=bin_width, max_memory=2**28)
+            assert_(np.all(np.abs(binned - pdf) <= bound))
+
+        # pdf and logpdf agree for the approximate methods as well
+        with np.errstate(divide='ignore'):
+            logpdf = np.log(gkde.pdf(xs, method='tree'))
+        assert_allclose(gkde.logpdf(xs, method='tree'), logpdf)
+
+    assert_raises(ValueError, gkde.evaluate, xs, method='wrong')
+    assert_raises(ValueError, gkde.evaluate, xs, method='tree', cutoff=-1)
+    assert_raises(ValueError, gkde.evaluate, xs, method='binned',
+                  max_memory=1000)
+
+    gkde = stats.gaussian_kde(np.random.randn(4, 50))
+    assert_raises(ValueError, gkde.evaluate, np.zeros(4), method='binned')